@@ -0,0 +1,33 @@
+"""Add HTTP fetch validators to sources for conditional feed polling.
+
+Revision ID: 0039_source_fetch_validators
+Revises: 0038_canonical_entity_registry
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0039_source_fetch_validators"
+down_revision = "0038_canonical_entity_registry"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("sources", sa.Column("fetch_etag", sa.String(length=512), nullable=True))
+    op.add_column(
+        "sources",
+        sa.Column("fetch_last_modified", sa.String(length=64), nullable=True),
+    )
+    op.add_column("sources", sa.Column("fetch_body_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "fetch_body_hash")
+    op.drop_column("sources", "fetch_last_modified")
+    op.drop_column("sources", "fetch_etag")
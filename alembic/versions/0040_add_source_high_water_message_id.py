@@ -0,0 +1,26 @@
+"""Add Telegram message high-water mark to sources for incremental streaming.
+
+Revision ID: 0040_source_high_water_message_id
+Revises: 0039_source_fetch_validators
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0040_source_high_water_message_id"
+down_revision = "0039_source_fetch_validators"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("sources", sa.Column("high_water_message_id", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "high_water_message_id")
@@ -0,0 +1,42 @@
+"""Add MinHash signature and LSH bands to raw items for near-duplicate dedup.
+
+Revision ID: 0041_raw_item_minhash
+Revises: 0040_source_high_water_message_id
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0041_raw_item_minhash"
+down_revision = "0040_source_high_water_message_id"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "raw_items",
+        sa.Column("minhash_signature", postgresql.ARRAY(sa.Integer()), nullable=True),
+    )
+    op.add_column(
+        "raw_items",
+        sa.Column("minhash_bands", postgresql.ARRAY(sa.Integer()), nullable=True),
+    )
+    op.create_index(
+        "idx_raw_items_minhash_bands",
+        "raw_items",
+        ["minhash_bands"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_raw_items_minhash_bands", table_name="raw_items")
+    op.drop_column("raw_items", "minhash_bands")
+    op.drop_column("raw_items", "minhash_signature")
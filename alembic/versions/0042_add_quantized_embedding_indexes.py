@@ -0,0 +1,56 @@
+"""Swap embedding ANN indexes to the configured quantized storage mode.
+
+Revision ID: 0042_quantized_embedding_indexes
+Revises: 0041_raw_item_minhash
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from src.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision = "0042_quantized_embedding_indexes"
+down_revision = "0041_raw_item_minhash"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("raw_items", "events")
+_QUANTIZED_EXPRESSIONS = {
+    "halfvec": "(embedding::halfvec(1536)) halfvec_cosine_ops",
+    "binary": "(binary_quantize(embedding)::bit(1536)) bit_hamming_ops",
+}
+
+
+def upgrade() -> None:
+    # Only the configured mode is indexed, so inserts keep maintaining a single
+    # ANN index per table. `full` keeps the existing vector_cosine_ops index.
+    storage = settings.EMBEDDING_ANN_STORAGE
+    expression = _QUANTIZED_EXPRESSIONS.get(storage)
+    if expression is None:
+        return
+    for table in _TABLES:
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_embedding_{storage}
+            ON {table}
+            USING ivfflat ({expression})
+            WITH (lists = 64)
+            """
+        )
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_embedding")
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_embedding
+            ON {table}
+            USING ivfflat (embedding vector_cosine_ops)
+            WITH (lists = 64)
+            """
+        )
+        for storage in _QUANTIZED_EXPRESSIONS:
+            op.execute(f"DROP INDEX IF EXISTS idx_{table}_embedding_{storage}")
@@ -0,0 +1,58 @@
+"""Add running-sum embedding centroids to events and backfill them from linked items.
+
+Revision ID: 0043_event_embedding_centroid
+Revises: 0042_quantized_embedding_indexes
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0043_event_embedding_centroid"
+down_revision = "0042_quantized_embedding_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("embedding_centroid_sum", Vector(1536), nullable=True))
+    op.add_column(
+        "events",
+        sa.Column(
+            "embedding_centroid_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    # Sum unit-normalised item vectors of the event's own model, as the clusterer does.
+    op.execute(
+        """
+        UPDATE events
+        SET embedding_centroid_sum = centroids.total,
+            embedding_centroid_count = centroids.members
+        FROM (
+            SELECT ei.event_id,
+                   sum(l2_normalize(ri.embedding)) AS total,
+                   count(*) AS members
+            FROM event_items AS ei
+            JOIN raw_items AS ri ON ri.id = ei.item_id
+            JOIN events AS ev ON ev.id = ei.event_id
+            WHERE ri.embedding IS NOT NULL
+              AND ri.embedding_model = ev.embedding_model
+              AND vector_norm(ri.embedding) > 0
+            GROUP BY ei.event_id
+        ) AS centroids
+        WHERE events.id = centroids.event_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("events", "embedding_centroid_count")
+    op.drop_column("events", "embedding_centroid_sum")
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.middleware.auth import require_privileged_access
 from src.api.routes._privileged_write_contract import event_revision_token
 from src.api.routes.event_review_metadata import EventReviewMetadata, load_event_review_metadata
+from src.processing.corroboration_grouping import PROVENANCE_COUNTERS_KEY
 from src.processing.event_cluster_health import (
     cluster_health_payload,
     resolve_cluster_health,
@@ -534,7 +535,12 @@ async def get_event(
             review_metadata=review_metadata,
         ).model_dump(),
         corroboration_score=resolved_corroboration_score(event),
-        provenance_summary=dict(event.provenance_summary or {}),
+        # Merge counters are internal bookkeeping and can grow with the event.
+        provenance_summary={
+            key: value
+            for key, value in (event.provenance_summary or {}).items()
+            if key != PROVENANCE_COUNTERS_KEY
+        },
         extraction_provenance=dict(event.extraction_provenance or {}),
         extraction_status=resolved_extraction_status(event),
         provisional_extraction=_visible_provisional_extraction(event),
@@ -633,6 +633,28 @@ class Settings(BaseSettings):
             raise ValueError(msg)
         return normalized
 
+    @field_validator("EMBEDDING_ANN_STORAGE", mode="before")
+    @classmethod
+    def parse_embedding_ann_storage(cls, value: Any) -> str:
+        """Normalize embedding ANN storage mode."""
+        normalized = str(value or "full").strip().lower()
+        allowed = {"full", "halfvec", "binary"}
+        if normalized not in allowed:
+            msg = "EMBEDDING_ANN_STORAGE must be one of: full, halfvec, binary"
+            raise ValueError(msg)
+        return normalized
+
+    @field_validator("CLUSTER_EVENT_EMBEDDING_MODE", mode="before")
+    @classmethod
+    def parse_cluster_event_embedding_mode(cls, value: Any) -> str:
+        """Normalize the event vector used as the clustering target."""
+        normalized = str(value or "seed").strip().lower()
+        allowed = {"seed", "centroid"}
+        if normalized not in allowed:
+            msg = "CLUSTER_EVENT_EMBEDDING_MODE must be one of: seed, centroid"
+            raise ValueError(msg)
+        return normalized
+
     @field_validator("CALIBRATION_DRIFT_WEBHOOK_URL", mode="before")
     @classmethod
     def parse_optional_webhook_url(cls, value: Any) -> str | None:
@@ -986,11 +1008,35 @@ class Settings(BaseSettings):
         le=2048,
         description="Maximum texts per embedding API request",
     )
+    EMBEDDING_MAX_CONCURRENT_REQUESTS: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum embedding API requests in flight per embedding service",
+    )
     EMBEDDING_CACHE_MAX_SIZE: int = Field(
         default=2048,
         ge=1,
         description="Maximum in-memory embedding cache entries before LRU eviction",
     )
+    EMBEDDING_SHARED_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Share embedding vectors across workers through Redis",
+    )
+    EMBEDDING_SHARED_CACHE_TTL_SECONDS: int = Field(
+        default=604800,
+        ge=60,
+        description="TTL for shared embedding cache entries (seconds)",
+    )
+    EMBEDDING_SHARED_CACHE_MAX_ENTRIES: int = Field(
+        default=20000,
+        ge=1,
+        description="Max shared embedding cache entries per model before oldest eviction",
+    )
+    EMBEDDING_SHARED_CACHE_REDIS_PREFIX: str = Field(
+        default="horadus:embedding_cache",
+        description="Redis key prefix for shared embedding cache vectors and indexes",
+    )
     EMBEDDING_MAX_INPUT_TOKENS: int = Field(
         default=8191,
         ge=1,
@@ -1006,6 +1052,19 @@ class Settings(BaseSettings):
         le=16,
         description="Chars-per-token heuristic used for deterministic embedding token estimation",
     )
+    EMBEDDING_ANN_STORAGE: str = Field(
+        default="full",
+        description=(
+            "Vector precision used by embedding ANN lookups (`full`, `halfvec` or `binary`); "
+            "quantized modes re-rank candidates with full-precision distance"
+        ),
+    )
+    EMBEDDING_ANN_RERANK_CANDIDATES: int = Field(
+        default=40,
+        ge=1,
+        le=1000,
+        description="Quantized ANN candidates re-ranked with full-precision distance per lookup",
+    )
     VECTOR_REVALIDATION_CADENCE_DAYS: int = Field(
         default=30,
         ge=1,
@@ -1155,6 +1214,42 @@ class Settings(BaseSettings):
         default_factory=lambda: list(_DEFAULT_DEDUP_URL_TRACKING_PARAMS),
         description="Exact query params removed during URL dedup normalization",
     )
+    DEDUP_RECENT_KEY_FILTER_ENABLED: bool = Field(
+        default=False,
+        description="Skip exact dedup queries for keys absent from the Redis Bloom filter",
+    )
+    DEDUP_RECENT_KEY_FILTER_BITS: int = Field(
+        default=16_777_216,
+        ge=1024,
+        le=4_294_967_296,
+        description="Bits per Bloom filter generation bitmap",
+    )
+    DEDUP_RECENT_KEY_FILTER_HASHES: int = Field(
+        default=7,
+        ge=1,
+        le=16,
+        description="Bit positions set per key in the dedup Bloom filter",
+    )
+    DEDUP_RECENT_KEY_FILTER_WINDOW_DAYS: int = Field(
+        default=7,
+        ge=1,
+        le=90,
+        description="Longest dedup window the Bloom filter answers for (one generation)",
+    )
+    DEDUP_RECENT_KEY_FILTER_REDIS_PREFIX: str = Field(
+        default="horadus:dedup_filter",
+        description="Redis key prefix for dedup Bloom filter bitmaps",
+    )
+    DEDUP_MINHASH_ENABLED: bool = Field(
+        default=True,
+        description="Match near-identical raw item text by MinHash before embedding checks",
+    )
+    DEDUP_MINHASH_THRESHOLD: float = Field(
+        default=0.8,
+        ge=0.5,
+        le=1,
+        description="Minimum estimated shingle Jaccard similarity for a MinHash match",
+    )
     CLUSTER_SIMILARITY_THRESHOLD: float = Field(
         default=0.88,
         ge=0,
@@ -1166,6 +1261,22 @@ class Settings(BaseSettings):
         ge=1,
         description="Time window for event clustering",
     )
+    CLUSTER_EVENT_EMBEDDING_MODE: str = Field(
+        default="seed",
+        description=(
+            "Event vector matched during clustering (`seed` uses the stored embedding, "
+            "`centroid` the running sum of all linked item embeddings)"
+        ),
+    )
+    CLUSTER_EVENT_INDEX_ENABLED: bool = Field(
+        default=False,
+        description="Match clustering candidates from a worker-resident index of active events",
+    )
+    CLUSTER_EVENT_INDEX_MAX_EVENTS: int = Field(
+        default=50_000,
+        ge=1,
+        description="Largest active window kept in the in-process event index",
+    )
     PROCESSING_PIPELINE_BATCH_SIZE: int = Field(
         default=200,
         ge=1,
@@ -1353,6 +1464,34 @@ class Settings(BaseSettings):
     # Collection
     # =========================================================================
     RSS_COLLECTION_INTERVAL: int = Field(default=360, description="Minutes")
+    RSS_ADAPTIVE_POLLING_ENABLED: bool = Field(
+        default=False,
+        description="Collect each RSS feed only when due from its observed publish cadence",
+    )
+    RSS_ADAPTIVE_POLL_TICK_MINUTES: int = Field(
+        default=5,
+        ge=1,
+        le=60,
+        description="RSS beat cadence in minutes when adaptive polling is enabled",
+    )
+    RSS_ADAPTIVE_POLL_MIN_MINUTES: int = Field(
+        default=5,
+        ge=1,
+        le=1440,
+        description="Shortest adaptive poll interval for a busy RSS feed",
+    )
+    RSS_ADAPTIVE_POLL_MAX_MINUTES: int = Field(
+        default=720,
+        ge=1,
+        le=10080,
+        description="Longest adaptive poll interval for a quiet RSS feed",
+    )
+    RSS_ADAPTIVE_POLL_HISTORY_SIZE: int = Field(
+        default=20,
+        ge=2,
+        le=200,
+        description="Recent publish times per feed used to estimate its cadence",
+    )
     GDELT_COLLECTION_INTERVAL: int = Field(default=360, description="Minutes")
     INGESTION_WINDOW_OVERLAP_SECONDS: int = Field(
         default=300,
@@ -1432,6 +1571,92 @@ class Settings(BaseSettings):
         le=7200,
         description="Total timeout budget in seconds for a single RSS feed collection run",
     )
+    RSS_COLLECTOR_MAX_CONCURRENT_FEEDS: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum RSS feeds collected concurrently per run (1 keeps serial collection)",
+    )
+    RSS_COLLECTOR_MAX_CONCURRENT_PER_DOMAIN: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Maximum RSS feeds collected concurrently against the same domain",
+    )
+    RSS_COLLECTOR_DOMAIN_BURST: int = Field(
+        default=1,
+        ge=1,
+        le=20,
+        description="Token-bucket burst per feed domain; `settings.domain_rate_limits` in rss_feeds.yaml overrides it",
+    )
+    INGESTION_RATE_LIMIT_DISTRIBUTED: bool = Field(
+        default=False,
+        description="Share RSS/GDELT per-domain token buckets across workers through Redis",
+    )
+    INGESTION_RATE_LIMIT_REDIS_PREFIX: str = Field(
+        default="horadus:ingestion_rate_limit",
+        description="Redis key prefix for shared ingestion rate-limit buckets",
+    )
+    CONTENT_EXTRACTION_MAX_WORKERS: int = Field(
+        default=2,
+        ge=0,
+        le=32,
+        description="Worker processes for article text extraction (0 extracts in a thread)",
+    )
+    CONTENT_EXTRACTION_MAX_HTML_BYTES: int = Field(
+        default=2_000_000,
+        ge=10_000,
+        le=50_000_000,
+        description="Article HTML larger than this is not extracted; the feed summary is kept",
+    )
+    CONTENT_EXTRACTION_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        ge=0.5,
+        le=120.0,
+        description="Per-article extraction timeout before falling back to the feed summary",
+    )
+    ARTICLE_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache extracted article text by normalized URL across feeds",
+    )
+    ARTICLE_CACHE_FRESH_SECONDS: int = Field(
+        default=900,
+        ge=0,
+        le=86400,
+        description="Age below which a cached article is reused without any request",
+    )
+    ARTICLE_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        ge=1,
+        le=86400,
+        description="Retention for cached articles; stale entries are revalidated with their validators",
+    )
+    ARTICLE_CACHE_MAX_ENTRIES: int = Field(
+        default=2000,
+        ge=1,
+        le=100000,
+        description="Maximum in-process cached articles (least recently used are evicted)",
+    )
+    ARTICLE_CACHE_REDIS_ENABLED: bool = Field(
+        default=False,
+        description="Share the article cache across ingestion workers through Redis",
+    )
+    ARTICLE_CACHE_REDIS_PREFIX: str = Field(
+        default="horadus:article_cache",
+        description="Redis key prefix for shared article cache entries",
+    )
+    GDELT_COLLECTOR_MAX_CONCURRENT_QUERIES: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum GDELT queries collected concurrently per run (1 keeps serial collection)",
+    )
+    GDELT_API_BURST: int = Field(
+        default=2,
+        ge=1,
+        le=20,
+        description="Token-bucket burst size for GDELT API requests shared by concurrent queries",
+    )
     GDELT_COLLECTOR_TOTAL_TIMEOUT_SECONDS: int = Field(
         default=300,
         ge=30,
@@ -101,6 +101,11 @@ SOURCE_COVERAGE_DROP_ALERTS_TOTAL = Counter(
     "Coverage drop alerts emitted by severity and dimension.",
     ["severity", "dimension"],
 )
+EMBEDDING_CACHE_LOOKUPS_TOTAL = Counter(
+    "embedding_cache_lookups_total",
+    "Embedding cache lookups by tier (memory/shared) and result.",
+    ["tier", "result"],
+)
 LLM_SEMANTIC_CACHE_LOOKUPS_TOTAL = Counter(
     "llm_semantic_cache_lookups_total",
     "LLM semantic cache lookups by stage and result.",
@@ -231,6 +236,13 @@ def record_source_catchup_dispatch(*, collector: str) -> None:
     SOURCE_CATCHUP_DISPATCH_TOTAL.labels(collector=collector).inc()
 
 
+def record_embedding_cache_lookups(*, tier: str, hits: int, misses: int) -> None:
+    if hits:
+        EMBEDDING_CACHE_LOOKUPS_TOTAL.labels(tier=tier, result="hit").inc(hits)
+    if misses:
+        EMBEDDING_CACHE_LOOKUPS_TOTAL.labels(tier=tier, result="miss").inc(misses)
+
+
 def record_llm_semantic_cache_lookup(*, stage: str, result: str) -> None:
     LLM_SEMANTIC_CACHE_LOOKUPS_TOTAL.labels(stage=stage, result=result).inc()
 
@@ -50,6 +50,8 @@ def _as_utc(value: datetime) -> datetime:
 
 def _collector_interval_minutes(source_type: SourceType) -> int | None:
     if source_type == SourceType.RSS:
+        if settings.RSS_ADAPTIVE_POLLING_ENABLED:
+            return max(1, settings.RSS_ADAPTIVE_POLL_MAX_MINUTES)
         return max(1, settings.RSS_COLLECTION_INTERVAL)
     if source_type == SourceType.GDELT:
         return max(1, settings.GDELT_COLLECTION_INTERVAL)
@@ -1,5 +1,8 @@
 """
-Vector retrieval benchmark utilities (exact vs IVFFlat vs HNSW).
+Vector retrieval benchmark utilities (exact vs IVFFlat vs HNSW vs quantized re-ranking).
+
+Optionally compares seed and centroid event embeddings as online clustering targets,
+and per-pair cosine loops against the batched in-process similarity kernels.
 """
 
 from __future__ import annotations
@@ -13,13 +16,28 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 import asyncpg  # type: ignore[import-untyped]
+import numpy as np
 
 from src.core.config import settings
-from src.processing.vector_similarity import max_distance_for_similarity
+from src.processing.similarity_kernels import cosine_scores, normalize_rows, top_k_indices
+from src.processing.vector_similarity import cosine_similarity, max_distance_for_similarity
 
 BENCHMARK_TABLE_NAME = "eval_vector_benchmark"
 SUMMARY_FILENAME = "vector-benchmark-summary.json"
 _MAX_SUMMARY_HISTORY = 50
+_ANN_STRATEGIES = ("ivfflat", "hnsw", "halfvec", "binary")
+# Candidate ordering over the quantized expression indexes; results are re-ranked exactly.
+_QUANTIZED_CANDIDATE_ORDER = {
+    "halfvec": "embedding::halfvec({dimensions}) <=> $1::vector::halfvec({dimensions})",
+    "binary": (
+        "binary_quantize(embedding)::bit({dimensions}) <~> "
+        "binary_quantize($1::vector)::bit({dimensions})"
+    ),
+}
+CLUSTER_TARGETS = ("seed", "centroid")
+# Per-step story drift and per-item noise, as L2 norms independent of dimensionality.
+_STORY_DRIFT = 0.08
+_ITEM_NOISE = 0.25
 
 
 @dataclass(slots=True, frozen=True)
@@ -40,6 +58,48 @@ class StrategyMetrics:
         }
 
 
+@dataclass(slots=True, frozen=True)
+class ClusterTargetMetrics:
+    """Clustering quality/cost of one event embedding target over drifting stories."""
+
+    name: str
+    events_created: int
+    events_per_story: float
+    purity: float
+    avg_assign_latency_us: float
+
+    def to_dict(self) -> dict[str, float | int | str]:
+        return {
+            "name": self.name,
+            "events_created": self.events_created,
+            "events_per_story": round(self.events_per_story, 4),
+            "purity": round(self.purity, 6),
+            "avg_assign_latency_us": round(self.avg_assign_latency_us, 4),
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class SimilarityKernelMetrics:
+    """Per-query in-process top-k cost of a per-pair cosine loop vs one matrix product."""
+
+    candidate_count: int
+    loop_avg_ms: float
+    kernel_avg_ms: float
+    matrix_build_ms: float
+    top_k_agreement: float
+
+    def to_dict(self) -> dict[str, float | int]:
+        speedup = self.loop_avg_ms / self.kernel_avg_ms if self.kernel_avg_ms > 0 else 0.0
+        return {
+            "candidate_count": self.candidate_count,
+            "loop_avg_ms": round(self.loop_avg_ms, 4),
+            "kernel_avg_ms": round(self.kernel_avg_ms, 4),
+            "matrix_build_ms": round(self.matrix_build_ms, 4),
+            "speedup": round(speedup, 2),
+            "top_k_agreement": round(self.top_k_agreement, 6),
+        }
+
+
 def _vector_literal(vector: list[float]) -> str:
     return "[" + ",".join(f"{value:.6f}" for value in vector) + "]"
 
@@ -72,6 +132,136 @@ def _build_clustered_vectors(
     return vectors
 
 
+def _build_drifting_stories(
+    *,
+    story_count: int,
+    items_per_story: int,
+    dimensions: int,
+    seed: int,
+) -> tuple[np.ndarray, list[int]]:
+    """Interleave items of stories whose centre random-walks away from the first item."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(story_count, dimensions))
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+    step_scale = _STORY_DRIFT / np.sqrt(dimensions)
+    noise_scale = _ITEM_NOISE / np.sqrt(dimensions)
+    vectors = np.empty((story_count * items_per_story, dimensions), dtype=np.float32)
+    labels: list[int] = []
+    for step in range(items_per_story):
+        centers += rng.normal(scale=step_scale, size=centers.shape)
+        centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+        items = centers + rng.normal(scale=noise_scale, size=centers.shape)
+        items /= np.linalg.norm(items, axis=1, keepdims=True)
+        vectors[step * story_count : (step + 1) * story_count] = items
+        labels.extend(range(story_count))
+    return (vectors, labels)
+
+
+def _simulate_cluster_target(
+    vectors: np.ndarray,
+    labels: list[int],
+    *,
+    target: str,
+    similarity_threshold: float,
+) -> ClusterTargetMetrics:
+    """Cluster items online, matching each against seed or running-mean event vectors."""
+    item_count, dimensions = vectors.shape
+    targets = np.zeros((item_count, dimensions), dtype=np.float32)
+    sums = np.zeros((item_count, dimensions), dtype=np.float32)
+    event_count = 0
+    assignments: list[int] = []
+    latencies_us: list[float] = []
+    for vector in vectors:
+        started = time.perf_counter()
+        matched = -1
+        if event_count:
+            scores = targets[:event_count] @ vector
+            best = int(np.argmax(scores))
+            if scores[best] >= similarity_threshold:
+                matched = best
+        if matched < 0:
+            matched = event_count
+            sums[matched] = vector
+            targets[matched] = vector
+            event_count += 1
+        elif target == "centroid":
+            sums[matched] += vector
+            targets[matched] = sums[matched] / np.linalg.norm(sums[matched])
+        latencies_us.append((time.perf_counter() - started) * 1_000_000.0)
+        assignments.append(matched)
+
+    members: dict[int, dict[int, int]] = {}
+    for event_index, label in zip(assignments, labels, strict=True):
+        counts = members.setdefault(event_index, {})
+        counts[label] = counts.get(label, 0) + 1
+    majority = sum(max(counts.values()) for counts in members.values())
+    story_count = len(set(labels))
+    return ClusterTargetMetrics(
+        name=target,
+        events_created=event_count,
+        events_per_story=event_count / story_count if story_count else 0.0,
+        purity=majority / item_count if item_count else 0.0,
+        avg_assign_latency_us=sum(latencies_us) / len(latencies_us) if latencies_us else 0.0,
+    )
+
+
+def _compare_cluster_targets(
+    *,
+    dataset_size: int,
+    dimensions: int,
+    similarity_threshold: float,
+    seed: int,
+) -> dict[str, ClusterTargetMetrics]:
+    story_count = max(8, min(32, dataset_size // 80))
+    vectors, labels = _build_drifting_stories(
+        story_count=story_count,
+        items_per_story=max(1, dataset_size // story_count),
+        dimensions=dimensions,
+        seed=seed,
+    )
+    return {
+        target: _simulate_cluster_target(
+            vectors,
+            labels,
+            target=target,
+            similarity_threshold=similarity_threshold,
+        )
+        for target in CLUSTER_TARGETS
+    }
+
+
+def _compare_similarity_kernels(
+    *,
+    vectors: list[list[float]],
+    query_vectors: list[list[float]],
+    top_k: int,
+) -> SimilarityKernelMetrics:
+    """Time top-k by scalar `cosine_similarity` calls against the float32 kernel path."""
+    started = time.perf_counter()
+    units = normalize_rows(vectors)
+    matrix_build_ms = (time.perf_counter() - started) * 1000.0
+    loop_latencies: list[float] = []
+    kernel_latencies: list[float] = []
+    agreements: list[float] = []
+    for query_vector in query_vectors:
+        started = time.perf_counter()
+        scores = [cosine_similarity(query_vector, vector) for vector in vectors]
+        loop_top = sorted(range(len(scores)), key=lambda index: (-scores[index], index))[:top_k]
+        loop_latencies.append((time.perf_counter() - started) * 1000.0)
+
+        started = time.perf_counter()
+        kernel_top = top_k_indices(cosine_scores(units, query_vector), top_k)
+        kernel_latencies.append((time.perf_counter() - started) * 1000.0)
+        agreements.append(len(set(loop_top) & set(kernel_top.tolist())) / len(loop_top))
+    return SimilarityKernelMetrics(
+        candidate_count=len(vectors),
+        loop_avg_ms=sum(loop_latencies) / len(loop_latencies) if loop_latencies else 0.0,
+        kernel_avg_ms=sum(kernel_latencies) / len(kernel_latencies) if kernel_latencies else 0.0,
+        matrix_build_ms=matrix_build_ms,
+        top_k_agreement=sum(agreements) / len(agreements) if agreements else 1.0,
+    )
+
+
 def _percentile(values: list[float], percentile: float) -> float:
     if not values:
         return 0.0
@@ -114,12 +304,15 @@ async def _prepare_dataset(
 async def _drop_strategy_indexes(conn: asyncpg.Connection) -> None:
     await conn.execute("DROP INDEX IF EXISTS idx_eval_vector_benchmark_embedding_ivfflat")
     await conn.execute("DROP INDEX IF EXISTS idx_eval_vector_benchmark_embedding_hnsw")
+    await conn.execute("DROP INDEX IF EXISTS idx_eval_vector_benchmark_embedding_halfvec")
+    await conn.execute("DROP INDEX IF EXISTS idx_eval_vector_benchmark_embedding_binary")
 
 
 async def _apply_strategy_index(
     conn: asyncpg.Connection,
     *,
     strategy: str,
+    dimensions: int,
 ) -> None:
     await _drop_strategy_indexes(conn)
     if strategy == "exact":
@@ -145,6 +338,26 @@ async def _apply_strategy_index(
             """
         )
         await conn.execute("SET hnsw.ef_search = 64")
+    elif strategy == "halfvec":
+        await conn.execute(
+            f"""
+            CREATE INDEX idx_eval_vector_benchmark_embedding_halfvec
+            ON eval_vector_benchmark
+            USING ivfflat ((embedding::halfvec({dimensions})) halfvec_cosine_ops)
+            WITH (lists = 100)
+            """
+        )
+        await conn.execute("SET ivfflat.probes = 10")
+    elif strategy == "binary":
+        await conn.execute(
+            f"""
+            CREATE INDEX idx_eval_vector_benchmark_embedding_binary
+            ON eval_vector_benchmark
+            USING ivfflat ((binary_quantize(embedding)::bit({dimensions})) bit_hamming_ops)
+            WITH (lists = 100)
+            """
+        )
+        await conn.execute("SET ivfflat.probes = 10")
     else:
         msg = f"Unsupported strategy '{strategy}'"
         raise ValueError(msg)
@@ -158,20 +371,41 @@ async def _query_neighbors(
     query_vector: list[float],
     max_distance: float,
     top_k: int,
+    candidate_order: str | None = None,
 ) -> tuple[list[int], float]:
     started = time.perf_counter()
-    rows = await conn.fetch(
-        """
-        SELECT id
-        FROM eval_vector_benchmark
-        WHERE embedding <=> $1::vector <= $2
-        ORDER BY embedding <=> $1::vector ASC
-        LIMIT $3
-        """,
-        _vector_literal(query_vector),
-        max_distance,
-        top_k,
-    )
+    if candidate_order is None:
+        rows = await conn.fetch(
+            """
+            SELECT id
+            FROM eval_vector_benchmark
+            WHERE embedding <=> $1::vector <= $2
+            ORDER BY embedding <=> $1::vector ASC
+            LIMIT $3
+            """,
+            _vector_literal(query_vector),
+            max_distance,
+            top_k,
+        )
+    else:
+        rows = await conn.fetch(
+            f"""
+            SELECT id
+            FROM (
+                SELECT id, embedding
+                FROM eval_vector_benchmark
+                ORDER BY {candidate_order}
+                LIMIT $4
+            ) AS candidates
+            WHERE embedding <=> $1::vector <= $2
+            ORDER BY embedding <=> $1::vector ASC
+            LIMIT $3
+            """,  # nosec B608
+            _vector_literal(query_vector),
+            max_distance,
+            top_k,
+            max(top_k, settings.EMBEDDING_ANN_RERANK_CANDIDATES),
+        )
     elapsed_ms = (time.perf_counter() - started) * 1000.0
     return ([int(row["id"]) for row in rows], elapsed_ms)
 
@@ -184,8 +418,15 @@ async def _run_strategy(
     max_distance: float,
     top_k: int,
     exact_neighbors: list[list[int]],
+    dimensions: int,
 ) -> StrategyMetrics:
-    await _apply_strategy_index(conn, strategy=strategy)
+    await _apply_strategy_index(conn, strategy=strategy, dimensions=dimensions)
+    candidate_order_template = _QUANTIZED_CANDIDATE_ORDER.get(strategy)
+    candidate_order = (
+        candidate_order_template.format(dimensions=dimensions)
+        if candidate_order_template is not None
+        else None
+    )
 
     latencies_ms: list[float] = []
     recalls: list[float] = []
@@ -195,6 +436,7 @@ async def _run_strategy(
             query_vector=query_vector,
             max_distance=max_distance,
             top_k=top_k,
+            candidate_order=candidate_order,
         )
         latencies_ms.append(latency_ms)
 
@@ -216,6 +458,49 @@ async def _run_strategy(
     )
 
 
+async def _measure_strategies(
+    conn: asyncpg.Connection,
+    *,
+    query_vectors: list[list[float]],
+    max_distance: float,
+    top_k: int,
+    dimensions: int,
+) -> dict[str, StrategyMetrics]:
+    exact_neighbors: list[list[int]] = []
+    exact_latencies: list[float] = []
+    for query_vector in query_vectors:
+        ids, latency_ms = await _query_neighbors(
+            conn,
+            query_vector=query_vector,
+            max_distance=max_distance,
+            top_k=top_k,
+        )
+        exact_neighbors.append(ids)
+        exact_latencies.append(latency_ms)
+
+    metrics_by_strategy: dict[str, StrategyMetrics] = {
+        "exact": StrategyMetrics(
+            name="exact",
+            avg_latency_ms=(sum(exact_latencies) / len(exact_latencies))
+            if exact_latencies
+            else 0.0,
+            p95_latency_ms=_percentile(exact_latencies, 95.0),
+            recall_at_k=1.0,
+        )
+    }
+    for strategy in _ANN_STRATEGIES:
+        metrics_by_strategy[strategy] = await _run_strategy(
+            conn,
+            strategy=strategy,
+            query_vectors=query_vectors,
+            max_distance=max_distance,
+            top_k=top_k,
+            exact_neighbors=exact_neighbors,
+            dimensions=dimensions,
+        )
+    return metrics_by_strategy
+
+
 def _recommend_strategy(
     *,
     metrics_by_strategy: dict[str, StrategyMetrics],
@@ -246,9 +531,16 @@ async def run_vector_retrieval_benchmark(
     top_k: int = 10,
     similarity_threshold: float = 0.88,
     seed: int = 42,
+    compare_cluster_targets: bool = False,
+    compare_similarity_kernels: bool = False,
 ) -> Path:
     """
     Run deterministic vector retrieval benchmark and write JSON artifact.
+
+    With `compare_cluster_targets`, the artifact also reports how many events
+    (each a Tier-2 call) seed and centroid targets create over drifting stories.
+    With `compare_similarity_kernels`, it times in-process top-k over the same
+    vectors and queries with per-pair cosine calls and with the batched kernels.
     """
     if dataset_size < 100:
         msg = "dataset_size must be >= 100"
@@ -277,38 +569,13 @@ async def run_vector_retrieval_benchmark(
     conn = await asyncpg.connect(_database_url_for_asyncpg(database_url))
     try:
         await _prepare_dataset(conn, vectors=vectors, dimensions=dimensions)
-
-        exact_neighbors: list[list[int]] = []
-        exact_latencies: list[float] = []
-        for query_vector in query_vectors:
-            ids, latency_ms = await _query_neighbors(
-                conn,
-                query_vector=query_vector,
-                max_distance=max_distance,
-                top_k=top_k,
-            )
-            exact_neighbors.append(ids)
-            exact_latencies.append(latency_ms)
-
-        metrics_by_strategy: dict[str, StrategyMetrics] = {
-            "exact": StrategyMetrics(
-                name="exact",
-                avg_latency_ms=(sum(exact_latencies) / len(exact_latencies))
-                if exact_latencies
-                else 0.0,
-                p95_latency_ms=_percentile(exact_latencies, 95.0),
-                recall_at_k=1.0,
-            )
-        }
-        for strategy in ("ivfflat", "hnsw"):
-            metrics_by_strategy[strategy] = await _run_strategy(
-                conn,
-                strategy=strategy,
-                query_vectors=query_vectors,
-                max_distance=max_distance,
-                top_k=top_k,
-                exact_neighbors=exact_neighbors,
-            )
+        metrics_by_strategy = await _measure_strategies(
+            conn,
+            query_vectors=query_vectors,
+            max_distance=max_distance,
+            top_k=top_k,
+            dimensions=dimensions,
+        )
         recommendation = _recommend_strategy(metrics_by_strategy=metrics_by_strategy)
     finally:
         try:
@@ -325,6 +592,7 @@ async def run_vector_retrieval_benchmark(
             "dimensions": dimensions,
             "query_count": query_count,
             "top_k": top_k,
+            "rerank_candidates": max(top_k, settings.EMBEDDING_ANN_RERANK_CANDIDATES),
             "similarity_threshold": similarity_threshold,
             "seed": seed,
             "vector_fingerprint_sha256": vector_fingerprint,
@@ -348,6 +616,21 @@ async def run_vector_retrieval_benchmark(
         },
     }
 
+    if compare_cluster_targets:
+        cluster_targets = _compare_cluster_targets(
+            dataset_size=dataset_size,
+            dimensions=dimensions,
+            similarity_threshold=similarity_threshold,
+            seed=seed,
+        )
+        payload["cluster_targets"] = {
+            target: metrics.to_dict() for target, metrics in cluster_targets.items()
+        }
+    if compare_similarity_kernels:
+        payload["similarity_kernels"] = _compare_similarity_kernels(
+            vectors=vectors, query_vectors=query_vectors, top_k=top_k
+        ).to_dict()
+
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     payload_canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
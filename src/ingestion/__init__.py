@@ -1,13 +1,11 @@
 """Data ingestion."""
 
-from src.ingestion.gdelt_client import GDELTClient, GDELTCollectionResult, GDELTQueryConfig
-from src.ingestion.rss_collector import CollectionResult, FeedConfig, RSSCollector
-from src.ingestion.telegram_harvester import (
-    ChannelConfig,
-    HarvesterSettings,
-    HarvestResult,
-    TelegramHarvester,
-)
+from src.ingestion.gdelt_client import GDELTClient, GDELTCollectionResult
+from src.ingestion.gdelt_config import GDELTQueryConfig
+from src.ingestion.rss_collector import CollectionResult, RSSCollector
+from src.ingestion.rss_config import FeedConfig
+from src.ingestion.telegram_config import ChannelConfig, HarvesterSettings
+from src.ingestion.telegram_harvester import HarvestResult, TelegramHarvester
 
 __all__ = [
     "ChannelConfig",
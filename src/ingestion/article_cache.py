@@ -0,0 +1,183 @@
+"""
+Short-lived cache of extracted article text shared across feeds and workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, cast
+
+import redis
+import structlog
+
+from src.core.config import settings
+from src.ingestion.feed_validators import FeedValidators
+from src.processing.deduplication_service import DeduplicationService
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedArticle:
+    """Extracted text plus the validators of the response it came from."""
+
+    text: str
+    validators: FeedValidators
+    stored_at: float
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "text": self.text,
+                "etag": self.validators.etag,
+                "last_modified": self.validators.last_modified,
+                "body_hash": self.validators.body_hash,
+                "stored_at": self.stored_at,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> CachedArticle | None:
+        try:
+            payload = json.loads(raw)
+            return cls(
+                text=str(payload["text"]),
+                validators=FeedValidators(
+                    etag=payload.get("etag"),
+                    last_modified=payload.get("last_modified"),
+                    body_hash=payload.get("body_hash"),
+                ),
+                stored_at=float(payload["stored_at"]),
+            )
+        except (ValueError, TypeError, KeyError):
+            return None
+
+
+class ArticleCache:
+    """
+    Extracted article text keyed by normalized URL.
+
+    Entries live in a bounded in-process LRU and, when enabled, in Redis so every
+    ingestion worker shares them. Entries younger than `fresh_seconds` are served
+    without a request; older ones up to `ttl_seconds` keep their validators so the
+    caller can revalidate with a conditional GET instead of re-extracting.
+    """
+
+    _DEGRADE_RETRY_SECONDS = 30
+
+    def __init__(
+        self,
+        *,
+        enabled: bool | None = None,
+        ttl_seconds: int | None = None,
+        fresh_seconds: int | None = None,
+        max_entries: int | None = None,
+        redis_enabled: bool | None = None,
+        redis_prefix: str | None = None,
+        redis_url: str | None = None,
+        redis_client: redis.Redis[str] | None = None,
+        wall_time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        self.enabled = settings.ARTICLE_CACHE_ENABLED if enabled is None else bool(enabled)
+        self.ttl_seconds = max(
+            1,
+            settings.ARTICLE_CACHE_TTL_SECONDS if ttl_seconds is None else int(ttl_seconds),
+        )
+        self.fresh_seconds = min(
+            self.ttl_seconds,
+            settings.ARTICLE_CACHE_FRESH_SECONDS if fresh_seconds is None else int(fresh_seconds),
+        )
+        self.max_entries = max(
+            1,
+            settings.ARTICLE_CACHE_MAX_ENTRIES if max_entries is None else int(max_entries),
+        )
+        self.redis_enabled = (
+            settings.ARTICLE_CACHE_REDIS_ENABLED if redis_enabled is None else bool(redis_enabled)
+        )
+        self.redis_prefix = (
+            settings.ARTICLE_CACHE_REDIS_PREFIX if redis_prefix is None else str(redis_prefix)
+        ).strip() or "horadus:article_cache"
+        self.redis_url = settings.REDIS_URL if redis_url is None else str(redis_url).strip()
+        self._redis_client = redis_client
+        self._backend_unavailable_until = 0.0
+        self._wall_time_fn = wall_time_fn or time.time
+        self._entries: OrderedDict[str, CachedArticle] = OrderedDict()
+
+    def is_fresh(self, article: CachedArticle) -> bool:
+        """Return whether an entry may be used without revalidating it."""
+        return self._wall_time_fn() - article.stored_at < self.fresh_seconds
+
+    async def get(self, url: str) -> CachedArticle | None:
+        """Return the cached article for a URL, checking memory before Redis."""
+        key = self._key(url)
+        if key is None:
+            return None
+
+        article = self._entries.get(key)
+        if article is not None:
+            if self._wall_time_fn() - article.stored_at < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                return article
+            del self._entries[key]
+
+        raw = await self._redis_call("get", key)
+        article = CachedArticle.from_json(raw) if isinstance(raw, str) else None
+        if article is not None:
+            self._remember(key, article)
+        return article
+
+    async def put(self, url: str, text: str, validators: FeedValidators) -> None:
+        """Store extracted text for a URL in memory and, when enabled, Redis."""
+        key = self._key(url)
+        if key is None:
+            return
+        article = CachedArticle(text=text, validators=validators, stored_at=self._wall_time_fn())
+        self._remember(key, article)
+        await self._redis_call("setex", key, self.ttl_seconds, article.to_json())
+
+    def _key(self, url: str) -> str | None:
+        if not self.enabled:
+            return None
+        normalized_url = DeduplicationService.normalize_url(url)
+        if normalized_url is None:
+            return None
+        digest = hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+        return f"{self.redis_prefix}:{digest}"
+
+    def _remember(self, key: str, article: CachedArticle) -> None:
+        self._entries[key] = article
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _redis_call(self, method: str, *args: Any) -> Any:
+        if not self.redis_enabled or time.monotonic() < self._backend_unavailable_until:
+            return None
+        try:
+            return await asyncio.to_thread(getattr(cast("Any", self._client()), method), *args)
+        except Exception as exc:
+            self._backend_unavailable_until = time.monotonic() + self._DEGRADE_RETRY_SECONDS
+            logger.warning(
+                "Article cache backend unavailable; using memory only",
+                error=str(exc),
+                retry_after_seconds=self._DEGRADE_RETRY_SECONDS,
+            )
+            return None
+
+    def _client(self) -> redis.Redis[str]:
+        if self._redis_client is None:
+            self._redis_client = redis.Redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis_client
+
+
+@lru_cache
+def get_article_cache() -> ArticleCache:
+    """Get the process-wide article cache configured from settings."""
+    return ArticleCache()
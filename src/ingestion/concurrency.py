@@ -0,0 +1,89 @@
+"""
+Bounded concurrency helpers for collectors that fan out across sources.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ingestion.rate_limiter import domain_key
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+class DomainConcurrencyLimiter:
+    """
+    Caps in-flight work globally and per destination domain.
+
+    Request spacing stays with the collector's rate limiter; this only bounds how many
+    source collections may be active at once against the same host.
+    """
+
+    def __init__(self, *, max_concurrency: int, max_per_domain: int) -> None:
+        if max_concurrency < 1:
+            msg = "max_concurrency must be >= 1"
+            raise ValueError(msg)
+        if max_per_domain < 1:
+            msg = "max_per_domain must be >= 1"
+            raise ValueError(msg)
+        self.max_concurrency = max_concurrency
+        self.max_per_domain = max_per_domain
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._domains: dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one domain slot and one global slot for the duration of the block."""
+        domain = self._domains.setdefault(domain_key(url), asyncio.Semaphore(self.max_per_domain))
+        # Acquire the domain slot first so feeds queued behind a busy host do not
+        # hold global slots that other domains could use.
+        async with domain, self._global:
+            yield
+
+
+async def run_bounded(
+    items: Sequence[ItemT],
+    *,
+    url_for: Callable[[ItemT], str],
+    worker: Callable[[ItemT], Awaitable[ResultT]],
+    limiter: DomainConcurrencyLimiter,
+) -> list[ResultT]:
+    """
+    Run `worker` for every item under `limiter`, preserving input order in results.
+    """
+
+    async def _run(item: ItemT) -> ResultT:
+        async with limiter.slot(url_for(item)):
+            return await worker(item)
+
+    return list(await asyncio.gather(*(_run(item) for item in items)))
+
+
+async def run_in_session(
+    session_factory: SessionFactory,
+    work: Callable[[AsyncSession], Awaitable[ResultT]],
+    *,
+    on_failure: Callable[[Exception], ResultT],
+) -> ResultT:
+    """
+    Run `work` in a dedicated session, committing on success.
+
+    Failures roll the session back and are converted by `on_failure`, so one
+    source cannot abort or partially commit a concurrent collection run.
+    """
+    async with session_factory() as session:
+        try:
+            result = await work(session)
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            return on_failure(exc)
+    return result
@@ -4,8 +4,20 @@ Wrapper around Trafilatura extraction.
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+from collections.abc import Awaitable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+import structlog
 import trafilatura
 
+from src.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
 
 class ContentExtractor:
     """Extracts main article text from raw HTML."""
@@ -26,3 +38,97 @@ class ContentExtractor:
             return None
         normalized = " ".join(extracted.split())
         return normalized or None
+
+
+class ExtractionExecutor:
+    """
+    Runs Trafilatura extraction off the event loop.
+
+    Extraction uses a lazily started pool of `max_workers` processes, or a thread
+    when `max_workers` is 0 or the host cannot start child processes (e.g. daemonic
+    Celery prefork children). Oversized input, timeouts, and pool crashes return
+    None so callers fall back to the feed summary.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        max_html_bytes: int,
+        timeout_seconds: float,
+    ) -> None:
+        if max_workers < 0:
+            msg = "max_workers must be >= 0"
+            raise ValueError(msg)
+        if max_html_bytes < 1:
+            msg = "max_html_bytes must be >= 1"
+            raise ValueError(msg)
+        if timeout_seconds <= 0:
+            msg = "timeout_seconds must be > 0"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self.max_html_bytes = max_html_bytes
+        self.timeout_seconds = timeout_seconds
+        self._pool: ProcessPoolExecutor | None = None
+        self._use_processes = max_workers > 0
+
+    async def extract_text(self, html: str) -> str | None:
+        """Extract article text, or return None when extraction is skipped or fails."""
+        size_bytes = len(html.encode("utf-8"))
+        if size_bytes > self.max_html_bytes:
+            logger.info(
+                "Article HTML exceeds extraction size cap; fallback to summary",
+                size_bytes=size_bytes,
+                max_html_bytes=self.max_html_bytes,
+            )
+            return None
+        try:
+            return await asyncio.wait_for(self._submit(html), timeout=self.timeout_seconds)
+        except TimeoutError:
+            logger.warning(
+                "Article extraction timed out; fallback to summary",
+                timeout_seconds=self.timeout_seconds,
+            )
+            return None
+        except BrokenProcessPool as exc:
+            logger.warning("Extraction worker pool crashed; restarting", error=str(exc))
+            self.shutdown()
+            return None
+
+    def shutdown(self) -> None:
+        """Stop the process pool; the next extraction starts a fresh one."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _submit(self, html: str) -> Awaitable[str | None]:
+        if self._use_processes:
+            loop = asyncio.get_running_loop()
+            try:
+                return loop.run_in_executor(self._get_pool(), ContentExtractor.extract_text, html)
+            except (AssertionError, OSError) as exc:
+                logger.warning(
+                    "Extraction process pool unavailable; extracting in a thread",
+                    error=str(exc),
+                )
+                self.shutdown()
+                self._use_processes = False
+        return asyncio.to_thread(ContentExtractor.extract_text, html)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+
+@lru_cache
+def get_extraction_executor() -> ExtractionExecutor:
+    """Get the process-wide extraction executor configured from settings."""
+    return ExtractionExecutor(
+        max_workers=settings.CONTENT_EXTRACTION_MAX_WORKERS,
+        max_html_bytes=settings.CONTENT_EXTRACTION_MAX_HTML_BYTES,
+        timeout_seconds=settings.CONTENT_EXTRACTION_TIMEOUT_SECONDS,
+    )
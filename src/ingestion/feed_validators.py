@@ -0,0 +1,72 @@
+"""
+HTTP cache validators used for conditional feed polling.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from src.storage.models import Source
+
+_MAX_ETAG_LENGTH = 512
+_MAX_LAST_MODIFIED_LENGTH = 64
+
+
+@dataclass(frozen=True, slots=True)
+class FeedValidators:
+    """ETag / Last-Modified / body-hash state remembered between feed polls."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    body_hash: str | None = None
+
+    @classmethod
+    def from_source(cls, source: Source) -> FeedValidators:
+        return cls(
+            etag=getattr(source, "fetch_etag", None),
+            last_modified=getattr(source, "fetch_last_modified", None),
+            body_hash=getattr(source, "fetch_body_hash", None),
+        )
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, *, body_hash: str) -> FeedValidators:
+        return cls(
+            etag=_bounded_header(response.headers.get("ETag"), _MAX_ETAG_LENGTH),
+            last_modified=_bounded_header(
+                response.headers.get("Last-Modified"),
+                _MAX_LAST_MODIFIED_LENGTH,
+            ),
+            body_hash=body_hash,
+        )
+
+    def request_headers(self) -> dict[str, str]:
+        """Return conditional request headers for the stored validators."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def apply_to(self, source: Source) -> None:
+        source.fetch_etag = self.etag
+        source.fetch_last_modified = self.last_modified
+        source.fetch_body_hash = self.body_hash
+
+
+def body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _bounded_header(value: str | None, max_length: int) -> str | None:
+    if value is None:
+        return None
+    stripped = value.strip()
+    if not stripped or len(stripped) > max_length:
+        return None
+    return stripped
@@ -0,0 +1,210 @@
+"""
+Parsing and filtering helpers for GDELT DOC API article payloads.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.ingestion.gdelt_config import GDELTQueryConfig
+
+
+def matches_query_filters(article: dict[str, Any], query: GDELTQueryConfig) -> bool:
+    article_themes = {
+        value.lower()
+        for value in (
+            split_terms(article.get("themes"))
+            + split_terms(article.get("v2themes"))
+            + split_terms(article.get("theme"))
+        )
+    }
+    if query.themes and not any(theme.lower() in article_themes for theme in query.themes):
+        return False
+    actor_terms = " ".join(
+        split_terms(article.get("persons"))
+        + split_terms(article.get("v2persons"))
+        + split_terms(article.get("organizations"))
+        + split_terms(article.get("v2organizations"))
+        + split_terms(article.get("actor1name"))
+        + split_terms(article.get("actor2name"))
+        + split_terms(article.get("title"))
+    ).lower()
+    if query.actors and not any(actor.lower() in actor_terms for actor in query.actors):
+        return False
+    if query.countries:
+        article_country = _safe_str(article.get("sourcecountry") or article.get("source_country"))
+        if article_country is None:
+            return False
+        allowed_countries = {country.upper() for country in query.countries}
+        if article_country.upper() not in allowed_countries:
+            return False
+    if query.languages:
+        raw_language = _safe_str(article.get("language"))
+        normalized_language = normalize_language(raw_language)
+        if normalized_language is None:
+            return False
+        allowed_languages = {
+            normalized
+            for normalized in (normalize_language(language) for language in query.languages)
+            if normalized is not None
+        }
+        if normalized_language not in allowed_languages:
+            return False
+    return True
+
+
+def oldest_published_at(articles: list[dict[str, Any]]) -> datetime | None:
+    parsed_dates = [
+        published_at
+        for published_at in (parse_article_datetime(article) for article in articles)
+        if published_at is not None
+    ]
+    if not parsed_dates:
+        return None
+    return min(parsed_dates)
+
+
+def compose_raw_content(
+    article: dict[str, Any],
+    title: str | None,
+    normalized_url: str | None,
+) -> str | None:
+    parts: list[str] = []
+    if title:
+        parts.append(title)
+    for key in ("snippet", "summary", "description"):
+        value = _safe_str(article.get(key))
+        if value:
+            parts.append(value)
+    themes = split_terms(article.get("themes")) + split_terms(article.get("v2themes"))
+    actors = (
+        split_terms(article.get("persons"))
+        + split_terms(article.get("v2persons"))
+        + split_terms(article.get("organizations"))
+        + split_terms(article.get("v2organizations"))
+    )
+    if themes:
+        parts.append(f"Themes: {', '.join(themes)}")
+    if actors:
+        parts.append(f"Actors: {', '.join(actors)}")
+    source_country = _safe_str(article.get("sourcecountry") or article.get("source_country"))
+    if source_country:
+        parts.append(f"Source country: {source_country}")
+    domain = _safe_str(article.get("domain"))
+    if domain:
+        parts.append(f"Domain: {domain}")
+    if normalized_url:
+        parts.append(f"URL: {normalized_url}")
+    if not parts:
+        return None
+    return "\n\n".join(parts)
+
+
+def parse_article_datetime(article: dict[str, Any]) -> datetime | None:
+    candidates = [
+        article.get("seendate"),
+        article.get("seenDate"),
+        article.get("publishdate"),
+        article.get("published"),
+        article.get("date"),
+    ]
+    for candidate in candidates:
+        parsed = parse_datetime_value(candidate)
+        if parsed is not None:
+            return parsed
+    return None
+
+
+def parse_datetime_value(raw_value: Any) -> datetime | None:
+    if raw_value is None:
+        return None
+    if isinstance(raw_value, int | float):
+        return datetime.fromtimestamp(float(raw_value), tz=UTC)
+    if not isinstance(raw_value, str):
+        return None
+    stripped = raw_value.strip()
+    if not stripped:
+        return None
+    compact_utc = (
+        len(stripped) == 16
+        and stripped[8] == "T"
+        and stripped.endswith("Z")
+        and stripped[:8].isdigit()
+        and stripped[9:15].isdigit()
+    )
+    if compact_utc:
+        try:
+            return datetime(
+                int(stripped[0:4]),
+                int(stripped[4:6]),
+                int(stripped[6:8]),
+                int(stripped[9:11]),
+                int(stripped[11:13]),
+                int(stripped[13:15]),
+                tzinfo=UTC,
+            )
+        except ValueError:
+            return None
+    compact_without_tz = len(stripped) == 14 and stripped.isdigit()
+    if compact_without_tz:
+        try:
+            return datetime(
+                int(stripped[0:4]),
+                int(stripped[4:6]),
+                int(stripped[6:8]),
+                int(stripped[8:10]),
+                int(stripped[10:12]),
+                int(stripped[12:14]),
+                tzinfo=UTC,
+            )
+        except ValueError:
+            return None
+    try:
+        parsed_iso = datetime.fromisoformat(stripped.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed_iso.tzinfo is None:
+        return parsed_iso.replace(tzinfo=UTC)
+    return parsed_iso.astimezone(UTC)
+
+
+def split_terms(raw_value: Any) -> list[str]:
+    if raw_value is None:
+        return []
+    if isinstance(raw_value, str):
+        normalized = raw_value.replace("|", ",").replace(";", ",")
+        return [term.strip() for term in normalized.split(",") if term.strip()]
+    if isinstance(raw_value, list):
+        return [str(term).strip() for term in raw_value if str(term).strip()]
+    return []
+
+
+def normalize_language(raw_language: str | None) -> str | None:
+    if raw_language is None:
+        return None
+    normalized = raw_language.strip().lower()
+    if not normalized:
+        return None
+
+    aliases = {
+        "english": "en",
+        "russian": "ru",
+        "ukrainian": "uk",
+        "french": "fr",
+        "spanish": "es",
+        "german": "de",
+        "arabic": "ar",
+        "chinese": "zh",
+    }
+    if normalized in aliases:
+        return aliases[normalized]
+    return normalized
+
+
+def _safe_str(value: Any) -> str | None:
+    if value is None:
+        return None
+    as_str = str(value).strip()
+    return as_str or None
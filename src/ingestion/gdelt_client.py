@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import hashlib
 import time
 from dataclasses import dataclass, field
@@ -11,47 +12,49 @@ from typing import Any
 import httpx
 import structlog
 import yaml
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import ColumnElement, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
-from src.ingestion.rate_limiter import DomainRateLimiter
+from src.ingestion.concurrency import (
+    DomainConcurrencyLimiter,
+    SessionFactory,
+    run_bounded,
+    run_in_session,
+)
+from src.ingestion.gdelt_articles import (
+    compose_raw_content,
+    matches_query_filters,
+    normalize_language,
+    oldest_published_at,
+    parse_article_datetime,
+    parse_datetime_value,
+    split_terms,
+)
+from src.ingestion.gdelt_config import (
+    GDELTQueryConfig,
+    GDELTSettings,
+    parse_gdelt_queries,
+    parse_gdelt_settings,
+    parse_str_list,
+)
+from src.ingestion.http_retry import (
+    backoff_seconds,
+    failure_reason,
+    is_retryable_status,
+    is_transient_failure,
+    parse_retry_after,
+)
+from src.ingestion.rate_limiter import SharedTokenBucketRateLimiter
+from src.ingestion.raw_item_writer import RawItemCandidate, RawItemWriter
 from src.ingestion.source_identity import gdelt_provider_source_key_from_mapping
 from src.processing.corroboration_provenance import refresh_events_for_source
 from src.processing.deduplication_service import DeduplicationService
-from src.storage.models import ProcessingStatus, RawItem, Source, SourceType
+from src.storage.models import Source, SourceType
 
 logger = structlog.get_logger(__name__)
 
 
-@dataclass(slots=True)
-class GDELTQueryConfig:
-    name: str
-    query: str = ""
-    credibility: float = 0.5
-    themes: list[str] = field(default_factory=list)
-    actors: list[str] = field(default_factory=list)
-    countries: list[str] = field(default_factory=list)
-    languages: list[str] = field(default_factory=list)
-    lookback_hours: int = 12
-    max_records_per_page: int = 100
-    max_pages: int = 3
-    source_tier: str = "aggregator"
-    reporting_type: str = "aggregator"
-    enabled: bool = True
-    extra: dict[str, Any] = field(default_factory=dict)
-
-
-@dataclass(slots=True)
-class GDELTSettings:
-    request_timeout_seconds: int = 30
-    user_agent: str = "GeopoliticalIntel/1.0 (GDELT Client)"
-    default_lookback_hours: int = 12
-    default_max_records_per_page: int = 100
-    default_max_pages: int = 3
-
-
 @dataclass(slots=True)
 class GDELTCollectionResult:
     query_name: str
@@ -77,21 +80,33 @@ class GDELTClient:
         config_path: str = "config/sources/gdelt_queries.yaml",
         api_url: str = "https://api.gdeltproject.org/api/v2/doc/doc",
         requests_per_second: float = 1.0,
+        session_factory: SessionFactory | None = None,
     ) -> None:
         self.session = session
+        self.session_factory = session_factory
         self.http_client = http_client
         self.config_path = Path(config_path)
         self.api_url = api_url
-        self.rate_limiter = DomainRateLimiter(requests_per_second=requests_per_second)
+        self.rate_limiter = SharedTokenBucketRateLimiter(
+            requests_per_second=requests_per_second,
+            burst=settings.GDELT_API_BURST,
+        )
 
         self.settings = GDELTSettings()
         self._queries: list[GDELTQueryConfig] = []
         self._config_mtime: float | None = None
 
         self.total_timeout_seconds = settings.GDELT_COLLECTOR_TOTAL_TIMEOUT_SECONDS
+        self.max_concurrent_queries = settings.GDELT_COLLECTOR_MAX_CONCURRENT_QUERIES
+        self.lock_source_rows = False
         self.max_retries = 3
         self.dedup_window_days = 7
         self.deduplication_service = DeduplicationService(session=session)
+        self.raw_item_writer = RawItemWriter(
+            session,
+            deduplication_service=self.deduplication_service,
+            dedup_window_days=self.dedup_window_days,
+        )
 
     @property
     def queries(self) -> list[GDELTQueryConfig]:
@@ -134,14 +149,65 @@ class GDELTClient:
         )
 
     async def collect_all(self) -> list[GDELTCollectionResult]:
-        """Collect from all enabled GDELT queries."""
+        """
+        Collect from all enabled GDELT queries.
+
+        With a `session_factory` and `max_concurrent_queries > 1`, queries run
+        concurrently, each in its own session and transaction; API requests still
+        draw from the one shared token bucket.
+        """
         await self.load_config()
-        results: list[GDELTCollectionResult] = []
-        for query in self._queries:
-            if not query.enabled:
-                continue
-            results.append(await self.collect_query(query))
-        return results
+        queries = [query for query in self._queries if query.enabled]
+        session_factory = self.session_factory
+        if session_factory is None or self.max_concurrent_queries <= 1:
+            return [await self.collect_query(query) for query in queries]
+
+        limiter = DomainConcurrencyLimiter(
+            max_concurrency=self.max_concurrent_queries,
+            max_per_domain=self.max_concurrent_queries,
+        )
+        return await run_bounded(
+            queries,
+            url_for=lambda _query: self.api_url,
+            worker=lambda query: run_in_session(
+                session_factory,
+                lambda session: self._bind_session(session).collect_query(query),
+                on_failure=lambda exc: self._rolled_back_result(query, exc),
+            ),
+            limiter=limiter,
+        )
+
+    def _bind_session(self, session: AsyncSession) -> GDELTClient:
+        """
+        Return a copy sharing HTTP/rate-limit state that writes through `session`.
+
+        Bound copies lock their source row, so a query's watermark is read and
+        advanced inside the transaction that stores its items.
+        """
+        bound = copy.copy(self)
+        bound.session = session
+        bound.deduplication_service = DeduplicationService(session=session)
+        bound.raw_item_writer = RawItemWriter(
+            session,
+            deduplication_service=bound.deduplication_service,
+            dedup_window_days=bound.dedup_window_days,
+        )
+        bound.lock_source_rows = True
+        return bound
+
+    def _rolled_back_result(self, query: GDELTQueryConfig, exc: Exception) -> GDELTCollectionResult:
+        failure_reason = self._failure_reason(exc)
+        logger.warning(
+            "GDELT query collection rolled back",
+            query_name=query.name,
+            error=str(exc),
+            failure_reason=failure_reason,
+        )
+        return GDELTCollectionResult(
+            query_name=query.name,
+            errors=[f"[terminal] GDELT collection failed ({failure_reason}): {exc}"],
+            terminal_errors=1,
+        )
 
     async def collect_query(self, query: GDELTQueryConfig) -> GDELTCollectionResult:
         """Collect from one configured GDELT query."""
@@ -189,27 +255,13 @@ class GDELTClient:
                     result.items_fetched += len(articles)
 
                     oldest_published = self._oldest_published_at(articles)
-                    for article in articles:
-                        published_at = self._parse_article_datetime(article)
-                        if published_at is not None and (
-                            max_processed_published_at is None
-                            or published_at > max_processed_published_at
-                        ):
-                            max_processed_published_at = published_at
-
-                        if not self._matches_filters(article, query):
-                            result.items_skipped += 1
-                            continue
-
-                        stored_item = await self._store_article(
-                            source=source,
-                            article=article,
-                            published_at=published_at,
-                        )
-                        if stored_item is None:
-                            result.items_skipped += 1
-                        else:
-                            result.items_stored += 1
+                    max_processed_published_at = await self._store_page(
+                        source=source,
+                        query=query,
+                        articles=articles,
+                        result=result,
+                        max_published_at=max_processed_published_at,
+                    )
 
                     if len(articles) < query.max_records_per_page:
                         break
@@ -315,8 +367,10 @@ class GDELTClient:
                 if not should_retry or attempt + 1 >= max_attempts:
                     raise
                 retry_after = self._parse_retry_after(exc.response.headers.get("Retry-After"))
-                delay = retry_after if retry_after is not None else self._backoff_seconds(attempt)
-                await asyncio.sleep(delay)
+                if retry_after is not None:
+                    await self.rate_limiter.penalize(self.api_url, retry_after)
+                else:
+                    await asyncio.sleep(self._backoff_seconds(attempt))
             except (httpx.TimeoutException, httpx.NetworkError):
                 if attempt + 1 >= max_attempts:
                     raise
@@ -339,14 +393,14 @@ class GDELTClient:
         }
         provider_source_key = gdelt_provider_source_key_from_mapping(config_payload)
         source = await self.session.scalar(
-            select(Source).where(
+            self._select_source(
                 Source.type == SourceType.GDELT,
                 Source.provider_source_key == provider_source_key,
             )
         )
         if source is None:
             legacy_source = await self.session.scalar(
-                select(Source).where(
+                self._select_source(
                     Source.type == SourceType.GDELT,
                     Source.name == query.name,
                     Source.provider_source_key.is_(None),
@@ -404,12 +458,47 @@ class GDELTClient:
             await refresh_events_for_source(session=self.session, source_id=source.id)
         return source
 
+    def _select_source(self, *criteria: ColumnElement[bool]) -> Select[tuple[Source]]:
+        statement = select(Source).where(*criteria)
+        return statement.with_for_update() if self.lock_source_rows else statement
+
+    async def _store_page(
+        self,
+        *,
+        source: Source,
+        query: GDELTQueryConfig,
+        articles: list[dict[str, Any]],
+        result: GDELTCollectionResult,
+        max_published_at: datetime | None,
+    ) -> datetime | None:
+        """Queue one page of articles, bulk-insert it, and return the latest publish time."""
+        for article in articles:
+            published_at = self._parse_article_datetime(article)
+            if published_at is not None and (
+                max_published_at is None or published_at > max_published_at
+            ):
+                max_published_at = published_at
+
+            if self._matches_filters(article, query) and await self._store_article(
+                source=source,
+                article=article,
+                published_at=published_at,
+            ):
+                result.items_stored += 1
+            else:
+                result.items_skipped += 1
+
+        flushed = await self.raw_item_writer.flush()
+        result.items_stored -= flushed.skipped
+        result.items_skipped += flushed.skipped
+        return max_published_at
+
     async def _store_article(
         self,
         source: Source,
         article: dict[str, Any],
         published_at: datetime | None,
-    ) -> RawItem | None:
+    ) -> bool:
         raw_url = self._safe_str(article.get("url") or article.get("url_mobile"))
         normalized_url = self._normalize_url(raw_url) if raw_url is not None else None
 
@@ -417,54 +506,27 @@ class GDELTClient:
         if external_id is None:
             external_id = normalized_url
         if external_id is None:
-            return None
+            return False
 
         title = self._safe_str(article.get("title"))
         raw_content = self._compose_raw_content(article, title, normalized_url)
         if raw_content is None:
-            return None
+            return False
 
         content_hash = self._compute_hash(raw_content)
-        if await self._is_duplicate(normalized_url, external_id, content_hash):
-            return None
-
-        language = self._normalize_language(self._safe_str(article.get("language")))
-        author = self._safe_str(article.get("domain") or article.get("sourcecommonname"))
-        item = RawItem(
-            source_id=source.id,
-            external_id=external_id,
-            url=normalized_url,
-            title=title,
-            author=author,
-            published_at=published_at,
-            raw_content=raw_content,
-            content_hash=content_hash,
-            language=language,
-            processing_status=ProcessingStatus.PENDING,
-        )
-
-        try:
-            async with self.session.begin_nested():
-                self.session.add(item)
-                await self.session.flush()
-        except IntegrityError:
-            logger.debug("Duplicate GDELT item skipped on insert race", external_id=external_id)
-            return None
-        return item
-
-    async def _is_duplicate(
-        self,
-        normalized_url: str | None,
-        external_id: str,
-        content_hash: str,
-    ) -> bool:
-        result = await self.deduplication_service.find_duplicate(
-            external_id=external_id,
-            url=normalized_url,
-            content_hash=content_hash,
-            dedup_window_days=self.dedup_window_days,
+        return self.raw_item_writer.add(
+            RawItemCandidate(
+                source_id=source.id,
+                external_id=external_id,
+                url=normalized_url,
+                title=title,
+                author=self._safe_str(article.get("domain") or article.get("sourcecommonname")),
+                published_at=published_at,
+                raw_content=raw_content,
+                content_hash=content_hash,
+                language=self._normalize_language(self._safe_str(article.get("language"))),
+            )
         )
-        return result.is_duplicate
 
     def _determine_collection_window(
         self,
@@ -532,84 +594,9 @@ class GDELTClient:
         source.last_error = error[:1000]
         await self.session.flush()
 
-    @staticmethod
-    def _parse_settings(raw_settings: dict[str, Any]) -> GDELTSettings:
-        return GDELTSettings(
-            request_timeout_seconds=int(raw_settings.get("request_timeout_seconds", 30)),
-            user_agent=str(raw_settings.get("user_agent", "GeopoliticalIntel/1.0 (GDELT Client)")),
-            default_lookback_hours=int(raw_settings.get("default_lookback_hours", 12)),
-            default_max_records_per_page=int(raw_settings.get("default_max_records_per_page", 100)),
-            default_max_pages=int(raw_settings.get("default_max_pages", 3)),
-        )
-
-    @staticmethod
-    def _parse_queries(
-        raw_settings: dict[str, Any],
-        raw_queries: list[Any],
-    ) -> list[GDELTQueryConfig]:
-        default_lookback_hours = int(raw_settings.get("default_lookback_hours", 12))
-        default_max_records = int(raw_settings.get("default_max_records_per_page", 100))
-        default_max_pages = int(raw_settings.get("default_max_pages", 3))
-        parsed_queries: list[GDELTQueryConfig] = []
-        for raw_query in raw_queries:
-            if not isinstance(raw_query, dict):
-                continue
-            name = GDELTClient._safe_str(raw_query.get("name"))
-            if name is None:
-                continue
-            query = GDELTClient._safe_str(raw_query.get("query")) or ""
-            themes = GDELTClient._parse_str_list(raw_query.get("themes"))
-            actors = GDELTClient._parse_str_list(raw_query.get("actors"))
-            if not query and not themes and not actors:
-                continue
-            known_keys = {
-                "name",
-                "query",
-                "credibility",
-                "themes",
-                "actors",
-                "countries",
-                "languages",
-                "lookback_hours",
-                "max_records_per_page",
-                "max_pages",
-                "source_tier",
-                "reporting_type",
-                "enabled",
-            }
-            extra = {key: value for key, value in raw_query.items() if key not in known_keys}
-            parsed_queries.append(
-                GDELTQueryConfig(
-                    name=name,
-                    query=query,
-                    credibility=float(raw_query.get("credibility", 0.5)),
-                    themes=themes,
-                    actors=actors,
-                    countries=GDELTClient._parse_str_list(raw_query.get("countries")),
-                    languages=GDELTClient._parse_str_list(raw_query.get("languages")),
-                    lookback_hours=int(raw_query.get("lookback_hours", default_lookback_hours)),
-                    max_records_per_page=int(
-                        raw_query.get("max_records_per_page", default_max_records)
-                    ),
-                    max_pages=int(raw_query.get("max_pages", default_max_pages)),
-                    source_tier=str(raw_query.get("source_tier", "aggregator")),
-                    reporting_type=str(raw_query.get("reporting_type", "aggregator")),
-                    enabled=bool(raw_query.get("enabled", True)),
-                    extra=extra,
-                )
-            )
-        return parsed_queries
-
-    @staticmethod
-    def _parse_str_list(raw_value: Any) -> list[str]:
-        if raw_value is None:
-            return []
-        if isinstance(raw_value, str):
-            parts = raw_value.replace(";", ",").split(",")
-            return [part.strip() for part in parts if part.strip()]
-        if isinstance(raw_value, list):
-            return [str(value).strip() for value in raw_value if str(value).strip()]
-        return []
+    _parse_settings = staticmethod(parse_gdelt_settings)
+    _parse_queries = staticmethod(parse_gdelt_queries)
+    _parse_str_list = staticmethod(parse_str_list)
 
     @staticmethod
     def _build_query_string(query: GDELTQueryConfig) -> str:
@@ -632,174 +619,13 @@ class GDELTClient:
             return "geopolitics"
         return " AND ".join(clauses)
 
-    @staticmethod
-    def _matches_filters(article: dict[str, Any], query: GDELTQueryConfig) -> bool:
-        article_themes = {
-            value.lower()
-            for value in (
-                GDELTClient._split_terms(article.get("themes"))
-                + GDELTClient._split_terms(article.get("v2themes"))
-                + GDELTClient._split_terms(article.get("theme"))
-            )
-        }
-        if query.themes and not any(theme.lower() in article_themes for theme in query.themes):
-            return False
-        actor_terms = " ".join(
-            GDELTClient._split_terms(article.get("persons"))
-            + GDELTClient._split_terms(article.get("v2persons"))
-            + GDELTClient._split_terms(article.get("organizations"))
-            + GDELTClient._split_terms(article.get("v2organizations"))
-            + GDELTClient._split_terms(article.get("actor1name"))
-            + GDELTClient._split_terms(article.get("actor2name"))
-            + GDELTClient._split_terms(article.get("title"))
-        ).lower()
-        if query.actors and not any(actor.lower() in actor_terms for actor in query.actors):
-            return False
-        if query.countries:
-            article_country = GDELTClient._safe_str(
-                article.get("sourcecountry") or article.get("source_country")
-            )
-            if article_country is None:
-                return False
-            allowed_countries = {country.upper() for country in query.countries}
-            if article_country.upper() not in allowed_countries:
-                return False
-        if query.languages:
-            raw_language = GDELTClient._safe_str(article.get("language"))
-            normalized_language = GDELTClient._normalize_language(raw_language)
-            if normalized_language is None:
-                return False
-            allowed_languages = {
-                normalized
-                for normalized in (
-                    GDELTClient._normalize_language(language) for language in query.languages
-                )
-                if normalized is not None
-            }
-            if normalized_language not in allowed_languages:
-                return False
-        return True
-
-    @staticmethod
-    def _oldest_published_at(articles: list[dict[str, Any]]) -> datetime | None:
-        parsed_dates = [
-            published_at
-            for published_at in (
-                GDELTClient._parse_article_datetime(article) for article in articles
-            )
-            if published_at is not None
-        ]
-        if not parsed_dates:
-            return None
-        return min(parsed_dates)
-
-    @staticmethod
-    def _compose_raw_content(
-        article: dict[str, Any],
-        title: str | None,
-        normalized_url: str | None,
-    ) -> str | None:
-        parts: list[str] = []
-        if title:
-            parts.append(title)
-        for key in ("snippet", "summary", "description"):
-            value = GDELTClient._safe_str(article.get(key))
-            if value:
-                parts.append(value)
-        themes = GDELTClient._split_terms(article.get("themes")) + GDELTClient._split_terms(
-            article.get("v2themes")
-        )
-        actors = (
-            GDELTClient._split_terms(article.get("persons"))
-            + GDELTClient._split_terms(article.get("v2persons"))
-            + GDELTClient._split_terms(article.get("organizations"))
-            + GDELTClient._split_terms(article.get("v2organizations"))
-        )
-        if themes:
-            parts.append(f"Themes: {', '.join(themes)}")
-        if actors:
-            parts.append(f"Actors: {', '.join(actors)}")
-        source_country = GDELTClient._safe_str(
-            article.get("sourcecountry") or article.get("source_country")
-        )
-        if source_country:
-            parts.append(f"Source country: {source_country}")
-        domain = GDELTClient._safe_str(article.get("domain"))
-        if domain:
-            parts.append(f"Domain: {domain}")
-        if normalized_url:
-            parts.append(f"URL: {normalized_url}")
-        if not parts:
-            return None
-        return "\n\n".join(parts)
-
-    @staticmethod
-    def _parse_article_datetime(article: dict[str, Any]) -> datetime | None:
-        candidates = [
-            article.get("seendate"),
-            article.get("seenDate"),
-            article.get("publishdate"),
-            article.get("published"),
-            article.get("date"),
-        ]
-        for candidate in candidates:
-            parsed = GDELTClient._parse_datetime_value(candidate)
-            if parsed is not None:
-                return parsed
-        return None
-
-    @staticmethod
-    def _parse_datetime_value(raw_value: Any) -> datetime | None:
-        if raw_value is None:
-            return None
-        if isinstance(raw_value, int | float):
-            return datetime.fromtimestamp(float(raw_value), tz=UTC)
-        if not isinstance(raw_value, str):
-            return None
-        stripped = raw_value.strip()
-        if not stripped:
-            return None
-        compact_utc = (
-            len(stripped) == 16
-            and stripped[8] == "T"
-            and stripped.endswith("Z")
-            and stripped[:8].isdigit()
-            and stripped[9:15].isdigit()
-        )
-        if compact_utc:
-            try:
-                return datetime(
-                    int(stripped[0:4]),
-                    int(stripped[4:6]),
-                    int(stripped[6:8]),
-                    int(stripped[9:11]),
-                    int(stripped[11:13]),
-                    int(stripped[13:15]),
-                    tzinfo=UTC,
-                )
-            except ValueError:
-                return None
-        compact_without_tz = len(stripped) == 14 and stripped.isdigit()
-        if compact_without_tz:
-            try:
-                return datetime(
-                    int(stripped[0:4]),
-                    int(stripped[4:6]),
-                    int(stripped[6:8]),
-                    int(stripped[8:10]),
-                    int(stripped[10:12]),
-                    int(stripped[12:14]),
-                    tzinfo=UTC,
-                )
-            except ValueError:
-                return None
-        try:
-            parsed_iso = datetime.fromisoformat(stripped.replace("Z", "+00:00"))
-        except ValueError:
-            return None
-        if parsed_iso.tzinfo is None:
-            return parsed_iso.replace(tzinfo=UTC)
-        return parsed_iso.astimezone(UTC)
+    _matches_filters = staticmethod(matches_query_filters)
+    _oldest_published_at = staticmethod(oldest_published_at)
+    _compose_raw_content = staticmethod(compose_raw_content)
+    _parse_article_datetime = staticmethod(parse_article_datetime)
+    _parse_datetime_value = staticmethod(parse_datetime_value)
+    _split_terms = staticmethod(split_terms)
+    _normalize_language = staticmethod(normalize_language)
 
     @staticmethod
     def _format_gdelt_datetime(value: datetime) -> str:
@@ -810,85 +636,15 @@ class GDELTClient:
     def _normalize_url(url: str) -> str | None:
         return DeduplicationService.normalize_url(url)
 
-    @staticmethod
-    def _split_terms(raw_value: Any) -> list[str]:
-        if raw_value is None:
-            return []
-        if isinstance(raw_value, str):
-            normalized = raw_value.replace("|", ",").replace(";", ",")
-            return [term.strip() for term in normalized.split(",") if term.strip()]
-        if isinstance(raw_value, list):
-            return [str(term).strip() for term in raw_value if str(term).strip()]
-        return []
-
-    @staticmethod
-    def _normalize_language(raw_language: str | None) -> str | None:
-        if raw_language is None:
-            return None
-        normalized = raw_language.strip().lower()
-        if not normalized:
-            return None
-
-        aliases = {
-            "english": "en",
-            "russian": "ru",
-            "ukrainian": "uk",
-            "french": "fr",
-            "spanish": "es",
-            "german": "de",
-            "arabic": "ar",
-            "chinese": "zh",
-        }
-        if normalized in aliases:
-            return aliases[normalized]
-        return normalized
-
     @staticmethod
     def _compute_hash(content: str) -> str:
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
-    @staticmethod
-    def _is_retryable_status(status_code: int) -> bool:
-        return status_code == 429 or status_code >= 500
-
-    @staticmethod
-    def _is_transient_failure(exc: BaseException) -> bool:
-        if isinstance(
-            exc, httpx.TimeoutException | httpx.NetworkError | TimeoutError | asyncio.TimeoutError
-        ):
-            return True
-        if isinstance(exc, httpx.HTTPStatusError):
-            return GDELTClient._is_retryable_status(exc.response.status_code)
-        return False
-
-    @staticmethod
-    def _failure_reason(exc: BaseException) -> str:
-        if isinstance(exc, httpx.TimeoutException | TimeoutError | asyncio.TimeoutError):
-            return "timeout"
-        if isinstance(exc, httpx.NetworkError):
-            return "network"
-        if isinstance(exc, httpx.HTTPStatusError):
-            return f"http_{exc.response.status_code}"
-        return type(exc).__name__.lower()
-
-    @staticmethod
-    def _backoff_seconds(attempt: int) -> float:
-        base = min(float(2**attempt), 30.0)
-        jitter = (time.monotonic_ns() % 250_000_000) / 1_000_000_000
-        return base + jitter
-
-    @staticmethod
-    def _parse_retry_after(raw_retry_after: str | None) -> float | None:
-        if raw_retry_after is None:
-            return None
-        retry_after = raw_retry_after.strip()
-        if not retry_after:
-            return None
-        try:
-            parsed = float(retry_after)
-        except ValueError:
-            return None
-        return parsed if parsed >= 0 else None
+    _is_retryable_status = staticmethod(is_retryable_status)
+    _is_transient_failure = staticmethod(is_transient_failure)
+    _failure_reason = staticmethod(failure_reason)
+    _backoff_seconds = staticmethod(backoff_seconds)
+    _parse_retry_after = staticmethod(parse_retry_after)
 
     @staticmethod
     def _safe_str(value: Any) -> str | None:
@@ -0,0 +1,125 @@
+"""
+GDELT query configuration models and YAML parsing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class GDELTQueryConfig:
+    """GDELT query configuration loaded from YAML."""
+
+    name: str
+    query: str = ""
+    credibility: float = 0.5
+    themes: list[str] = field(default_factory=list)
+    actors: list[str] = field(default_factory=list)
+    countries: list[str] = field(default_factory=list)
+    languages: list[str] = field(default_factory=list)
+    lookback_hours: int = 12
+    max_records_per_page: int = 100
+    max_pages: int = 3
+    source_tier: str = "aggregator"
+    reporting_type: str = "aggregator"
+    enabled: bool = True
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class GDELTSettings:
+    """Global GDELT client settings from YAML."""
+
+    request_timeout_seconds: int = 30
+    user_agent: str = "GeopoliticalIntel/1.0 (GDELT Client)"
+    default_lookback_hours: int = 12
+    default_max_records_per_page: int = 100
+    default_max_pages: int = 3
+
+
+def parse_gdelt_settings(raw_settings: dict[str, Any]) -> GDELTSettings:
+    return GDELTSettings(
+        request_timeout_seconds=int(raw_settings.get("request_timeout_seconds", 30)),
+        user_agent=str(raw_settings.get("user_agent", "GeopoliticalIntel/1.0 (GDELT Client)")),
+        default_lookback_hours=int(raw_settings.get("default_lookback_hours", 12)),
+        default_max_records_per_page=int(raw_settings.get("default_max_records_per_page", 100)),
+        default_max_pages=int(raw_settings.get("default_max_pages", 3)),
+    )
+
+
+def parse_gdelt_queries(
+    raw_settings: dict[str, Any],
+    raw_queries: list[Any],
+) -> list[GDELTQueryConfig]:
+    default_lookback_hours = int(raw_settings.get("default_lookback_hours", 12))
+    default_max_records = int(raw_settings.get("default_max_records_per_page", 100))
+    default_max_pages = int(raw_settings.get("default_max_pages", 3))
+    parsed_queries: list[GDELTQueryConfig] = []
+    for raw_query in raw_queries:
+        if not isinstance(raw_query, dict):
+            continue
+        name = _safe_str(raw_query.get("name"))
+        if name is None:
+            continue
+        query = _safe_str(raw_query.get("query")) or ""
+        themes = parse_str_list(raw_query.get("themes"))
+        actors = parse_str_list(raw_query.get("actors"))
+        if not query and not themes and not actors:
+            continue
+        known_keys = {
+            "name",
+            "query",
+            "credibility",
+            "themes",
+            "actors",
+            "countries",
+            "languages",
+            "lookback_hours",
+            "max_records_per_page",
+            "max_pages",
+            "source_tier",
+            "reporting_type",
+            "enabled",
+        }
+        extra = {key: value for key, value in raw_query.items() if key not in known_keys}
+        parsed_queries.append(
+            GDELTQueryConfig(
+                name=name,
+                query=query,
+                credibility=float(raw_query.get("credibility", 0.5)),
+                themes=themes,
+                actors=actors,
+                countries=parse_str_list(raw_query.get("countries")),
+                languages=parse_str_list(raw_query.get("languages")),
+                lookback_hours=int(raw_query.get("lookback_hours", default_lookback_hours)),
+                max_records_per_page=int(
+                    raw_query.get("max_records_per_page", default_max_records)
+                ),
+                max_pages=int(raw_query.get("max_pages", default_max_pages)),
+                source_tier=str(raw_query.get("source_tier", "aggregator")),
+                reporting_type=str(raw_query.get("reporting_type", "aggregator")),
+                enabled=bool(raw_query.get("enabled", True)),
+                extra=extra,
+            )
+        )
+    return parsed_queries
+
+
+def parse_str_list(raw_value: Any) -> list[str]:
+    if raw_value is None:
+        return []
+    if isinstance(raw_value, str):
+        parts = raw_value.replace(";", ",").split(",")
+        return [part.strip() for part in parts if part.strip()]
+    if isinstance(raw_value, list):
+        return [str(value).strip() for value in raw_value if str(value).strip()]
+    return []
+
+
+def _safe_str(value: Any) -> str | None:
+    if value is None:
+        return None
+    as_str = str(value).strip()
+    return as_str or None
@@ -0,0 +1,53 @@
+"""
+Shared HTTP retry and failure-taxonomy helpers for ingestion collectors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+
+
+def is_retryable_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def is_transient_failure(exc: BaseException) -> bool:
+    if isinstance(
+        exc, httpx.TimeoutException | httpx.NetworkError | TimeoutError | asyncio.TimeoutError
+    ):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return is_retryable_status(exc.response.status_code)
+    return False
+
+
+def failure_reason(exc: BaseException) -> str:
+    if isinstance(exc, httpx.TimeoutException | TimeoutError | asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(exc, httpx.NetworkError):
+        return "network"
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"http_{exc.response.status_code}"
+    return type(exc).__name__.lower()
+
+
+def backoff_seconds(attempt: int) -> float:
+    base = min(float(2**attempt), 30.0)
+    jitter = (time.monotonic_ns() % 250_000_000) / 1_000_000_000
+    return base + jitter
+
+
+def parse_retry_after(raw_retry_after: str | None) -> float | None:
+    if raw_retry_after is None:
+        return None
+    retry_after = raw_retry_after.strip()
+    if not retry_after:
+        return None
+    try:
+        parsed = float(retry_after)
+    except ValueError:
+        return None
+    return parsed if parsed >= 0 else None
@@ -0,0 +1,129 @@
+"""
+Adaptive per-feed polling cadence derived from observed publish intervals.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
+from statistics import median
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import structlog
+from sqlalchemy import func, select
+
+from src.storage.models import RawItem, Source, SourceType
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.ingestion.rss_config import FeedConfig
+
+logger = structlog.get_logger(__name__)
+
+
+def adaptive_poll_interval(
+    published_at: Sequence[datetime],
+    *,
+    default_minutes: int,
+    min_minutes: int,
+    max_minutes: int,
+) -> timedelta:
+    """
+    Return the median gap between recent publications, clamped to the bounds.
+
+    Feeds with fewer than two known publish times keep `default_minutes`.
+    """
+    upper = max(min_minutes, max_minutes)
+    ordered = sorted(_as_utc(value) for value in published_at)
+    gaps = [(later - earlier).total_seconds() / 60 for earlier, later in pairwise(ordered)]
+    minutes = median(gaps) if gaps else float(default_minutes)
+    return timedelta(minutes=min(float(upper), max(float(min_minutes), minutes)))
+
+
+async def load_recent_publish_times(
+    session: AsyncSession,
+    source_ids: Sequence[UUID],
+    *,
+    per_source: int,
+) -> dict[UUID, list[datetime]]:
+    """Load the newest `per_source` publish times of each source in one query."""
+    if not source_ids:
+        return {}
+    ranked = (
+        select(
+            RawItem.source_id,
+            RawItem.published_at,
+            func.row_number()
+            .over(partition_by=RawItem.source_id, order_by=RawItem.published_at.desc())
+            .label("recency_rank"),
+        )
+        .where(RawItem.source_id.in_(source_ids), RawItem.published_at.is_not(None))
+        .subquery()
+    )
+    rows = await session.execute(
+        select(ranked.c.source_id, ranked.c.published_at).where(ranked.c.recency_rank <= per_source)
+    )
+    history: dict[UUID, list[datetime]] = {}
+    for source_id, published_at in rows.all():
+        history.setdefault(source_id, []).append(published_at)
+    return history
+
+
+async def select_due_feeds(
+    session: AsyncSession,
+    feeds: Sequence[FeedConfig],
+    *,
+    min_minutes: int,
+    max_minutes: int,
+    history_size: int,
+    now: datetime | None = None,
+) -> list[FeedConfig]:
+    """
+    Return the feeds whose adaptive poll interval has elapsed since their last fetch.
+
+    Feeds without a source row or a previous fetch are always due.
+    """
+    if not feeds:
+        return []
+    now_utc = _as_utc(now or datetime.now(tz=UTC))
+    source_rows = (
+        await session.execute(
+            select(Source.url, Source.id, Source.last_fetched_at).where(
+                Source.type == SourceType.RSS,
+                Source.url.in_([feed.url for feed in feeds]),
+            )
+        )
+    ).all()
+    sources = {url: (source_id, last_fetched_at) for url, source_id, last_fetched_at in source_rows}
+    history = await load_recent_publish_times(
+        session,
+        [source_id for source_id, _last_fetched_at in sources.values()],
+        per_source=history_size,
+    )
+
+    due: list[FeedConfig] = []
+    for feed in feeds:
+        source_id, last_fetched_at = sources.get(feed.url, (None, None))
+        if source_id is None or last_fetched_at is None:
+            due.append(feed)
+            continue
+        interval = adaptive_poll_interval(
+            history.get(source_id, []),
+            default_minutes=feed.check_interval_minutes,
+            min_minutes=min_minutes,
+            max_minutes=max_minutes,
+        )
+        if _as_utc(last_fetched_at) + interval <= now_utc:
+            due.append(feed)
+
+    logger.info("RSS feeds due for polling", due=len(due), total=len(feeds))
+    return due
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
@@ -6,34 +6,227 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, cast
 from urllib.parse import urlparse
 
+import redis
+import structlog
+
+from src.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+def domain_key(url: str) -> str:
+    """Return the normalized domain bucket used for per-domain throttling."""
+    return urlparse(url).netloc.lower() or "unknown-domain"
 
-class DomainRateLimiter:
-    """
-    Limits requests to a configurable rate per domain.
-    """
 
-    def __init__(self, requests_per_second: float = 1.0) -> None:
-        if requests_per_second <= 0:
+@dataclass(frozen=True, slots=True)
+class DomainRateLimit:
+    """Token-bucket budget for one domain."""
+
+    requests_per_second: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.requests_per_second <= 0:
             msg = "requests_per_second must be > 0"
             raise ValueError(msg)
-        self._interval_seconds = 1.0 / requests_per_second
-        self._last_request_at: dict[str, float] = {}
-        self._locks: dict[str, asyncio.Lock] = {}
+        if self.burst < 1:
+            msg = "burst must be >= 1"
+            raise ValueError(msg)
+
+
+class TokenBucketRateLimiter:
+    """
+    Per-domain token buckets shared by concurrent callers.
+
+    Each domain starts with `burst` tokens refilled at `requests_per_second`
+    unless `domain_overrides` sets its own budget. A call reserves a token up
+    front and sleeps off any deficit, so waiters are served in arrival order and
+    the long-run rate never exceeds the budget however many tasks share the limiter.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 1.0,
+        burst: int = 1,
+        domain_overrides: Mapping[str, DomainRateLimit] | None = None,
+    ) -> None:
+        self._default_limit = DomainRateLimit(requests_per_second=requests_per_second, burst=burst)
+        self._domain_overrides: dict[str, DomainRateLimit] = {}
+        self._tokens: dict[str, float] = {}
+        self._refilled_at: dict[str, float] = {}
+        self.set_domain_overrides(domain_overrides or {})
+
+    def set_domain_overrides(self, overrides: Mapping[str, DomainRateLimit]) -> None:
+        """Replace per-domain budgets, e.g. after a config hot-reload."""
+        self._domain_overrides = {domain.lower(): limit for domain, limit in overrides.items()}
+
+    def limit_for(self, domain: str) -> DomainRateLimit:
+        """Return the budget applied to a domain bucket."""
+        return self._domain_overrides.get(domain, self._default_limit)
+
+    async def wait(self, url: str) -> None:
+        """
+        Waits until a token is available for the URL's domain, then consumes it.
+        """
+        delay = self._reserve_local(domain_key(url), penalty_seconds=0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def penalize(self, url: str, retry_after_seconds: float) -> None:
+        """
+        Drain the URL's domain bucket so the next request waits out `Retry-After`.
+        """
+        self._reserve_local(domain_key(url), penalty_seconds=retry_after_seconds)
+
+    def _reserve_local(self, domain: str, *, penalty_seconds: float) -> float:
+        limit = self.limit_for(domain)
+        now = time.monotonic()
+        elapsed = now - self._refilled_at.get(domain, now)
+        tokens = min(
+            float(limit.burst),
+            self._tokens.get(domain, float(limit.burst)) + elapsed * limit.requests_per_second,
+        )
+        delay = 0.0
+        if penalty_seconds > 0:
+            tokens = min(tokens, -penalty_seconds * limit.requests_per_second)
+        else:
+            tokens -= 1
+            delay = max(0.0, -tokens / limit.requests_per_second)
+        self._tokens[domain] = tokens
+        self._refilled_at[domain] = now
+        return delay
+
+
+class SharedTokenBucketRateLimiter(TokenBucketRateLimiter):
+    """
+    Token buckets shared by every ingestion worker through Redis.
+
+    Buckets live in Redis hashes updated by one Lua script, registered once and
+    run by SHA, that reads the Redis server clock, so workers on different hosts draw from the same per-domain
+    budget. When the shared backend is disabled or unreachable the limiter falls
+    back to the in-process buckets and retries Redis after a short cool-down.
+    """
+
+    _DEGRADE_RETRY_SECONDS = 30
+    _TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local penalty_ms = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now_ms = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+
+local state = redis.call("HMGET", key, "tokens", "ts")
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+  tokens = burst
+  ts = now_ms
+end
+if now_ms > ts then
+  tokens = math.min(burst, tokens + (now_ms - ts) * rate / 1000)
+  ts = now_ms
+end
+
+local wait_ms = 0
+if penalty_ms > 0 then
+  tokens = math.min(tokens, -penalty_ms * rate / 1000)
+else
+  tokens = tokens - 1
+  if tokens < 0 then
+    wait_ms = math.ceil(-tokens * 1000 / rate)
+  end
+end
+redis.call("HSET", key, "tokens", tostring(tokens), "ts", tostring(ts))
+redis.call("PEXPIRE", key, math.ceil((burst - tokens) * 1000 / rate) + 1000)
+return wait_ms
+"""
+
+    def __init__(
+        self,
+        requests_per_second: float = 1.0,
+        burst: int = 1,
+        domain_overrides: Mapping[str, DomainRateLimit] | None = None,
+        *,
+        enabled: bool | None = None,
+        redis_prefix: str | None = None,
+        redis_url: str | None = None,
+        redis_client: redis.Redis[str] | None = None,
+    ) -> None:
+        super().__init__(
+            requests_per_second=requests_per_second,
+            burst=burst,
+            domain_overrides=domain_overrides,
+        )
+        self.enabled = (
+            settings.INGESTION_RATE_LIMIT_DISTRIBUTED if enabled is None else bool(enabled)
+        )
+        self.redis_prefix = (
+            settings.INGESTION_RATE_LIMIT_REDIS_PREFIX
+            if redis_prefix is None
+            else str(redis_prefix).strip()
+        )
+        if not self.redis_prefix:
+            self.redis_prefix = "horadus:ingestion_rate_limit"
+        self.redis_url = settings.REDIS_URL if redis_url is None else str(redis_url).strip()
+        self._redis_client = redis_client
+        self._token_bucket_script: Any = None
+        self._backend_unavailable_until = 0.0
 
     async def wait(self, url: str) -> None:
         """
-        Waits if needed so requests to the same domain respect the configured rate.
-        """
-        domain = urlparse(url).netloc.lower() or "unknown-domain"
-        lock = self._locks.setdefault(domain, asyncio.Lock())
-        async with lock:
-            now = time.monotonic()
-            last_request_at = self._last_request_at.get(domain)
-            if last_request_at is not None:
-                elapsed = now - last_request_at
-                remaining = self._interval_seconds - elapsed
-                if remaining > 0:
-                    await asyncio.sleep(remaining)
-            self._last_request_at[domain] = time.monotonic()
+        Waits until the shared bucket for the URL's domain grants a token.
+        """
+        domain = domain_key(url)
+        delay = await self._reserve_shared(domain, penalty_seconds=0.0)
+        if delay is None:
+            delay = self._reserve_local(domain, penalty_seconds=0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def penalize(self, url: str, retry_after_seconds: float) -> None:
+        """
+        Drain the shared bucket so every worker waits out `Retry-After`.
+        """
+        domain = domain_key(url)
+        self._reserve_local(domain, penalty_seconds=retry_after_seconds)
+        await self._reserve_shared(domain, penalty_seconds=retry_after_seconds)
+
+    async def _reserve_shared(self, domain: str, *, penalty_seconds: float) -> float | None:
+        if not self.enabled or time.monotonic() < self._backend_unavailable_until:
+            return None
+        limit = self.limit_for(domain)
+        try:
+            wait_ms = await asyncio.to_thread(
+                self._script(),
+                keys=[f"{self.redis_prefix}:{domain}"],
+                args=[limit.requests_per_second, limit.burst, round(penalty_seconds * 1000)],
+            )
+        except Exception as exc:
+            self._backend_unavailable_until = time.monotonic() + self._DEGRADE_RETRY_SECONDS
+            logger.warning(
+                "Ingestion rate limit backend degraded to memory",
+                error=str(exc),
+                retry_after_seconds=self._DEGRADE_RETRY_SECONDS,
+            )
+            return None
+        return int(wait_ms) / 1000
+
+    def _script(self) -> Any:
+        # Registered once; redis-py runs it with EVALSHA and reloads it on NOSCRIPT.
+        if self._token_bucket_script is None:
+            self._token_bucket_script = cast("Any", self._client()).register_script(
+                self._TOKEN_BUCKET_LUA
+            )
+        return self._token_bucket_script
+
+    def _client(self) -> redis.Redis[str]:
+        if self._redis_client is None:
+            self._redis_client = redis.Redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis_client
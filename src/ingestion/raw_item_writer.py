@@ -0,0 +1,169 @@
+"""
+Buffered multi-row RawItem writer shared by ingestion collectors.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.processing.deduplication_service import DuplicateCandidate
+from src.processing.text_fingerprint import minhash_bands, minhash_signature
+from src.storage.models import ProcessingStatus, RawItem
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.processing.deduplication_service import DeduplicationService
+
+logger = structlog.get_logger(__name__)
+
+# Thirteen bound parameters per row keeps one statement under the PostgreSQL 65535 cap.
+_MAX_ROWS_PER_STATEMENT = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class RawItemCandidate:
+    """Column values for one RawItem awaiting insert."""
+
+    source_id: UUID
+    external_id: str
+    url: str | None
+    title: str | None
+    author: str | None
+    published_at: datetime | None
+    raw_content: str
+    content_hash: str
+    language: str | None
+
+
+@dataclass(slots=True)
+class FlushResult:
+    """Outcome of one writer flush."""
+
+    inserted_ids: list[UUID] = field(default_factory=list)
+    skipped: int = 0
+
+
+class RawItemWriter:
+    """
+    Buffers RawItem candidates and writes them with one INSERT ... ON CONFLICT DO NOTHING.
+
+    `add` rejects candidates that share an external_id, URL, or content hash with
+    one already buffered. `flush` fingerprints each text with MinHash; with a
+    `deduplication_service` it first drops candidates matching stored rows of the
+    dedup window exactly or by MinHash through `find_duplicates_bulk`, then
+    records the written keys in its recent-key filter. `flush` reports the ids
+    actually inserted so collectors keep stored/skipped counts exact when a
+    concurrent run inserts the same item first.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        deduplication_service: DeduplicationService | None = None,
+        dedup_window_days: int = 7,
+    ) -> None:
+        self.session = session
+        self.deduplication_service = deduplication_service
+        self.dedup_window_days = dedup_window_days
+        self._pending: list[RawItemCandidate] = []
+        self._keys: set[tuple[str, str]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered candidates not yet written."""
+        return len(self._pending)
+
+    def add(self, candidate: RawItemCandidate) -> bool:
+        """Buffer a candidate; return False when it duplicates a buffered one."""
+        keys = {
+            ("external_id", candidate.external_id),
+            ("content_hash", candidate.content_hash),
+        }
+        if candidate.url is not None:
+            keys.add(("url", candidate.url))
+        if not keys.isdisjoint(self._keys):
+            return False
+        self._keys.update(keys)
+        self._pending.append(candidate)
+        return True
+
+    async def flush(self) -> FlushResult:
+        """Write buffered candidates and return the ids that were inserted."""
+        candidates = self._pending
+        self._pending = []
+        self._keys = set()
+        if not candidates:
+            return FlushResult()
+        buffered = len(candidates)
+        kept = await self._drop_stored_duplicates(
+            [(candidate, _dedup_candidate(candidate)) for candidate in candidates]
+        )
+
+        inserted_ids: list[UUID] = []
+        for start in range(0, len(kept), _MAX_ROWS_PER_STATEMENT):
+            chunk = kept[start : start + _MAX_ROWS_PER_STATEMENT]
+            statement = (
+                pg_insert(RawItem)
+                .values([_row(candidate, dedup.minhash) for candidate, dedup in chunk])
+                .on_conflict_do_nothing(constraint="uq_source_external")
+                .returning(RawItem.id)
+            )
+            inserted_ids.extend((await self.session.scalars(statement)).all())
+        if self.deduplication_service is not None and inserted_ids:
+            await self.deduplication_service.record_stored([dedup for _candidate, dedup in kept])
+
+        raced = len(kept) - len(inserted_ids)
+        if raced:
+            logger.debug("Duplicate raw items skipped on insert race", skipped=raced)
+        return FlushResult(inserted_ids=inserted_ids, skipped=buffered - len(inserted_ids))
+
+    async def _drop_stored_duplicates(
+        self,
+        candidates: list[tuple[RawItemCandidate, DuplicateCandidate]],
+    ) -> list[tuple[RawItemCandidate, DuplicateCandidate]]:
+        if self.deduplication_service is None:
+            return candidates
+        results = await self.deduplication_service.find_duplicates_bulk(
+            [dedup for _candidate, dedup in candidates],
+            dedup_window_days=self.dedup_window_days,
+        )
+        return [
+            pair
+            for pair, result in zip(candidates, results, strict=True)
+            if not result.is_duplicate
+        ]
+
+
+def _dedup_candidate(candidate: RawItemCandidate) -> DuplicateCandidate:
+    return DuplicateCandidate(
+        external_id=candidate.external_id,
+        url=candidate.url,
+        content_hash=candidate.content_hash,
+        minhash=minhash_signature(candidate.raw_content),
+    )
+
+
+def _row(candidate: RawItemCandidate, signature: list[int] | None) -> dict[str, Any]:
+    return {
+        "id": uuid4(),
+        "source_id": candidate.source_id,
+        "external_id": candidate.external_id,
+        "url": candidate.url,
+        "title": candidate.title,
+        "author": candidate.author,
+        "published_at": candidate.published_at,
+        "raw_content": candidate.raw_content,
+        "content_hash": candidate.content_hash,
+        "minhash_signature": signature,
+        "minhash_bands": minhash_bands(signature) if signature is not None else None,
+        "language": candidate.language,
+        "processing_status": ProcessingStatus.PENDING,
+    }
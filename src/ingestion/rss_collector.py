@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import calendar
+import copy
 import hashlib
 import time
 from dataclasses import dataclass, field
@@ -19,45 +20,41 @@ import httpx
 import structlog
 import yaml
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
-from src.ingestion.content_extractor import ContentExtractor
-from src.ingestion.rate_limiter import DomainRateLimiter
+from src.ingestion.article_cache import ArticleCache, get_article_cache
+from src.ingestion.concurrency import (
+    DomainConcurrencyLimiter,
+    SessionFactory,
+    run_bounded,
+    run_in_session,
+)
+from src.ingestion.content_extractor import ExtractionExecutor, get_extraction_executor
+from src.ingestion.feed_validators import FeedValidators, body_hash
+from src.ingestion.http_retry import (
+    backoff_seconds,
+    failure_reason,
+    is_retryable_status,
+    is_transient_failure,
+    parse_retry_after,
+)
+from src.ingestion.poll_scheduler import select_due_feeds
+from src.ingestion.rate_limiter import SharedTokenBucketRateLimiter
+from src.ingestion.raw_item_writer import RawItemCandidate, RawItemWriter
+from src.ingestion.rss_config import (
+    CollectorSettings,
+    FeedConfig,
+    parse_collector_settings,
+    parse_feed_configs,
+)
 from src.processing.corroboration_provenance import refresh_events_for_source
 from src.processing.deduplication_service import DeduplicationService
-from src.storage.models import ProcessingStatus, RawItem, Source, SourceType
+from src.storage.models import Source, SourceType
 
 logger = structlog.get_logger(__name__)
 
 
-@dataclass(slots=True)
-class FeedConfig:
-    """RSS feed configuration loaded from YAML."""
-
-    name: str
-    url: str
-    credibility: float
-    categories: list[str] = field(default_factory=list)
-    check_interval_minutes: int = 30
-    max_items_per_fetch: int = 200
-    language: str | None = None
-    source_tier: str = "regional"
-    reporting_type: str = "secondary"
-    enabled: bool = True
-    extra: dict[str, Any] = field(default_factory=dict)
-
-
-@dataclass(slots=True)
-class CollectorSettings:
-    """Global collector settings from YAML."""
-
-    request_timeout_seconds: int = 30
-    user_agent: str = "GeopoliticalIntel/1.0 (RSS Collector)"
-    default_lookback_hours: int = 12
-
-
 @dataclass(slots=True)
 class CollectionResult:
     """Outcome metrics for one feed collection run."""
@@ -87,21 +84,40 @@ class RSSCollector:
         http_client: httpx.AsyncClient,
         config_path: str = "config/sources/rss_feeds.yaml",
         requests_per_second: float = 1.0,
+        session_factory: SessionFactory | None = None,
+        extraction_executor: ExtractionExecutor | None = None,
+        article_cache: ArticleCache | None = None,
     ) -> None:
         self.session = session
+        self.session_factory = session_factory
         self.http_client = http_client
         self.config_path = Path(config_path)
-        self.rate_limiter = DomainRateLimiter(requests_per_second=requests_per_second)
+        self.rate_limiter = SharedTokenBucketRateLimiter(
+            requests_per_second=requests_per_second,
+            burst=settings.RSS_COLLECTOR_DOMAIN_BURST,
+        )
 
         self.settings = CollectorSettings()
         self._feeds: list[FeedConfig] = []
         self._config_mtime: float | None = None
 
         self.feed_total_timeout_seconds = settings.RSS_COLLECTOR_TOTAL_TIMEOUT_SECONDS
+        self.max_concurrent_feeds = settings.RSS_COLLECTOR_MAX_CONCURRENT_FEEDS
+        self.max_concurrent_per_domain = settings.RSS_COLLECTOR_MAX_CONCURRENT_PER_DOMAIN
+        self.adaptive_polling = settings.RSS_ADAPTIVE_POLLING_ENABLED
         self.article_timeout_seconds = 30
+        self.extraction_executor = extraction_executor or get_extraction_executor()
+        self.article_cache = article_cache or get_article_cache()
         self.max_retries = 3
         self.dedup_window_days = 7
         self.deduplication_service = DeduplicationService(session=session)
+        self.raw_item_writer = RawItemWriter(
+            session,
+            deduplication_service=self.deduplication_service,
+            dedup_window_days=self.dedup_window_days,
+        )
+        self.store_batch_size = 50
+        self._pending_validators: dict[Any, FeedValidators] = {}
 
     @property
     def feeds(self) -> list[FeedConfig]:
@@ -137,6 +153,7 @@ class RSSCollector:
 
         self.settings = self._parse_settings(settings_config)
         self._feeds = self._parse_feeds(settings_config, feeds_config)
+        self.rate_limiter.set_domain_overrides(self.settings.domain_rate_limits)
         self._config_mtime = mtime
 
         logger.info(
@@ -148,14 +165,77 @@ class RSSCollector:
     async def collect_all(self) -> list[CollectionResult]:
         """
         Collect from all enabled feeds.
+
+        With `adaptive_polling`, only feeds whose observed publish cadence makes
+        them due are collected. With a `session_factory` and
+        `max_concurrent_feeds > 1`, feeds run concurrently, each in its own
+        session and transaction.
         """
         await self.load_config()
-        results: list[CollectionResult] = []
-        for feed in self._feeds:
-            if not feed.enabled:
-                continue
-            results.append(await self.collect_feed(feed))
-        return results
+        feeds = [feed for feed in self._feeds if feed.enabled]
+        if self.adaptive_polling:
+            feeds = await select_due_feeds(
+                self.session,
+                feeds,
+                min_minutes=settings.RSS_ADAPTIVE_POLL_MIN_MINUTES,
+                max_minutes=settings.RSS_ADAPTIVE_POLL_MAX_MINUTES,
+                history_size=settings.RSS_ADAPTIVE_POLL_HISTORY_SIZE,
+            )
+        session_factory = self.session_factory
+        if session_factory is None or self.max_concurrent_feeds <= 1:
+            return [await self.collect_feed(feed) for feed in feeds]
+
+        limiter = DomainConcurrencyLimiter(
+            max_concurrency=self.max_concurrent_feeds,
+            max_per_domain=self.max_concurrent_per_domain,
+        )
+        return await run_bounded(
+            feeds,
+            url_for=lambda feed: feed.url,
+            worker=lambda feed: self._collect_feed_isolated(feed, session_factory),
+            limiter=limiter,
+        )
+
+    async def _collect_feed_isolated(
+        self,
+        feed: FeedConfig,
+        session_factory: SessionFactory,
+    ) -> CollectionResult:
+        """
+        Collect one feed in a dedicated session and commit it independently.
+        """
+        return await run_in_session(
+            session_factory,
+            lambda session: self._bind_session(session).collect_feed(feed),
+            on_failure=lambda exc: self._rolled_back_result(feed, exc),
+        )
+
+    def _rolled_back_result(self, feed: FeedConfig, exc: Exception) -> CollectionResult:
+        failure_reason = self._failure_reason(exc)
+        logger.warning(
+            "RSS feed collection rolled back",
+            feed=feed.name,
+            source_url=feed.url,
+            error=str(exc),
+            failure_reason=failure_reason,
+        )
+        return CollectionResult(
+            feed_name=feed.name,
+            errors=[f"[terminal] Feed collection failed ({failure_reason}): {exc}"],
+            terminal_errors=1,
+        )
+
+    def _bind_session(self, session: AsyncSession) -> RSSCollector:
+        """Return a shallow copy sharing HTTP/rate-limit state that writes through `session`."""
+        bound = copy.copy(self)
+        bound.session = session
+        bound.deduplication_service = DeduplicationService(session=session)
+        bound.raw_item_writer = RawItemWriter(
+            session,
+            deduplication_service=bound.deduplication_service,
+            dedup_window_days=bound.dedup_window_days,
+        )
+        return bound
 
     async def collect_feed(self, feed: FeedConfig) -> CollectionResult:
         """
@@ -180,35 +260,12 @@ class RSSCollector:
             actual_start=window_start.isoformat(),
         )
 
-        published_timestamps: list[datetime] = []
-
         try:
             async with asyncio.timeout(self.feed_total_timeout_seconds):
-                parsed_feed = await self._fetch_feed(feed.url)
-                entries = list(getattr(parsed_feed, "entries", []))
-                result.items_fetched = min(len(entries), feed.max_items_per_fetch)
-
-                for entry in entries[: feed.max_items_per_fetch]:
-                    entry_data = dict(entry) if hasattr(entry, "items") else {}
-                    published_at = self._parse_published_at(entry_data)
-                    if published_at is not None:
-                        published_timestamps.append(published_at)
-                    try:
-                        was_stored = await self._process_entry(source, feed, entry)
-                    except Exception as exc:
-                        logger.warning(
-                            "RSS entry processing failed",
-                            feed=feed.name,
-                            source_url=feed.url,
-                            error=str(exc),
-                        )
-                        result.errors.append(str(exc))
-                        continue
-
-                    if was_stored:
-                        result.items_stored += 1
-                    else:
-                        result.items_skipped += 1
+                parsed_feed = await self._fetch_feed(feed.url, source=source)
+                entries = list(getattr(parsed_feed, "entries", []))[: feed.max_items_per_fetch]
+                result.items_fetched = len(entries)
+                published_timestamps = await self._process_entries(source, feed, entries, result)
         except Exception as exc:
             failure_class = "transient" if self._is_transient_failure(exc) else "terminal"
             failure_reason = self._failure_reason(exc)
@@ -259,13 +316,64 @@ class RSSCollector:
         )
         return result
 
+    async def _process_entries(
+        self,
+        source: Source,
+        feed: FeedConfig,
+        entries: list[Any],
+        result: CollectionResult,
+    ) -> list[datetime]:
+        """
+        Process feed entries and return their published timestamps.
+
+        Links already stored are skipped with one bulk lookup before any article
+        is fetched; the content-hash check still runs after extraction.
+        """
+        known_urls = await self.deduplication_service.find_existing_identifiers(
+            [url for entry in entries if (url := self._entry_normalized_url(entry)) is not None],
+            dedup_window_days=self.dedup_window_days,
+            source_id=getattr(source, "id", None),
+        )
+        published_timestamps: list[datetime] = []
+        for entry in entries:
+            entry_data = dict(entry) if hasattr(entry, "items") else {}
+            published_at = self._parse_published_at(entry_data)
+            if published_at is not None:
+                published_timestamps.append(published_at)
+            if self._entry_normalized_url(entry) in known_urls:
+                result.items_skipped += 1
+                continue
+            try:
+                was_stored = await self._process_entry(source, feed, entry)
+            except Exception as exc:
+                logger.warning(
+                    "RSS entry processing failed",
+                    feed=feed.name,
+                    source_url=feed.url,
+                    error=str(exc),
+                )
+                result.errors.append(str(exc))
+                # Keep the previous validators so the next poll refetches the body.
+                self._pending_validators.pop(getattr(source, "id", None), None)
+                continue
+
+            if was_stored:
+                result.items_stored += 1
+            else:
+                result.items_skipped += 1
+            if self.raw_item_writer.pending >= self.store_batch_size:
+                await self._flush_items(result)
+        await self._flush_items(result)
+        return published_timestamps
+
+    async def _flush_items(self, result: CollectionResult) -> None:
+        flushed = await self.raw_item_writer.flush()
+        result.items_stored -= flushed.skipped
+        result.items_skipped += flushed.skipped
+
     async def _process_entry(self, source: Source, feed: FeedConfig, entry: Any) -> bool:
         entry_data = dict(entry) if hasattr(entry, "items") else {}
-        raw_link = self._entry_link(entry_data)
-        if raw_link is None:
-            return False
-
-        normalized_url = self._normalize_url(raw_link)
+        normalized_url = self._entry_normalized_url(entry)
         if normalized_url is None:
             return False
 
@@ -278,27 +386,50 @@ class RSSCollector:
         if content is None:
             return False
 
-        content_hash = self._compute_hash(content)
-        if await self._is_duplicate(normalized_url, content_hash):
-            return False
-
-        stored_item = await self._store_item(
+        return await self._store_item(
             source=source,
             feed=feed,
             entry=entry_data,
             normalized_url=normalized_url,
             title=title,
             content=content,
-            content_hash=content_hash,
+            content_hash=self._compute_hash(content),
         )
-        return stored_item is not None
 
-    async def _fetch_feed(self, url: str) -> feedparser.FeedParserDict:
-        raw_feed = await self._fetch_with_retries(
+    async def _fetch_feed(
+        self,
+        url: str,
+        source: Source | None = None,
+    ) -> feedparser.FeedParserDict:
+        """
+        Fetch and parse a feed, short-circuiting when it is unchanged since the last poll.
+
+        Stored validators are sent as conditional headers. A `304` or a body hash
+        identical to the last successful poll yields an empty parse; fresh
+        validators are persisted only once the collection run succeeds with
+        every entry processed.
+        """
+        validators = FeedValidators.from_source(source) if source is not None else FeedValidators()
+        response = await self._request_with_retries(
             url=url,
             timeout_seconds=self.settings.request_timeout_seconds,
+            headers=validators.request_headers(),
         )
-        parsed = feedparser.parse(raw_feed)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.info("RSS feed not modified", url=url, reason="status_304")
+            return feedparser.FeedParserDict(entries=[])
+
+        content_hash = body_hash(response.content)
+        if source is not None:
+            self._pending_validators[source.id] = FeedValidators.from_response(
+                response,
+                body_hash=content_hash,
+            )
+        if validators.body_hash == content_hash:
+            logger.info("RSS feed not modified", url=url, reason="body_hash")
+            return feedparser.FeedParserDict(entries=[])
+
+        parsed = feedparser.parse(response.text)
 
         if getattr(parsed, "bozo", False):
             logger.warning(
@@ -310,17 +441,41 @@ class RSSCollector:
         return parsed
 
     async def _extract_content(self, url: str) -> str | None:
+        cached = await self.article_cache.get(url)
+        if cached is not None and self.article_cache.is_fresh(cached):
+            return cached.text
+
         try:
-            html = await self._fetch_with_retries(
+            response = await self._request_with_retries(
                 url=url,
                 timeout_seconds=self.article_timeout_seconds,
+                headers=cached.validators.request_headers() if cached is not None else None,
             )
         except Exception as exc:
             logger.debug("Article fetch failed; fallback to summary", url=url, error=str(exc))
-            return None
-        return ContentExtractor.extract_text(html)
+            return cached.text if cached is not None else None
 
-    async def _fetch_with_retries(self, url: str, timeout_seconds: int) -> str:
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            validators = cached.validators
+        else:
+            validators = FeedValidators.from_response(
+                response,
+                body_hash=body_hash(response.content),
+            )
+        if cached is not None and validators.body_hash == cached.validators.body_hash:
+            text: str | None = cached.text
+        else:
+            text = await self.extraction_executor.extract_text(response.text)
+        if text is not None:
+            await self.article_cache.put(url, text, validators)
+        return text
+
+    async def _request_with_retries(
+        self,
+        url: str,
+        timeout_seconds: int,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
         max_attempts = self.max_retries + 1
 
         for attempt in range(max_attempts):
@@ -330,18 +485,21 @@ class RSSCollector:
                     url,
                     timeout=timeout_seconds,
                     follow_redirects=True,
-                    headers={"User-Agent": self.settings.user_agent},
+                    headers={"User-Agent": self.settings.user_agent, **(headers or {})},
                 )
-                response.raise_for_status()
-                return response.text
+                if response.status_code != httpx.codes.NOT_MODIFIED:
+                    response.raise_for_status()
+                return response
             except httpx.HTTPStatusError as exc:
                 status_code = exc.response.status_code
                 should_retry = self._is_retryable_status(status_code)
                 if not should_retry or attempt + 1 >= max_attempts:
                     raise
                 retry_after = self._parse_retry_after(exc.response.headers.get("Retry-After"))
-                delay = retry_after if retry_after is not None else self._backoff_seconds(attempt)
-                await asyncio.sleep(delay)
+                if retry_after is not None:
+                    await self.rate_limiter.penalize(url, retry_after)
+                else:
+                    await asyncio.sleep(self._backoff_seconds(attempt))
             except (httpx.TimeoutException, httpx.NetworkError):
                 if attempt + 1 >= max_attempts:
                     raise
@@ -403,15 +561,6 @@ class RSSCollector:
             await refresh_events_for_source(session=self.session, source_id=source.id)
         return source
 
-    async def _is_duplicate(self, normalized_url: str, content_hash: str) -> bool:
-        result = await self.deduplication_service.find_duplicate(
-            external_id=normalized_url,
-            url=normalized_url,
-            content_hash=content_hash,
-            dedup_window_days=self.dedup_window_days,
-        )
-        return result.is_duplicate
-
     async def _store_item(
         self,
         source: Source,
@@ -421,33 +570,22 @@ class RSSCollector:
         title: str | None,
         content: str,
         content_hash: str,
-    ) -> RawItem | None:
-        language = self._safe_str(entry.get("language")) or feed.language
-        published_at = self._parse_published_at(entry)
-        author = self._safe_str(entry.get("author"))
-
-        item = RawItem(
-            source_id=source.id,
-            external_id=normalized_url,
-            url=normalized_url,
-            title=title,
-            author=author,
-            published_at=published_at,
-            raw_content=content,
-            content_hash=content_hash,
-            language=language,
-            processing_status=ProcessingStatus.PENDING,
+    ) -> bool:
+        """Queue an entry for the next bulk insert; False when it repeats a queued item."""
+        return self.raw_item_writer.add(
+            RawItemCandidate(
+                source_id=source.id,
+                external_id=normalized_url,
+                url=normalized_url,
+                title=title,
+                author=self._safe_str(entry.get("author")),
+                published_at=self._parse_published_at(entry),
+                raw_content=content,
+                content_hash=content_hash,
+                language=self._safe_str(entry.get("language")) or feed.language,
+            )
         )
 
-        try:
-            async with self.session.begin_nested():
-                self.session.add(item)
-                await self.session.flush()
-        except IntegrityError:
-            logger.debug("Duplicate item skipped on insert race", url=normalized_url)
-            return None
-        return item
-
     def _determine_collection_window(
         self,
         *,
@@ -481,6 +619,9 @@ class RSSCollector:
         return value.astimezone(UTC)
 
     async def _record_source_success(self, source: Source, *, window_end: datetime) -> None:
+        validators = self._pending_validators.pop(source.id, None)
+        if validators is not None:
+            validators.apply_to(source)
         source.last_fetched_at = datetime.now(tz=UTC)
         source.ingestion_window_end_at = self._as_utc(window_end)
         source.error_count = 0
@@ -488,75 +629,13 @@ class RSSCollector:
         await self.session.flush()
 
     async def _record_source_failure(self, source: Source, error: str) -> None:
+        self._pending_validators.pop(source.id, None)
         source.error_count = source.error_count + 1
         source.last_error = error[:1000]
         await self.session.flush()
 
-    @staticmethod
-    def _parse_settings(raw_settings: dict[str, Any]) -> CollectorSettings:
-        timeout_value = raw_settings.get("request_timeout_seconds", 30)
-        user_agent = raw_settings.get("user_agent", "GeopoliticalIntel/1.0 (RSS Collector)")
-        return CollectorSettings(
-            request_timeout_seconds=int(timeout_value),
-            user_agent=str(user_agent),
-            default_lookback_hours=int(raw_settings.get("default_lookback_hours", 12)),
-        )
-
-    @staticmethod
-    def _parse_feeds(
-        raw_settings: dict[str, Any],
-        raw_feeds: list[Any],
-    ) -> list[FeedConfig]:
-        default_interval = int(raw_settings.get("default_check_interval_minutes", 30))
-        default_max_items = int(raw_settings.get("default_max_items_per_fetch", 200))
-
-        parsed_feeds: list[FeedConfig] = []
-        for raw_feed in raw_feeds:
-            if not isinstance(raw_feed, dict):
-                continue
-            name = str(raw_feed.get("name", "")).strip()
-            url = str(raw_feed.get("url", "")).strip()
-            if not name or not url:
-                continue
-
-            categories_raw = raw_feed.get("categories", [])
-            categories = (
-                [str(category) for category in categories_raw]
-                if isinstance(categories_raw, list)
-                else []
-            )
-            known_keys = {
-                "name",
-                "url",
-                "credibility",
-                "categories",
-                "check_interval_minutes",
-                "max_items_per_fetch",
-                "language",
-                "source_tier",
-                "reporting_type",
-                "enabled",
-            }
-            extra = {key: value for key, value in raw_feed.items() if key not in known_keys}
-
-            parsed_feeds.append(
-                FeedConfig(
-                    name=name,
-                    url=url,
-                    credibility=float(raw_feed.get("credibility", 0.5)),
-                    categories=categories,
-                    check_interval_minutes=int(
-                        raw_feed.get("check_interval_minutes", default_interval)
-                    ),
-                    max_items_per_fetch=int(raw_feed.get("max_items_per_fetch", default_max_items)),
-                    language=RSSCollector._safe_str(raw_feed.get("language")),
-                    source_tier=str(raw_feed.get("source_tier", "regional")),
-                    reporting_type=str(raw_feed.get("reporting_type", "secondary")),
-                    enabled=bool(raw_feed.get("enabled", True)),
-                    extra=extra,
-                )
-            )
-        return parsed_feeds
+    _parse_settings = staticmethod(parse_collector_settings)
+    _parse_feeds = staticmethod(parse_feed_configs)
 
     @staticmethod
     def _extract_summary(entry: dict[str, Any]) -> str | None:
@@ -577,6 +656,11 @@ class RSSCollector:
     def _entry_link(entry: dict[str, Any]) -> str | None:
         return RSSCollector._safe_str(entry.get("link") or entry.get("id"))
 
+    def _entry_normalized_url(self, entry: Any) -> str | None:
+        entry_data = dict(entry) if hasattr(entry, "items") else {}
+        raw_link = self._entry_link(entry_data)
+        return self._normalize_url(raw_link) if raw_link is not None else None
+
     @staticmethod
     def _entry_title(entry: dict[str, Any]) -> str | None:
         return RSSCollector._safe_str(entry.get("title"))
@@ -597,48 +681,11 @@ class RSSCollector:
     def _compute_hash(content: str) -> str:
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
-    @staticmethod
-    def _backoff_seconds(attempt: int) -> float:
-        base = min(float(2**attempt), 30.0)
-        jitter = (time.monotonic_ns() % 250_000_000) / 1_000_000_000
-        return base + jitter
-
-    @staticmethod
-    def _is_retryable_status(status_code: int) -> bool:
-        return status_code == 429 or status_code >= 500
-
-    @staticmethod
-    def _is_transient_failure(exc: BaseException) -> bool:
-        if isinstance(
-            exc, httpx.TimeoutException | httpx.NetworkError | TimeoutError | asyncio.TimeoutError
-        ):
-            return True
-        if isinstance(exc, httpx.HTTPStatusError):
-            return RSSCollector._is_retryable_status(exc.response.status_code)
-        return False
-
-    @staticmethod
-    def _failure_reason(exc: BaseException) -> str:
-        if isinstance(exc, httpx.TimeoutException | TimeoutError | asyncio.TimeoutError):
-            return "timeout"
-        if isinstance(exc, httpx.NetworkError):
-            return "network"
-        if isinstance(exc, httpx.HTTPStatusError):
-            return f"http_{exc.response.status_code}"
-        return type(exc).__name__.lower()
-
-    @staticmethod
-    def _parse_retry_after(raw_retry_after: str | None) -> float | None:
-        if raw_retry_after is None:
-            return None
-        retry_after = raw_retry_after.strip()
-        if not retry_after:
-            return None
-        try:
-            parsed = float(retry_after)
-        except ValueError:
-            return None
-        return parsed if parsed >= 0 else None
+    _is_retryable_status = staticmethod(is_retryable_status)
+    _is_transient_failure = staticmethod(is_transient_failure)
+    _failure_reason = staticmethod(failure_reason)
+    _backoff_seconds = staticmethod(backoff_seconds)
+    _parse_retry_after = staticmethod(parse_retry_after)
 
     @staticmethod
     def _safe_str(value: Any) -> str | None:
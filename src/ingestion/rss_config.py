@@ -0,0 +1,127 @@
+"""
+RSS feed configuration models and YAML parsing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.ingestion.rate_limiter import DomainRateLimit
+
+
+@dataclass(slots=True)
+class FeedConfig:
+    """RSS feed configuration loaded from YAML."""
+
+    name: str
+    url: str
+    credibility: float
+    categories: list[str] = field(default_factory=list)
+    check_interval_minutes: int = 30
+    max_items_per_fetch: int = 200
+    language: str | None = None
+    source_tier: str = "regional"
+    reporting_type: str = "secondary"
+    enabled: bool = True
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class CollectorSettings:
+    """Global collector settings from YAML."""
+
+    request_timeout_seconds: int = 30
+    user_agent: str = "GeopoliticalIntel/1.0 (RSS Collector)"
+    default_lookback_hours: int = 12
+    domain_rate_limits: dict[str, DomainRateLimit] = field(default_factory=dict)
+
+
+def parse_collector_settings(raw_settings: dict[str, Any]) -> CollectorSettings:
+    timeout_value = raw_settings.get("request_timeout_seconds", 30)
+    user_agent = raw_settings.get("user_agent", "GeopoliticalIntel/1.0 (RSS Collector)")
+    return CollectorSettings(
+        request_timeout_seconds=int(timeout_value),
+        user_agent=str(user_agent),
+        default_lookback_hours=int(raw_settings.get("default_lookback_hours", 12)),
+        domain_rate_limits=parse_domain_rate_limits(raw_settings.get("domain_rate_limits")),
+    )
+
+
+def parse_domain_rate_limits(raw_limits: Any) -> dict[str, DomainRateLimit]:
+    if not isinstance(raw_limits, dict):
+        return {}
+
+    limits: dict[str, DomainRateLimit] = {}
+    for raw_domain, raw_limit in raw_limits.items():
+        domain = str(raw_domain).strip().lower()
+        if not domain or not isinstance(raw_limit, dict):
+            continue
+        limits[domain] = DomainRateLimit(
+            requests_per_second=float(raw_limit.get("requests_per_second", 1.0)),
+            burst=int(raw_limit.get("burst", 1)),
+        )
+    return limits
+
+
+def parse_feed_configs(
+    raw_settings: dict[str, Any],
+    raw_feeds: list[Any],
+) -> list[FeedConfig]:
+    default_interval = int(raw_settings.get("default_check_interval_minutes", 30))
+    default_max_items = int(raw_settings.get("default_max_items_per_fetch", 200))
+
+    parsed_feeds: list[FeedConfig] = []
+    for raw_feed in raw_feeds:
+        if not isinstance(raw_feed, dict):
+            continue
+        name = str(raw_feed.get("name", "")).strip()
+        url = str(raw_feed.get("url", "")).strip()
+        if not name or not url:
+            continue
+
+        categories_raw = raw_feed.get("categories", [])
+        categories = (
+            [str(category) for category in categories_raw]
+            if isinstance(categories_raw, list)
+            else []
+        )
+        known_keys = {
+            "name",
+            "url",
+            "credibility",
+            "categories",
+            "check_interval_minutes",
+            "max_items_per_fetch",
+            "language",
+            "source_tier",
+            "reporting_type",
+            "enabled",
+        }
+        extra = {key: value for key, value in raw_feed.items() if key not in known_keys}
+
+        parsed_feeds.append(
+            FeedConfig(
+                name=name,
+                url=url,
+                credibility=float(raw_feed.get("credibility", 0.5)),
+                categories=categories,
+                check_interval_minutes=int(
+                    raw_feed.get("check_interval_minutes", default_interval)
+                ),
+                max_items_per_fetch=int(raw_feed.get("max_items_per_fetch", default_max_items)),
+                language=_safe_str(raw_feed.get("language")),
+                source_tier=str(raw_feed.get("source_tier", "regional")),
+                reporting_type=str(raw_feed.get("reporting_type", "secondary")),
+                enabled=bool(raw_feed.get("enabled", True)),
+                extra=extra,
+            )
+        )
+    return parsed_feeds
+
+
+def _safe_str(value: Any) -> str | None:
+    if value is None:
+        return None
+    as_str = str(value).strip()
+    return as_str or None
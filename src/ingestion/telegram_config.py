@@ -0,0 +1,110 @@
+"""
+Telegram channel configuration models and YAML parsing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class ChannelConfig:
+    """Telegram channel configuration loaded from YAML."""
+
+    name: str
+    channel: str
+    credibility: float
+    categories: list[str] = field(default_factory=list)
+    check_interval_minutes: int = 15
+    max_messages_per_fetch: int = 100
+    include_media: bool = True
+    language: str | None = None
+    source_tier: str = "regional"
+    reporting_type: str = "secondary"
+    enabled: bool = True
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class HarvesterSettings:
+    """Global Telegram harvester settings from YAML."""
+
+    default_check_interval_minutes: int = 15
+    default_max_messages_per_fetch: int = 100
+
+
+def parse_harvester_settings(raw_settings: dict[str, Any]) -> HarvesterSettings:
+    return HarvesterSettings(
+        default_check_interval_minutes=int(raw_settings.get("default_check_interval_minutes", 15)),
+        default_max_messages_per_fetch=int(raw_settings.get("default_max_messages_per_fetch", 100)),
+    )
+
+
+def parse_channel_configs(
+    raw_settings: dict[str, Any],
+    raw_channels: list[Any],
+) -> list[ChannelConfig]:
+    default_interval = int(raw_settings.get("default_check_interval_minutes", 15))
+    default_max_messages = int(raw_settings.get("default_max_messages_per_fetch", 100))
+
+    channels: list[ChannelConfig] = []
+    for raw_channel in raw_channels:
+        if not isinstance(raw_channel, dict):
+            continue
+
+        name = _safe_str(raw_channel.get("name"))
+        channel_ref = _safe_str(raw_channel.get("channel"))
+        if name is None or channel_ref is None:
+            continue
+
+        categories_raw = raw_channel.get("categories", [])
+        categories = (
+            [str(category).strip() for category in categories_raw if str(category).strip()]
+            if isinstance(categories_raw, list)
+            else []
+        )
+        known_keys = {
+            "name",
+            "channel",
+            "credibility",
+            "categories",
+            "check_interval_minutes",
+            "max_messages_per_fetch",
+            "include_media",
+            "language",
+            "source_tier",
+            "reporting_type",
+            "enabled",
+        }
+        extra = {key: value for key, value in raw_channel.items() if key not in known_keys}
+
+        channels.append(
+            ChannelConfig(
+                name=name,
+                channel=channel_ref,
+                credibility=float(raw_channel.get("credibility", 0.5)),
+                categories=categories,
+                check_interval_minutes=int(
+                    raw_channel.get("check_interval_minutes", default_interval)
+                ),
+                max_messages_per_fetch=int(
+                    raw_channel.get("max_messages_per_fetch", default_max_messages)
+                ),
+                include_media=bool(raw_channel.get("include_media", True)),
+                language=_safe_str(raw_channel.get("language")),
+                source_tier=str(raw_channel.get("source_tier", "regional")),
+                reporting_type=str(raw_channel.get("reporting_type", "secondary")),
+                enabled=bool(raw_channel.get("enabled", True)),
+                extra=extra,
+            )
+        )
+
+    return channels
+
+
+def _safe_str(value: Any) -> str | None:
+    if value is None:
+        return None
+    as_str = str(value).strip()
+    return as_str or None
@@ -15,48 +15,28 @@ from typing import Any
 import structlog
 import yaml
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from telethon import TelegramClient
 
 from src.core.config import settings
+from src.ingestion.raw_item_writer import RawItemCandidate, RawItemWriter
 from src.ingestion.source_identity import (
     normalize_telegram_channel_handle,
     telegram_provider_source_key,
 )
+from src.ingestion.telegram_config import (
+    ChannelConfig,
+    HarvesterSettings,
+    parse_channel_configs,
+    parse_harvester_settings,
+)
 from src.processing.corroboration_provenance import refresh_events_for_source
 from src.processing.deduplication_service import DeduplicationService
-from src.storage.models import ProcessingStatus, RawItem, Source, SourceType
+from src.storage.models import Source, SourceType
 
 logger = structlog.get_logger(__name__)
 
 
-@dataclass(slots=True)
-class ChannelConfig:
-    """Telegram channel configuration loaded from YAML."""
-
-    name: str
-    channel: str
-    credibility: float
-    categories: list[str] = field(default_factory=list)
-    check_interval_minutes: int = 15
-    max_messages_per_fetch: int = 100
-    include_media: bool = True
-    language: str | None = None
-    source_tier: str = "regional"
-    reporting_type: str = "secondary"
-    enabled: bool = True
-    extra: dict[str, Any] = field(default_factory=dict)
-
-
-@dataclass(slots=True)
-class HarvesterSettings:
-    """Global Telegram harvester settings from YAML."""
-
-    default_check_interval_minutes: int = 15
-    default_max_messages_per_fetch: int = 100
-
-
 @dataclass(slots=True)
 class HarvestResult:
     """Outcome metrics for one channel harvest run."""
@@ -87,6 +67,7 @@ class TelegramHarvester:
         self.settings = HarvesterSettings()
         self._channels: list[ChannelConfig] = []
         self._config_mtime: float | None = None
+        self._entities: dict[str, Any] = {}
 
         self.client = client or self._create_client()
         self._owns_client = client is None
@@ -94,6 +75,12 @@ class TelegramHarvester:
         self.dedup_window_days = 7
         self.max_backfill_messages = 1000
         self.deduplication_service = DeduplicationService(session=session)
+        self.raw_item_writer = RawItemWriter(
+            session,
+            deduplication_service=self.deduplication_service,
+            dedup_window_days=self.dedup_window_days,
+        )
+        self.store_batch_size = 250
 
     @property
     def channels(self) -> list[ChannelConfig]:
@@ -173,7 +160,7 @@ class TelegramHarvester:
 
         try:
             await self._ensure_connected()
-            entity = await self.client.get_entity(channel.channel)
+            entity = await self._resolve_entity(channel)
             max_items = limit or channel.max_messages_per_fetch
             messages = await self.client.get_messages(entity, limit=max_items)
             message_list = list(messages) if messages is not None else []
@@ -185,6 +172,7 @@ class TelegramHarvester:
                     result.messages_stored += 1
                 else:
                     result.messages_skipped += 1
+            await self._flush_items(result)
         except Exception as exc:
             error_message = f"Telegram harvest failed: {exc}"
             logger.warning(
@@ -230,6 +218,9 @@ class TelegramHarvester:
                     result.messages_stored += 1
                 else:
                     result.messages_skipped += 1
+                if self.raw_item_writer.pending >= self.store_batch_size:
+                    await self._flush_items(result)
+            await self._flush_items(result)
         except Exception as exc:
             error_message = f"Telegram backfill failed: {exc}"
             logger.warning(
@@ -257,36 +248,109 @@ class TelegramHarvester:
 
         `max_polls=None` runs continuously.
         """
-        result = HarvestResult(channel_name=channel.name)
-        source = await self._get_or_create_source(channel)
+        results = await self.stream_channels(
+            [channel],
+            poll_interval_seconds=poll_interval_seconds,
+            max_polls=max_polls,
+        )
+        return results[0]
+
+    async def stream_channels(
+        self,
+        channels: list[ChannelConfig],
+        poll_interval_seconds: float = 5.0,
+        max_polls: int | None = None,
+    ) -> list[HarvestResult]:
+        """
+        Near real-time polling of several channels over one client connection.
+
+        Each poll pages oldest-first through messages above the source's persisted
+        `high_water_message_id` and advances the mark only through what it fetched,
+        so a backlog larger than `max_messages_per_fetch` drains over later polls.
+        A source without a mark is seeded from its newest messages instead of
+        replaying the channel history. The mark is committed after every cycle so a restarted stream resumes where
+        it stopped. `max_polls=None` runs continuously.
+        """
+        streams = [
+            (
+                channel,
+                await self._get_or_create_source(channel),
+                HarvestResult(channel_name=channel.name),
+            )
+            for channel in channels
+        ]
         polls = 0
-        last_seen_id = 0
 
         await self._ensure_connected()
         while max_polls is None or polls < max_polls:
             polls += 1
-            entity = await self.client.get_entity(channel.channel)
-            messages = await self.client.get_messages(
-                entity,
-                limit=channel.max_messages_per_fetch,
-            )
-            message_list = list(messages) if messages is not None else []
-            for message in reversed(message_list):
-                message_id = self._message_id(message)
-                if message_id is None or message_id <= last_seen_id:
-                    continue
-
-                result.messages_fetched += 1
-                was_stored = await self._process_message(source, channel, message)
-                if was_stored:
-                    result.messages_stored += 1
-                else:
-                    result.messages_skipped += 1
-                last_seen_id = message_id
+            for index, (channel, source, result) in enumerate(streams):
+                if index:
+                    await asyncio.sleep(self.min_request_interval_seconds)
+                await self._poll_channel(channel, source, result)
+            await self.session.commit()
 
             await asyncio.sleep(max(self.min_request_interval_seconds, poll_interval_seconds))
 
-        return result
+        return [result for _channel, _source, result in streams]
+
+    async def _poll_channel(
+        self,
+        channel: ChannelConfig,
+        source: Source,
+        result: HarvestResult,
+    ) -> None:
+        seeding = source.high_water_message_id is None
+        high_water_mark = source.high_water_message_id or 0
+        try:
+            entity = await self._resolve_entity(channel)
+            if seeding:
+                messages = await self.client.get_messages(
+                    entity,
+                    limit=channel.max_messages_per_fetch,
+                )
+            else:
+                messages = await self.client.get_messages(
+                    entity,
+                    limit=channel.max_messages_per_fetch,
+                    min_id=high_water_mark,
+                    reverse=True,
+                )
+        except Exception as exc:
+            logger.warning(
+                "Telegram channel poll failed",
+                channel_name=channel.name,
+                channel_ref=channel.channel,
+                error=str(exc),
+            )
+            result.errors.append(f"Telegram poll failed: {exc}")
+            return
+
+        message_list = list(messages) if messages is not None else []
+        if seeding:
+            message_list.reverse()
+        for message in message_list:
+            message_id = self._message_id(message)
+            if message_id is None or message_id <= high_water_mark:
+                continue
+
+            result.messages_fetched += 1
+            was_stored = await self._process_message(source, channel, message)
+            if was_stored:
+                result.messages_stored += 1
+            else:
+                result.messages_skipped += 1
+            high_water_mark = message_id
+        await self._flush_items(result)
+        if high_water_mark:
+            source.high_water_message_id = high_water_mark
+
+    async def _resolve_entity(self, channel: ChannelConfig) -> Any:
+        entity = self._entities.get(channel.channel)
+        if entity is None:
+            entity = await self.client.get_entity(channel.channel)
+            self._entities[channel.channel] = entity
+        return entity
 
     async def _process_message(
         self,
@@ -304,12 +368,8 @@ class TelegramHarvester:
         if content is None:
             return False
 
-        content_hash = self._compute_hash(content)
-        if await self._is_duplicate(external_id=external_id, url=url, content_hash=content_hash):
-            return False
-
         title = self._build_title(content)
-        item = await self._store_item(
+        return await self._store_item(
             source=source,
             external_id=external_id,
             url=url,
@@ -317,10 +377,9 @@ class TelegramHarvester:
             author=self._message_author(message),
             published_at=self._message_datetime(message),
             raw_content=content,
-            content_hash=content_hash,
+            content_hash=self._compute_hash(content),
             language=channel.language,
         )
-        return item is not None
 
     async def _store_item(
         self,
@@ -333,42 +392,26 @@ class TelegramHarvester:
         raw_content: str,
         content_hash: str,
         language: str | None,
-    ) -> RawItem | None:
-        item = RawItem(
-            source_id=source.id,
-            external_id=external_id,
-            url=url,
-            title=title,
-            author=author,
-            published_at=published_at,
-            raw_content=raw_content,
-            content_hash=content_hash,
-            language=language,
-            processing_status=ProcessingStatus.PENDING,
-        )
-
-        try:
-            async with self.session.begin_nested():
-                self.session.add(item)
-                await self.session.flush()
-        except IntegrityError:
-            logger.debug("Duplicate Telegram item skipped on insert race", external_id=external_id)
-            return None
-        return item
-
-    async def _is_duplicate(
-        self,
-        external_id: str,
-        url: str | None,
-        content_hash: str,
     ) -> bool:
-        result = await self.deduplication_service.find_duplicate(
-            external_id=external_id,
-            url=url,
-            content_hash=content_hash,
-            dedup_window_days=self.dedup_window_days,
+        """Queue a message for the next bulk insert; False when it repeats a queued item."""
+        return self.raw_item_writer.add(
+            RawItemCandidate(
+                source_id=source.id,
+                external_id=external_id,
+                url=url,
+                title=title,
+                author=author,
+                published_at=published_at,
+                raw_content=raw_content,
+                content_hash=content_hash,
+                language=language,
+            )
         )
-        return result.is_duplicate
+
+    async def _flush_items(self, result: HarvestResult) -> None:
+        flushed = await self.raw_item_writer.flush()
+        result.messages_stored -= flushed.skipped
+        result.messages_skipped += flushed.skipped
 
     async def _get_or_create_source(self, channel: ChannelConfig) -> Source:
         provider_source_key = telegram_provider_source_key(channel.channel)
@@ -480,78 +523,8 @@ class TelegramHarvester:
         if self._owns_client:
             await self.client.disconnect()
 
-    @staticmethod
-    def _parse_settings(raw_settings: dict[str, Any]) -> HarvesterSettings:
-        return HarvesterSettings(
-            default_check_interval_minutes=int(
-                raw_settings.get("default_check_interval_minutes", 15)
-            ),
-            default_max_messages_per_fetch=int(
-                raw_settings.get("default_max_messages_per_fetch", 100)
-            ),
-        )
-
-    @staticmethod
-    def _parse_channels(
-        raw_settings: dict[str, Any],
-        raw_channels: list[Any],
-    ) -> list[ChannelConfig]:
-        default_interval = int(raw_settings.get("default_check_interval_minutes", 15))
-        default_max_messages = int(raw_settings.get("default_max_messages_per_fetch", 100))
-
-        channels: list[ChannelConfig] = []
-        for raw_channel in raw_channels:
-            if not isinstance(raw_channel, dict):
-                continue
-
-            name = TelegramHarvester._safe_str(raw_channel.get("name"))
-            channel_ref = TelegramHarvester._safe_str(raw_channel.get("channel"))
-            if name is None or channel_ref is None:
-                continue
-
-            categories_raw = raw_channel.get("categories", [])
-            categories = (
-                [str(category).strip() for category in categories_raw if str(category).strip()]
-                if isinstance(categories_raw, list)
-                else []
-            )
-            known_keys = {
-                "name",
-                "channel",
-                "credibility",
-                "categories",
-                "check_interval_minutes",
-                "max_messages_per_fetch",
-                "include_media",
-                "language",
-                "source_tier",
-                "reporting_type",
-                "enabled",
-            }
-            extra = {key: value for key, value in raw_channel.items() if key not in known_keys}
-
-            channels.append(
-                ChannelConfig(
-                    name=name,
-                    channel=channel_ref,
-                    credibility=float(raw_channel.get("credibility", 0.5)),
-                    categories=categories,
-                    check_interval_minutes=int(
-                        raw_channel.get("check_interval_minutes", default_interval)
-                    ),
-                    max_messages_per_fetch=int(
-                        raw_channel.get("max_messages_per_fetch", default_max_messages)
-                    ),
-                    include_media=bool(raw_channel.get("include_media", True)),
-                    language=TelegramHarvester._safe_str(raw_channel.get("language")),
-                    source_tier=str(raw_channel.get("source_tier", "regional")),
-                    reporting_type=str(raw_channel.get("reporting_type", "secondary")),
-                    enabled=bool(raw_channel.get("enabled", True)),
-                    extra=extra,
-                )
-            )
-
-        return channels
+    _parse_settings = staticmethod(parse_harvester_settings)
+    _parse_channels = staticmethod(parse_channel_configs)
 
     @staticmethod
     def _message_id(message: Any) -> int | None:
@@ -1,7 +1,11 @@
 """Data processing services."""
 
 from src.processing.cost_tracker import BudgetExceededError, CostTracker
-from src.processing.deduplication_service import DeduplicationResult, DeduplicationService
+from src.processing.deduplication_service import (
+    DeduplicationResult,
+    DeduplicationService,
+    DuplicateCandidate,
+)
 from src.processing.embedding_service import EmbeddingRunResult, EmbeddingService
 from src.processing.event_clusterer import ClusterResult, EventClusterer
 from src.processing.pipeline_orchestrator import ProcessingPipeline
@@ -30,6 +34,7 @@ __all__ = [
     "CostTracker",
     "DeduplicationResult",
     "DeduplicationService",
+    "DuplicateCandidate",
     "EmbeddingRunResult",
     "EmbeddingService",
     "EventClusterer",
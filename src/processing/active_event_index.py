@@ -0,0 +1,290 @@
+"""
+Worker-resident nearest-event index over active-window event embeddings.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.event import listen
+
+from src.core.config import settings
+from src.processing.event_centroid import event_match_embedding_column
+from src.processing.similarity_kernels import cosine_scores
+from src.storage.models import Event
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+logger = structlog.get_logger(__name__)
+
+_INITIAL_CAPACITY = 1024
+_PENDING_UPSERTS_KEY = "active_event_index_pending_upserts"
+
+
+@dataclass(slots=True)
+class _ModelRows:
+    """Unit-normalised embeddings of one model, one row per indexed event."""
+
+    matrix: npt.NDArray[np.float32]
+    last_mention: npt.NDArray[np.float64]
+    event_ids: list[UUID | None] = field(default_factory=list)
+    free_slots: list[int] = field(default_factory=list)
+
+    @property
+    def high_water(self) -> int:
+        return len(self.event_ids)
+
+
+class ActiveEventIndex:
+    """
+    In-memory cosine index of events mentioned within the clustering window.
+
+    Rows are unit-normalised float32 match vectors (`event_match_embedding`) in
+    one matrix per embedding model, so a lookup is one matrix-vector product and a masked arg-max. The
+    first `sync` loads the window; later syncs read only events whose
+    `last_updated_at` moved since the previous one and expire rows whose
+    `last_mention_at` left the window. The clusterer upserts events it creates
+    or merges once their transaction commits. Hits are hints that callers re-check against Postgres; misses
+    are only complete for events committed before the last sync.
+    """
+
+    # last_updated_at is the writing transaction's start time, so rows from long
+    # pipeline runs commit after later timestamps were already synced.
+    _SYNC_OVERLAP = timedelta(minutes=30)
+
+    def __init__(
+        self,
+        *,
+        enabled: bool | None = None,
+        window_hours: int | None = None,
+        max_events: int | None = None,
+    ) -> None:
+        self.enabled = settings.CLUSTER_EVENT_INDEX_ENABLED if enabled is None else bool(enabled)
+        self.window = timedelta(
+            hours=settings.CLUSTER_TIME_WINDOW_HOURS if window_hours is None else window_hours
+        )
+        self.max_events = max(
+            1,
+            settings.CLUSTER_EVENT_INDEX_MAX_EVENTS if max_events is None else int(max_events),
+        )
+        self._rows_by_model: dict[str, _ModelRows] = {}
+        self._slot_by_event: dict[UUID, tuple[str, int]] = {}
+        self._synced_through: datetime | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether lookups reflect the window as of the last sync."""
+        return self.enabled and self._synced_through is not None
+
+    def __len__(self) -> int:
+        return len(self._slot_by_event)
+
+    async def sync(self, session: AsyncSession, *, now: datetime | None = None) -> int:
+        """Load the window on first use, then apply changes since the last sync."""
+        if not self.enabled:
+            return 0
+        now = now or datetime.now(tz=UTC)
+        window_start = now - self.window
+        target = event_match_embedding_column()
+        query = select(
+            Event.id,
+            target,
+            Event.embedding_model,
+            Event.last_mention_at,
+            Event.last_updated_at,
+        ).where(Event.last_mention_at >= window_start, target.is_not(None))
+        if self._synced_through is None:
+            window_size = await session.scalar(
+                select(func.count())
+                .select_from(Event)
+                .where(Event.last_mention_at >= window_start, target.is_not(None))
+            )
+            if int(window_size or 0) > self.max_events:
+                logger.warning(
+                    "Active event window exceeds in-process index capacity; using pgvector",
+                    window_events=int(window_size or 0),
+                    max_events=self.max_events,
+                )
+                return 0
+        else:
+            query = query.where(Event.last_updated_at >= self._synced_through - self._SYNC_OVERLAP)
+        rows = (await session.execute(query)).all()
+
+        synced_through = self._synced_through or now
+        for event_id, embedding, embedding_model, last_mention_at, last_updated_at in rows:
+            self.upsert(
+                event_id=event_id,
+                embedding=embedding,
+                embedding_model=embedding_model,
+                last_mention_at=last_mention_at,
+            )
+            if last_updated_at is not None:
+                synced_through = max(synced_through, last_updated_at)
+        self.expire(window_start)
+        self._synced_through = synced_through
+        if len(self) > self.max_events:
+            logger.warning(
+                "Active event index outgrew its capacity; using pgvector until next warm-up",
+                indexed_events=len(self),
+                max_events=self.max_events,
+            )
+            self.clear()
+        return len(rows)
+
+    def upsert(
+        self,
+        *,
+        event_id: UUID,
+        embedding: Any,
+        embedding_model: str | None,
+        last_mention_at: datetime | None,
+    ) -> None:
+        """Insert or replace the row for `event_id`; unusable rows are dropped."""
+        self.discard(event_id)
+        if not self.enabled or embedding is None or not embedding_model or last_mention_at is None:
+            return
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0 or not np.isfinite(norm):
+            return
+        rows = self._rows_by_model.get(embedding_model)
+        if rows is None:
+            rows = _ModelRows(
+                matrix=np.zeros((_INITIAL_CAPACITY, vector.shape[0]), dtype=np.float32),
+                last_mention=np.full(_INITIAL_CAPACITY, -np.inf),
+            )
+            self._rows_by_model[embedding_model] = rows
+        elif rows.matrix.shape[1] != vector.shape[0]:
+            return
+        if rows.free_slots:
+            slot = rows.free_slots.pop()
+        else:
+            slot = rows.high_water
+            if slot == rows.matrix.shape[0]:
+                self._grow(rows)
+            rows.event_ids.append(None)
+        rows.matrix[slot] = vector / norm
+        rows.last_mention[slot] = last_mention_at.timestamp()
+        rows.event_ids[slot] = event_id
+        self._slot_by_event[event_id] = (embedding_model, slot)
+
+    def upsert_on_commit(
+        self,
+        session: AsyncSession,
+        *,
+        event_id: UUID,
+        embedding: Any,
+        embedding_model: str | None,
+        last_mention_at: datetime | None,
+    ) -> None:
+        """
+        Queue an `upsert` that applies when `session` commits.
+
+        Any rollback, savepoints included, drops the queued rows so the index
+        never serves writes Postgres discarded; `sync` picks up the rest.
+        """
+        sync_session = session.sync_session
+        key = (_PENDING_UPSERTS_KEY, id(self))
+        pending = sync_session.info.get(key)
+        if pending is None:
+            pending = sync_session.info[key] = {}
+            listen(sync_session, "after_commit", self._apply_pending_upserts)
+            listen(sync_session, "after_soft_rollback", self._drop_pending_upserts)
+        pending[event_id] = {
+            "embedding": embedding,
+            "embedding_model": embedding_model,
+            "last_mention_at": last_mention_at,
+        }
+
+    def _apply_pending_upserts(self, session: Session) -> None:
+        pending = session.info[(_PENDING_UPSERTS_KEY, id(self))]
+        for event_id, row in pending.items():
+            self.upsert(event_id=event_id, **row)
+        pending.clear()
+
+    def _drop_pending_upserts(self, session: Session, _previous_transaction: Any) -> None:
+        session.info[(_PENDING_UPSERTS_KEY, id(self))].clear()
+
+    def discard(self, event_id: UUID) -> None:
+        """Remove `event_id` when indexed."""
+        located = self._slot_by_event.pop(event_id, None)
+        if located is None:
+            return
+        embedding_model, slot = located
+        rows = self._rows_by_model[embedding_model]
+        rows.last_mention[slot] = -np.inf
+        rows.event_ids[slot] = None
+        rows.free_slots.append(slot)
+
+    def expire(self, before: datetime) -> int:
+        """Drop events last mentioned before `before`; return how many were dropped."""
+        cutoff = before.timestamp()
+        expired: list[UUID] = []
+        for rows in self._rows_by_model.values():
+            live = rows.last_mention[: rows.high_water]
+            # Freed slots hold -inf, so every finite slot still has its event id.
+            stale = np.flatnonzero((live < cutoff) & np.isfinite(live))
+            expired.extend(cast("UUID", rows.event_ids[int(slot)]) for slot in stale)
+        for event_id in expired:
+            self.discard(event_id)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Forget every row; the next sync reloads the window."""
+        self._rows_by_model.clear()
+        self._slot_by_event.clear()
+        self._synced_through = None
+
+    def nearest(
+        self,
+        embedding: Any,
+        embedding_model: str,
+        *,
+        window_start: datetime,
+        min_similarity: float,
+    ) -> tuple[UUID, float] | None:
+        """Return the most similar indexed event in the window above `min_similarity`."""
+        rows = self._rows_by_model.get(embedding_model)
+        if rows is None or rows.high_water == 0:
+            return None
+        query = np.asarray(embedding, dtype=np.float32)
+        if query.ndim != 1 or query.shape[0] != rows.matrix.shape[1]:
+            return None
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0 or not np.isfinite(norm):
+            return None
+        count = rows.high_water
+        scores = cosine_scores(rows.matrix[:count], query)
+        scores[rows.last_mention[:count] < window_start.timestamp()] = -np.inf
+        slot = int(np.argmax(scores))
+        similarity = float(scores[slot])
+        event_id = rows.event_ids[slot]
+        if event_id is None or similarity < min_similarity:
+            return None
+        return (event_id, similarity)
+
+    @staticmethod
+    def _grow(rows: _ModelRows) -> None:
+        capacity = rows.matrix.shape[0] * 2
+        matrix = np.zeros((capacity, rows.matrix.shape[1]), dtype=np.float32)
+        matrix[: rows.matrix.shape[0]] = rows.matrix
+        last_mention = np.full(capacity, -np.inf)
+        last_mention[: rows.last_mention.shape[0]] = rows.last_mention
+        rows.matrix = matrix
+        rows.last_mention = last_mention
+
+
+@lru_cache
+def get_active_event_index() -> ActiveEventIndex:
+    """Get the process-wide active event index configured from settings."""
+    return ActiveEventIndex()
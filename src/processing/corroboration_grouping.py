@@ -0,0 +1,391 @@
+"""Independence grouping and mergeable provenance counters for event evidence."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+from uuid import UUID
+
+PROVENANCE_COUNTERS_KEY = "counters"
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_SPACE_RE = re.compile(r"\s+")
+_SYNDICATION_PATTERNS: tuple[tuple[str, tuple[re.Pattern[str], ...]], ...] = (
+    (
+        "reuters",
+        (
+            re.compile(r"\breuters\b", re.IGNORECASE),
+            re.compile(r"\bthomson reuters\b", re.IGNORECASE),
+        ),
+    ),
+    (
+        "associated-press",
+        (
+            re.compile(r"\bassociated press\b", re.IGNORECASE),
+            re.compile(r"\bap news\b", re.IGNORECASE),
+        ),
+    ),
+    (
+        "afp",
+        (
+            re.compile(r"\bafp\b", re.IGNORECASE),
+            re.compile(r"\bagence france-presse\b", re.IGNORECASE),
+        ),
+    ),
+    (
+        "interfax",
+        (re.compile(r"\binterfax\b", re.IGNORECASE),),
+    ),
+    (
+        "tass",
+        (re.compile(r"\btass\b", re.IGNORECASE),),
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EventSourceProvenance:
+    """Normalized source/item metadata used to infer independence groups."""
+
+    source_id: UUID | str
+    source_name: str | None
+    source_url: str | None
+    source_tier: str | None
+    reporting_type: str | None
+    item_url: str | None
+    title: str | None
+    author: str | None
+    content_hash: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class _GroupMember:
+    source_id: str
+    source_family: str | None
+    # Normalized reporting type; "" when the source has none.
+    reporting_type: str
+
+    def as_payload(self) -> dict[str, str | None]:
+        return {
+            "source_id": self.source_id,
+            "source_family": self.source_family,
+            "reporting_type": self.reporting_type,
+        }
+
+
+@dataclass(slots=True)
+class _GroupAccumulator:
+    key: str
+    kind: str
+    source_ids: Counter[str] = field(default_factory=Counter)
+    source_families: Counter[str] = field(default_factory=Counter)
+    reporting_types: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def member_count(self) -> int:
+        return sum(self.source_ids.values())
+
+    @property
+    def weight(self) -> float:
+        return max(
+            (reporting_type_weight(reporting_type) for reporting_type in self.reporting_types),
+            default=reporting_type_weight(None),
+        )
+
+    def add(self, member: _GroupMember) -> None:
+        self.source_ids[member.source_id] += 1
+        if member.source_family:
+            self.source_families[member.source_family] += 1
+        self.reporting_types[member.reporting_type] += 1
+
+    def remove(self, member: _GroupMember) -> None:
+        _decrement(self.source_ids, member.source_id)
+        if member.source_family:
+            _decrement(self.source_families, member.source_family)
+        _decrement(self.reporting_types, member.reporting_type)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "kind": self.kind,
+            "weight": round(self.weight, 4),
+            "member_count": self.member_count,
+            "source_count": len(self.source_ids),
+            "source_families": sorted(self.source_families),
+            "reporting_types": sorted(value for value in self.reporting_types if value),
+        }
+
+    def as_payload(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "source_ids": dict(self.source_ids),
+            "source_families": dict(self.source_families),
+            "reporting_types": dict(self.reporting_types),
+        }
+
+
+@dataclass(slots=True)
+class ProvenanceCounters:
+    """
+    Mergeable per-event state behind the provenance-aware corroboration summary.
+
+    Observations can be folded in one at a time and in any order with the same
+    result as grouping them all at once. A member filed under its source or
+    family while its story fingerprint is still unique stays in `pending`, and
+    moves into the near-duplicate group when that fingerprint repeats.
+    """
+
+    observation_count: int = 0
+    source_families: set[str] = field(default_factory=set)
+    fingerprints: Counter[str] = field(default_factory=Counter)
+    pending: dict[str, tuple[str, _GroupMember]] = field(default_factory=dict)
+    groups: dict[str, _GroupAccumulator] = field(default_factory=dict)
+
+    @classmethod
+    def from_observations(cls, observations: list[EventSourceProvenance]) -> ProvenanceCounters:
+        counters = cls()
+        for observation in observations:
+            counters.add(observation)
+        return counters
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> ProvenanceCounters | None:
+        """Rebuild counters persisted by `as_payload`; None when missing or malformed."""
+        if not isinstance(payload, dict):
+            return None
+        try:
+            counters = cls(
+                observation_count=int(payload["observation_count"]),
+                source_families={str(value) for value in payload["source_families"]},
+                fingerprints=Counter(
+                    {str(key): int(count) for key, count in payload["fingerprints"].items()}
+                ),
+            )
+            for fingerprint, entry in payload["pending"].items():
+                counters.pending[str(fingerprint)] = (str(entry["group"]), _member(entry))
+            for key, group in payload["groups"].items():
+                counters.groups[str(key)] = _GroupAccumulator(
+                    key=str(key),
+                    kind=str(group["kind"]),
+                    source_ids=_counter(group["source_ids"]),
+                    source_families=_counter(group["source_families"]),
+                    reporting_types=_counter(group["reporting_types"]),
+                )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+        return counters
+
+    def add(self, observation: EventSourceProvenance) -> None:
+        """Fold one observation into the groups in O(1)."""
+        self.observation_count += 1
+        source_family = infer_source_family(observation)
+        if source_family:
+            self.source_families.add(source_family)
+        fingerprint = _story_fingerprint(observation)
+        if fingerprint is not None:
+            self.fingerprints[fingerprint] += 1
+            moved = self.pending.pop(fingerprint, None)
+            if moved is not None:
+                self._move(moved, key=f"near-duplicate:{fingerprint}", kind="near_duplicate")
+        group_key, group_kind = _group_identity(
+            observation=observation,
+            source_family=source_family,
+            fingerprint_counts=self.fingerprints,
+        )
+        member = _GroupMember(
+            source_id=str(observation.source_id),
+            source_family=source_family,
+            reporting_type=_normalized_value(observation.reporting_type) or "",
+        )
+        self._group(group_key, group_kind).add(member)
+        if (
+            fingerprint is not None
+            and self.fingerprints[fingerprint] == 1
+            and group_kind in {"source", "source_family"}
+            and member.reporting_type != "firsthand"
+        ):
+            self.pending[fingerprint] = (group_key, member)
+
+    def as_payload(self) -> dict[str, Any]:
+        return {
+            "observation_count": self.observation_count,
+            "source_families": sorted(self.source_families),
+            "fingerprints": dict(sorted(self.fingerprints.items())),
+            "pending": {
+                fingerprint: {"group": group_key, **member.as_payload()}
+                for fingerprint, (group_key, member) in sorted(self.pending.items())
+            },
+            "groups": {key: self.groups[key].as_payload() for key in sorted(self.groups)},
+        }
+
+    def _group(self, key: str, kind: str) -> _GroupAccumulator:
+        return self.groups.setdefault(key, _GroupAccumulator(key=key, kind=kind))
+
+    def _move(self, entry: tuple[str, _GroupMember], *, key: str, kind: str) -> None:
+        group_key, member = entry
+        group = self.groups.get(group_key)
+        if group is not None:
+            group.remove(member)
+            if group.member_count == 0:
+                del self.groups[group_key]
+        self._group(key, kind).add(member)
+
+
+def _member(entry: Any) -> _GroupMember:
+    source_family = entry["source_family"]
+    return _GroupMember(
+        source_id=str(entry["source_id"]),
+        source_family=None if source_family is None else str(source_family),
+        reporting_type=str(entry["reporting_type"]),
+    )
+
+
+def _counter(values: Any) -> Counter[str]:
+    return Counter({str(key): int(count) for key, count in values.items() if int(count) > 0})
+
+
+def _decrement(counter: Counter[str], key: str) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+
+def infer_source_family(observation: EventSourceProvenance) -> str | None:
+    """Infer a bounded source-family key from URLs or the configured source name."""
+
+    for candidate in (observation.item_url, observation.source_url):
+        family_key = _source_family_key_from_url(candidate)
+        if family_key is not None:
+            return family_key
+    return _slug_text(observation.source_name)
+
+
+def reporting_type_weight(reporting_type: str | None) -> float:
+    """Weight corroboration groups conservatively by reporting type."""
+
+    reporting = _normalized_value(reporting_type)
+    if reporting == "firsthand":
+        return 1.0
+    if reporting == "secondary":
+        return 0.6
+    if reporting == "aggregator":
+        return 0.35
+    return 0.5
+
+
+def _group_identity(
+    *,
+    observation: EventSourceProvenance,
+    source_family: str | None,
+    fingerprint_counts: Counter[str],
+) -> tuple[str, str]:
+    reporting_type = _normalized_value(observation.reporting_type)
+    if reporting_type == "firsthand":
+        return (f"source:{observation.source_id}", "source")
+
+    story_fingerprint = _story_fingerprint(observation)
+    syndicator = _syndication_provider(observation)
+    if syndicator is not None and story_fingerprint is not None:
+        return (f"syndication:{syndicator}:{story_fingerprint}", "syndication")
+    if story_fingerprint is not None and fingerprint_counts.get(story_fingerprint, 0) > 1:
+        return (f"near-duplicate:{story_fingerprint}", "near_duplicate")
+    if source_family is not None:
+        return (f"family:{source_family}", "source_family")
+    return (f"source:{observation.source_id}", "source")
+
+
+def _story_fingerprint(observation: EventSourceProvenance) -> str | None:
+    content_hash = _normalized_value(observation.content_hash)
+    if content_hash:
+        return f"content:{content_hash[:16]}"
+    title = _normalized_text(observation.title)
+    if len(title) < 24:
+        return None
+    digest = hashlib.sha256(title.encode("utf-8")).hexdigest()[:16]
+    return f"title:{digest}"
+
+
+def _syndication_provider(observation: EventSourceProvenance) -> str | None:
+    haystack = " | ".join(
+        value
+        for value in (observation.author, observation.title, observation.source_name)
+        if isinstance(value, str) and value.strip()
+    )
+    if not haystack:
+        return None
+    for provider, patterns in _SYNDICATION_PATTERNS:
+        if any(pattern.search(haystack) for pattern in patterns):
+            return provider
+    return None
+
+
+def maybe_str(value: Any) -> str | None:
+    """Return `value` as a stripped string, or None when missing or blank."""
+
+    if value is None:
+        return None
+    if isinstance(value, str):
+        stripped = value.strip()
+        return stripped or None
+    return str(value)
+
+
+def _normalized_hostname(value: str | None) -> str | None:
+    normalized = maybe_str(value)
+    if normalized is None:
+        return None
+    parsed = urlparse(normalized if "://" in normalized else f"https://{normalized}")
+    hostname = parsed.hostname.lower() if parsed.hostname else ""
+    if hostname.startswith("www."):
+        hostname = hostname[4:]
+    return hostname or None
+
+
+def _source_family_key_from_url(value: str | None) -> str | None:
+    normalized = maybe_str(value)
+    if normalized is None:
+        return None
+    parsed = urlparse(normalized if "://" in normalized else f"https://{normalized}")
+    hostname = parsed.hostname.lower() if parsed.hostname else ""
+    if hostname.startswith("www."):
+        hostname = hostname[4:]
+    if hostname in {"t.me", "telegram.me"}:
+        hostname = "t.me"
+        segments = [
+            segment.strip().lower() for segment in parsed.path.split("/") if segment.strip()
+        ]
+        if len(segments) >= 2 and segments[0] == "s":
+            return f"{hostname}/{segments[1]}"
+        if segments:
+            return f"{hostname}/{segments[0]}"
+    return hostname or None
+
+
+def _slug_text(value: str | None) -> str | None:
+    normalized = _normalized_text(value)
+    if not normalized:
+        return None
+    words = _WORD_RE.findall(normalized)
+    if not words:
+        return None
+    return "-".join(words[:6])
+
+
+def _normalized_text(value: str | None) -> str:
+    normalized = maybe_str(value)
+    if normalized is None:
+        return ""
+    lowered = normalized.lower()
+    return _SPACE_RE.sub(" ", lowered).strip()
+
+
+def _normalized_value(value: str | None) -> str | None:
+    normalized = maybe_str(value)
+    if normalized is None:
+        return None
+    lowered = normalized.lower()
+    return lowered or None
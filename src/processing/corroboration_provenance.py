@@ -2,15 +2,11 @@
 
 from __future__ import annotations
 
-import hashlib
-import re
-from collections import Counter
 from collections.abc import Mapping
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from inspect import isawaitable
 from typing import Any
-from urllib.parse import urlparse
 from uuid import UUID
 
 from sqlalchemy import select
@@ -18,6 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.source_credibility import DEFAULT_SOURCE_CREDIBILITY
 from src.core.trend_engine import TrendEngine
+from src.processing.corroboration_grouping import (
+    PROVENANCE_COUNTERS_KEY,
+    EventSourceProvenance,
+    ProvenanceCounters,
+    maybe_str,
+)
 from src.processing.corroboration_refresh_support import (
     _build_canonical_summary,
     _load_item_effective_credibility_for_refresh,
@@ -37,86 +39,8 @@ from src.storage.models import Event, EventItem, RawItem, Source, Trend
 PROVENANCE_AWARE_MODE = "provenance_aware"
 FALLBACK_MODE = "fallback"
 _GROUPS_PAYLOAD_LIMIT = 20
-_WORD_RE = re.compile(r"[a-z0-9]+")
-_SPACE_RE = re.compile(r"\s+")
-_SYNDICATION_PATTERNS: tuple[tuple[str, tuple[re.Pattern[str], ...]], ...] = (
-    (
-        "reuters",
-        (
-            re.compile(r"\breuters\b", re.IGNORECASE),
-            re.compile(r"\bthomson reuters\b", re.IGNORECASE),
-        ),
-    ),
-    (
-        "associated-press",
-        (
-            re.compile(r"\bassociated press\b", re.IGNORECASE),
-            re.compile(r"\bap news\b", re.IGNORECASE),
-        ),
-    ),
-    (
-        "afp",
-        (
-            re.compile(r"\bafp\b", re.IGNORECASE),
-            re.compile(r"\bagence france-presse\b", re.IGNORECASE),
-        ),
-    ),
-    (
-        "interfax",
-        (re.compile(r"\binterfax\b", re.IGNORECASE),),
-    ),
-    (
-        "tass",
-        (re.compile(r"\btass\b", re.IGNORECASE),),
-    ),
-)
-
-
-@dataclass(frozen=True, slots=True)
-class EventSourceProvenance:
-    """Normalized source/item metadata used to infer independence groups."""
-
-    source_id: UUID | str
-    source_name: str | None
-    source_url: str | None
-    source_tier: str | None
-    reporting_type: str | None
-    item_url: str | None
-    title: str | None
-    author: str | None
-    content_hash: str | None
-
-
-@dataclass(slots=True)
-class _GroupAccumulator:
-    key: str
-    kind: str
-    weight: float
-    source_ids: set[str] = field(default_factory=set)
-    source_families: set[str] = field(default_factory=set)
-    reporting_types: set[str] = field(default_factory=set)
-    member_count: int = 0
-
-    def add(self, observation: EventSourceProvenance, *, source_family: str | None) -> None:
-        self.member_count += 1
-        self.source_ids.add(str(observation.source_id))
-        if source_family:
-            self.source_families.add(source_family)
-        reporting_type = _normalized_value(observation.reporting_type)
-        if reporting_type:
-            self.reporting_types.add(reporting_type)
-        self.weight = max(self.weight, reporting_type_weight(observation.reporting_type))
-
-    def as_dict(self) -> dict[str, Any]:
-        return {
-            "key": self.key,
-            "kind": self.kind,
-            "weight": round(self.weight, 4),
-            "member_count": self.member_count,
-            "source_count": len(self.source_ids),
-            "source_families": sorted(self.source_families),
-            "reporting_types": sorted(self.reporting_types),
-        }
+# Incremental merges fall back to a full recompute at this observation-count interval.
+_PROVENANCE_VERIFY_INTERVAL = 50
 
 
 @dataclass(frozen=True, slots=True)
@@ -190,41 +114,35 @@ def summarize_event_provenance(
             unique_source_count=unique_source_count,
             reason="no_event_item_provenance",
         )
-
-    story_fingerprints = Counter(
-        fingerprint
-        for fingerprint in (_story_fingerprint(observation) for observation in observations)
-        if fingerprint is not None
+    return summarize_provenance_counters(
+        ProvenanceCounters.from_observations(observations),
+        raw_source_count=raw_source_count,
+        unique_source_count=unique_source_count,
     )
-    groups: dict[str, _GroupAccumulator] = {}
-    source_families: set[str] = set()
-
-    for observation in observations:
-        source_family = infer_source_family(observation)
-        if source_family:
-            source_families.add(source_family)
-        group_key, group_kind = _group_identity(
-            observation=observation,
-            source_family=source_family,
-            fingerprint_counts=story_fingerprints,
-        )
-        accumulator = groups.setdefault(
-            group_key,
-            _GroupAccumulator(
-                key=group_key,
-                kind=group_kind,
-                weight=reporting_type_weight(observation.reporting_type),
-            ),
+
+
+def summarize_provenance_counters(
+    counters: ProvenanceCounters,
+    *,
+    raw_source_count: int,
+    unique_source_count: int,
+) -> EventProvenanceSummary:
+    """Build the persisted summary from folded provenance counters."""
+
+    if counters.observation_count == 0:
+        return fallback_event_provenance_summary(
+            raw_source_count=raw_source_count,
+            unique_source_count=unique_source_count,
+            reason="no_event_item_provenance",
         )
-        accumulator.add(observation, source_family=source_family)
 
     ordered_groups = sorted(
-        (group.as_dict() for group in groups.values()),
+        (group.as_dict() for group in counters.groups.values()),
         key=lambda group: (-int(group["member_count"]), str(group["key"])),
     )
     groups_payload = tuple(ordered_groups[:_GROUPS_PAYLOAD_LIMIT])
     groups_truncated = max(0, len(ordered_groups) - len(groups_payload))
-    independent_evidence_count = max(1, len(groups))
+    independent_evidence_count = max(1, len(counters.groups))
     corroboration_score = sum(float(group["weight"]) for group in ordered_groups)
 
     return EventProvenanceSummary(
@@ -234,7 +152,7 @@ def summarize_event_provenance(
         unique_source_count=max(0, int(unique_source_count or 0)),
         independent_evidence_count=independent_evidence_count,
         weighted_corroboration_score=max(0.1, corroboration_score),
-        source_family_count=len(source_families),
+        source_family_count=len(counters.source_families),
         syndication_group_count=sum(
             1 for group in ordered_groups if group["kind"] == "syndication"
         ),
@@ -255,14 +173,14 @@ def parse_event_provenance_row(row: Any) -> EventSourceProvenance | None:
             return None
         return EventSourceProvenance(
             source_id=source_id,
-            source_name=_maybe_str(row[1]),
-            source_url=_maybe_str(row[2]),
-            source_tier=_maybe_str(row[3]),
-            reporting_type=_maybe_str(row[4]),
-            item_url=_maybe_str(row[5]),
-            title=_maybe_str(row[6]),
-            author=_maybe_str(row[7]),
-            content_hash=_maybe_str(row[8]),
+            source_name=maybe_str(row[1]),
+            source_url=maybe_str(row[2]),
+            source_tier=maybe_str(row[3]),
+            reporting_type=maybe_str(row[4]),
+            item_url=maybe_str(row[5]),
+            title=maybe_str(row[6]),
+            author=maybe_str(row[7]),
+            content_hash=maybe_str(row[8]),
         )
 
     mapping = getattr(row, "_mapping", None)
@@ -273,14 +191,14 @@ def parse_event_provenance_row(row: Any) -> EventSourceProvenance | None:
         return None
     return EventSourceProvenance(
         source_id=source_id,
-        source_name=_maybe_str(mapping.get("source_name")),
-        source_url=_maybe_str(mapping.get("source_url")),
-        source_tier=_maybe_str(mapping.get("source_tier")),
-        reporting_type=_maybe_str(mapping.get("reporting_type")),
-        item_url=_maybe_str(mapping.get("item_url")),
-        title=_maybe_str(mapping.get("title")),
-        author=_maybe_str(mapping.get("author")),
-        content_hash=_maybe_str(mapping.get("content_hash")),
+        source_name=maybe_str(mapping.get("source_name")),
+        source_url=maybe_str(mapping.get("source_url")),
+        source_tier=maybe_str(mapping.get("source_tier")),
+        reporting_type=maybe_str(mapping.get("reporting_type")),
+        item_url=maybe_str(mapping.get("item_url")),
+        title=maybe_str(mapping.get("title")),
+        author=maybe_str(mapping.get("author")),
+        content_hash=maybe_str(mapping.get("content_hash")),
     )
 
 
@@ -322,13 +240,20 @@ async def refresh_event_provenance(
     *,
     session: AsyncSession,
     event: Event,
+    item: RawItem | None = None,
 ) -> EventProvenanceSummary:
-    """Recompute and persist one event's provenance-aware corroboration summary."""
-
-    prior_cluster_health = None
-    if isinstance(event.provenance_summary, dict):
-        prior_cluster_health = event.provenance_summary.get(CLUSTER_HEALTH_KEY)
-
+    """
+    Recompute and persist one event's provenance-aware corroboration summary.
+
+    Pass the newly linked `item` on a merge to fold it into the stored counters
+    instead; the summary is recomputed from every item when they cannot be used.
+    """
+
+    if item is not None:
+        folded = await _fold_item_into_event_provenance(session=session, event=event, item=item)
+        if folded is not None:
+            return folded
+    counters: ProvenanceCounters | None = None
     if event.id is None:
         summary = fallback_event_provenance_summary(
             raw_source_count=event.source_count,
@@ -337,18 +262,86 @@ async def refresh_event_provenance(
         )
     else:
         observations = await load_event_provenance_observations(session=session, event_id=event.id)
-        summary = summarize_event_provenance(
-            observations=observations,
+        counters = ProvenanceCounters.from_observations(observations)
+        summary = summarize_provenance_counters(
+            counters,
             raw_source_count=event.source_count,
             unique_source_count=event.unique_source_count,
         )
+    _store_event_provenance(event, summary=summary, counters=counters)
+    return summary
+
+
+async def _fold_item_into_event_provenance(
+    *,
+    session: AsyncSession,
+    event: Event,
+    item: RawItem,
+) -> EventProvenanceSummary | None:
+    """
+    Add one newly linked item to the event's stored provenance counters.
+
+    Only the item's source is read, so merging into a large event costs O(1)
+    database work. Returns None without touching the event when the counters
+    are missing, out of step with `event.source_count`, or due for a periodic
+    full check.
+    """
+
+    stored = (
+        event.provenance_summary.get(PROVENANCE_COUNTERS_KEY)
+        if isinstance(event.provenance_summary, dict)
+        else None
+    )
+    counters = ProvenanceCounters.from_payload(stored)
+    if (
+        counters is None
+        or event.id is None
+        or counters.observation_count != int(event.source_count or 0) - 1
+        or (counters.observation_count + 1) % _PROVENANCE_VERIFY_INTERVAL == 0
+    ):
+        return None
+    source = await session.get(Source, item.source_id)
+    if source is None:
+        return None
+    counters.add(
+        EventSourceProvenance(
+            source_id=source.id,
+            source_name=maybe_str(source.name),
+            source_url=maybe_str(source.url),
+            source_tier=maybe_str(source.source_tier),
+            reporting_type=maybe_str(source.reporting_type),
+            item_url=maybe_str(item.url),
+            title=maybe_str(item.title),
+            author=maybe_str(item.author),
+            content_hash=maybe_str(item.content_hash),
+        )
+    )
+    summary = summarize_provenance_counters(
+        counters,
+        raw_source_count=event.source_count,
+        unique_source_count=event.unique_source_count,
+    )
+    _store_event_provenance(event, summary=summary, counters=counters)
+    return summary
+
+
+def _store_event_provenance(
+    event: Event,
+    *,
+    summary: EventProvenanceSummary,
+    counters: ProvenanceCounters | None,
+) -> None:
+    prior_cluster_health = None
+    if isinstance(event.provenance_summary, dict):
+        prior_cluster_health = event.provenance_summary.get(CLUSTER_HEALTH_KEY)
     event.independent_evidence_count = summary.independent_evidence_count
     event.corroboration_score = summary.weighted_corroboration_score
     event.corroboration_mode = summary.method
     event.provenance_summary = summary.as_dict()
     if isinstance(prior_cluster_health, dict):
         event.provenance_summary[CLUSTER_HEALTH_KEY] = dict(prior_cluster_health)
-    return summary
+    if counters is not None and counters.observation_count > 0:
+        event.provenance_summary[PROVENANCE_COUNTERS_KEY] = counters.as_payload()
 
 
 async def refresh_events_for_source(
@@ -512,138 +505,3 @@ def _contradiction_penalty(event: Event) -> float:
     if event.has_contradictions:
         return 0.7
     return 1.0
-
-
-def infer_source_family(observation: EventSourceProvenance) -> str | None:
-    """Infer a bounded source-family key from URLs or the configured source name."""
-
-    for candidate in (observation.item_url, observation.source_url):
-        family_key = _source_family_key_from_url(candidate)
-        if family_key is not None:
-            return family_key
-    return _slug_text(observation.source_name)
-
-
-def reporting_type_weight(reporting_type: str | None) -> float:
-    """Weight corroboration groups conservatively by reporting type."""
-
-    reporting = _normalized_value(reporting_type)
-    if reporting == "firsthand":
-        return 1.0
-    if reporting == "secondary":
-        return 0.6
-    if reporting == "aggregator":
-        return 0.35
-    return 0.5
-
-
-def _group_identity(
-    *,
-    observation: EventSourceProvenance,
-    source_family: str | None,
-    fingerprint_counts: Counter[str],
-) -> tuple[str, str]:
-    reporting_type = _normalized_value(observation.reporting_type)
-    if reporting_type == "firsthand":
-        return (f"source:{observation.source_id}", "source")
-
-    story_fingerprint = _story_fingerprint(observation)
-    syndicator = _syndication_provider(observation)
-    if syndicator is not None and story_fingerprint is not None:
-        return (f"syndication:{syndicator}:{story_fingerprint}", "syndication")
-    if story_fingerprint is not None and fingerprint_counts.get(story_fingerprint, 0) > 1:
-        return (f"near-duplicate:{story_fingerprint}", "near_duplicate")
-    if source_family is not None:
-        return (f"family:{source_family}", "source_family")
-    return (f"source:{observation.source_id}", "source")
-
-
-def _story_fingerprint(observation: EventSourceProvenance) -> str | None:
-    content_hash = _normalized_value(observation.content_hash)
-    if content_hash:
-        return f"content:{content_hash[:16]}"
-    title = _normalized_text(observation.title)
-    if len(title) < 24:
-        return None
-    digest = hashlib.sha256(title.encode("utf-8")).hexdigest()[:16]
-    return f"title:{digest}"
-
-
-def _syndication_provider(observation: EventSourceProvenance) -> str | None:
-    haystack = " | ".join(
-        value
-        for value in (observation.author, observation.title, observation.source_name)
-        if isinstance(value, str) and value.strip()
-    )
-    if not haystack:
-        return None
-    for provider, patterns in _SYNDICATION_PATTERNS:
-        if any(pattern.search(haystack) for pattern in patterns):
-            return provider
-    return None
-
-
-def _maybe_str(value: Any) -> str | None:
-    if value is None:
-        return None
-    if isinstance(value, str):
-        stripped = value.strip()
-        return stripped or None
-    return str(value)
-
-
-def _normalized_hostname(value: str | None) -> str | None:
-    normalized = _maybe_str(value)
-    if normalized is None:
-        return None
-    parsed = urlparse(normalized if "://" in normalized else f"https://{normalized}")
-    hostname = parsed.hostname.lower() if parsed.hostname else ""
-    if hostname.startswith("www."):
-        hostname = hostname[4:]
-    return hostname or None
-
-
-def _source_family_key_from_url(value: str | None) -> str | None:
-    normalized = _maybe_str(value)
-    if normalized is None:
-        return None
-    parsed = urlparse(normalized if "://" in normalized else f"https://{normalized}")
-    hostname = parsed.hostname.lower() if parsed.hostname else ""
-    if hostname.startswith("www."):
-        hostname = hostname[4:]
-    if hostname in {"t.me", "telegram.me"}:
-        hostname = "t.me"
-        segments = [
-            segment.strip().lower() for segment in parsed.path.split("/") if segment.strip()
-        ]
-        if len(segments) >= 2 and segments[0] == "s":
-            return f"{hostname}/{segments[1]}"
-        if segments:
-            return f"{hostname}/{segments[0]}"
-    return hostname or None
-
-
-def _slug_text(value: str | None) -> str | None:
-    normalized = _normalized_text(value)
-    if not normalized:
-        return None
-    words = _WORD_RE.findall(normalized)
-    if not words:
-        return None
-    return "-".join(words[:6])
-
-
-def _normalized_text(value: str | None) -> str:
-    normalized = _maybe_str(value)
-    if normalized is None:
-        return ""
-    lowered = normalized.lower()
-    return _SPACE_RE.sub(" ", lowered).strip()
-
-
-def _normalized_value(value: str | None) -> str | None:
-    normalized = _maybe_str(value)
-    if normalized is None:
-        return None
-    lowered = normalized.lower()
-    return lowered or None
@@ -59,11 +59,19 @@ class CostTracker:
         *,
         provider: str | None = None,
         model: str | None = None,
+        reserved_calls: int = 0,
+        reserved_input_tokens: int = 0,
     ) -> None:
-        """Raise BudgetExceededError if the requested tier budget is exhausted."""
+        """
+        Raise BudgetExceededError if the requested tier budget is exhausted.
+
+        `reserved_calls` and `reserved_input_tokens` describe calls the caller has
+        already admitted but not yet recorded, so concurrent callers cannot all
+        pass the check against the same remaining headroom.
+        """
         normalized_tier = self._normalize_tier(tier)
         try:
-            self._resolve_token_rates(
+            input_rate, _output_rate = self._resolve_token_rates(
                 tier=normalized_tier,
                 provider=provider,
                 model=model,
@@ -77,7 +85,12 @@ class CostTracker:
             )
             raise BudgetExceededError(pricing_reason) from exc
 
-        allowed, reason = await self.check_budget(normalized_tier)
+        allowed, reason = await self.check_budget(
+            normalized_tier,
+            reserved_calls=reserved_calls,
+            reserved_cost_usd=(Decimal(max(0, reserved_input_tokens)) / Decimal(1_000_000))
+            * input_rate,
+        )
         if allowed:
             return
         reason_code = self._denial_reason_code(reason)
@@ -89,20 +102,26 @@ class CostTracker:
         msg = reason or f"{normalized_tier} budget exceeded"
         raise BudgetExceededError(msg)
 
-    async def check_budget(self, tier: str) -> tuple[bool, str | None]:
-        """Return whether a tier can make another call right now."""
+    async def check_budget(
+        self,
+        tier: str,
+        *,
+        reserved_calls: int = 0,
+        reserved_cost_usd: Decimal = Decimal(0),
+    ) -> tuple[bool, str | None]:
+        """Return whether a tier can make another call on top of any reserved ones."""
         normalized_tier = self._normalize_tier(tier)
         today = datetime.now(tz=UTC).date()
         usage = await self._get_or_create_usage(today, normalized_tier)
 
         call_limit = self._call_limit_for_tier(normalized_tier)
-        if call_limit > 0 and usage.call_count >= call_limit:
+        if call_limit > 0 and usage.call_count + max(0, reserved_calls) >= call_limit:
             return (
                 False,
                 f"{normalized_tier} daily call limit ({call_limit}) exceeded",
             )
 
-        total_cost = await self._total_cost_for_date(today)
+        total_cost = await self._total_cost_for_date(today) + reserved_cost_usd
         daily_limit = Decimal(str(settings.DAILY_COST_LIMIT_USD))
         if daily_limit > 0 and total_cost >= daily_limit:
             return (
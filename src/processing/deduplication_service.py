@@ -1,22 +1,26 @@
 """
-Deduplication service using exact and embedding-similarity checks.
+Deduplication service using exact, MinHash and embedding-similarity checks.
 """
 
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.processing.recent_key_filter import DedupKey, RecentKeyFilter, get_recent_key_filter
+from src.processing.text_fingerprint import estimated_jaccard, minhash_bands
 from src.processing.vector_similarity import max_distance_for_similarity
 from src.storage.models import RawItem
+from src.storage.vector_types import EmbeddingVector, ann_candidate_distance
 
 
 @dataclass(slots=True)
@@ -29,15 +33,45 @@ class DeduplicationResult:
     similarity: float | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class DuplicateCandidate:
+    """Exact-match keys and MinHash signature of one item for `find_duplicates_bulk`."""
+
+    external_id: str | None = None
+    url: str | None = None
+    content_hash: str | None = None
+    item_id: UUID | None = None
+    minhash: list[int] | None = None
+
+
+_EXACT_MATCH_FIELDS = ("external_id", "url", "content_hash")
+_MinhashIndex = dict[int, list[tuple[UUID | None, list[int]]]]
+
+
 class DeduplicationService:
-    """Detect duplicate raw items by exact fields and embedding similarity."""
+    """
+    Detect duplicate raw items by exact fields, MinHash and embedding similarity.
+
+    Exact keys reported absent by the recent-key Bloom filter skip their SQL
+    lookup; possible positives are always confirmed against `raw_items`. MinHash
+    neighbours are fetched through the GIN-indexed LSH bands and confirmed by
+    estimated Jaccard similarity, so re-worded copies are caught before any
+    embedding is paid for.
+    """
 
     def __init__(
         self,
         session: AsyncSession,
         similarity_threshold: float | None = None,
+        recent_key_filter: RecentKeyFilter | None = None,
+        minhash_threshold: float | None = None,
     ) -> None:
         self.session = session
+        self.recent_key_filter = recent_key_filter or get_recent_key_filter()
+        self.minhash_enabled = settings.DEDUP_MINHASH_ENABLED
+        self.minhash_threshold = (
+            settings.DEDUP_MINHASH_THRESHOLD if minhash_threshold is None else minhash_threshold
+        )
         self.similarity_threshold = (
             settings.DEDUP_SIMILARITY_THRESHOLD
             if similarity_threshold is None
@@ -50,13 +84,16 @@ class DeduplicationService:
         external_id: str | None = None,
         url: str | None = None,
         content_hash: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: EmbeddingVector | None = None,
         embedding_model: str | None = None,
         dedup_window_days: int = 7,
         exclude_item_id: UUID | None = None,
+        minhash: list[int] | None = None,
     ) -> DeduplicationResult:
         """
         Return duplicate match details for a candidate item.
+
+        Checks run cheapest first: exact keys, then MinHash, then embedding.
         """
         if not 0 <= self.similarity_threshold <= 1:
             msg = "similarity_threshold must be between 0 and 1"
@@ -66,44 +103,33 @@ class DeduplicationService:
         normalized_url = self.normalize_url(url) if url is not None else None
         normalized_embedding_model = embedding_model.strip() if embedding_model else None
 
-        match_id = await self._find_exact_match(
-            RawItem.external_id,
-            external_id,
-            window_start,
-            exclude_item_id=exclude_item_id,
-        )
-        if match_id is not None:
-            return DeduplicationResult(
-                is_duplicate=True,
-                matched_item_id=match_id,
-                match_reason="external_id",
-            )
-
-        match_id = await self._find_exact_match(
-            RawItem.url,
-            normalized_url,
-            window_start,
-            exclude_item_id=exclude_item_id,
+        exact_keys = await self._possible_keys(
+            _present_keys((external_id, normalized_url, content_hash)),
+            dedup_window_days=dedup_window_days,
         )
-        if match_id is not None:
-            return DeduplicationResult(
-                is_duplicate=True,
-                matched_item_id=match_id,
-                match_reason="url",
+        for field, value in exact_keys:
+            match_id = await self._find_exact_match(
+                getattr(RawItem, field),
+                value,
+                window_start,
+                exclude_item_id=exclude_item_id,
             )
+            if match_id is not None:
+                return DeduplicationResult(
+                    is_duplicate=True,
+                    matched_item_id=match_id,
+                    match_reason=field,
+                )
 
-        match_id = await self._find_exact_match(
-            RawItem.content_hash,
-            content_hash,
-            window_start,
-            exclude_item_id=exclude_item_id,
-        )
-        if match_id is not None:
-            return DeduplicationResult(
-                is_duplicate=True,
-                matched_item_id=match_id,
-                match_reason="content_hash",
+        if minhash is not None and self.minhash_enabled:
+            neighbours = await self._load_minhash_neighbours(
+                [minhash],
+                window_start=window_start,
+                exclude_item_ids=[exclude_item_id] if exclude_item_id is not None else [],
             )
+            near_result = self._minhash_result(minhash, neighbours)
+            if near_result is not None:
+                return near_result
 
         if embedding is not None and normalized_embedding_model:
             embedding_match = await self._find_embedding_match(
@@ -130,10 +156,11 @@ class DeduplicationService:
         external_id: str | None = None,
         url: str | None = None,
         content_hash: str | None = None,
-        embedding: list[float] | None = None,
+        embedding: EmbeddingVector | None = None,
         embedding_model: str | None = None,
         dedup_window_days: int = 7,
         exclude_item_id: UUID | None = None,
+        minhash: list[int] | None = None,
     ) -> bool:
         """Convenience wrapper returning only duplicate status."""
         return (
@@ -145,9 +172,200 @@ class DeduplicationService:
                 embedding_model=embedding_model,
                 dedup_window_days=dedup_window_days,
                 exclude_item_id=exclude_item_id,
+                minhash=minhash,
             )
         ).is_duplicate
 
+    async def find_duplicates_bulk(
+        self,
+        candidates: Sequence[DuplicateCandidate],
+        *,
+        dedup_window_days: int = 7,
+    ) -> list[DeduplicationResult]:
+        """
+        Resolve exact and MinHash duplicates for a batch with one query each.
+
+        Each result keeps the `find_duplicate` precedence (external_id, url,
+        content_hash, minhash). A candidate also duplicates an earlier candidate
+        of the batch sharing a key or a MinHash match. Stored rows of the batch
+        itself (`item_id`) are matched only through that ordering, so the first
+        occurrence is kept.
+        """
+        if not candidates:
+            return []
+
+        candidate_keys = [
+            (
+                candidate.external_id,
+                self.normalize_url(candidate.url) if candidate.url is not None else None,
+                candidate.content_hash,
+            )
+            for candidate in candidates
+        ]
+        batch_item_ids = [c.item_id for c in candidates if c.item_id is not None]
+        stored = await self._load_exact_matches(
+            candidate_keys,
+            dedup_window_days=dedup_window_days,
+            exclude_item_ids=batch_item_ids,
+        )
+        signatures = [c.minhash for c in candidates if c.minhash is not None]
+        stored_neighbours = await self._load_minhash_neighbours(
+            signatures if self.minhash_enabled else [],
+            window_start=datetime.now(tz=UTC) - timedelta(days=dedup_window_days),
+            exclude_item_ids=batch_item_ids,
+        )
+
+        earlier: dict[tuple[str, str], UUID | None] = {}
+        earlier_neighbours: _MinhashIndex = {}
+        results: list[DeduplicationResult] = []
+        for candidate, keys in zip(candidates, candidate_keys, strict=True):
+            present = _present_keys(keys)
+            result = _exact_result(present, stored, earlier)
+            if result is None and candidate.minhash is not None and self.minhash_enabled:
+                result = self._minhash_result(
+                    candidate.minhash, stored_neighbours
+                ) or self._minhash_result(candidate.minhash, earlier_neighbours)
+            for key in present:
+                earlier.setdefault(key, candidate.item_id)
+            if candidate.minhash is not None:
+                _index_minhash(earlier_neighbours, candidate.item_id, candidate.minhash)
+            results.append(result or DeduplicationResult(is_duplicate=False))
+        return results
+
+    async def record_stored(self, candidates: Sequence[DuplicateCandidate]) -> None:
+        """Add the keys of rows just written to `raw_items` to the recent-key filter."""
+        await self.recent_key_filter.add(
+            [
+                key
+                for candidate in candidates
+                for key in _present_keys(
+                    (candidate.external_id, candidate.url, candidate.content_hash)
+                )
+            ]
+        )
+
+    async def _possible_keys(
+        self,
+        keys: Sequence[DedupKey],
+        *,
+        dedup_window_days: int,
+    ) -> list[DedupKey]:
+        verdicts = await self.recent_key_filter.might_contain(keys, window_days=dedup_window_days)
+        return [key for key, maybe in zip(keys, verdicts, strict=True) if maybe]
+
+    async def _load_exact_matches(
+        self,
+        candidate_keys: Sequence[tuple[str | None, str | None, str | None]],
+        *,
+        dedup_window_days: int,
+        exclude_item_ids: Sequence[UUID],
+    ) -> dict[tuple[str, str], UUID]:
+        distinct_keys = sorted({key for keys in candidate_keys for key in _present_keys(keys)})
+        possible_keys = await self._possible_keys(
+            distinct_keys,
+            dedup_window_days=dedup_window_days,
+        )
+        conditions = []
+        for field in _EXACT_MATCH_FIELDS:
+            values = [value for key_field, value in possible_keys if key_field == field]
+            if values:
+                conditions.append(getattr(RawItem, field).in_(values))
+        if not conditions:
+            return {}
+
+        window_start = datetime.now(tz=UTC) - timedelta(days=dedup_window_days)
+        query = select(
+            RawItem.id,
+            RawItem.external_id,
+            RawItem.url,
+            RawItem.content_hash,
+        ).where(RawItem.fetched_at >= window_start, or_(*conditions))
+        if exclude_item_ids:
+            query = query.where(RawItem.id.not_in(exclude_item_ids))
+
+        stored: dict[tuple[str, str], UUID] = {}
+        for row in (await self.session.execute(query)).all():
+            for key in _present_keys(row[1:]):
+                stored.setdefault(key, row[0])
+        return stored
+
+    async def _load_minhash_neighbours(
+        self,
+        signatures: Sequence[list[int]],
+        *,
+        window_start: datetime,
+        exclude_item_ids: Sequence[UUID],
+    ) -> _MinhashIndex:
+        bands = sorted({band for signature in signatures for band in minhash_bands(signature)})
+        if not bands:
+            return {}
+        query = select(RawItem.id, RawItem.minhash_signature).where(
+            RawItem.fetched_at >= window_start,
+            RawItem.minhash_bands.overlap(bands),
+        )
+        if exclude_item_ids:
+            query = query.where(RawItem.id.not_in(exclude_item_ids))
+
+        neighbours: _MinhashIndex = {}
+        for item_id, signature in (await self.session.execute(query)).all():
+            if signature is not None:
+                _index_minhash(neighbours, item_id, list(signature))
+        return neighbours
+
+    def _minhash_result(
+        self,
+        signature: list[int],
+        neighbours: _MinhashIndex,
+    ) -> DeduplicationResult | None:
+        best: tuple[UUID | None, float] | None = None
+        for band in minhash_bands(signature):
+            for item_id, other in neighbours.get(band, ()):
+                similarity = estimated_jaccard(signature, other)
+                if similarity >= self.minhash_threshold and (best is None or similarity > best[1]):
+                    best = (item_id, similarity)
+        if best is None:
+            return None
+        return DeduplicationResult(
+            is_duplicate=True,
+            matched_item_id=best[0],
+            match_reason="minhash",
+            similarity=best[1],
+        )
+
+    async def find_existing_identifiers(
+        self,
+        identifiers: Sequence[str],
+        *,
+        dedup_window_days: int = 7,
+        source_id: UUID | None = None,
+    ) -> set[str]:
+        """
+        Return the subset of `identifiers` already stored as an external_id or URL.
+
+        One query covers the exact external_id/url checks of `find_duplicate` for a
+        whole batch. With `source_id`, that source's own external_ids also match
+        outside the window, since the `(source_id, external_id)` key rejects them.
+        """
+        candidates = sorted(set(identifiers))
+        if not candidates:
+            return set()
+
+        window_start = datetime.now(tz=UTC) - timedelta(days=dedup_window_days)
+        condition = and_(
+            RawItem.fetched_at >= window_start,
+            or_(RawItem.external_id.in_(candidates), RawItem.url.in_(candidates)),
+        )
+        if source_id is not None:
+            condition = or_(
+                condition,
+                and_(RawItem.source_id == source_id, RawItem.external_id.in_(candidates)),
+            )
+        rows = (
+            await self.session.execute(select(RawItem.external_id, RawItem.url).where(condition))
+        ).all()
+        candidate_set = set(candidates)
+        return {value for row in rows for value in row if value in candidate_set}
+
     async def _find_exact_match(
         self,
         column: Any,
@@ -169,30 +387,42 @@ class DeduplicationService:
     async def _find_embedding_match(
         self,
         *,
-        embedding: list[float],
+        embedding: EmbeddingVector,
         embedding_model: str,
         window_start: datetime,
         similarity_threshold: float,
         exclude_item_id: UUID | None = None,
     ) -> tuple[UUID, float] | None:
-        if not embedding:
+        if len(embedding) == 0:
             msg = "embedding must not be empty"
             raise ValueError(msg)
 
         max_distance = max_distance_for_similarity(similarity_threshold)
-        distance_expr = RawItem.embedding.cosine_distance(embedding)
-
-        query = (
-            select(RawItem.id, distance_expr.label("distance"))
+        storage = settings.EMBEDDING_ANN_STORAGE
+        candidates = (
+            select(RawItem.id, RawItem.embedding)
             .where(RawItem.fetched_at >= window_start)
             .where(RawItem.embedding.is_not(None))
             .where(RawItem.embedding_model == embedding_model)
-            .where(distance_expr <= max_distance)
         )
         if exclude_item_id is not None:
-            query = query.where(RawItem.id != exclude_item_id)
-
-        query = query.order_by(distance_expr.asc()).limit(1)
+            candidates = candidates.where(RawItem.id != exclude_item_id)
+
+        if storage == "full":
+            distance_expr = RawItem.embedding.cosine_distance(embedding)
+            query = candidates.with_only_columns(RawItem.id, distance_expr.label("distance"))
+        else:
+            # Quantized index picks candidates; exact distance decides the match.
+            shortlist = (
+                candidates.order_by(
+                    ann_candidate_distance(RawItem.embedding, embedding, storage=storage).asc()
+                )
+                .limit(settings.EMBEDDING_ANN_RERANK_CANDIDATES)
+                .subquery()
+            )
+            distance_expr = shortlist.c.embedding.cosine_distance(embedding)
+            query = select(shortlist.c.id, distance_expr.label("distance"))
+        query = query.where(distance_expr <= max_distance).order_by(distance_expr.asc()).limit(1)
         row = (await self.session.execute(query)).first()
         if row is None:
             return None
@@ -268,3 +498,31 @@ class DeduplicationService:
     def compute_content_hash(content: str) -> str:
         """Compute SHA256 hash used for exact deduplication."""
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _exact_result(
+    present: Sequence[DedupKey],
+    stored: dict[DedupKey, UUID],
+    earlier: dict[DedupKey, UUID | None],
+) -> DeduplicationResult | None:
+    for key in present:
+        if key in stored or key in earlier:
+            return DeduplicationResult(
+                is_duplicate=True,
+                matched_item_id=stored[key] if key in stored else earlier[key],
+                match_reason=key[0],
+            )
+    return None
+
+
+def _index_minhash(index: _MinhashIndex, item_id: UUID | None, signature: list[int]) -> None:
+    for band in minhash_bands(signature):
+        index.setdefault(band, []).append((item_id, signature))
+
+
+def _present_keys(values: Sequence[str | None]) -> list[DedupKey]:
+    return [
+        (field, value)
+        for field, value in zip(_EXACT_MATCH_FIELDS, values, strict=True)
+        if value is not None
+    ]
@@ -0,0 +1,295 @@
+"""
+Resumable embedding backfill for rows missing a target-model vector.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.processing.cost_tracker import BudgetExceededError
+from src.processing.embedding_service import EmbeddingInputAudit, EmbeddingService
+from src.storage.models import Event, RawItem
+
+if TYPE_CHECKING:
+    from src.storage.vector_types import EmbeddingVector
+
+logger = structlog.get_logger(__name__)
+
+BACKFILL_ENTITIES = ("raw_items", "events")
+_ENTITY_SPECS: dict[str, tuple[Any, Any, str]] = {
+    "raw_items": (RawItem, RawItem.raw_content, "raw_item"),
+    "events": (Event, Event.canonical_summary, "event"),
+}
+# Event centroids sum item vectors of the old model; re-seed them from the new embedding.
+_ENTITY_RESETS: dict[str, dict[str, Any]] = {
+    "events": {"embedding_centroid_sum": None, "embedding_centroid_count": 0},
+}
+
+
+@dataclass(slots=True)
+class EmbeddingBackfillProgress:
+    """Checkpointed position and counters of one entity/model backfill."""
+
+    entity: str
+    target_model: str
+    last_id: str | None = None
+    scanned: int = 0
+    embedded: int = 0
+    cache_hits: int = 0
+    api_calls: int = 0
+    pages: int = 0
+    completed: bool = False
+    stopped_reason: str | None = None
+    updated_at: str | None = None
+
+
+@dataclass(slots=True)
+class _Page:
+    ids: list[UUID]
+    texts: list[str]
+    vectors: list[EmbeddingVector] = field(default_factory=list)
+    audits: list[EmbeddingInputAudit] = field(default_factory=list)
+    cache_hits: int = 0
+    api_calls: int = 0
+
+
+class EmbeddingBackfillRunner:
+    """
+    Re-embed rows whose vector is missing or from another model.
+
+    Rows are paged by primary-key keyset, so each page costs one index range scan
+    however far the run has progressed. Reading, embedding and writing run as
+    three async stages joined by bounded queues: the next page is read while the
+    current one is embedded and the previous one is written. Each page is
+    written and committed in one bulk UPDATE before its last id is checkpointed,
+    so an interrupted run resumes after the last committed page. Runs stop
+    cleanly at `max_api_calls`, at the daily embedding budget, or when the
+    scope is exhausted.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession] | Callable[[], Any],
+        entity: str,
+        checkpoint_path: str | Path,
+        page_size: int = 200,
+        queue_depth: int = 2,
+        max_api_calls: int | None = None,
+        max_items_per_minute: float | None = None,
+        embedding_service_factory: Callable[[AsyncSession], EmbeddingService] | None = None,
+        monotonic_fn: Callable[[], float] | None = None,
+    ) -> None:
+        if entity not in _ENTITY_SPECS:
+            msg = f"entity must be one of: {', '.join(BACKFILL_ENTITIES)}"
+            raise ValueError(msg)
+        if page_size < 1:
+            msg = "page_size must be >= 1"
+            raise ValueError(msg)
+        if max_items_per_minute is not None and max_items_per_minute <= 0:
+            msg = "max_items_per_minute must be > 0"
+            raise ValueError(msg)
+        self.session_factory = session_factory
+        self.entity = entity
+        self.checkpoint_path = Path(checkpoint_path)
+        self.page_size = page_size
+        self.queue_depth = max(1, queue_depth)
+        self.max_api_calls = max_api_calls
+        self.max_items_per_minute = max_items_per_minute
+        self._embedding_service_factory = embedding_service_factory or (
+            lambda session: EmbeddingService(session=session)
+        )
+        self._monotonic_fn = monotonic_fn or time.monotonic
+
+    async def run(self, *, restart: bool = False) -> EmbeddingBackfillProgress:
+        """Backfill until the scope, the run cap or the budget is exhausted."""
+        async with self.session_factory() as embed_session:
+            service = self._embedding_service_factory(embed_session)
+            progress = self._load_checkpoint(service.model, restart=restart)
+            progress.completed = False
+            progress.stopped_reason = None
+            read_queue: asyncio.Queue[_Page | None] = asyncio.Queue(self.queue_depth)
+            write_queue: asyncio.Queue[_Page | None] = asyncio.Queue(self.queue_depth)
+            stop = asyncio.Event()
+            stages = [
+                asyncio.ensure_future(self._read_stage(read_queue, progress, stop)),
+                asyncio.ensure_future(
+                    self._embed_stage(
+                        read_queue, write_queue, service, embed_session, progress, stop
+                    )
+                ),
+                asyncio.ensure_future(self._write_stage(write_queue, service.model, progress)),
+            ]
+            try:
+                await asyncio.gather(*stages)
+            except BaseException:
+                for stage in stages:
+                    stage.cancel()
+                await asyncio.gather(*stages, return_exceptions=True)
+                raise
+
+        progress.completed = progress.stopped_reason is None
+        self._save_checkpoint(progress)
+        logger.info("Embedding backfill finished", **asdict(progress))
+        return progress
+
+    async def _read_stage(
+        self,
+        read_queue: asyncio.Queue[_Page | None],
+        progress: EmbeddingBackfillProgress,
+        stop: asyncio.Event,
+    ) -> None:
+        entity_cls, text_column, _context = _ENTITY_SPECS[self.entity]
+        cursor = UUID(progress.last_id) if progress.last_id else None
+        async with self.session_factory() as session:
+            while not stop.is_set():
+                query = (
+                    select(entity_cls.id, text_column)
+                    .where(text_column.is_not(None))
+                    .where(
+                        or_(
+                            entity_cls.embedding.is_(None),
+                            entity_cls.embedding_model.is_distinct_from(progress.target_model),
+                        )
+                    )
+                    .order_by(entity_cls.id.asc())
+                    .limit(self.page_size)
+                )
+                if cursor is not None:
+                    query = query.where(entity_cls.id > cursor)
+                rows = (await session.execute(query)).all()
+                if rows:
+                    cursor = rows[-1][0]
+                    await read_queue.put(
+                        _Page(ids=[row[0] for row in rows], texts=[row[1] for row in rows])
+                    )
+                if len(rows) < self.page_size:
+                    break
+        await read_queue.put(None)
+
+    async def _embed_stage(
+        self,
+        read_queue: asyncio.Queue[_Page | None],
+        write_queue: asyncio.Queue[_Page | None],
+        service: EmbeddingService,
+        session: AsyncSession,
+        progress: EmbeddingBackfillProgress,
+        stop: asyncio.Event,
+    ) -> None:
+        _entity_cls, _text_column, context = _ENTITY_SPECS[self.entity]
+        api_calls = 0
+        next_page_at = self._monotonic_fn()
+        while (page := await read_queue.get()) is not None:
+            if self.max_api_calls is not None and api_calls >= self.max_api_calls:
+                progress.stopped_reason = "max_api_calls"
+                break
+            delay = next_page_at - self._monotonic_fn()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.max_items_per_minute is not None:
+                next_page_at = max(next_page_at, self._monotonic_fn()) + (
+                    60.0 * len(page.ids) / self.max_items_per_minute
+                )
+            try:
+                (
+                    page.vectors,
+                    page.audits,
+                    page.cache_hits,
+                    page.api_calls,
+                ) = await service.embed_texts_with_contexts(
+                    page.texts,
+                    entity_type=context,
+                    entity_ids=list(page.ids),
+                )
+            except BudgetExceededError as exc:
+                progress.stopped_reason = f"budget: {exc}"
+                break
+            finally:
+                # Persist recorded usage so the next page's budget check sees it.
+                await session.commit()
+            api_calls += page.api_calls
+            await write_queue.put(page)
+        await write_queue.put(None)
+        if page is not None:
+            # Stopped early: let the reader observe `stop` and finish its last put.
+            stop.set()
+            while await read_queue.get() is not None:
+                pass
+
+    async def _write_stage(
+        self,
+        write_queue: asyncio.Queue[_Page | None],
+        target_model: str,
+        progress: EmbeddingBackfillProgress,
+    ) -> None:
+        entity_cls, _text_column, _context = _ENTITY_SPECS[self.entity]
+        async with self.session_factory() as session:
+            while (page := await write_queue.get()) is not None:
+                generated_at = datetime.now(tz=UTC)
+                await session.execute(
+                    update(entity_cls),
+                    [
+                        {
+                            "id": row_id,
+                            "embedding": vector,
+                            "embedding_model": target_model,
+                            "embedding_generated_at": generated_at,
+                            "embedding_input_tokens": audit.original_tokens,
+                            "embedding_retained_tokens": audit.retained_tokens,
+                            "embedding_was_truncated": audit.was_truncated,
+                            "embedding_truncation_strategy": (
+                                audit.strategy if audit.was_cut else None
+                            ),
+                            **_ENTITY_RESETS.get(self.entity, {}),
+                        }
+                        for row_id, vector, audit in zip(
+                            page.ids, page.vectors, page.audits, strict=True
+                        )
+                    ],
+                )
+                await session.commit()
+                progress.last_id = str(page.ids[-1])
+                progress.scanned += len(page.ids)
+                progress.embedded += len(page.vectors)
+                progress.cache_hits += page.cache_hits
+                progress.api_calls += page.api_calls
+                progress.pages += 1
+                self._save_checkpoint(progress)
+
+    def _load_checkpoint(self, target_model: str, *, restart: bool) -> EmbeddingBackfillProgress:
+        fresh = EmbeddingBackfillProgress(entity=self.entity, target_model=target_model)
+        if restart or not self.checkpoint_path.exists():
+            return fresh
+        try:
+            loaded = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            progress = EmbeddingBackfillProgress(**loaded)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("Ignoring unreadable embedding backfill checkpoint")
+            return fresh
+        # A finished scope starts over so rows inserted behind the cursor are picked up.
+        if (
+            progress.completed
+            or progress.entity != self.entity
+            or progress.target_model != target_model
+        ):
+            return fresh
+        return progress
+
+    def _save_checkpoint(self, progress: EmbeddingBackfillProgress) -> None:
+        progress.updated_at = datetime.now(tz=UTC).isoformat()
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = self.checkpoint_path.with_suffix(".tmp")
+        staging_path.write_text(json.dumps(asdict(progress), indent=2) + "\n", encoding="utf-8")
+        staging_path.replace(self.checkpoint_path)
@@ -0,0 +1,156 @@
+"""
+Redis-backed embedding cache shared across workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import redis
+import structlog
+
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from src.storage.vector_types import EmbeddingVector
+
+logger = structlog.get_logger(__name__)
+
+
+class SharedEmbeddingCache:
+    """
+    Cross-worker embedding vectors keyed by namespace and normalized-text hash.
+
+    Vectors are stored as packed little-endian float32 (4 bytes per dimension)
+    with a TTL. A sorted-set index per namespace keeps at most `max_entries`
+    vectors by evicting the oldest writes. Lookups and writes are batched into
+    one round trip each; while Redis is unavailable the cache reports misses
+    and drops writes so callers fall back to the provider.
+    """
+
+    _DEGRADE_RETRY_SECONDS = 30
+
+    def __init__(
+        self,
+        *,
+        enabled: bool | None = None,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
+        redis_prefix: str | None = None,
+        redis_url: str | None = None,
+        redis_client: redis.Redis[bytes] | None = None,
+        wall_time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        self.enabled = settings.EMBEDDING_SHARED_CACHE_ENABLED if enabled is None else bool(enabled)
+        self.ttl_seconds = max(
+            1,
+            settings.EMBEDDING_SHARED_CACHE_TTL_SECONDS
+            if ttl_seconds is None
+            else int(ttl_seconds),
+        )
+        self.max_entries = max(
+            1,
+            settings.EMBEDDING_SHARED_CACHE_MAX_ENTRIES
+            if max_entries is None
+            else int(max_entries),
+        )
+        self.redis_prefix = (
+            settings.EMBEDDING_SHARED_CACHE_REDIS_PREFIX
+            if redis_prefix is None
+            else str(redis_prefix)
+        ).strip() or "horadus:embedding_cache"
+        self.redis_url = settings.REDIS_URL if redis_url is None else str(redis_url).strip()
+        self._redis_client = redis_client
+        self._backend_unavailable_until = 0.0
+        self._wall_time_fn = wall_time_fn or time.time
+
+    async def get_many(
+        self,
+        namespace: str,
+        text_hashes: Sequence[str],
+        *,
+        dimensions: int,
+    ) -> list[EmbeddingVector | None]:
+        """Return cached vectors in input order; None marks a miss."""
+        if not self.enabled or not text_hashes:
+            return [None] * len(text_hashes)
+        keys = [self._key(namespace, text_hash) for text_hash in text_hashes]
+        raw_values = await self._redis_call(lambda client: client.mget(keys))
+        if raw_values is None:
+            return [None] * len(text_hashes)
+        return [_unpack(raw, dimensions=dimensions) for raw in raw_values]
+
+    async def set_many(self, namespace: str, vectors: Mapping[str, EmbeddingVector]) -> None:
+        """Store vectors by text hash and evict the namespace's oldest overflow."""
+        if not self.enabled or not vectors:
+            return
+        index_key = f"{self.redis_prefix}:{namespace}:index"
+        now = self._wall_time_fn()
+        payloads = {self._key(namespace, text_hash): _pack(v) for text_hash, v in vectors.items()}
+
+        def write(client: redis.Redis[bytes]) -> None:
+            pipe = client.pipeline(transaction=False)
+            for key, payload in payloads.items():
+                pipe.setex(key, self.ttl_seconds, payload)
+            pipe.zadd(index_key, dict.fromkeys(payloads, now))
+            pipe.zremrangebyscore(index_key, "-inf", now - self.ttl_seconds)
+            pipe.expire(index_key, self.ttl_seconds * 2)
+            pipe.zcard(index_key)
+            overflow = int(pipe.execute()[-1] or 0) - self.max_entries
+            if overflow <= 0:
+                return
+            evicted = client.zrange(index_key, 0, overflow - 1)
+            if evicted:
+                eviction = client.pipeline(transaction=False)
+                eviction.zrem(index_key, *evicted)
+                eviction.delete(*evicted)
+                eviction.execute()
+
+        await self._redis_call(write)
+
+    def _key(self, namespace: str, text_hash: str) -> str:
+        return f"{self.redis_prefix}:{namespace}:{text_hash}"
+
+    async def _redis_call(self, operation: Callable[[redis.Redis[bytes]], Any]) -> Any:
+        if time.monotonic() < self._backend_unavailable_until:
+            return None
+        try:
+            return await asyncio.to_thread(operation, self._client())
+        except Exception as exc:
+            self._backend_unavailable_until = time.monotonic() + self._DEGRADE_RETRY_SECONDS
+            logger.warning(
+                "Shared embedding cache unavailable; using provider",
+                error=str(exc),
+                retry_after_seconds=self._DEGRADE_RETRY_SECONDS,
+            )
+            return None
+
+    def _client(self) -> redis.Redis[bytes]:
+        if self._redis_client is None:
+            self._redis_client = redis.Redis.from_url(self.redis_url)
+        return self._redis_client
+
+
+_WIRE_DTYPE = np.dtype("<f4")
+
+
+def _pack(vector: EmbeddingVector) -> bytes:
+    return np.asarray(vector, dtype=_WIRE_DTYPE).tobytes()
+
+
+def _unpack(raw: Any, *, dimensions: int) -> EmbeddingVector | None:
+    if not isinstance(raw, bytes) or len(raw) != dimensions * 4:
+        return None
+    # Copy out of the reply buffer so callers get a writable native float32 array.
+    return np.frombuffer(raw, dtype=_WIRE_DTYPE).astype(np.float32)
+
+
+@lru_cache
+def get_shared_embedding_cache() -> SharedEmbeddingCache:
+    """Get the process-wide shared embedding cache configured from settings."""
+    return SharedEmbeddingCache()
@@ -4,23 +4,29 @@ Embedding service with batching, caching, and pgvector persistence.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import math
 from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
 import structlog
 from openai import AsyncOpenAI
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
-from src.core.observability import record_embedding_input_guardrail
+from src.core.observability import (
+    record_embedding_cache_lookups,
+    record_embedding_input_guardrail,
+)
 from src.processing.cost_tracker import EMBEDDING, CostTracker
+from src.processing.embedding_cache import SharedEmbeddingCache, get_shared_embedding_cache
 from src.processing.llm_input_safety import estimate_tokens, truncate_to_token_limit
 from src.storage.models import Event, RawItem
+from src.storage.vector_types import EmbeddingVector, as_embedding_vector
 
 logger = structlog.get_logger(__name__)
 
@@ -62,6 +68,9 @@ class _PreparedEmbeddingInput:
 class EmbeddingService:
     """
     Generate embeddings and persist them into pgvector columns.
+
+    Vectors are cached by normalized-text SHA-256 in a per-instance LRU backed by
+    a Redis cache shared across workers, so repeated texts skip the provider.
     """
 
     def __init__(
@@ -76,6 +85,8 @@ class EmbeddingService:
         input_policy: str | None = None,
         token_estimate_chars_per_token: int | None = None,
         cost_tracker: CostTracker | None = None,
+        shared_cache: SharedEmbeddingCache | None = None,
+        max_concurrent_requests: int | None = None,
     ) -> None:
         self.session = session
         self.model = model or settings.EMBEDDING_MODEL
@@ -90,7 +101,26 @@ class EmbeddingService:
 
         self.client = client or self._create_client()
         self.cost_tracker = cost_tracker or CostTracker(session=session)
-        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+        self.max_concurrent_requests = max(
+            1, max_concurrent_requests or settings.EMBEDDING_MAX_CONCURRENT_REQUESTS
+        )
+        self.shared_cache = shared_cache or get_shared_embedding_cache()
+        self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        self._cost_tracker_lock = asyncio.Lock()
+        # Admitted requests whose usage is not recorded yet, counted against the budget.
+        self._reserved_calls = 0
+        self._reserved_input_tokens = 0
+        self._cache: OrderedDict[str, EmbeddingVector] = OrderedDict()
+        # Truncation and chunking settings change the vector stored for a text.
+        self._shared_cache_namespace = ":".join(
+            (
+                self.model,
+                str(self.dimensions),
+                self.input_policy,
+                str(self.max_input_tokens),
+                str(self.token_estimate_chars_per_token),
+            )
+        )
         self._last_input_audits: list[EmbeddingInputAudit] = []
 
     def _create_client(self) -> AsyncOpenAI:
@@ -99,12 +129,12 @@ class EmbeddingService:
             raise ValueError(msg)
         return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
-    async def embed_text(self, text: str) -> list[float]:
+    async def embed_text(self, text: str) -> EmbeddingVector:
         """Generate a single embedding."""
         embeddings, _hits, _calls = await self.embed_texts([text])
         return embeddings[0]
 
-    async def embed_texts(self, texts: list[str]) -> tuple[list[list[float]], int, int]:
+    async def embed_texts(self, texts: list[str]) -> tuple[list[EmbeddingVector], int, int]:
         """
         Generate embeddings for multiple texts with cache reuse.
 
@@ -130,7 +160,7 @@ class EmbeddingService:
         *,
         entity_type: str,
         entity_ids: list[str | Any | None] | None,
-    ) -> tuple[list[list[float]], list[EmbeddingInputAudit], int, int]:
+    ) -> tuple[list[EmbeddingVector], list[EmbeddingInputAudit], int, int]:
         """Embed texts while attaching entity context for audit logs/metrics."""
         if not texts:
             return ([], [], 0, 0)
@@ -142,7 +172,7 @@ class EmbeddingService:
         cache_hits = 0
         api_calls = 0
 
-        results: list[list[float] | None] = [None] * len(normalized_texts)
+        results: list[EmbeddingVector | None] = [None] * len(normalized_texts)
         audits: list[EmbeddingInputAudit | None] = [None] * len(normalized_texts)
         misses_by_key: dict[str, list[int]] = {}
         prepared_by_key: dict[str, _PreparedEmbeddingInput] = {}
@@ -175,33 +205,18 @@ class EmbeddingService:
 
             misses_by_key.setdefault(cache_key, []).append(index)
 
-        miss_keys = list(misses_by_key.keys())
-        single_chunk_keys = [key for key in miss_keys if len(prepared_by_key[key].text_chunks) == 1]
-        multi_chunk_keys = [key for key in miss_keys if len(prepared_by_key[key].text_chunks) > 1]
-
-        for chunk_start in range(0, len(single_chunk_keys), self.batch_size):
-            chunk_keys = single_chunk_keys[chunk_start : chunk_start + self.batch_size]
-            chunk_texts = [prepared_by_key[key].text_chunks[0] for key in chunk_keys]
-            vectors = await self._request_embeddings(chunk_texts)
-            api_calls += 1
-
-            for key, vector in zip(chunk_keys, vectors, strict=True):
-                self._cache_set(key, vector)
-                for result_index in misses_by_key[key]:
-                    results[result_index] = vector
-
-        for key in multi_chunk_keys:
-            prepared = prepared_by_key[key]
-            chunk_vectors: list[list[float]] = []
-            for chunk_start in range(0, len(prepared.text_chunks), self.batch_size):
-                chunk_inputs = prepared.text_chunks[chunk_start : chunk_start + self.batch_size]
-                chunk_vectors.extend(await self._request_embeddings(chunk_inputs))
-                api_calls += 1
-
-            merged_vector = self._average_vectors(chunk_vectors)
-            self._cache_set(key, merged_vector)
+        record_embedding_cache_lookups(
+            tier="memory", hits=cache_hits, misses=len(texts) - cache_hits
+        )
+        cache_hits += await self._fill_from_shared_cache(misses_by_key, results)
+        fresh_vectors, api_calls = await self._embed_missing(
+            {key: prepared_by_key[key] for key in misses_by_key}
+        )
+        for key, vector in fresh_vectors.items():
+            self._cache_set(key, vector)
             for result_index in misses_by_key[key]:
-                results[result_index] = merged_vector
+                results[result_index] = vector
+        await self.shared_cache.set_many(self._shared_cache_namespace, fresh_vectors)
 
         finalized = [vector for vector in results if vector is not None]
         finalized_audits = [audit for audit in audits if audit is not None]
@@ -305,30 +320,100 @@ class EmbeddingService:
             api_calls=api_calls,
         )
 
-    async def _request_embeddings(self, inputs: list[str]) -> list[list[float]]:
+    async def _embed_missing(
+        self,
+        prepared_by_key: dict[str, _PreparedEmbeddingInput],
+    ) -> tuple[dict[str, EmbeddingVector], int]:
+        """
+        Embed cache misses with concurrent provider requests.
+
+        Single-chunk texts share `batch_size` requests; each multi-chunk text
+        gets its own requests and its chunk vectors are averaged. Returns the
+        vectors by cache key and the number of requests made.
+        """
+        single_chunk_keys = [key for key, p in prepared_by_key.items() if len(p.text_chunks) == 1]
+        request_inputs: list[list[str]] = []
+        request_keys: list[list[str]] = []
+        for chunk_start in range(0, len(single_chunk_keys), self.batch_size):
+            chunk_keys = single_chunk_keys[chunk_start : chunk_start + self.batch_size]
+            request_inputs.append([prepared_by_key[key].text_chunks[0] for key in chunk_keys])
+            request_keys.append(chunk_keys)
+        multi_chunk_requests: dict[str, list[int]] = {}
+        for key, prepared in prepared_by_key.items():
+            if len(prepared.text_chunks) == 1:
+                continue
+            for chunk_start in range(0, len(prepared.text_chunks), self.batch_size):
+                multi_chunk_requests.setdefault(key, []).append(len(request_inputs))
+                request_inputs.append(
+                    prepared.text_chunks[chunk_start : chunk_start + self.batch_size]
+                )
+
+        responses = await self._request_embeddings_concurrently(request_inputs)
+        vectors: dict[str, EmbeddingVector] = {}
+        for chunk_keys, response in zip(request_keys, responses, strict=False):
+            vectors.update(zip(chunk_keys, response, strict=True))
+        for key, request_indexes in multi_chunk_requests.items():
+            chunk_vectors = [vector for index in request_indexes for vector in responses[index]]
+            vectors[key] = self._average_vectors(chunk_vectors)
+        return (vectors, len(request_inputs))
+
+    async def _request_embeddings_concurrently(
+        self,
+        requests: list[list[str]],
+    ) -> list[list[EmbeddingVector]]:
+        """Run requests at most `max_concurrent_requests` at a time, in input order."""
+        tasks = [asyncio.ensure_future(self._request_embeddings(inputs)) for inputs in requests]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _request_embeddings(self, inputs: list[str]) -> list[EmbeddingVector]:
         if not inputs:
             return []
 
-        await self.cost_tracker.ensure_within_budget(
-            EMBEDDING,
-            provider=settings.LLM_PRIMARY_PROVIDER,
-            model=self.model,
-        )
-        response = await self.client.embeddings.create(
-            model=self.model,
-            input=inputs,
-        )
-        usage_obj = getattr(response, "usage", None)
-        prompt_tokens = int(getattr(usage_obj, "prompt_tokens", 0) or 0)
-        if prompt_tokens == 0:
-            prompt_tokens = int(getattr(usage_obj, "total_tokens", 0) or 0)
-        await self.cost_tracker.record_usage(
-            tier=EMBEDDING,
-            input_tokens=prompt_tokens,
-            output_tokens=0,
-            provider=settings.LLM_PRIMARY_PROVIDER,
-            model=self.model,
+        estimated_tokens = sum(
+            estimate_tokens(text=text, chars_per_token=self.token_estimate_chars_per_token)
+            for text in inputs
         )
+        async with self._request_slots:
+            # Concurrent requests share one AsyncSession, so budget reads and
+            # usage writes are serialized; only the provider calls overlap. Each
+            # request reserves its call and estimated tokens before launching so
+            # in-flight requests cannot jointly overshoot the remaining budget.
+            async with self._cost_tracker_lock:
+                await self.cost_tracker.ensure_within_budget(
+                    EMBEDDING,
+                    provider=settings.LLM_PRIMARY_PROVIDER,
+                    model=self.model,
+                    reserved_calls=self._reserved_calls,
+                    reserved_input_tokens=self._reserved_input_tokens,
+                )
+                self._reserved_calls += 1
+                self._reserved_input_tokens += estimated_tokens
+            try:
+                response = await self.client.embeddings.create(
+                    model=self.model,
+                    input=inputs,
+                )
+                usage_obj = getattr(response, "usage", None)
+                prompt_tokens = int(getattr(usage_obj, "prompt_tokens", 0) or 0)
+                if prompt_tokens == 0:
+                    prompt_tokens = int(getattr(usage_obj, "total_tokens", 0) or 0)
+                async with self._cost_tracker_lock:
+                    await self.cost_tracker.record_usage(
+                        tier=EMBEDDING,
+                        input_tokens=prompt_tokens,
+                        output_tokens=0,
+                        provider=settings.LLM_PRIMARY_PROVIDER,
+                        model=self.model,
+                    )
+            finally:
+                self._reserved_calls -= 1
+                self._reserved_input_tokens -= estimated_tokens
 
         raw_data = getattr(response, "data", None)
         if not isinstance(raw_data, list):
@@ -338,7 +423,7 @@ class EmbeddingService:
             msg = "Embedding response size does not match input size"
             raise ValueError(msg)
 
-        indexed_vectors: list[tuple[int, list[float]]] = []
+        indexed_vectors: list[tuple[int, EmbeddingVector]] = []
         for fallback_index, item in enumerate(raw_data):
             raw_index = getattr(item, "index", fallback_index)
             if not isinstance(raw_index, int):
@@ -349,21 +434,7 @@ class EmbeddingService:
             if not isinstance(raw_embedding, list):
                 msg = "Embedding response embedding is not a list"
                 raise ValueError(msg)
-            if len(raw_embedding) != self.dimensions:
-                msg = f"Embedding dimension mismatch: expected {self.dimensions}"
-                raise ValueError(msg)
-
-            vector: list[float] = []
-            for value in raw_embedding:
-                if not isinstance(value, int | float):
-                    msg = "Embedding vector contains non-numeric value"
-                    raise ValueError(msg)
-                float_value = float(value)
-                if not math.isfinite(float_value):
-                    msg = "Embedding vector contains non-finite value"
-                    raise ValueError(msg)
-                vector.append(float_value)
-
+            vector = as_embedding_vector(raw_embedding, dimensions=self.dimensions)
             indexed_vectors.append((raw_index, vector))
 
         indexed_vectors.sort(key=lambda pair: pair[0])
@@ -375,18 +446,45 @@ class EmbeddingService:
 
         return [vector for _index, vector in indexed_vectors]
 
+    async def _fill_from_shared_cache(
+        self,
+        misses_by_key: dict[str, list[int]],
+        results: list[EmbeddingVector | None],
+    ) -> int:
+        """Serve memory misses from the shared cache; return the inputs served."""
+        if not misses_by_key:
+            return 0
+        keys = list(misses_by_key)
+        vectors = await self.shared_cache.get_many(
+            self._shared_cache_namespace,
+            keys,
+            dimensions=self.dimensions,
+        )
+        served = 0
+        for key, vector in zip(keys, vectors, strict=True):
+            if vector is None:
+                continue
+            self._cache_set(key, vector)
+            for result_index in misses_by_key.pop(key):
+                results[result_index] = vector
+                served += 1
+        if self.shared_cache.enabled:
+            hits = len(keys) - len(misses_by_key)
+            record_embedding_cache_lookups(tier="shared", hits=hits, misses=len(misses_by_key))
+        return served
+
     @staticmethod
     def _cache_key(text: str) -> str:
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
-    def _cache_get(self, cache_key: str) -> list[float] | None:
+    def _cache_get(self, cache_key: str) -> EmbeddingVector | None:
         cached = self._cache.get(cache_key)
         if cached is None:
             return None
         self._cache.move_to_end(cache_key)
         return cached
 
-    def _cache_set(self, cache_key: str, vector: list[float]) -> None:
+    def _cache_set(self, cache_key: str, vector: EmbeddingVector) -> None:
         self._cache[cache_key] = vector
         self._cache.move_to_end(cache_key)
         while len(self._cache) > self.cache_max_size:
@@ -503,21 +601,15 @@ class EmbeddingService:
             max_input_tokens=self.max_input_tokens,
         )
 
-    def _average_vectors(self, vectors: list[list[float]]) -> list[float]:
+    def _average_vectors(self, vectors: list[EmbeddingVector]) -> EmbeddingVector:
         if not vectors:
             msg = "Expected at least one chunk vector for aggregation"
             raise ValueError(msg)
-
-        accumulator = [0.0] * self.dimensions
-        for vector in vectors:
-            if len(vector) != self.dimensions:
-                msg = "Chunk vector dimension mismatch during aggregation"
-                raise ValueError(msg)
-            for index, value in enumerate(vector):
-                accumulator[index] += value
-
-        vector_count = float(len(vectors))
-        return [value / vector_count for value in accumulator]
+        if any(len(vector) != self.dimensions for vector in vectors):
+            msg = "Chunk vector dimension mismatch during aggregation"
+            raise ValueError(msg)
+        mean = np.mean(np.asarray(vectors, dtype=np.float64), axis=0)
+        return np.asarray(mean, dtype=np.float32)
 
     @staticmethod
     def _normalize_text(text: str) -> str:
@@ -0,0 +1,155 @@
+"""
+Running-sum centroids of the item embeddings linked to an event.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from sqlalchemy import func
+
+from src.core.config import settings
+from src.storage.models import Event
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import QueryableAttribute
+    from sqlalchemy.sql.elements import ColumnElement
+
+    from src.storage.vector_types import EmbeddingVector
+
+EVENT_EMBEDDING_MODES = ("seed", "centroid")
+
+
+def _unit_vector(embedding: Any) -> EmbeddingVector | None:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if vector.ndim != 1 or norm == 0.0 or not np.isfinite(norm):
+        return None
+    return vector / np.float32(norm)
+
+
+def _centroid_state(event: Event) -> tuple[EmbeddingVector | None, int]:
+    """
+    Return the event's sum vector and count, seeding legacy events from `embedding`.
+
+    Events created before centroids were tracked count their stored embedding as
+    one member until the backfill replaces it with the exact sum.
+    """
+    count = int(event.embedding_centroid_count or 0)
+    if count > 0 and event.embedding_centroid_sum is not None:
+        return (np.asarray(event.embedding_centroid_sum, dtype=np.float32), count)
+    if event.embedding is None:
+        return (None, 0)
+    seed = _unit_vector(event.embedding)
+    return (seed, 0 if seed is None else 1)
+
+
+def _store_centroid(event: Event, total: EmbeddingVector | None, count: int) -> None:
+    # Assign fresh arrays so the ORM sees the change; in-place edits are not tracked.
+    if total is None or count <= 0:
+        event.embedding_centroid_sum = None
+        event.embedding_centroid_count = 0
+        return
+    event.embedding_centroid_sum = total
+    event.embedding_centroid_count = count
+
+
+def add_to_event_centroid(event: Event, embedding: Any, embedding_model: str | None) -> bool:
+    """Fold one item embedding of the event's model into its centroid in O(d)."""
+    if embedding is None or embedding_model != event.embedding_model:
+        return False
+    unit = _unit_vector(embedding)
+    if unit is None:
+        return False
+    total, count = _centroid_state(event)
+    if total is None:
+        _store_centroid(event, unit, 1)
+    elif total.shape != unit.shape:
+        return False
+    else:
+        _store_centroid(event, total + unit, count + 1)
+    return True
+
+
+def _sum_unit_vectors(
+    embeddings: Iterable[tuple[Any, str | None]],
+    embedding_model: str | None,
+    dimensions: int | None,
+) -> tuple[EmbeddingVector | None, int]:
+    total: EmbeddingVector | None = None
+    count = 0
+    for embedding, item_model in embeddings:
+        if embedding is None or item_model != embedding_model:
+            continue
+        unit = _unit_vector(embedding)
+        if unit is None or (dimensions is not None and unit.shape[0] != dimensions):
+            continue
+        dimensions = unit.shape[0]
+        total = unit if total is None else total + unit
+        count += 1
+    return (total, count)
+
+
+def remove_from_event_centroid(
+    event: Event,
+    embeddings: Iterable[tuple[Any, str | None]],
+) -> None:
+    """Subtract moved item embeddings of the event's model from its centroid."""
+    total, count = _centroid_state(event)
+    if total is None:
+        return
+    removed, removed_count = _sum_unit_vectors(embeddings, event.embedding_model, total.shape[0])
+    if removed is not None:
+        _store_centroid(event, total - removed, count - removed_count)
+
+
+def merge_event_centroids(target: Event, source: Event) -> bool:
+    """Add `source`'s centroid to `target`'s in O(d) when both share a model."""
+    if source.embedding_model != target.embedding_model:
+        return False
+    source_total, source_count = _centroid_state(source)
+    if source_total is None:
+        return True
+    target_total, target_count = _centroid_state(target)
+    if target_total is None:
+        _store_centroid(target, source_total, source_count)
+    elif target_total.shape != source_total.shape:
+        return False
+    else:
+        _store_centroid(target, target_total + source_total, target_count + source_count)
+    return True
+
+
+def rebuild_event_centroid(event: Event, embeddings: Iterable[tuple[Any, str | None]]) -> None:
+    """Recompute the centroid from every linked item embedding of the event's model."""
+    total, count = _sum_unit_vectors(embeddings, event.embedding_model, None)
+    _store_centroid(event, total, count)
+
+
+def event_match_embedding(event: Event, *, mode: str | None = None) -> Any:
+    """
+    Return the vector new items are matched against for `event`.
+
+    `centroid` mode uses the running sum, which points the same way as the mean
+    so cosine scores are unchanged. `embedding` always stays the seed item's
+    vector described by the event's embedding audit fields.
+    """
+    if (
+        (mode or settings.CLUSTER_EVENT_EMBEDDING_MODE) == "centroid"
+        and int(event.embedding_centroid_count or 0) > 0
+        and event.embedding_centroid_sum is not None
+    ):
+        return event.embedding_centroid_sum
+    return event.embedding
+
+
+def event_match_embedding_column(
+    *, mode: str | None = None
+) -> ColumnElement[Any] | QueryableAttribute[Any]:
+    """Return the SQL counterpart of `event_match_embedding`."""
+    if (mode or settings.CLUSTER_EVENT_EMBEDDING_MODE) == "centroid":
+        # Sums are cleared whenever no member is tracked, so NULL means "use the seed".
+        return func.coalesce(Event.embedding_centroid_sum, Event.embedding)
+    return Event.embedding
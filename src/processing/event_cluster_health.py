@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
-from itertools import combinations
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
+import numpy as np
+import numpy.typing as npt
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.processing.vector_similarity import cosine_similarity
+from src.processing.event_centroid import rebuild_event_centroid
+from src.processing.similarity_kernels import normalize_rows, pairwise_similarity_stats
 from src.storage.models import EventItem, RawItem
 
+if TYPE_CHECKING:
+    from src.storage.vector_types import EmbeddingVector
+
 CLUSTER_HEALTH_KEY = "cluster_health"
 DEFAULT_CLUSTER_COHESION_SCORE = 1.0
 DEFAULT_SPLIT_RISK_SCORE = 0.0
+# Members least similar to the centroid, kept to score a new item's worst pair.
+CLUSTER_HEALTH_OUTLIER_LIMIT = 8
 
 
 def cluster_health_payload(event: Any) -> dict[str, float]:
@@ -76,7 +84,7 @@ def apply_merge_cluster_health(event: Any, *, similarity: float) -> None:
 def apply_repaired_cluster_health(
     event: Any,
     *,
-    item_embeddings: list[list[float] | None],
+    item_embeddings: list[EmbeddingVector | None],
 ) -> None:
     """Recompute cluster health from the repaired event's current item embeddings."""
 
@@ -100,6 +108,50 @@ def split_risk_score(event: Any) -> float:
     return cluster_health_payload(event)["split_risk_score"]
 
 
+async def update_cluster_health_after_merge(
+    *,
+    session: AsyncSession,
+    event: Any,
+    item_id: UUID,
+    item_embedding: EmbeddingVector | None,
+    prior_health: Any,
+) -> None:
+    """
+    Fold one merged item into the event's cluster health without a pairwise pass.
+
+    `item_embedding` is the item's vector when it was added to the event
+    centroid, else None. The centroid sums unit vectors, so every squared norm
+    is 1 and the pairwise similarity total is `(|sum|^2 - n) / 2`, which gives
+    cohesion exactly in O(d). Split risk only grows as items join; the new
+    item's worst pair is looked for among a bounded set of members least
+    similar to the centroid. When the stored counters do not line up with the
+    centroid (legacy rows, model changes, lineage repairs) the health and the
+    centroid are rebuilt once from every item embedding.
+    """
+
+    running = _running_stats(prior_health)
+    member_count = int(getattr(event, "embedding_centroid_count", 0) or 0)
+    centroid_sum = getattr(event, "embedding_centroid_sum", None)
+    if running is not None and centroid_sum is not None:
+        prior_count, outlier_ids = running
+        if item_embedding is None and member_count == prior_count:
+            provenance_summary = dict(getattr(event, "provenance_summary", None) or {})
+            provenance_summary[CLUSTER_HEALTH_KEY] = dict(prior_health)
+            event.provenance_summary = provenance_summary
+            return
+        if item_embedding is not None and member_count == prior_count + 1:
+            await _store_incremental_cluster_health(
+                session=session,
+                event=event,
+                item_id=item_id,
+                item_embedding=item_embedding,
+                prior_health=prior_health,
+                outlier_ids=outlier_ids,
+            )
+            return
+    await _store_exact_cluster_health(session=session, event=event)
+
+
 async def ensure_cluster_health(
     *,
     session: AsyncSession,
@@ -155,14 +207,107 @@ async def resolve_cluster_health(
     return _cluster_health_from_item_embeddings(item_embeddings)
 
 
+async def _store_incremental_cluster_health(
+    *,
+    session: AsyncSession,
+    event: Any,
+    item_id: UUID,
+    item_embedding: EmbeddingVector,
+    prior_health: dict[str, Any],
+    outlier_ids: list[UUID],
+) -> None:
+    member_count = int(event.embedding_centroid_count)
+    centroid_sum = np.asarray(event.embedding_centroid_sum, dtype=np.float64)
+    cohesion = DEFAULT_CLUSTER_COHESION_SCORE
+    if member_count > 1:
+        pair_total = (float(centroid_sum @ centroid_sum) - member_count) / 2.0
+        cohesion = pair_total / ((member_count * (member_count - 1)) / 2.0)
+
+    item_unit = _unit_rows([item_embedding])[0]
+    if item_unit is None:
+        await _store_exact_cluster_health(session=session, event=event)
+        return
+    outlier_rows: list[tuple[UUID, Any]] = []
+    if outlier_ids:
+        result = await session.execute(
+            select(RawItem.id, RawItem.embedding).where(RawItem.id.in_(outlier_ids))
+        )
+        outlier_rows = [(row[0], row[1]) for row in result.all()]
+    outlier_units = _unit_rows([embedding for _item_id, embedding in outlier_rows])
+    outliers = [
+        (row[0], unit)
+        for row, unit in zip(outlier_rows, outlier_units, strict=True)
+        if unit is not None and unit.shape == item_unit.shape
+    ]
+    split_risk = _bounded_float(
+        prior_health.get("split_risk_score"), default=DEFAULT_SPLIT_RISK_SCORE
+    )
+    if outliers:
+        worst = min(float(unit @ item_unit) for _item_id, unit in outliers)
+        split_risk = max(split_risk, 1.0 - worst)
+
+    _store_cluster_health(
+        event=event,
+        cluster_cohesion_score=cohesion,
+        split_risk_score=split_risk,
+        member_count=member_count,
+        outlier_item_ids=_least_central_ids([*outliers, (item_id, item_unit)], centroid_sum),
+    )
+
+
+async def _store_exact_cluster_health(*, session: AsyncSession, event: Any) -> None:
+    event_id = getattr(event, "id", None)
+    if event_id is None or getattr(event, "embedding_model", None) is None:
+        apply_default_cluster_health(event)
+        return
+    rows = list(
+        (
+            await session.execute(
+                select(RawItem.id, RawItem.embedding)
+                .join(EventItem, EventItem.item_id == RawItem.id)
+                .where(EventItem.event_id == event_id)
+                .where(RawItem.embedding.is_not(None))
+                .where(RawItem.embedding_model == event.embedding_model)
+            )
+        ).all()
+    )
+    rebuild_event_centroid(event, [(row[1], event.embedding_model) for row in rows])
+    units = _unit_rows([row[1] for row in rows])
+    dimensions = next((unit.shape[0] for unit in units if unit is not None), None)
+    members = [
+        (row[0], unit)
+        for row, unit in zip(rows, units, strict=True)
+        if unit is not None and unit.shape[0] == dimensions
+    ]
+    payload = _cluster_health_from_item_embeddings([unit for _item_id, unit in members])
+    centroid_sum = getattr(event, "embedding_centroid_sum", None)
+    member_count = int(getattr(event, "embedding_centroid_count", 0) or 0)
+    cohesion = payload["cluster_cohesion_score"]
+    split_risk = payload["split_risk_score"]
+    if centroid_sum is None or member_count != len(members):
+        _store_cluster_health(
+            event=event, cluster_cohesion_score=cohesion, split_risk_score=split_risk
+        )
+        return
+    _store_cluster_health(
+        event=event,
+        cluster_cohesion_score=cohesion,
+        split_risk_score=split_risk,
+        member_count=member_count,
+        outlier_item_ids=_least_central_ids(members, np.asarray(centroid_sum, dtype=np.float64)),
+    )
+
+
 def _store_cluster_health(
     *,
     event: Any,
     cluster_cohesion_score: float,
     split_risk_score: float,
+    member_count: int | None = None,
+    outlier_item_ids: list[UUID] | None = None,
 ) -> None:
     provenance_summary = dict(getattr(event, "provenance_summary", None) or {})
-    provenance_summary[CLUSTER_HEALTH_KEY] = {
+    payload: dict[str, Any] = {
         "cluster_cohesion_score": round(
             _bounded_float(cluster_cohesion_score, default=DEFAULT_CLUSTER_COHESION_SCORE), 6
         ),
@@ -170,9 +315,35 @@ def _store_cluster_health(
             _bounded_float(split_risk_score, default=DEFAULT_SPLIT_RISK_SCORE), 6
         ),
     }
+    if member_count is not None and outlier_item_ids is not None:
+        payload["member_count"] = member_count
+        payload["outlier_item_ids"] = [str(item_id) for item_id in outlier_item_ids]
+    provenance_summary[CLUSTER_HEALTH_KEY] = payload
     event.provenance_summary = provenance_summary
 
 
+def _running_stats(payload: Any) -> tuple[int, list[UUID]] | None:
+    if not isinstance(payload, dict):
+        return None
+    member_count = payload.get("member_count")
+    outlier_item_ids = payload.get("outlier_item_ids")
+    if not isinstance(member_count, int) or not isinstance(outlier_item_ids, list):
+        return None
+    try:
+        return (member_count, [UUID(str(item_id)) for item_id in outlier_item_ids])
+    except ValueError:
+        return None
+
+
+def _least_central_ids(
+    members: list[tuple[UUID, npt.NDArray[np.float64]]],
+    centroid_sum: npt.NDArray[np.float64],
+) -> list[UUID]:
+    scores = np.vstack([unit for _item_id, unit in members]) @ centroid_sum
+    keep = np.argsort(scores, kind="stable")[:CLUSTER_HEALTH_OUTLIER_LIMIT]
+    return [members[int(index)][0] for index in keep]
+
+
 def _bounded_float(value: Any, *, default: float) -> float:
     try:
         parsed = float(value)
@@ -181,36 +352,60 @@ def _bounded_float(value: Any, *, default: float) -> float:
     return max(0.0, min(1.0, parsed))
 
 
+def _unit_rows(embeddings: list[Any]) -> list[npt.NDArray[np.float64] | None]:
+    units: list[npt.NDArray[np.float64] | None] = []
+    for embedding in embeddings:
+        vector = _as_vector(embedding)
+        norm = float(np.linalg.norm(vector)) if vector is not None else 0.0
+        units.append(vector / norm if vector is not None and norm > 0.0 else None)
+    return units
+
+
+def _as_vector(embedding: Any) -> npt.NDArray[np.float64] | None:
+    if embedding is None:
+        return None
+    try:
+        vector = np.asarray(embedding, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if vector.ndim != 1 or vector.shape[0] == 0 or not np.isfinite(vector).all():
+        return None
+    return vector
+
+
 def _cluster_health_from_item_embeddings(
-    item_embeddings: list[list[float] | None],
+    item_embeddings: list[Any],
 ) -> dict[str, float]:
-    if len(item_embeddings) <= 1:
-        return {
-            "cluster_cohesion_score": DEFAULT_CLUSTER_COHESION_SCORE,
-            "split_risk_score": DEFAULT_SPLIT_RISK_SCORE,
-        }
-    similarities: list[float] = []
-    for left_embedding, right_embedding in combinations(item_embeddings, 2):
-        if left_embedding is None or right_embedding is None:
-            continue
-        try:
-            similarities.append(cosine_similarity(left_embedding, right_embedding))
-        except ValueError:
-            continue
-    if not similarities:
+    """Exact mean and minimum pairwise cosine over same-length item embeddings."""
+
+    groups: dict[int, list[npt.NDArray[np.float64]]] = {}
+    for embedding in item_embeddings:
+        vector = _as_vector(embedding)
+        if vector is not None:
+            # Vectors of different lengths are never compared with each other.
+            groups.setdefault(vector.shape[0], []).append(vector)
+    pair_count = 0
+    pair_total = 0.0
+    lowest = 1.0
+    for vectors in groups.values():
+        group_pairs, group_total, group_lowest = pairwise_similarity_stats(
+            normalize_rows(vectors, dtype=np.float64)
+        )
+        pair_count += group_pairs
+        pair_total += group_total
+        lowest = min(lowest, group_lowest)
+    if pair_count == 0:
         return {
             "cluster_cohesion_score": DEFAULT_CLUSTER_COHESION_SCORE,
             "split_risk_score": DEFAULT_SPLIT_RISK_SCORE,
         }
-    cluster_cohesion = sum(similarities) / len(similarities)
-    split_risk = max(1.0 - similarity for similarity in similarities)
     return {
         "cluster_cohesion_score": _bounded_float(
-            cluster_cohesion,
+            pair_total / pair_count,
             default=DEFAULT_CLUSTER_COHESION_SCORE,
         ),
         "split_risk_score": _bounded_float(
-            split_risk,
+            1.0 - lowest,
             default=DEFAULT_SPLIT_RISK_SCORE,
         ),
     }
@@ -9,10 +9,12 @@ from datetime import UTC, datetime, timedelta
 from typing import cast
 from uuid import UUID, uuid4
 
+import numpy as np
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import func, select, true
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.core.config import settings
 from src.core.observability import record_processing_event_suppression
@@ -20,21 +22,36 @@ from src.core.source_credibility import (
     DEFAULT_SOURCE_CREDIBILITY,
     source_multiplier_expression,
 )
+from src.processing.active_event_index import ActiveEventIndex, get_active_event_index
 from src.processing.corroboration_provenance import refresh_event_provenance
+from src.processing.event_centroid import (
+    add_to_event_centroid,
+    event_match_embedding,
+    event_match_embedding_column,
+    rebuild_event_centroid,
+)
 from src.processing.event_cluster_health import (
+    CLUSTER_HEALTH_KEY,
     apply_default_cluster_health,
     ensure_cluster_health,
-    resolve_cluster_health,
+    update_cluster_health_after_merge,
 )
 from src.processing.event_lifecycle import EventLifecycleManager
-from src.processing.vector_similarity import max_distance_for_similarity
+from src.processing.similarity_kernels import cosine_scores, normalize_rows
+from src.processing.vector_similarity import cosine_similarity, max_distance_for_similarity
 from src.storage.event_state import EventActivityState, EventEpistemicState
 from src.storage.event_summary import refresh_event_summary_from_canonical
 from src.storage.models import Event, EventItem, RawItem, Source
 from src.storage.restatement_models import HumanFeedback
+from src.storage.vector_types import EmbeddingVector, ann_candidate_distance
 
 logger = structlog.get_logger(__name__)
 
+_SUPPRESSION_ACTIONS = ("mark_noise", "invalidate")
+# Float32 index scores may sit just under the threshold; exact checks decide.
+_INDEX_SIMILARITY_SLACK = 1e-4
+_INDEX_VERIFY_ATTEMPTS = 3
+
 
 @dataclass(slots=True)
 class ClusterResult:
@@ -50,17 +67,18 @@ class ClusterResult:
 class EventClusterer:
     """Cluster raw items into events using embedding similarity and time windows."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        event_index: ActiveEventIndex | None = None,
+    ) -> None:
         self.session = session
         self.lifecycle_manager = EventLifecycleManager(session)
+        self.event_index = event_index if event_index is not None else get_active_event_index()
 
     async def cluster_item(self, item: RawItem) -> ClusterResult:
         """Cluster a single raw item into an existing or new event."""
-        item_id = item.id
-        if item_id is None:
-            msg = "RawItem must have an id before clustering"
-            raise ValueError(msg)
-
+        item_id = self._require_item_id(item)
         already_event_id = await self._find_existing_event_id_for_item(item_id)
         if already_event_id is not None:
             return ClusterResult(
@@ -70,23 +88,90 @@ class EventClusterer:
                 merged=True,
             )
 
-        if item.embedding is None:
-            return await self._create_linked_event(item)
+        item_embedding_model = self._item_embedding_model(item)
+        matched = None
+        if item.embedding is not None and item_embedding_model is not None:
+            matched = await self._find_matching_event(
+                item.embedding,
+                item_embedding_model,
+                self._item_timestamp(item),
+            )
+        result, _event = await self._cluster_with_match(item, matched)
+        return result
+
+    async def cluster_items(self, items: list[RawItem]) -> list[ClusterResult]:
+        """
+        Cluster a batch of raw items, returning results in input order.
+
+        Existing links, the best candidate event for every embedded item and
+        those candidates' suppression state are each resolved with one query
+        for the whole batch. Items are then applied in input order; events
+        created or merged earlier in the batch are re-scored in memory, so
+        similar items that match no stored event form one new event together,
+        led by the first of them.
+        """
+        if not items:
+            return []
+        item_ids = [self._require_item_id(item) for item in items]
+        if self.event_index.enabled:
+            await self.event_index.sync(self.session)
+        linked_event_ids = await self._find_existing_event_ids_for_items(item_ids)
+        matches = await self._find_matching_events(
+            [
+                item
+                for item in items
+                if item.id not in linked_event_ids
+                and item.embedding is not None
+                and self._item_embedding_model(item) is not None
+            ]
+        )
+        suppression_actions = await self._event_suppression_actions(
+            event_ids={event.id for event, _similarity in matches.values()}
+        )
 
-        item_embedding_model = item.embedding_model.strip() if item.embedding_model else None
-        if not item_embedding_model:
-            return await self._create_linked_event(item)
+        results: list[ClusterResult] = []
+        batch_events: dict[UUID, Event] = {}
+        for item, item_id in zip(items, item_ids, strict=True):
+            already_event_id = linked_event_ids.get(item_id)
+            if already_event_id is not None:
+                results.append(
+                    ClusterResult(
+                        item_id=item_id,
+                        event_id=already_event_id,
+                        created=False,
+                        merged=True,
+                    )
+                )
+                continue
+            matched = self._best_batch_match(item, matches.get(item_id), batch_events)
+            result, touched_event = await self._cluster_with_match(
+                item,
+                matched,
+                suppression_actions=suppression_actions,
+            )
+            linked_event_ids[item_id] = result.event_id
+            if touched_event is not None:
+                batch_events[touched_event.id] = touched_event
+            results.append(result)
+        return results
 
-        matched = await self._find_matching_event(
-            item.embedding,
-            item_embedding_model,
-            self._item_timestamp(item),
-        )
+    async def _cluster_with_match(
+        self,
+        item: RawItem,
+        matched: tuple[Event, float] | None,
+        *,
+        suppression_actions: dict[UUID, str] | None = None,
+    ) -> tuple[ClusterResult, Event | None]:
+        """Merge `item` into `matched` or a new event; also return the event it changed."""
+        item_id = item.id
         if matched is None:
             return await self._create_linked_event(item)
 
         event, similarity = matched
-        suppression_action = await self._event_suppression_action(event_id=event.id)
+        if suppression_actions is None:
+            suppression_action = await self._event_suppression_action(event_id=event.id)
+        else:
+            suppression_action = suppression_actions.get(event.id)
         if suppression_action is not None:
             record_processing_event_suppression(
                 action=suppression_action,
@@ -98,12 +183,15 @@ class EventClusterer:
                 item_id=str(item_id),
                 action=suppression_action,
             )
-            return ClusterResult(
-                item_id=item_id,
-                event_id=event.id,
-                created=False,
-                merged=False,
-                similarity=similarity,
+            return (
+                ClusterResult(
+                    item_id=item_id,
+                    event_id=event.id,
+                    created=False,
+                    merged=False,
+                    similarity=similarity,
+                ),
+                None,
             )
         await ensure_cluster_health(session=self.session, event=event)
         link_added = await self._add_event_link(event.id, item_id)
@@ -116,41 +204,55 @@ class EventClusterer:
                     requested_event_id=str(event.id),
                     existing_event_id=str(resolved_event_id),
                 )
-                return ClusterResult(
-                    item_id=item_id,
-                    event_id=resolved_event_id,
-                    created=False,
-                    merged=True,
-                    similarity=similarity,
+                return (
+                    ClusterResult(
+                        item_id=item_id,
+                        event_id=resolved_event_id,
+                        created=False,
+                        merged=True,
+                        similarity=similarity,
+                    ),
+                    None,
                 )
             logger.info(
                 "Skipping merge metadata update because item was already linked",
                 event_id=str(event.id),
                 item_id=str(item_id),
             )
-            return ClusterResult(
+            return (
+                ClusterResult(
+                    item_id=item_id,
+                    event_id=event.id,
+                    created=False,
+                    merged=True,
+                    similarity=similarity,
+                ),
+                None,
+            )
+        await self._merge_into_event(event, item)
+        self._index_event(event)
+        return (
+            ClusterResult(
                 item_id=item_id,
                 event_id=event.id,
                 created=False,
                 merged=True,
                 similarity=similarity,
-            )
-        await self._merge_into_event(event, item)
-        return ClusterResult(
-            item_id=item_id,
-            event_id=event.id,
-            created=False,
-            merged=True,
-            similarity=similarity,
+            ),
+            event,
         )
 
-    async def _create_linked_event(self, item: RawItem) -> ClusterResult:
+    async def _create_linked_event(self, item: RawItem) -> tuple[ClusterResult, Event]:
         event = await self._create_event(item)
         await self._add_event_link(event.id, item.id)
         await self._refresh_event_provenance(event)
         apply_default_cluster_health(event)
         await self.session.flush()
-        return ClusterResult(item_id=item.id, event_id=event.id, created=True, merged=False)
+        self._index_event(event)
+        return (
+            ClusterResult(item_id=item.id, event_id=event.id, created=True, merged=False),
+            event,
+        )
 
     async def cluster_unlinked_items(self, limit: int = 100) -> list[ClusterResult]:
         """Cluster raw items not yet attached to an event."""
@@ -161,8 +263,8 @@ class EventClusterer:
             .order_by(RawItem.fetched_at.asc())
             .limit(limit)
         )
-        items = (await self.session.scalars(query)).all()
-        results = [await self.cluster_item(item) for item in items]
+        items = list((await self.session.scalars(query)).all())
+        results = await self.cluster_items(items)
         await self.session.flush()
         return results
 
@@ -182,6 +284,7 @@ class EventClusterer:
             last_mention_at=timestamp,
             primary_item_id=item.id,
         )
+        rebuild_event_centroid(event, [(item.embedding, item.embedding_model)])
         if event.id is None:
             event.id = uuid4()
         self.session.add(event)
@@ -196,6 +299,11 @@ class EventClusterer:
             event.embedding = item.embedding
             event.embedding_model = item.embedding_model
             event.embedding_generated_at = item.embedding_generated_at
+            rebuild_event_centroid(event, [(item.embedding, item.embedding_model)])
+            folded = True
+        else:
+            folded = add_to_event_centroid(event, item.embedding, item.embedding_model)
+        prior_cluster_health = dict(event.provenance_summary or {}).get(CLUSTER_HEALTH_KEY)
 
         primary_changed = await self._update_primary_item(event, item.id)
         if primary_changed:
@@ -207,40 +315,63 @@ class EventClusterer:
             )
 
         event.unique_source_count = await self._count_unique_sources(event.id, item.source_id)
-        await self._refresh_event_provenance(event)
-        cluster_health = await resolve_cluster_health(
+        await self._refresh_event_provenance(event, item)
+        await update_cluster_health_after_merge(
             session=self.session,
             event=event,
-            prefer_stored=False,
+            item_id=item.id,
+            item_embedding=item.embedding if folded else None,
+            prior_health=prior_cluster_health,
         )
-        provenance_summary = dict(event.provenance_summary or {})
-        provenance_summary["cluster_health"] = cluster_health
-        event.provenance_summary = provenance_summary
         self.lifecycle_manager.on_event_mention(event, mentioned_at=mention_time)
         await self.session.flush()
 
-    async def _refresh_event_provenance(self, event: Event) -> None:
-        await refresh_event_provenance(session=self.session, event=event)
+    async def _refresh_event_provenance(self, event: Event, item: RawItem | None = None) -> None:
+        await refresh_event_provenance(session=self.session, event=event, item=item)
 
     async def _find_matching_event(
         self,
-        item_embedding: list[float],
+        item_embedding: EmbeddingVector,
         embedding_model: str,
         reference_time: datetime,
     ) -> tuple[Event, float] | None:
         window_start = reference_time - timedelta(hours=settings.CLUSTER_TIME_WINDOW_HOURS)
+        if self.event_index.ready:
+            matched = await self._verify_index_hint(
+                self._index_hint(item_embedding, embedding_model, window_start),
+                item_embedding,
+                embedding_model,
+                window_start,
+            )
+            if matched is not None:
+                return matched
         max_distance = max_distance_for_similarity(settings.CLUSTER_SIMILARITY_THRESHOLD)
-        distance_expr = Event.embedding.cosine_distance(item_embedding)
-
-        query = (
-            select(Event, distance_expr.label("distance"))
+        storage = settings.EMBEDDING_ANN_STORAGE
+        target = event_match_embedding_column()
+        candidates = (
+            select(Event.id, target.label("embedding"))
             .where(Event.last_mention_at >= window_start)
-            .where(Event.embedding.is_not(None))
+            .where(target.is_not(None))
             .where(Event.embedding_model == embedding_model)
-            .where(distance_expr <= max_distance)
-            .order_by(distance_expr.asc())
-            .limit(1)
         )
+
+        if storage == "full":
+            distance_expr = target.cosine_distance(item_embedding)
+            query = candidates.with_only_columns(Event, distance_expr.label("distance"))
+        else:
+            # Quantized index picks candidates; exact distance decides the match.
+            shortlist = (
+                candidates.order_by(
+                    ann_candidate_distance(target, item_embedding, storage=storage).asc()
+                )
+                .limit(settings.EMBEDDING_ANN_RERANK_CANDIDATES)
+                .subquery()
+            )
+            distance_expr = shortlist.c.embedding.cosine_distance(item_embedding)
+            query = select(Event, distance_expr.label("distance")).join(
+                shortlist, Event.id == shortlist.c.id
+            )
+        query = query.where(distance_expr <= max_distance).order_by(distance_expr.asc()).limit(1)
         row = (await self.session.execute(query)).first()
         if row is None:
             return None
@@ -250,25 +381,232 @@ class EventClusterer:
         similarity = 1.0 - distance
         return (event, similarity)
 
+    async def _find_matching_events(
+        self,
+        items: list[RawItem],
+    ) -> dict[UUID, tuple[Event, float]]:
+        """
+        Resolve the best event for every item with one LATERAL ANN query.
+
+        The batch's embeddings are read from `raw_items`, so vectors are not
+        sent back to the database. Quantized storage shortlists
+        `EMBEDDING_ANN_RERANK_CANDIDATES` events per item and `DISTINCT ON`
+        keeps the exact-distance best, mirroring `_find_matching_event`. A
+        ready in-process index answers first; only items without a verified
+        index hit reach the query.
+        """
+        matches: dict[UUID, tuple[Event, float]] = {}
+        if items and self.event_index.ready:
+            matches, items = await self._find_indexed_matches(items)
+        if not items:
+            return matches
+        await self.session.flush()
+        window = timedelta(hours=settings.CLUSTER_TIME_WINDOW_HOURS)
+        max_distance = max_distance_for_similarity(settings.CLUSTER_SIMILARITY_THRESHOLD)
+        storage = settings.EMBEDDING_ANN_STORAGE
+        batch = (
+            select(
+                RawItem.id.label("item_id"),
+                RawItem.embedding.label("embedding"),
+                func.btrim(RawItem.embedding_model).label("embedding_model"),
+                (
+                    func.coalesce(RawItem.published_at, RawItem.fetched_at, func.now()) - window
+                ).label("window_start"),
+            )
+            .where(RawItem.id.in_([item.id for item in items]))
+            .subquery("batch")
+        )
+        target = event_match_embedding_column()
+        distance_expr = target.cosine_distance(batch.c.embedding)
+        candidates = (
+            select(Event, distance_expr.label("distance"))
+            .where(Event.last_mention_at >= batch.c.window_start)
+            .where(target.is_not(None))
+            .where(Event.embedding_model == batch.c.embedding_model)
+        )
+        if storage == "full":
+            candidates = candidates.order_by(distance_expr.asc()).limit(1)
+        else:
+            candidates = candidates.order_by(
+                ann_candidate_distance(target, batch.c.embedding, storage=storage).asc()
+            ).limit(settings.EMBEDDING_ANN_RERANK_CANDIDATES)
+        candidate = candidates.lateral("candidate")
+        candidate_event = aliased(Event, candidate)
+        query = (
+            select(batch.c.item_id, candidate_event, candidate.c.distance)
+            .select_from(batch.join(candidate, true()))
+            .where(candidate.c.distance <= max_distance)
+            .order_by(batch.c.item_id, candidate.c.distance.asc())
+            .distinct(batch.c.item_id)
+        )
+        rows = (await self.session.execute(query)).all()
+        matches.update({row[0]: (cast("Event", row[1]), 1.0 - float(row[2])) for row in rows})
+        return matches
+
+    async def _find_indexed_matches(
+        self,
+        items: list[RawItem],
+    ) -> tuple[dict[UUID, tuple[Event, float]], list[RawItem]]:
+        """Resolve items from the in-process index; return matches and unresolved items."""
+        window = timedelta(hours=settings.CLUSTER_TIME_WINDOW_HOURS)
+        lookups = []
+        unresolved: list[RawItem] = []
+        for item in items:
+            if item.embedding is None:
+                unresolved.append(item)
+                continue
+            embedding_model = self._item_embedding_model(item) or ""
+            window_start = self._item_timestamp(item) - window
+            hint = self._index_hint(item.embedding, embedding_model, window_start)
+            lookups.append((item, item.embedding, embedding_model, window_start, hint))
+        matches: dict[UUID, tuple[Event, float]] = {}
+        for item, embedding, embedding_model, window_start, hint in lookups:
+            matched = await self._verify_index_hint(hint, embedding, embedding_model, window_start)
+            if matched is not None:
+                matches[item.id] = matched
+            else:
+                unresolved.append(item)
+        return (matches, unresolved)
+
+    def _index_hint(
+        self,
+        item_embedding: EmbeddingVector,
+        embedding_model: str,
+        window_start: datetime,
+    ) -> tuple[UUID, float] | None:
+        return self.event_index.nearest(
+            item_embedding,
+            embedding_model,
+            window_start=window_start,
+            min_similarity=settings.CLUSTER_SIMILARITY_THRESHOLD - _INDEX_SIMILARITY_SLACK,
+        )
+
+    async def _verify_index_hint(
+        self,
+        hint: tuple[UUID, float] | None,
+        item_embedding: EmbeddingVector,
+        embedding_model: str,
+        window_start: datetime,
+    ) -> tuple[Event, float] | None:
+        """
+        Check index hints against Postgres and return the verified match.
+
+        A stale hint drops its row (re-indexed from the reloaded event once the
+        session commits) and the index is asked again. A miss is
+        never final: events created by concurrent runs since the last sync are
+        not indexed, so callers fall back to the pgvector query.
+        """
+        for _attempt in range(_INDEX_VERIFY_ATTEMPTS):
+            if hint is None:
+                return None
+            # Reload so a row changed by another worker is not read from the identity map.
+            event = await self.session.get(Event, hint[0], populate_existing=True)
+            if (
+                event is not None
+                and (event_embedding := event_match_embedding(event)) is not None
+                and event.embedding_model == embedding_model
+                and event.last_mention_at >= window_start
+            ):
+                similarity = cosine_similarity(item_embedding, event_embedding)
+                if similarity >= settings.CLUSTER_SIMILARITY_THRESHOLD:
+                    return (event, similarity)
+            # Drop the stale row now; the reloaded event is re-indexed on commit.
+            self.event_index.discard(hint[0])
+            if event is not None:
+                self._index_event(event)
+            hint = self._index_hint(item_embedding, embedding_model, window_start)
+        return None
+
+    def _index_event(self, event: Event) -> None:
+        if self.event_index.ready:
+            self.event_index.upsert_on_commit(
+                self.session,
+                event_id=event.id,
+                embedding=event_match_embedding(event),
+                embedding_model=event.embedding_model,
+                last_mention_at=event.last_mention_at,
+            )
+
+    def _best_batch_match(
+        self,
+        item: RawItem,
+        matched: tuple[Event, float] | None,
+        batch_events: dict[UUID, Event],
+    ) -> tuple[Event, float] | None:
+        """Let events created or merged earlier in the batch compete with `matched`."""
+        embedding_model = self._item_embedding_model(item)
+        if item.embedding is None or embedding_model is None or not batch_events:
+            return matched
+        window_start = self._item_timestamp(item) - timedelta(
+            hours=settings.CLUSTER_TIME_WINDOW_HOURS
+        )
+        max_distance = max_distance_for_similarity(settings.CLUSTER_SIMILARITY_THRESHOLD)
+        candidates = [
+            event
+            for event in batch_events.values()
+            if event_match_embedding(event) is not None
+            and event.embedding_model == embedding_model
+            and event.last_mention_at is not None
+            and event.last_mention_at >= window_start
+        ]
+        if not candidates:
+            return matched
+        units = normalize_rows(list(map(event_match_embedding, candidates)), dtype=np.float64)
+        scores = cosine_scores(units, item.embedding)
+        # Ties keep the earlier candidate so results depend only on input order.
+        best_index = int(np.argmax(scores))
+        similarity = float(scores[best_index])
+        if 1.0 - similarity > max_distance or (matched is not None and similarity <= matched[1]):
+            return matched
+        return (candidates[best_index], similarity)
+
     async def _find_existing_event_id_for_item(self, item_id: UUID) -> UUID | None:
         query = select(EventItem.event_id).where(EventItem.item_id == item_id).limit(1)
         event_id: UUID | None = await self.session.scalar(query)
         return event_id
 
+    async def _find_existing_event_ids_for_items(self, item_ids: list[UUID]) -> dict[UUID, UUID]:
+        query = select(EventItem.item_id, EventItem.event_id).where(EventItem.item_id.in_(item_ids))
+        rows = (await self.session.execute(query)).all()
+        return {row[0]: row[1] for row in rows}
+
     async def _event_suppression_action(self, *, event_id: UUID) -> str | None:
         query = (
             select(HumanFeedback.action)
             .where(HumanFeedback.target_type == "event")
             .where(HumanFeedback.target_id == event_id)
-            .where(HumanFeedback.action.in_(("mark_noise", "invalidate")))
+            .where(HumanFeedback.action.in_(_SUPPRESSION_ACTIONS))
             .order_by(HumanFeedback.created_at.desc())
             .limit(1)
         )
         action: str | None = await self.session.scalar(query)
+        return self._normalize_suppression_action(action)
+
+    async def _event_suppression_actions(self, *, event_ids: set[UUID]) -> dict[UUID, str]:
+        if not event_ids:
+            return {}
+        query = (
+            select(HumanFeedback.target_id, HumanFeedback.action)
+            .where(HumanFeedback.target_type == "event")
+            .where(HumanFeedback.target_id.in_(event_ids))
+            .where(HumanFeedback.action.in_(_SUPPRESSION_ACTIONS))
+            .order_by(HumanFeedback.target_id, HumanFeedback.created_at.desc())
+            .distinct(HumanFeedback.target_id)
+        )
+        rows = (await self.session.execute(query)).all()
+        actions: dict[UUID, str] = {}
+        for event_id, action in rows:
+            normalized_action = self._normalize_suppression_action(action)
+            if normalized_action is not None:
+                actions[event_id] = normalized_action
+        return actions
+
+    @staticmethod
+    def _normalize_suppression_action(action: object) -> str | None:
         if not isinstance(action, str):
             return None
         normalized_action = action.strip()
-        if normalized_action not in {"mark_noise", "invalidate"}:
+        if normalized_action not in _SUPPRESSION_ACTIONS:
             return None
         return normalized_action
 
@@ -331,6 +669,18 @@ class EventClusterer:
         except (TypeError, ValueError):
             return 0.0
 
+    @staticmethod
+    def _require_item_id(item: RawItem) -> UUID:
+        if item.id is None:
+            msg = "RawItem must have an id before clustering"
+            raise ValueError(msg)
+        return item.id
+
+    @staticmethod
+    def _item_embedding_model(item: RawItem) -> str | None:
+        embedding_model = item.embedding_model.strip() if item.embedding_model else ""
+        return embedding_model or None
+
     @staticmethod
     def _build_canonical_summary(item: RawItem) -> str:
         if item.title and item.title.strip():
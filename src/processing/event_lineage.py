@@ -18,6 +18,11 @@ from src.core.trend_restatement import (
     restatement_compensation_totals_by_evidence_id,
 )
 from src.processing.corroboration_provenance import refresh_event_provenance
+from src.processing.event_centroid import (
+    merge_event_centroids,
+    rebuild_event_centroid,
+    remove_from_event_centroid,
+)
 from src.processing.event_claims import deactivate_event_claims
 from src.processing.event_cluster_health import (
     apply_default_cluster_health,
@@ -92,6 +97,7 @@ async def split_event(
         raise ValueError("split must leave at least one item on the source event")
 
     new_event = await _build_event_from_rows(session=session, rows=selected_rows)
+    remove_from_event_centroid(source_event, _row_embeddings(selected_rows))
     moved_item_ids = tuple(row.item.id for row in selected_rows)
     for row in selected_rows:
         row.link.event_id = _require_event_id(new_event)
@@ -171,6 +177,7 @@ async def merge_events(
     for row in source_rows:
         row.link.event_id = target_event_id
     await session.flush()
+    merge_event_centroids(target_event, source_event)
 
     await _refresh_event_after_item_change(session=session, event=target_event)
     await _close_empty_merged_event(source_event, replay_pending=False)
@@ -335,6 +342,7 @@ async def _build_event_from_rows(
         last_mention_at=max(_item_timestamp(row.item) for row in rows),
         primary_item_id=primary_item.id,
     )
+    rebuild_event_centroid(event, _row_embeddings(rows))
     session.add(event)
     await session.flush()
     apply_default_cluster_health(event)
@@ -361,6 +369,7 @@ async def _refresh_event_after_item_change(*, session: AsyncSession, event: Even
         event,
         previous_canonical_summary=previous_canonical_summary,
     )
+    previous_embedding_model = event.embedding_model
     event.embedding = primary_item.embedding
     event.embedding_model = primary_item.embedding_model
     event.embedding_generated_at = primary_item.embedding_generated_at
@@ -368,6 +377,7 @@ async def _refresh_event_after_item_change(*, session: AsyncSession, event: Even
     event.embedding_retained_tokens = primary_item.embedding_retained_tokens
     event.embedding_was_truncated = bool(primary_item.embedding_was_truncated)
     event.embedding_truncation_strategy = primary_item.embedding_truncation_strategy
+    _sync_event_centroid(event, rows, previous_embedding_model=previous_embedding_model)
     event.first_seen_at = min(_item_timestamp(row.item) for row in rows)
     event.last_mention_at = max(_item_timestamp(row.item) for row in rows)
     await refresh_event_provenance(session=session, event=event)
@@ -393,6 +403,30 @@ async def _refresh_event_after_item_change(*, session: AsyncSession, event: Even
     await _mark_event_claims_stale(session=session, event_id=event_id)
 
 
+def _row_embeddings(rows: list[_EventItemRow]) -> list[tuple[Any, str | None]]:
+    return [(row.item.embedding, row.item.embedding_model) for row in rows]
+
+
+def _sync_event_centroid(
+    event: Event,
+    rows: list[_EventItemRow],
+    *,
+    previous_embedding_model: str | None,
+) -> None:
+    # Split/merge already moved the running sums; rebuild only when the primary
+    # item switched models or the sums no longer account for every linked item.
+    tracked = sum(
+        1
+        for row in rows
+        if row.item.embedding is not None and row.item.embedding_model == event.embedding_model
+    )
+    if (
+        event.embedding_model != previous_embedding_model
+        or int(event.embedding_centroid_count or 0) != tracked
+    ):
+        rebuild_event_centroid(event, _row_embeddings(rows))
+
+
 def _repaired_event_activity_state(event: Event) -> str:
     last_mention_at = event.last_mention_at
     if last_mention_at is None:
@@ -419,6 +453,8 @@ async def _close_empty_merged_event(event: Event, *, replay_pending: bool = True
     event.embedding_retained_tokens = None
     event.embedding_was_truncated = False
     event.embedding_truncation_strategy = None
+    event.embedding_centroid_sum = None
+    event.embedding_centroid_count = 0
     apply_event_state_update(
         event,
         epistemic_state=EventEpistemicState.EMERGING.value,
@@ -36,7 +36,11 @@ from src.core.trend_engine import (
     logodds_to_prob,
 )
 from src.processing.cost_tracker import BudgetExceededError
-from src.processing.deduplication_service import DeduplicationService
+from src.processing.deduplication_service import (
+    DeduplicationResult,
+    DeduplicationService,
+    DuplicateCandidate,
+)
 from src.processing.embedding_service import EmbeddingService
 from src.processing.event_claims import deactivate_event_claims, sync_event_claims
 from src.processing.event_clusterer import ClusterResult, EventClusterer
@@ -52,6 +56,8 @@ from src.processing.pipeline_types import (
 )
 from src.processing.tier1_classifier import Tier1Classifier, Tier1ItemResult, Tier1Usage
 from src.processing.tier2_candidate_processor import (
+    cluster_tier2_candidates,
+    embed_tier2_candidates,
     finalize_staged_tier2_candidate,
     load_item_source_credibility,
     order_tier2_candidates,
@@ -198,9 +204,13 @@ class ProcessingPipeline:
         execution_by_item: dict[UUID, _ItemExecution],
     ) -> list[_PreparedItem]:
         prepared_items: list[_PreparedItem] = []
-        for item in items:
+        duplicate_results = await self._find_exact_duplicates(items)
+        for item, duplicate_result in zip(items, duplicate_results, strict=True):
             record_processing_ingested_language(language=self._language_metric_label(item.language))
-            prepared, execution = await self._prepare_item_for_tier1(item=item)
+            prepared, execution = await self._prepare_item_for_tier1(
+                item=item,
+                duplicate_result=duplicate_result,
+            )
             if prepared is not None:
                 prepared_items.append(prepared)
             if execution is not None:
@@ -208,6 +218,36 @@ class ProcessingPipeline:
                 self._accumulate_usage(run_result=run_result, usage=execution.usage)
         return prepared_items
 
+    async def _find_exact_duplicates(
+        self, items: list[RawItem]
+    ) -> list[DeduplicationResult | None]:
+        """
+        Resolve exact and MinHash duplicates for the whole run; the first copy is kept.
+
+        A non-retryable bulk failure returns `None` for every item so each one
+        is looked up on its own in `_prepare_item_for_tier1`.
+        """
+        candidates = [
+            DuplicateCandidate(
+                external_id=item.external_id,
+                url=item.url,
+                content_hash=item.content_hash,
+                item_id=self._item_id(item),
+                minhash=item.minhash_signature,
+            )
+            for item in items
+        ]
+        try:
+            return list(await self.deduplication_service.find_duplicates_bulk(candidates))
+        except Exception as exc:
+            self._raise_retryable_failure_if_needed(item=None, stage="prepare", exc=exc)
+            logger.warning(
+                "Bulk duplicate lookup failed; falling back to per-item lookup",
+                item_count=len(items),
+                reason=str(exc),
+            )
+            return [None] * len(items)
+
     async def _resolve_prepared_items_after_tier1(
         self,
         *,
@@ -287,11 +327,26 @@ class ProcessingPipeline:
         execution_by_item: dict[UUID, _ItemExecution],
     ) -> list[_StagedTier2Candidate]:
         staged_candidates: list[_StagedTier2Candidate] = []
+        embedded_ids, embedding_api_calls, embedding_error = await embed_tier2_candidates(
+            owner=self,
+            prepared_items=[prepared for prepared, _tier1_result in ready_for_tier2],
+        )
+        self._accumulate_usage(
+            run_result=run_result,
+            usage=PipelineUsage(embedding_api_calls=embedding_api_calls),
+        )
+        cluster_results = await cluster_tier2_candidates(
+            owner=self,
+            prepared_items=[prepared for prepared, _tier1_result in ready_for_tier2],
+        )
         for prepared, tier1_result in ready_for_tier2:
             staged_candidate, execution = await stage_tier2_candidate(
                 owner=self,
                 prepared=prepared,
                 tier1_result=tier1_result,
+                embedded=prepared.item_id in embedded_ids,
+                embedding_error=embedding_error,
+                cluster_result=cluster_results.get(prepared.item_id),
             )
             if staged_candidate is not None:
                 staged_candidates.append(staged_candidate)
@@ -331,6 +386,29 @@ class ProcessingPipeline:
             )
         )
 
+    async def _prepare_budget_pending_execution(
+        self, *, item: RawItem, exc: BudgetExceededError
+    ) -> _ItemExecution:
+        item_id = self._item_id(item)
+        item.processing_status = ProcessingStatus.PENDING
+        item.processing_started_at = None
+        item.error_message = None
+        await self.session.flush()
+        logger.warning(
+            "Budget exceeded; leaving item pending for retry",
+            item_id=str(item_id),
+            reason=str(exc),
+        )
+        return _ItemExecution(
+            result=self._build_item_result(
+                item_id=item_id,
+                status=item.processing_status,
+                cluster_result=None,
+                embedded=False,
+                error_message=str(exc),
+            )
+        )
+
     async def _missing_execution_result(self, *, item: RawItem) -> _ItemExecution:
         item.processing_status = ProcessingStatus.ERROR
         item.processing_started_at = None
@@ -426,6 +504,7 @@ class ProcessingPipeline:
         self,
         *,
         item: RawItem,
+        duplicate_result: DeduplicationResult | None,
     ) -> tuple[_PreparedItem | None, _ItemExecution | None]:
         item_id = self._item_id(item)
         item.processing_status = ProcessingStatus.PROCESSING
@@ -433,12 +512,14 @@ class ProcessingPipeline:
         item.error_message = None
         await self.session.flush()
         try:
-            duplicate_result = await self.deduplication_service.find_duplicate(
-                external_id=item.external_id,
-                url=item.url,
-                content_hash=item.content_hash,
-                exclude_item_id=item_id,
-            )
+            if duplicate_result is None:
+                duplicate_result = await self.deduplication_service.find_duplicate(
+                    external_id=item.external_id,
+                    url=item.url,
+                    content_hash=item.content_hash,
+                    exclude_item_id=item_id,
+                    minhash=item.minhash_signature,
+                )
             if duplicate_result.is_duplicate:
                 item.processing_status = ProcessingStatus.NOISE
                 item.processing_started_at = None
@@ -493,27 +574,7 @@ class ProcessingPipeline:
                 None,
             )
         except BudgetExceededError as exc:
-            item.processing_status = ProcessingStatus.PENDING
-            item.processing_started_at = None
-            item.error_message = None
-            await self.session.flush()
-            logger.warning(
-                "Budget exceeded; leaving item pending for retry",
-                item_id=str(item_id),
-                reason=str(exc),
-            )
-            return (
-                None,
-                _ItemExecution(
-                    result=self._build_item_result(
-                        item_id=item_id,
-                        status=item.processing_status,
-                        cluster_result=None,
-                        embedded=False,
-                        error_message=str(exc),
-                    )
-                ),
-            )
+            return (None, await self._prepare_budget_pending_execution(item=item, exc=exc))
         except Exception as exc:
             self._raise_retryable_failure_if_needed(item=item, stage="prepare", exc=exc)
             item.processing_status = ProcessingStatus.ERROR
@@ -0,0 +1,266 @@
+"""
+Rolling-window Bloom filter of recently stored raw-item dedup keys.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import redis
+import structlog
+from sqlalchemy import select
+
+from src.core.config import settings
+from src.storage.models import RawItem
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = structlog.get_logger(__name__)
+
+DedupKey = tuple[str, str]
+_KEY_FIELDS = ("external_id", "url", "content_hash")
+
+
+class RecentKeyFilter:
+    """
+    Bloom filter over the exact dedup keys of recently fetched raw items.
+
+    Keys are `(field, value)` pairs for external_id, stored URL and content hash.
+    Bits live in Redis bitmaps, one per generation of `window_days`; writes go to
+    the current generation and lookups test the current and previous one, so every
+    key fetched within the window is covered. A coverage marker set by `rebuild`
+    records since when every insert was recorded. Until it spans the requested
+    window, or while Redis is unavailable, every key is reported as possibly
+    present so callers confirm with SQL. A lost write deletes the shared marker,
+    so every worker falls back to SQL until the next rebuild.
+    """
+
+    _DEGRADE_RETRY_SECONDS = 30
+    _EXPIRY_SLACK_SECONDS = 3600
+
+    def __init__(
+        self,
+        *,
+        enabled: bool | None = None,
+        bits: int | None = None,
+        hash_count: int | None = None,
+        window_days: int | None = None,
+        redis_prefix: str | None = None,
+        redis_url: str | None = None,
+        redis_client: redis.Redis[str] | None = None,
+        wall_time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        self.enabled = (
+            settings.DEDUP_RECENT_KEY_FILTER_ENABLED if enabled is None else bool(enabled)
+        )
+        self.bits = max(1, settings.DEDUP_RECENT_KEY_FILTER_BITS if bits is None else int(bits))
+        self.hash_count = max(
+            1,
+            settings.DEDUP_RECENT_KEY_FILTER_HASHES if hash_count is None else int(hash_count),
+        )
+        self.window_days = max(
+            1,
+            settings.DEDUP_RECENT_KEY_FILTER_WINDOW_DAYS
+            if window_days is None
+            else int(window_days),
+        )
+        self.redis_prefix = (
+            settings.DEDUP_RECENT_KEY_FILTER_REDIS_PREFIX
+            if redis_prefix is None
+            else str(redis_prefix)
+        ).strip() or "horadus:dedup_filter"
+        self.redis_url = settings.REDIS_URL if redis_url is None else str(redis_url).strip()
+        self._redis_client = redis_client
+        self._backend_unavailable_until = 0.0
+        self._coverage_lost = False
+        self._wall_time_fn = wall_time_fn or time.time
+
+    async def might_contain(
+        self,
+        keys: Sequence[DedupKey],
+        *,
+        window_days: int,
+    ) -> list[bool]:
+        """Return False for keys definitely not stored within `window_days`."""
+        if not keys:
+            return []
+        maybe = [True] * len(keys)
+        if not self.enabled or window_days > self.window_days:
+            return maybe
+        if self._coverage_lost:
+            if time.monotonic() >= self._backend_unavailable_until:
+                await self._withdraw_coverage()
+            return maybe
+
+        generation = self._generation()
+        positions = [self._positions(key) for key in keys]
+
+        def lookup(client: redis.Redis[str]) -> list[Any]:
+            pipe = client.pipeline(transaction=False)
+            pipe.get(self._coverage_key())
+            for offsets in positions:
+                for candidate_generation in (generation, generation - 1):
+                    bitmap = self._bitmap_key(candidate_generation)
+                    for offset in offsets:
+                        pipe.getbit(bitmap, offset)
+            return pipe.execute()
+
+        replies = await self._redis_call(lookup)
+        if replies is None or not self._covers(replies[0], window_days=window_days):
+            return maybe
+
+        bits = replies[1:]
+        width = self.hash_count
+        return [
+            all(bits[start : start + width]) or all(bits[start + width : start + 2 * width])
+            for start in range(0, len(keys) * 2 * width, 2 * width)
+        ]
+
+    async def add(self, keys: Sequence[DedupKey]) -> None:
+        """Record keys of rows just written to `raw_items`."""
+        if not self.enabled or not keys:
+            return
+        await self._record(keys)
+
+    async def rebuild(self, session: AsyncSession, *, batch_size: int = 5000) -> int:
+        """
+        Re-add every key fetched within the window from `raw_items`.
+
+        Returns the number of rows scanned. Coverage is withdrawn while the scan
+        runs and restored to the scan start minus one window once it completes.
+        """
+        if not self.enabled:
+            return 0
+        started_at = self._wall_time_fn()
+        await self._required_redis_call(lambda client: client.delete(self._coverage_key()))
+        window_start = datetime.fromtimestamp(started_at, tz=UTC) - timedelta(days=self.window_days)
+        result = await session.stream(
+            select(RawItem.external_id, RawItem.url, RawItem.content_hash)
+            .where(RawItem.fetched_at >= window_start)
+            .execution_options(yield_per=batch_size)
+        )
+        scanned = 0
+        async for partition in result.partitions(batch_size):
+            keys = [
+                (field, value)
+                for row in partition
+                for field, value in zip(_KEY_FIELDS, row, strict=True)
+                if value is not None
+            ]
+            scanned += len(partition)
+            if keys and not await self._record(keys):
+                msg = "Dedup filter rebuild lost a Redis write; rerun the rebuild"
+                raise RuntimeError(msg)
+
+        coverage_start = started_at - self._window_seconds(self.window_days)
+        await self._required_redis_call(
+            lambda client: client.set(self._coverage_key(), repr(coverage_start))
+        )
+        self._coverage_lost = False
+        logger.info("Dedup filter rebuilt", rows=scanned, window_days=self.window_days)
+        return scanned
+
+    async def _record(self, keys: Sequence[DedupKey]) -> bool:
+        generation = self._generation()
+        bitmap = self._bitmap_key(generation)
+        offsets = sorted({offset for key in keys for offset in self._positions(key)})
+        expire_at = self._generation_end(generation + 1) + self._EXPIRY_SLACK_SECONDS
+        invalidate = self._coverage_lost
+
+        def record(client: redis.Redis[str]) -> bool:
+            pipe = client.pipeline(transaction=False)
+            if invalidate:
+                pipe.delete(self._coverage_key())
+            for offset in offsets:
+                pipe.setbit(bitmap, offset, 1)
+            pipe.expireat(bitmap, expire_at)
+            pipe.execute()
+            return True
+
+        degraded = time.monotonic() < self._backend_unavailable_until
+        if await self._redis_call(record) is None:
+            # Without this write any worker could report a stored key as absent.
+            self._coverage_lost = True
+            if not degraded:
+                await self._withdraw_coverage()
+            return False
+        if invalidate:
+            self._coverage_lost = False
+        return True
+
+    async def _withdraw_coverage(self) -> None:
+        """Delete the shared coverage marker; retried on next use when Redis is down."""
+        try:
+            await self._required_redis_call(lambda client: client.delete(self._coverage_key()))
+        except Exception as exc:
+            self._backend_unavailable_until = time.monotonic() + self._DEGRADE_RETRY_SECONDS
+            logger.warning(
+                "Dedup filter could not withdraw coverage after a lost write",
+                error=str(exc),
+            )
+            return
+        self._coverage_lost = False
+
+    def _positions(self, key: DedupKey) -> list[int]:
+        digest = hashlib.sha256(f"{key[0]}\0{key[1]}".encode()).digest()
+        first = int.from_bytes(digest[:8], "big")
+        step = int.from_bytes(digest[8:16], "big") | 1
+        return [(first + index * step) % self.bits for index in range(self.hash_count)]
+
+    def _covers(self, raw_coverage: Any, *, window_days: int) -> bool:
+        try:
+            coverage_start = float(raw_coverage)
+        except (TypeError, ValueError):
+            return False
+        return coverage_start <= self._wall_time_fn() - self._window_seconds(window_days)
+
+    def _generation(self) -> int:
+        return int(self._wall_time_fn() // self._window_seconds(self.window_days))
+
+    def _generation_end(self, generation: int) -> int:
+        return (generation + 1) * self._window_seconds(self.window_days)
+
+    @staticmethod
+    def _window_seconds(window_days: int) -> int:
+        return window_days * 86400
+
+    def _bitmap_key(self, generation: int) -> str:
+        return f"{self.redis_prefix}:{self.window_days}d:{generation}"
+
+    def _coverage_key(self) -> str:
+        return f"{self.redis_prefix}:{self.window_days}d:coverage"
+
+    async def _redis_call(self, operation: Callable[[redis.Redis[str]], Any]) -> Any:
+        if time.monotonic() < self._backend_unavailable_until:
+            return None
+        try:
+            return await asyncio.to_thread(operation, self._client())
+        except Exception as exc:
+            self._backend_unavailable_until = time.monotonic() + self._DEGRADE_RETRY_SECONDS
+            logger.warning(
+                "Dedup filter backend unavailable; falling back to SQL lookups",
+                error=str(exc),
+                retry_after_seconds=self._DEGRADE_RETRY_SECONDS,
+            )
+            return None
+
+    async def _required_redis_call(self, operation: Callable[[redis.Redis[str]], Any]) -> Any:
+        return await asyncio.to_thread(operation, self._client())
+
+    def _client(self) -> redis.Redis[str]:
+        if self._redis_client is None:
+            self._redis_client = redis.Redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis_client
+
+
+@lru_cache
+def get_recent_key_filter() -> RecentKeyFilter:
+    """Get the process-wide dedup key filter configured from settings."""
+    return RecentKeyFilter()
@@ -0,0 +1,89 @@
+"""
+NumPy kernels for batched cosine similarity over unit-normalized embedding rows.
+
+Callers normalize a candidate matrix once and score queries against it with a
+single matrix product instead of one Python-level cosine call per pair.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+
+FloatMatrix = npt.NDArray[np.floating[Any]]
+# Rows of the Gram matrix materialised at once by `pairwise_similarity_stats`.
+PAIRWISE_BLOCK_ROWS = 512
+
+
+def normalize_rows(
+    vectors: Sequence[Any] | npt.NDArray[Any],
+    *,
+    dtype: npt.DTypeLike = np.float32,
+) -> FloatMatrix:
+    """Stack equal-length vectors into unit rows; zero or non-finite rows stay zero."""
+    matrix = np.asarray(vectors, dtype=dtype)
+    if matrix.ndim != 2:
+        msg = "vectors must form a 2-D matrix"
+        raise ValueError(msg)
+    with np.errstate(invalid="ignore", over="ignore"):
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    units = np.zeros_like(matrix)
+    np.divide(matrix, norms, out=units, where=np.isfinite(norms) & (norms > 0.0))
+    return units
+
+
+def cosine_scores(units: FloatMatrix, query: Sequence[float] | npt.NDArray[Any]) -> FloatMatrix:
+    """Score every unit row against `query` with one matrix-vector product."""
+    vector = normalize_rows(np.asarray(query, dtype=units.dtype)[None, :], dtype=units.dtype)[0]
+    return cast("FloatMatrix", units @ vector)
+
+
+def cosine_matrix(left_units: FloatMatrix, right_units: FloatMatrix) -> FloatMatrix:
+    """Score every left unit row against every right unit row in one matrix product."""
+    return left_units @ right_units.T
+
+
+def top_k_indices(scores: FloatMatrix, k: int) -> npt.NDArray[np.intp]:
+    """
+    Return the indices of the `k` highest scores, best first.
+
+    `argpartition` selects the candidates in linear time so only `k` scores are
+    sorted; equal scores keep index order.
+    """
+    if k < 1:
+        msg = "k must be >= 1"
+        raise ValueError(msg)
+    if k >= scores.shape[0]:
+        candidates = np.arange(scores.shape[0])
+    else:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+def pairwise_similarity_stats(
+    units: FloatMatrix,
+    *,
+    block_rows: int = PAIRWISE_BLOCK_ROWS,
+) -> tuple[int, float, float]:
+    """
+    Return the count, sum and minimum of cosine scores over all unordered row pairs.
+
+    The Gram matrix is built one block of rows at a time so memory stays bounded
+    for large events. The minimum is 1.0 when there are fewer than two rows.
+    """
+    pair_count = 0
+    pair_total = 0.0
+    lowest = 1.0
+    row_count = units.shape[0]
+    columns = np.arange(row_count)[None, :]
+    for start in range(0, row_count - 1, block_rows):
+        block = units[start : start + block_rows] @ units.T
+        rows = np.arange(start, start + block.shape[0])[:, None]
+        upper = block[columns > rows]
+        pair_count += int(upper.size)
+        pair_total += float(upper.sum(dtype=np.float64))
+        lowest = min(lowest, float(upper.min()))
+    return (pair_count, pair_total, lowest)
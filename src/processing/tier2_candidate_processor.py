@@ -10,6 +10,7 @@ from uuid import UUID
 
 import structlog
 from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.core.config import settings
 from src.core.source_credibility import (
@@ -18,6 +19,7 @@ from src.core.source_credibility import (
 )
 from src.core.trend_config import index_trends_by_runtime_id
 from src.processing.cost_tracker import TIER2, BudgetExceededError, CostTracker
+from src.processing.pipeline_retry import build_retryable_pipeline_error
 from src.processing.pipeline_types import (
     PipelineItemResult,
     PipelineUsage,
@@ -36,6 +38,7 @@ from src.storage.models import ProcessingStatus, RawItem, Source, Trend
 if TYPE_CHECKING:
     from src.processing.event_clusterer import ClusterResult
     from src.processing.tier1_classifier import Tier1ItemResult
+    from src.storage.vector_types import EmbeddingVector
 
 logger = structlog.get_logger(__name__)
 
@@ -45,19 +48,31 @@ async def stage_tier2_candidate(
     owner: Any,
     prepared: _PreparedItem,
     tier1_result: Tier1ItemResult,
+    embedded: bool = False,
+    embedding_error: Exception | None = None,
+    cluster_result: ClusterResult | None = None,
 ) -> tuple[_StagedTier2Candidate | None, _ItemExecution | None]:
+    """
+    Embed (when still needed) and cluster one Tier-2 candidate.
+
+    `embedded` marks items already embedded by `embed_tier2_candidates` in this
+    run; `embedding_error` is that batch's budget or retryable failure, reported
+    for items it left without a vector instead of calling the provider again. `cluster_result`
+    is the item's outcome from `cluster_tier2_candidates`, when it had one.
+    """
     usage = PipelineUsage()
     item = prepared.item
-    embedded = False
-    cluster_result: ClusterResult | None = None
     try:
-        if item.embedding is None:
-            embedded, embedding_api_calls = await ensure_item_embedding(
-                owner=owner, prepared=prepared
-            )
-            usage.embedding_api_calls += embedding_api_calls
+        if cluster_result is None:
+            if item.embedding is None:
+                if embedding_error is not None:
+                    raise embedding_error
+                embedded, embedding_api_calls = await ensure_item_embedding(
+                    owner=owner, prepared=prepared
+                )
+                usage.embedding_api_calls += embedding_api_calls
+            cluster_result = await owner.event_clusterer.cluster_item(item)
 
-        cluster_result = await owner.event_clusterer.cluster_item(item)
         event = await owner._load_event(cluster_result.event_id)
         if event is None:
             msg = f"Event {cluster_result.event_id} not found after clustering"
@@ -125,13 +140,92 @@ async def stage_tier2_candidate(
         )
 
 
+async def embed_tier2_candidates(
+    *,
+    owner: Any,
+    prepared_items: list[_PreparedItem],
+) -> tuple[set[UUID], int, Exception | None]:
+    """
+    Embed every candidate still missing a vector with one batched call.
+
+    Returns the embedded item ids, the API calls made and the batch failure to
+    report per item, if any. A failed batch leaves every item untouched. Budget
+    denials and retryable errors are returned so `stage_tier2_candidate` keeps
+    their pending/requeue outcomes per item; any other failure, including a
+    response whose size does not match the batch, returns no error so each item
+    is embedded on its own.
+    """
+    missing = [prepared for prepared in prepared_items if prepared.item.embedding is None]
+    if not missing:
+        return (set(), 0, None)
+    embedding_api_calls = 0
+    try:
+        vectors, audits, embedding_api_calls = await _embed_items(owner=owner, prepared=missing)
+        embedded = list(zip(missing, vectors, audits, strict=True))
+    except Exception as exc:
+        retryable = build_retryable_pipeline_error(item_id=None, stage="embed_batch", exc=exc)
+        if isinstance(exc, BudgetExceededError) or retryable is not None:
+            return (set(), embedding_api_calls, exc)
+        logger.warning(
+            "Batch embedding failed; falling back to per-item embedding",
+            candidate_count=len(missing),
+            reason=str(exc),
+        )
+        return (set(), embedding_api_calls, None)
+    for prepared, vector, audit in embedded:
+        _apply_item_embedding(owner=owner, item=prepared.item, vector=vector, audit=audit)
+    return ({prepared.item_id for prepared in missing}, embedding_api_calls, None)
+
+
+async def cluster_tier2_candidates(
+    *,
+    owner: Any,
+    prepared_items: list[_PreparedItem],
+) -> dict[UUID, ClusterResult]:
+    """
+    Cluster every embedded candidate with one `cluster_items` call.
+
+    The batch runs inside a savepoint so a failed call leaves no partial event
+    writes behind. Database and retryable errors propagate; any other failure
+    leaves every item, like items without a vector, to `stage_tier2_candidate`,
+    which clusters them one at a time.
+    """
+    cluster_items = getattr(owner.event_clusterer, "cluster_items", None)
+    embedded = [prepared for prepared in prepared_items if prepared.item.embedding is not None]
+    if not callable(cluster_items) or not embedded:
+        return {}
+    try:
+        async with owner.session.begin_nested():
+            results = await cluster_items([prepared.item for prepared in embedded])
+    except SQLAlchemyError:
+        raise
+    except Exception as exc:
+        owner._raise_retryable_failure_if_needed(item=None, stage="cluster_batch", exc=exc)
+        logger.warning(
+            "Batch clustering failed; falling back to per-item clustering",
+            candidate_count=len(embedded),
+            reason=str(exc),
+        )
+        return {}
+    return {result.item_id: result for result in results}
+
+
 async def ensure_item_embedding(
     *,
     owner: Any,
     prepared: _PreparedItem,
 ) -> tuple[bool, int]:
-    item = prepared.item
-    embedding_audit = None
+    vectors, audits, embedding_api_calls = await _embed_items(owner=owner, prepared=[prepared])
+    _apply_item_embedding(owner=owner, item=prepared.item, vector=vectors[0], audit=audits[0])
+    return (True, embedding_api_calls)
+
+
+async def _embed_items(
+    *,
+    owner: Any,
+    prepared: list[_PreparedItem],
+) -> tuple[list[EmbeddingVector], list[Any], int]:
+    texts = [candidate.raw_content for candidate in prepared]
     embed_with_contexts = getattr(owner.embedding_service, "embed_texts_with_contexts", None)
     if callable(embed_with_contexts):
         (
@@ -140,28 +234,34 @@ async def ensure_item_embedding(
             _cache_hits,
             embedding_api_calls,
         ) = await embed_with_contexts(
-            [prepared.raw_content],
+            texts,
             entity_type="raw_item",
-            entity_ids=[prepared.item_id],
+            entity_ids=[candidate.item_id for candidate in prepared],
         )
-        embedding_audit = audits[0] if audits else None
-    else:
-        (
-            vectors,
-            _cache_hits,
-            embedding_api_calls,
-        ) = await owner.embedding_service.embed_texts([prepared.raw_content])
-    item.embedding = vectors[0]
+        return (vectors, list(audits) or [None] * len(vectors), embedding_api_calls)
+    (
+        vectors,
+        _cache_hits,
+        embedding_api_calls,
+    ) = await owner.embedding_service.embed_texts(texts)
+    return (vectors, [None] * len(vectors), embedding_api_calls)
+
+
+def _apply_item_embedding(
+    *,
+    owner: Any,
+    item: RawItem,
+    vector: EmbeddingVector,
+    audit: Any,
+) -> None:
+    item.embedding = vector
     item.embedding_model = getattr(owner.embedding_service, "model", settings.EMBEDDING_MODEL)
     item.embedding_generated_at = datetime.now(tz=UTC)
-    if embedding_audit is not None:
-        item.embedding_input_tokens = embedding_audit.original_tokens
-        item.embedding_retained_tokens = embedding_audit.retained_tokens
-        item.embedding_was_truncated = embedding_audit.was_truncated
-        item.embedding_truncation_strategy = (
-            embedding_audit.strategy if embedding_audit.was_cut else None
-        )
-    return (True, embedding_api_calls)
+    if audit is not None:
+        item.embedding_input_tokens = audit.original_tokens
+        item.embedding_retained_tokens = audit.retained_tokens
+        item.embedding_was_truncated = audit.was_truncated
+        item.embedding_truncation_strategy = audit.strategy if audit.was_cut else None
 
 
 async def finalize_staged_tier2_candidate(
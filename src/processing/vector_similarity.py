@@ -4,11 +4,17 @@ Vector similarity helpers used by retrieval and benchmarking paths.
 
 from __future__ import annotations
 
-import math
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TypeVar
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from src.processing.similarity_kernels import cosine_scores, normalize_rows
 
 EntityT = TypeVar("EntityT")
+type VectorLike = Sequence[float] | npt.NDArray[Any]
 
 
 @dataclass(slots=True, frozen=True)
@@ -27,27 +33,23 @@ def max_distance_for_similarity(similarity_threshold: float) -> float:
     return 1.0 - similarity_threshold
 
 
-def cosine_similarity(left: list[float], right: list[float]) -> float:
-    """Compute cosine similarity for two equal-length vectors."""
+def cosine_similarity(left: VectorLike, right: VectorLike) -> float:
+    """Compute cosine similarity for two equal-length vectors, accumulating in float64."""
     if len(left) != len(right):
         msg = "Vectors must have matching dimensions"
         raise ValueError(msg)
-    if not left:
+    if len(left) == 0:
         msg = "Vectors must not be empty"
         raise ValueError(msg)
 
-    dot = sum(left_value * right_value for left_value, right_value in zip(left, right, strict=True))
-    left_norm = math.sqrt(sum(value * value for value in left))
-    right_norm = math.sqrt(sum(value * value for value in right))
-    if left_norm == 0.0 or right_norm == 0.0:
-        return 0.0
-    return dot / (left_norm * right_norm)
+    units = normalize_rows([left, right], dtype=np.float64)
+    return float(units[0] @ units[1])
 
 
 def nearest_neighbors(
     *,
-    query_embedding: list[float],
-    candidates: list[tuple[str, list[float]]],
+    query_embedding: VectorLike,
+    candidates: list[tuple[str, VectorLike]],
     similarity_threshold: float,
     limit: int,
 ) -> list[NeighborResult]:
@@ -55,13 +57,25 @@ def nearest_neighbors(
     if limit < 1:
         msg = "limit must be >= 1"
         raise ValueError(msg)
+    if not candidates:
+        return []
+    if any(len(embedding) != len(query_embedding) for _entity_id, embedding in candidates):
+        msg = "Vectors must have matching dimensions"
+        raise ValueError(msg)
+    if len(query_embedding) == 0:
+        msg = "Vectors must not be empty"
+        raise ValueError(msg)
 
-    rows: list[NeighborResult] = []
-    for entity_id, embedding in candidates:
-        similarity = cosine_similarity(query_embedding, embedding)
-        if similarity < similarity_threshold:
-            continue
-        rows.append(NeighborResult(entity_id=entity_id, similarity=similarity))
-
+    units = normalize_rows([embedding for _entity_id, embedding in candidates], dtype=np.float64)
+    scores = cosine_scores(units, query_embedding)
+    eligible = np.flatnonzero(scores >= similarity_threshold)
+    if eligible.size > limit:
+        # Keep every score tied with the limit-th best so entity ids break ties below.
+        cutoff = np.partition(scores[eligible], -limit)[-limit]
+        eligible = eligible[scores[eligible] >= cutoff]
+    rows = [
+        NeighborResult(entity_id=candidates[int(index)][0], similarity=float(scores[index]))
+        for index in eligible
+    ]
     rows.sort(key=lambda row: (-row.similarity, row.entity_id))
     return rows[:limit]
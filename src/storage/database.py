@@ -13,6 +13,7 @@ from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -22,6 +23,7 @@ from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
 from src.storage.restatement_models import PrivilegedWriteAudit
+from src.storage.vector_types import register_vector_codec
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine
@@ -57,8 +59,19 @@ def create_engine() -> AsyncEngine:
     )
 
 
+def install_vector_codec(async_engine: AsyncEngine) -> None:
+    """Bind embeddings as binary float32 vectors on every new asyncpg connection."""
+    if async_engine.dialect.driver != "asyncpg":
+        return
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _register(dbapi_connection: Any, _connection_record: Any) -> None:
+        dbapi_connection.run_async(register_vector_codec)
+
+
 # Create engine instance
 engine = create_engine()
+install_vector_codec(engine)
 
 # Create session factory
 async_session_maker = async_sessionmaker(
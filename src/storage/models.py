@@ -7,7 +7,6 @@ from datetime import date, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
@@ -48,6 +47,7 @@ from src.storage.restatement_models import (
 )
 from src.storage.scoring_contract import TREND_SCORING_MATH_VERSION, TREND_SCORING_PARAMETER_SET
 from src.storage.trend_state_models import TrendDefinitionVersion, TrendStateVersion
+from src.storage.vector_types import EmbeddingVector, Float32Vector
 
 # fmt: off
 _ = (CanonicalEntity, CanonicalEntityAlias, CoverageSnapshot, EventAdjudication, EventEntity,
@@ -214,6 +214,10 @@ class Source(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     last_fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     ingestion_window_end_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    fetch_etag: Mapped[str | None] = mapped_column(String(512))
+    fetch_last_modified: Mapped[str | None] = mapped_column(String(64))
+    fetch_body_hash: Mapped[str | None] = mapped_column(String(64))
+    high_water_message_id: Mapped[int | None] = mapped_column(Integer)
     error_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     last_error: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
@@ -281,7 +285,7 @@ class RawItem(Base):
         nullable=False,
     )
     raw_content: Mapped[str] = mapped_column(Text, nullable=False)
-    embedding: Mapped[list[float] | None] = mapped_column(Vector(1536))  # OpenAI dim
+    embedding: Mapped[EmbeddingVector | None] = mapped_column(Float32Vector(1536))  # OpenAI dim
     embedding_model: Mapped[str | None] = mapped_column(String(255))
     embedding_generated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     embedding_input_tokens: Mapped[int | None] = mapped_column(Integer)
@@ -294,6 +298,8 @@ class RawItem(Base):
     )
     embedding_truncation_strategy: Mapped[str | None] = mapped_column(String(20))
     content_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # SHA256
+    minhash_signature: Mapped[list[int] | None] = mapped_column(ARRAY(Integer))
+    minhash_bands: Mapped[list[int] | None] = mapped_column(ARRAY(Integer))
     language: Mapped[str | None] = mapped_column(String(10))
     processing_status: Mapped[ProcessingStatus] = mapped_column(
         Enum(ProcessingStatus, name="processing_status", values_callable=enum_values),
@@ -317,7 +323,9 @@ class RawItem(Base):
         Index("idx_raw_items_hash", "content_hash"),
         Index("idx_raw_items_fetched", "fetched_at"),
         Index("idx_raw_items_source_fetched", "source_id", "fetched_at"),
+        Index("idx_raw_items_minhash_bands", "minhash_bands", postgresql_using="gin"),
         # Keep model metadata aligned with migration-managed pgvector index.
+        # EMBEDDING_ANN_STORAGE=halfvec|binary deployments swap it in migration 0042.
         Index(
             "idx_raw_items_embedding",
             "embedding",
@@ -340,7 +348,7 @@ class Event(Base):
     )
     canonical_summary: Mapped[str] = mapped_column(Text, nullable=False)
     event_summary: Mapped[str | None] = mapped_column(Text)
-    embedding: Mapped[list[float] | None] = mapped_column(Vector(1536))
+    embedding: Mapped[EmbeddingVector | None] = mapped_column(Float32Vector(1536))
     embedding_model: Mapped[str | None] = mapped_column(String(255))
     embedding_generated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     embedding_input_tokens: Mapped[int | None] = mapped_column(Integer)
@@ -352,6 +360,11 @@ class Event(Base):
         nullable=False,
     )
     embedding_truncation_strategy: Mapped[str | None] = mapped_column(String(20))
+    # Running sum of unit item embeddings of `embedding_model` and how many were added.
+    embedding_centroid_sum: Mapped[EmbeddingVector | None] = mapped_column(Float32Vector(1536))
+    embedding_centroid_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default=text("0"), nullable=False
+    )
 
     extracted_who: Mapped[list[str] | None] = mapped_column(ARRAY(String))
     extracted_what: Mapped[str | None] = mapped_column(Text)
@@ -452,6 +465,7 @@ class Event(Base):
         Index("idx_events_lifecycle", "lifecycle_status", "last_mention_at"),
         Index("idx_events_activity", "activity_state", "last_mention_at"),
         # Keep model metadata aligned with migration-managed pgvector index.
+        # EMBEDDING_ANN_STORAGE=halfvec|binary deployments swap it in migration 0042.
         Index(
             "idx_events_embedding",
             "embedding",
@@ -0,0 +1,124 @@
+"""
+Float32 embedding vectors and their pgvector column type.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from pgvector.asyncpg import register_vector
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
+from sqlalchemy import cast, func, literal
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql.elements import ColumnElement
+
+type EmbeddingVector = npt.NDArray[np.float32]
+
+ANN_STORAGE_MODES = ("full", "halfvec", "binary")
+
+_NUMERIC_KINDS = frozenset("biuf")
+
+
+def as_embedding_vector(
+    values: Sequence[float] | npt.NDArray[Any],
+    *,
+    dimensions: int | None = None,
+) -> EmbeddingVector:
+    """
+    Return `values` as a validated one-dimensional float32 array.
+
+    Float32 input is returned without copying. Raises ValueError for
+    non-numeric, non-finite or wrongly sized input.
+    """
+    try:
+        array = np.asarray(values)
+    except ValueError as exc:
+        msg = "Embedding vector contains non-numeric value"
+        raise ValueError(msg) from exc
+    if array.ndim != 1 or array.dtype.kind not in _NUMERIC_KINDS:
+        msg = "Embedding vector contains non-numeric value"
+        raise ValueError(msg)
+    if dimensions is not None and array.shape[0] != dimensions:
+        msg = f"Embedding dimension mismatch: expected {dimensions}"
+        raise ValueError(msg)
+    with np.errstate(over="ignore"):
+        vector = array.astype(np.float32, copy=False)
+    if not np.isfinite(vector).all():
+        msg = "Embedding vector contains non-finite value"
+        raise ValueError(msg)
+    return vector
+
+
+class Float32Vector(Vector):  # type: ignore[misc]
+    """
+    pgvector column bound as float32 arrays through asyncpg's binary codec.
+
+    Other drivers keep pgvector's text literal binding. Engines using asyncpg
+    must install the codec with `register_vector_codec` on connect.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect: Dialect) -> Callable[[Any], Any] | None:
+        if dialect.driver != "asyncpg":
+            processor: Callable[[Any], Any] | None = super().bind_processor(dialect)
+            return processor
+        dimensions = self.dim
+
+        def process(value: Any) -> EmbeddingVector | None:
+            if value is None:
+                return None
+            return as_embedding_vector(value, dimensions=dimensions)
+
+        return process
+
+
+async def register_vector_codec(connection: Any) -> None:
+    """Install pgvector's binary codecs on an asyncpg connection."""
+    try:
+        await register_vector(connection)
+    except ValueError as exc:
+        # A fresh database gets the extension from its first migration.
+        if not str(exc).startswith("unknown type"):
+            raise
+
+
+def ann_candidate_distance(
+    column: Any,
+    embedding: Sequence[float] | npt.NDArray[Any] | ColumnElement[Any],
+    *,
+    storage: str,
+) -> ColumnElement[Any]:
+    """
+    Return the distance the ANN index for `storage` orders candidates by.
+
+    `full` is exact cosine distance. `halfvec` and `binary` match the
+    migration's expression indexes over `embedding`, so their ordering is
+    approximate and callers must re-rank candidates by exact distance.
+    `embedding` may be a vector value or a vector column expression.
+    """
+    if storage == "full":
+        distance: ColumnElement[Any] = column.cosine_distance(embedding)
+        return distance
+    dimensions = column.type.dim
+    # Typed parameter keeps binary_quantize() from resolving ambiguously.
+    query = (
+        embedding
+        if isinstance(embedding, ColumnElement)
+        else cast(literal(embedding, type_=column.type), column.type)
+    )
+    if storage == "halfvec":
+        distance = cast(column, HALFVEC(dimensions)).cosine_distance(
+            cast(query, HALFVEC(dimensions))
+        )
+    elif storage == "binary":
+        distance = cast(func.binary_quantize(column), BIT(dimensions)).hamming_distance(
+            cast(func.binary_quantize(query), BIT(dimensions))
+        )
+    else:
+        msg = f"Unsupported ANN storage mode '{storage}'"
+        raise ValueError(msg)
+    return distance
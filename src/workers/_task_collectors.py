@@ -11,7 +11,11 @@ async def collect_rss_async(*, deps: Any) -> dict[str, Any]:
         deps.httpx.AsyncClient() as http_client,
         deps.async_session_maker() as session,
     ):
-        collector = deps.RSSCollector(session=session, http_client=http_client)
+        collector = deps.RSSCollector(
+            session=session,
+            http_client=http_client,
+            session_factory=deps.async_session_maker,
+        )
         results = await collector.collect_all()
         await session.commit()
 
@@ -35,7 +39,11 @@ async def collect_gdelt_async(*, deps: Any) -> dict[str, Any]:
         deps.httpx.AsyncClient() as http_client,
         deps.async_session_maker() as session,
     ):
-        collector = deps.GDELTClient(session=session, http_client=http_client)
+        collector = deps.GDELTClient(
+            session=session,
+            http_client=http_client,
+            session_factory=deps.async_session_maker,
+        )
         results = await collector.collect_all()
         await session.commit()
 
@@ -18,9 +18,14 @@ def _build_beat_schedule() -> dict[str, dict[str, Any]]:
     schedule: dict[str, dict[str, Any]] = {}
 
     if settings.ENABLE_RSS_INGESTION:
+        rss_interval_minutes = (
+            settings.RSS_ADAPTIVE_POLL_TICK_MINUTES
+            if settings.RSS_ADAPTIVE_POLLING_ENABLED
+            else settings.RSS_COLLECTION_INTERVAL
+        )
         schedule["collect-rss"] = {
             "task": "workers.collect_rss",
-            "schedule": timedelta(minutes=max(1, settings.RSS_COLLECTION_INTERVAL)),
+            "schedule": timedelta(minutes=max(1, rss_interval_minutes)),
         }
 
     if settings.ENABLE_GDELT_INGESTION:
@@ -401,6 +401,8 @@ def test_build_parser_accepts_eval_vector_benchmark_command() -> None:
             "0.9",
             "--seed",
             "7",
+            "--compare-cluster-targets",
+            "--compare-similarity-kernels",
         ]
     )
 
@@ -414,6 +416,8 @@ def test_build_parser_accepts_eval_vector_benchmark_command() -> None:
     assert args.top_k == 12
     assert args.similarity_threshold == pytest.approx(0.9)
     assert args.seed == 7
+    assert args.compare_cluster_targets is True
+    assert args.compare_similarity_kernels is True
 
 
 def test_build_parser_accepts_eval_embedding_lineage_command() -> None:
@@ -513,6 +517,40 @@ def test_build_parser_accepts_pipeline_dry_run_command() -> None:
     assert args.output_path.endswith("pipeline-dry-run-output.json")
 
 
+def test_build_parser_accepts_pipeline_rebuild_dedup_filter_command() -> None:
+    parser = _build_parser()
+    args = parser.parse_args(["pipeline", "rebuild-dedup-filter", "--batch-size", "250"])
+
+    assert args.command == "pipeline"
+    assert args.pipeline_command == "rebuild-dedup-filter"
+    assert args.batch_size == 250
+
+
+def test_build_parser_accepts_pipeline_backfill_embeddings_command() -> None:
+    parser = _build_parser()
+    args = parser.parse_args(
+        [
+            "pipeline",
+            "backfill-embeddings",
+            "--entity",
+            "events",
+            "--page-size",
+            "50",
+            "--max-api-calls",
+            "10",
+            "--restart",
+        ]
+    )
+
+    assert args.pipeline_command == "backfill-embeddings"
+    assert args.entity == "events"
+    assert args.page_size == 50
+    assert args.max_api_calls == 10
+    assert args.max_items_per_minute is None
+    assert args.checkpoint_dir == "artifacts/agent"
+    assert args.restart is True
+
+
 def test_build_parser_accepts_doctor_command() -> None:
     parser = _build_parser()
     args = parser.parse_args(["doctor", "--timeout-seconds", "3.5"])
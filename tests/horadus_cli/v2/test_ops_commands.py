@@ -25,8 +25,10 @@ import src.eval.replay as replay_module
 import src.eval.taxonomy_validation as taxonomy_validation_module
 import src.eval.vector_benchmark as vector_benchmark_module
 import src.processing.dry_run_pipeline as dry_run_pipeline_module
+import src.processing.recent_key_filter as recent_key_filter_module
 import src.storage.database as database_module
 import tools.horadus.python.horadus_app_cli_runtime as runtime_module
+import tools.horadus.python.horadus_app_cli_runtime_backfill as backfill_runtime_module
 import tools.horadus.python.horadus_cli.ops_commands as ops_module
 from tools.horadus.python.horadus_cli.result import ExitCode
 
@@ -205,6 +207,8 @@ async def test_collect_eval_wrappers_pass_normalized_arguments(
         top_k=0,
         similarity_threshold=0.9,
         seed=7,
+        compare_cluster_targets=True,
+        compare_similarity_kernels=True,
     )
 
     _, _, benchmark_exit = await runtime_module._collect_eval_benchmark(benchmark_args)
@@ -219,6 +223,8 @@ async def test_collect_eval_wrappers_pass_normalized_arguments(
     assert vector_calls["query_count"] == 10
     assert vector_calls["dimensions"] == 8
     assert vector_calls["top_k"] == 1
+    assert vector_calls["compare_cluster_targets"] is True
+    assert vector_calls["compare_similarity_kernels"] is True
     assert benchmark_exit == replay_exit == vector_exit == ExitCode.OK
 
 
@@ -414,6 +420,44 @@ def test_collect_eval_audit_validate_taxonomy_and_pipeline_dry_run(
     assert pipeline_exit == ExitCode.OK
 
 
+@pytest.mark.asyncio
+async def test_collect_pipeline_rebuild_dedup_filter_reports_rows_and_disabled_filter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    @asynccontextmanager
+    async def fake_session_maker():
+        yield "session"
+
+    rebuilds: list[tuple[object, int]] = []
+
+    class FakeFilter:
+        enabled = True
+        window_days = 7
+
+        async def rebuild(self, session: object, *, batch_size: int) -> int:
+            rebuilds.append((session, batch_size))
+            return 42
+
+    key_filter = FakeFilter()
+    monkeypatch.setattr(database_module, "async_session_maker", fake_session_maker)
+    monkeypatch.setattr(recent_key_filter_module, "get_recent_key_filter", lambda: key_filter)
+
+    data, lines, exit_code = await runtime_module._collect_pipeline_rebuild_dedup_filter(
+        SimpleNamespace(batch_size=0)
+    )
+    assert data == {"enabled": True, "rows": 42, "window_days": 7}
+    assert lines == ["Dedup filter rebuilt from 42 raw items (window_days=7)"]
+    assert exit_code == ExitCode.OK
+    assert rebuilds == [("session", 1)]
+
+    key_filter.enabled = False
+    data, _lines, exit_code = await runtime_module._collect_pipeline_rebuild_dedup_filter(
+        SimpleNamespace(batch_size=10)
+    )
+    assert data == {"enabled": False, "rows": 0}
+    assert exit_code == ExitCode.VALIDATION_ERROR
+
+
 def test_collect_eval_audit_and_taxonomy_without_warnings(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -1045,6 +1089,12 @@ def test_runtime_action_wrappers_delegate_to_collectors(monkeypatch: pytest.Monk
     monkeypatch.setattr(runtime_module, "_collect_eval_embedding_lineage", fake_async_collector)
     monkeypatch.setattr(runtime_module, "_collect_eval_source_freshness", fake_async_collector)
     monkeypatch.setattr(runtime_module, "_collect_pipeline_dry_run", fake_sync_collector)
+    monkeypatch.setattr(
+        runtime_module, "_collect_pipeline_rebuild_dedup_filter", fake_async_collector
+    )
+    monkeypatch.setattr(
+        backfill_runtime_module, "_collect_pipeline_backfill_embeddings", fake_async_collector
+    )
     monkeypatch.setattr(
         runtime_module,
         "_collect_doctor",
@@ -1065,6 +1115,16 @@ def test_runtime_action_wrappers_delegate_to_collectors(monkeypatch: pytest.Monk
     assert runtime_module._action_eval_embedding_lineage({"value": "x"})["data"] == {"value": "x"}
     assert runtime_module._action_eval_source_freshness({"value": "x"})["data"] == {"value": "x"}
     assert runtime_module._action_pipeline_dry_run({"value": "x"})["lines"] == ["sync"]
+    assert runtime_module._action_pipeline_rebuild_dedup_filter({"value": "x"})["lines"] == [
+        "async"
+    ]
+    assert backfill_runtime_module._action_pipeline_backfill_embeddings({"value": "x"})["data"] == {
+        "value": "x"
+    }
+    assert (
+        runtime_module._ACTIONS["pipeline-backfill-embeddings"]
+        is backfill_runtime_module._action_pipeline_backfill_embeddings
+    )
     assert runtime_module._action_doctor({"timeout_seconds": 0.0})["data"] == {"timeout": 0.1}
 
 
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import os
+from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+import src.processing.embedding_backfill as embedding_backfill_module
 import tools.horadus.python.horadus_app_cli_runtime as runtime_module
+import tools.horadus.python.horadus_app_cli_runtime_backfill as backfill_runtime_module
 import tools.horadus.python.horadus_cli.ops_commands as ops_module
+from tools.horadus.python.horadus_cli.result import ExitCode
 
 pytestmark = pytest.mark.unit
 
@@ -344,3 +349,61 @@ def test_run_doctor_returns_failure_on_safety_refusal(
 
     result = _run_doctor(timeout_seconds=0.2)
     assert result == 2
+
+
+@pytest.mark.asyncio
+async def test_collect_pipeline_backfill_embeddings_runs_entities_until_stopped(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    created: list[dict[str, object]] = []
+    stop_entity: dict[str, str | None] = {"name": None}
+
+    class FakeRunner:
+        def __init__(self, **kwargs: object) -> None:
+            created.append(kwargs)
+            self.entity = str(kwargs["entity"])
+
+        async def run(
+            self, *, restart: bool
+        ) -> embedding_backfill_module.EmbeddingBackfillProgress:
+            stopped = "max_api_calls" if self.entity == stop_entity["name"] else None
+            return embedding_backfill_module.EmbeddingBackfillProgress(
+                entity=self.entity,
+                target_model="embed-v2",
+                embedded=3,
+                api_calls=1,
+                pages=1,
+                completed=stopped is None and not restart,
+                stopped_reason=stopped,
+            )
+
+    monkeypatch.setattr(embedding_backfill_module, "EmbeddingBackfillRunner", FakeRunner)
+    args = SimpleNamespace(
+        entity="all",
+        checkpoint_dir=str(tmp_path),
+        page_size=0,
+        max_api_calls=None,
+        max_items_per_minute=None,
+        restart=False,
+    )
+
+    data, lines, exit_code = await backfill_runtime_module._collect_pipeline_backfill_embeddings(
+        args
+    )
+
+    assert exit_code == ExitCode.OK
+    assert data["completed"] is True
+    assert [run["entity"] for run in data["runs"]] == ["raw_items", "events"]
+    assert created[0]["page_size"] == 1
+    assert created[1]["checkpoint_path"] == tmp_path / "embedding-backfill-events.json"
+    assert lines[0] == "raw_items: embedded=3, api_calls=1, cache_hits=0, pages=1, completed=true"
+
+    stop_entity["name"] = "raw_items"
+    data, lines, exit_code = await backfill_runtime_module._collect_pipeline_backfill_embeddings(
+        args
+    )
+
+    assert exit_code == ExitCode.VALIDATION_ERROR
+    assert [run["entity"] for run in data["runs"]] == ["raw_items"]
+    assert lines[0].endswith("stopped=max_api_calls")
@@ -6,6 +6,7 @@ import httpx
 import pytest
 from sqlalchemy import select
 
+from src.ingestion.content_extractor import ExtractionExecutor
 from src.ingestion.rss_collector import FeedConfig, RSSCollector
 from src.storage.database import async_session_maker
 from src.storage.models import ProcessingStatus, RawItem, Source, SourceType
@@ -66,6 +67,11 @@ async def test_rss_collector_persists_and_deduplicates_items(
             session=session,
             http_client=http_client,
             requests_per_second=1000.0,
+            extraction_executor=ExtractionExecutor(
+                max_workers=0,
+                max_html_bytes=1_000_000,
+                timeout_seconds=5.0,
+            ),
         )
         feed = FeedConfig(
             name=source_name,
@@ -60,6 +60,7 @@ def _build_event(
                 "cluster_cohesion_score": 1.0,
                 "split_risk_score": 0.0,
             },
+            "counters": {"observation_count": 4},
         },
         lifecycle_status=lifecycle_status,
         has_contradictions=has_contradictions,
@@ -80,6 +81,7 @@ def _assert_event_detail_summary(result, *, event: Event) -> None:
     assert result.corroboration_mode == "provenance_aware"
     assert result.corroboration_score == pytest.approx(1.35)
     assert result.provenance_summary["method"] == "provenance_aware"
+    assert "counters" not in result.provenance_summary
     assert result.has_contradictions is True
     assert "conflict" in (result.contradiction_notes or "").lower()
     assert result.lineage[0]["lineage_kind"] == "merge"
@@ -245,6 +245,22 @@ def test_settings_rejects_invalid_embedding_input_policy() -> None:
         )
 
 
+def test_settings_normalizes_and_validates_embedding_ann_storage() -> None:
+    settings = Settings(_env_file=None, EMBEDDING_ANN_STORAGE=" HalfVec ")
+
+    assert settings.EMBEDDING_ANN_STORAGE == "halfvec"
+    with pytest.raises(ValidationError, match="EMBEDDING_ANN_STORAGE"):
+        Settings(_env_file=None, EMBEDDING_ANN_STORAGE="int8")
+
+
+def test_settings_normalizes_and_validates_cluster_event_embedding_mode() -> None:
+    settings = Settings(_env_file=None, CLUSTER_EVENT_EMBEDDING_MODE=" Seed ")
+
+    assert settings.CLUSTER_EVENT_EMBEDDING_MODE == "seed"
+    with pytest.raises(ValidationError, match="CLUSTER_EVENT_EMBEDDING_MODE"):
+        Settings(_env_file=None, CLUSTER_EVENT_EMBEDDING_MODE="medoid")
+
+
 def test_settings_normalizes_dedup_url_query_mode() -> None:
     settings = Settings(
         _env_file=None,
@@ -57,6 +57,11 @@ def test_collector_interval_minutes_handles_supported_and_unknown_collectors(
     assert _collector_interval_minutes(SourceType.GDELT) == 15
     assert _collector_interval_minutes(SourceType.TELEGRAM) is None
 
+    monkeypatch.setattr("src.core.source_freshness.settings.RSS_ADAPTIVE_POLLING_ENABLED", True)
+    monkeypatch.setattr("src.core.source_freshness.settings.RSS_ADAPTIVE_POLL_MAX_MINUTES", 720)
+
+    assert _collector_interval_minutes(SourceType.RSS) == 720
+
 
 @pytest.mark.asyncio
 async def test_build_source_freshness_report_marks_stale_sources(
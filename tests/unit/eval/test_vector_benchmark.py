@@ -164,7 +164,7 @@ async def test_prepare_dataset_creates_table_and_loads_rows() -> None:
 
 
 @pytest.mark.asyncio
-async def test_drop_strategy_indexes_removes_both_index_types() -> None:
+async def test_drop_strategy_indexes_removes_all_index_types() -> None:
     conn = _FakeConnection()
 
     await vector_benchmark_module._drop_strategy_indexes(conn)
@@ -172,11 +172,13 @@ async def test_drop_strategy_indexes_removes_both_index_types() -> None:
     assert conn.execute_calls == [
         "DROP INDEX IF EXISTS idx_eval_vector_benchmark_embedding_ivfflat",
         "DROP INDEX IF EXISTS idx_eval_vector_benchmark_embedding_hnsw",
+        "DROP INDEX IF EXISTS idx_eval_vector_benchmark_embedding_halfvec",
+        "DROP INDEX IF EXISTS idx_eval_vector_benchmark_embedding_binary",
     ]
 
 
 @pytest.mark.asyncio
-async def test_apply_strategy_index_supports_exact_ivfflat_and_hnsw(
+async def test_apply_strategy_index_supports_exact_ann_and_quantized_strategies(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     conn = _FakeConnection()
@@ -187,14 +189,20 @@ async def test_apply_strategy_index_supports_exact_ivfflat_and_hnsw(
 
     monkeypatch.setattr(vector_benchmark_module, "_drop_strategy_indexes", fake_drop)
 
-    await vector_benchmark_module._apply_strategy_index(conn, strategy="exact")
-    await vector_benchmark_module._apply_strategy_index(conn, strategy="ivfflat")
-    await vector_benchmark_module._apply_strategy_index(conn, strategy="hnsw")
+    for strategy in ("exact", "ivfflat", "hnsw", "halfvec", "binary"):
+        await vector_benchmark_module._apply_strategy_index(conn, strategy=strategy, dimensions=8)
 
-    assert drop_calls == [conn, conn, conn]
+    assert drop_calls == [conn] * 5
     assert any("ivfflat" in query for query in conn.execute_calls)
     assert any("hnsw" in query for query in conn.execute_calls)
-    assert conn.execute_calls.count("ANALYZE eval_vector_benchmark") == 2
+    assert any(
+        "(embedding::halfvec(8)) halfvec_cosine_ops" in query for query in conn.execute_calls
+    )
+    assert any(
+        "(binary_quantize(embedding)::bit(8)) bit_hamming_ops" in query
+        for query in conn.execute_calls
+    )
+    assert conn.execute_calls.count("ANALYZE eval_vector_benchmark") == 4
 
 
 @pytest.mark.asyncio
@@ -209,7 +217,7 @@ async def test_apply_strategy_index_rejects_unknown_strategy(
     monkeypatch.setattr(vector_benchmark_module, "_drop_strategy_indexes", fake_drop_indexes)
 
     with pytest.raises(ValueError, match="Unsupported strategy 'bogus'"):
-        await vector_benchmark_module._apply_strategy_index(conn, strategy="bogus")
+        await vector_benchmark_module._apply_strategy_index(conn, strategy="bogus", dimensions=8)
 
 
 @pytest.mark.asyncio
@@ -230,17 +238,43 @@ async def test_query_neighbors_returns_ids_and_latency(monkeypatch: pytest.Monke
     assert conn.fetch_calls[0][1] == ("[0.100000,0.200000]", 0.3, 5)
 
 
+@pytest.mark.asyncio
+async def test_query_neighbors_reranks_quantized_candidates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = _FakeConnection()
+    monkeypatch.setattr(vector_benchmark_module.settings, "EMBEDDING_ANN_RERANK_CANDIDATES", 40)
+
+    ids, _latency_ms = await vector_benchmark_module._query_neighbors(
+        conn,
+        query_vector=[0.1, 0.2],
+        max_distance=0.3,
+        top_k=5,
+        candidate_order="embedding::halfvec(2) <=> $1::vector::halfvec(2)",
+    )
+
+    query, args = conn.fetch_calls[0]
+    assert ids == [2, 7]
+    assert "ORDER BY embedding::halfvec(2) <=> $1::vector::halfvec(2)" in query
+    assert "ORDER BY embedding <=> $1::vector ASC" in query
+    assert args == ("[0.100000,0.200000]", 0.3, 5, 40)
+
+
 @pytest.mark.asyncio
 async def test_run_strategy_computes_recall_and_latency(monkeypatch: pytest.MonkeyPatch) -> None:
     conn = _FakeConnection()
     applied: list[str] = []
 
-    async def fake_apply_strategy_index(_conn: _FakeConnection, *, strategy: str) -> None:
+    async def fake_apply_strategy_index(
+        _conn: _FakeConnection, *, strategy: str, dimensions: int
+    ) -> None:
         applied.append(strategy)
 
     responses = iter([([1, 2], 4.0), ([3], 8.0), ([8], 2.0)])
+    candidate_orders: list[str | None] = []
 
-    async def fake_query_neighbors(*_args, **_kwargs):
+    async def fake_query_neighbors(*_args, candidate_order: str | None = None, **_kwargs):
+        candidate_orders.append(candidate_order)
         return next(responses)
 
     monkeypatch.setattr(vector_benchmark_module, "_apply_strategy_index", fake_apply_strategy_index)
@@ -253,15 +287,51 @@ async def test_run_strategy_computes_recall_and_latency(monkeypatch: pytest.Monk
         max_distance=0.3,
         top_k=3,
         exact_neighbors=[[1, 2, 3], [], [7, 8]],
+        dimensions=1,
     )
 
     assert applied == ["hnsw"]
+    assert candidate_orders == [None, None, None]
     assert metrics.name == "hnsw"
     assert metrics.avg_latency_ms == pytest.approx((4.0 + 8.0 + 2.0) / 3)
     assert metrics.p95_latency_ms == 8.0
     assert metrics.recall_at_k == pytest.approx(((2 / 3) + 1.0 + (1 / 2)) / 3)
 
 
+def test_compare_cluster_targets_shows_centroids_fragment_drifting_stories_less() -> None:
+    metrics = vector_benchmark_module._compare_cluster_targets(
+        dataset_size=400,
+        dimensions=32,
+        similarity_threshold=0.88,
+        seed=7,
+    )
+
+    assert set(metrics) == {"seed", "centroid"}
+    assert metrics["centroid"].events_created < metrics["seed"].events_created
+    assert metrics["centroid"].events_per_story >= 1.0
+    assert metrics["centroid"].purity >= 0.95
+    assert metrics["seed"].to_dict()["name"] == "seed"
+
+
+def test_compare_similarity_kernels_reports_matching_top_k() -> None:
+    vectors = vector_benchmark_module._build_clustered_vectors(
+        dataset_size=200, dimensions=16, seed=3
+    )
+
+    metrics = vector_benchmark_module._compare_similarity_kernels(
+        vectors=vectors,
+        query_vectors=vectors[:5],
+        top_k=4,
+    )
+
+    payload = metrics.to_dict()
+    assert payload["candidate_count"] == 200
+    assert payload["top_k_agreement"] == pytest.approx(1.0)
+    assert metrics.loop_avg_ms > 0.0
+    assert metrics.kernel_avg_ms > 0.0
+    assert payload["speedup"] > 0.0
+
+
 @pytest.mark.parametrize(
     ("kwargs", "message"),
     [
@@ -283,8 +353,18 @@ async def test_run_vector_retrieval_benchmark_validates_inputs(
         )
 
 
+@pytest.mark.parametrize(
+    ("options", "sections"),
+    [
+        ({}, set()),
+        ({"compare_cluster_targets": True}, {"cluster_targets"}),
+        ({"compare_similarity_kernels": True}, {"similarity_kernels"}),
+    ],
+)
 @pytest.mark.asyncio
 async def test_run_vector_retrieval_benchmark_writes_artifact_and_summary(
+    options: dict[str, bool],
+    sections: set[str],
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
@@ -305,9 +385,9 @@ async def test_run_vector_retrieval_benchmark_writes_artifact_and_summary(
 
     async def fake_run_strategy(*_args, strategy: str, **_kwargs):
         run_calls.append(strategy)
-        if strategy == "ivfflat":
-            return vector_benchmark_module.StrategyMetrics("ivfflat", 4.0, 5.0, 0.97)
-        return vector_benchmark_module.StrategyMetrics("hnsw", 3.0, 3.5, 0.99)
+        if strategy == "hnsw":
+            return vector_benchmark_module.StrategyMetrics("hnsw", 3.0, 3.5, 0.99)
+        return vector_benchmark_module.StrategyMetrics(strategy, 4.0, 5.0, 0.97)
 
     async def fake_drop_indexes(_conn: _FakeConnection) -> None:
         return None
@@ -337,6 +417,7 @@ async def test_run_vector_retrieval_benchmark_writes_artifact_and_summary(
         top_k=2,
         similarity_threshold=0.9,
         seed=7,
+        **options,
     )
 
     payload = json.loads(artifact_path.read_text(encoding="utf-8"))
@@ -345,11 +426,16 @@ async def test_run_vector_retrieval_benchmark_writes_artifact_and_summary(
     assert artifact_path.exists()
     assert payload["dataset"]["size"] == 100
     assert payload["recommendation"]["selected_default"] == "hnsw"
-    assert set(payload["strategies"]) == {"exact", "hnsw", "ivfflat"}
+    assert set(payload["strategies"]) == {"binary", "exact", "halfvec", "hnsw", "ivfflat"}
     assert summary["latest"]["artifact"] == artifact_path.name
     assert summary["latest"]["selected_default"] == "hnsw"
-    assert run_calls == ["ivfflat", "hnsw"]
+    assert run_calls == ["ivfflat", "hnsw", "halfvec", "binary"]
     assert conn.closed is True
+    assert {"cluster_targets", "similarity_kernels"} & set(payload) == sections
+    if "cluster_targets" in sections:
+        assert set(payload["cluster_targets"]) == {"seed", "centroid"}
+    if "similarity_kernels" in sections:
+        assert payload["similarity_kernels"]["candidate_count"] == 100
 
 
 def test_summary_entry_handles_non_mapping_payload_sections(tmp_path: Path) -> None:
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+import src.ingestion.article_cache as article_cache_module
+from src.ingestion.article_cache import ArticleCache, CachedArticle, get_article_cache
+from src.ingestion.feed_validators import FeedValidators
+from src.ingestion.rss_collector import RSSCollector
+
+pytestmark = pytest.mark.unit
+
+
+def _cache(clock: dict[str, float], **overrides: object) -> ArticleCache:
+    options: dict[str, object] = {
+        "enabled": True,
+        "ttl_seconds": 100,
+        "fresh_seconds": 10,
+        "max_entries": 2,
+        "redis_enabled": False,
+        "wall_time_fn": lambda: clock["now"],
+    }
+    options.update(overrides)
+    return ArticleCache(**options)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_article_cache_keys_by_normalized_url_and_evicts_lru_and_expired() -> None:
+    clock = {"now": 0.0}
+    cache = _cache(clock)
+    validators = FeedValidators(etag='"v1"', body_hash="h1")
+
+    await cache.put("https://www.example.com/a/", "text-a", validators)
+    await cache.put("https://example.com/b", "text-b", FeedValidators())
+    cached = await cache.get("https://example.com/a")
+    assert cached is not None
+    assert (cached.text, cached.validators) == ("text-a", validators)
+    assert cache.is_fresh(cached)
+
+    await cache.put("https://example.com/c", "text-c", FeedValidators())
+    assert await cache.get("https://example.com/b") is None
+    assert await cache.get("not a url") is None
+    await cache.put("not a url", "ignored", FeedValidators())
+
+    clock["now"] = 50.0
+    cached = await cache.get("https://example.com/a")
+    assert cached is not None
+    assert not cache.is_fresh(cached)
+
+    clock["now"] = 150.0
+    assert await cache.get("https://example.com/a") is None
+
+    disabled = ArticleCache(enabled=False)
+    await disabled.put("https://example.com/a", "text", FeedValidators())
+    assert await disabled.get("https://example.com/a") is None
+
+
+@pytest.mark.asyncio
+async def test_article_cache_shares_entries_through_redis() -> None:
+    clock = {"now": 0.0}
+    redis_client = MagicMock()
+    stored: dict[str, str] = {}
+    redis_client.setex = MagicMock(side_effect=lambda key, _ttl, value: stored.update({key: value}))
+    redis_client.get = MagicMock(side_effect=lambda key: stored.get(key))
+    writer = _cache(clock, redis_enabled=True, redis_client=redis_client, redis_prefix=" ")
+    reader = _cache(clock, redis_enabled=True, redis_client=redis_client)
+
+    await writer.put("https://example.com/a", "text-a", FeedValidators(last_modified="Mon"))
+    cached = await reader.get("https://example.com/a")
+
+    assert cached == CachedArticle(
+        text="text-a",
+        validators=FeedValidators(last_modified="Mon"),
+        stored_at=0.0,
+    )
+    assert redis_client.setex.call_args.args[0].startswith("horadus:article_cache:")
+    assert redis_client.setex.call_args.args[1] == 100
+
+    redis_client.get.reset_mock()
+    assert await reader.get("https://example.com/a") == cached
+    redis_client.get.assert_not_called()
+
+    assert CachedArticle.from_json("{broken") is None
+    assert CachedArticle.from_json('{"text": "x"}') is None
+
+
+@pytest.mark.asyncio
+async def test_article_cache_degrades_to_memory_when_redis_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = {"now": 0.0}
+    redis_client = MagicMock()
+    redis_client.setex = MagicMock(side_effect=ConnectionError("down"))
+    from_url = MagicMock(return_value=redis_client)
+    monkeypatch.setattr("src.ingestion.article_cache.redis.Redis.from_url", from_url)
+    cache = _cache(clock, redis_enabled=True, redis_url=" redis://cache:6379/0 ")
+
+    await cache.put("https://example.com/a", "text-a", FeedValidators())
+    assert await cache.get("https://example.com/b") is None
+
+    assert (await cache.get("https://example.com/a")) is not None
+    redis_client.get.assert_not_called()
+    from_url.assert_called_once_with("redis://cache:6379/0", decode_responses=True)
+
+
+def test_get_article_cache_builds_process_wide_instance_from_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(article_cache_module.settings, "ARTICLE_CACHE_MAX_ENTRIES", 7)
+    get_article_cache.cache_clear()
+    try:
+        cache = get_article_cache()
+        assert cache.max_entries == 7
+        assert get_article_cache() is cache
+    finally:
+        get_article_cache.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_extract_content_serves_cache_and_revalidates_stale_entries(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = {"now": 1000.0}
+    cache = ArticleCache(
+        enabled=True,
+        ttl_seconds=3600,
+        fresh_seconds=60,
+        redis_enabled=False,
+        wall_time_fn=lambda: clock["now"],
+    )
+    collector = RSSCollector(
+        session=mock_db_session,
+        http_client=mock_http_client,
+        article_cache=cache,
+    )
+    url = "https://example.com/story"
+    request = AsyncMock(
+        side_effect=[
+            httpx.Response(200, text="<html>v1</html>", headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+            httpx.Response(200, text="<html>v1</html>"),
+            httpx.ReadTimeout("timeout"),
+            httpx.Response(200, text="<html>v2</html>"),
+            httpx.Response(200, text="<html>v3</html>"),
+        ]
+    )
+    extract = AsyncMock(side_effect=lambda html: None if "v3" in html else f"text::{html}")
+    monkeypatch.setattr(collector, "_request_with_retries", request)
+    monkeypatch.setattr(collector.extraction_executor, "extract_text", extract)
+
+    assert await collector._extract_content(url) == "text::<html>v1</html>"
+    assert await collector._extract_content("https://www.example.com/story/") == (
+        "text::<html>v1</html>"
+    )
+    assert request.await_count == 1
+
+    clock["now"] += 120
+    assert await collector._extract_content(url) == "text::<html>v1</html>"
+    assert request.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    clock["now"] += 120
+    assert await collector._extract_content(url) == "text::<html>v1</html>"
+    clock["now"] += 120
+    assert await collector._extract_content(url) == "text::<html>v1</html>"
+    extract.assert_awaited_once()
+
+    clock["now"] += 120
+    assert await collector._extract_content(url) == "text::<html>v2</html>"
+    assert extract.await_count == 2
+
+    clock["now"] += 120
+    assert await collector._extract_content(url) is None
+    cached = await cache.get(url)
+    assert cached is not None
+    assert cached.text == "text::<html>v2</html>"
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.ingestion.concurrency import DomainConcurrencyLimiter, run_bounded
+from src.ingestion.rate_limiter import domain_key
+
+pytestmark = pytest.mark.unit
+
+
+def test_domain_key_normalizes_host_and_handles_missing_netloc() -> None:
+    assert domain_key("https://Example.COM/a?b=1") == "example.com"
+    assert domain_key("not-a-url") == "unknown-domain"
+
+
+def test_domain_concurrency_limiter_rejects_invalid_bounds() -> None:
+    with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+        DomainConcurrencyLimiter(max_concurrency=0, max_per_domain=1)
+    with pytest.raises(ValueError, match="max_per_domain must be >= 1"):
+        DomainConcurrencyLimiter(max_concurrency=1, max_per_domain=0)
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_caps_global_and_per_domain_concurrency() -> None:
+    limiter = DomainConcurrencyLimiter(max_concurrency=3, max_per_domain=1)
+    urls = [
+        "https://a.example/1",
+        "https://a.example/2",
+        "https://b.example/1",
+        "https://c.example/1",
+        "https://d.example/1",
+    ]
+    active_total = 0
+    active_by_domain: dict[str, int] = {}
+    peak_total = 0
+    peak_by_domain: dict[str, int] = {}
+
+    async def worker(url: str) -> str:
+        nonlocal active_total, peak_total
+        domain = domain_key(url)
+        active_total += 1
+        active_by_domain[domain] = active_by_domain.get(domain, 0) + 1
+        peak_total = max(peak_total, active_total)
+        peak_by_domain[domain] = max(peak_by_domain.get(domain, 0), active_by_domain[domain])
+        await asyncio.sleep(0.01)
+        active_total -= 1
+        active_by_domain[domain] -= 1
+        return url.upper()
+
+    results = await run_bounded(urls, url_for=lambda url: url, worker=worker, limiter=limiter)
+
+    assert results == [url.upper() for url in urls]
+    assert peak_total == 3
+    assert max(peak_by_domain.values()) == 1
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+
 import pytest
 
-from src.ingestion.content_extractor import ContentExtractor
+from src.core.config import settings
+from src.ingestion.content_extractor import (
+    ContentExtractor,
+    ExtractionExecutor,
+    get_extraction_executor,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -23,3 +33,122 @@ def test_extract_text_returns_none_when_not_extracted(monkeypatch: pytest.Monkey
     )
 
     assert ContentExtractor.extract_text("<html></html>") is None
+
+
+def _executor(**overrides: object) -> ExtractionExecutor:
+    values: dict[str, object] = {
+        "max_workers": 0,
+        "max_html_bytes": 1_000,
+        "timeout_seconds": 1.0,
+    }
+    values.update(overrides)
+    return ExtractionExecutor(**values)  # type: ignore[arg-type]
+
+
+def test_extraction_executor_rejects_invalid_bounds() -> None:
+    with pytest.raises(ValueError, match="max_workers must be >= 0"):
+        _executor(max_workers=-1)
+    with pytest.raises(ValueError, match="max_html_bytes must be >= 1"):
+        _executor(max_html_bytes=0)
+    with pytest.raises(ValueError, match="timeout_seconds must be > 0"):
+        _executor(timeout_seconds=0)
+
+
+@pytest.mark.asyncio
+async def test_extraction_executor_extracts_in_thread_and_skips_oversized_html(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def fake_extract(html: str) -> str:
+        calls.append(html)
+        return "text"
+
+    monkeypatch.setattr(ContentExtractor, "extract_text", staticmethod(fake_extract))
+    executor = _executor(max_html_bytes=10)
+
+    assert await executor.extract_text("<p>ok</p>") == "text"
+    assert await executor.extract_text("<p>" + "x" * 20 + "</p>") is None
+    assert calls == ["<p>ok</p>"]
+
+
+@pytest.mark.asyncio
+async def test_extraction_executor_falls_back_when_extraction_times_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        ContentExtractor,
+        "extract_text",
+        staticmethod(lambda _html: time.sleep(0.2) or "late"),
+    )
+
+    assert await _executor(timeout_seconds=0.01).extract_text("<p>slow</p>") is None
+
+
+@pytest.mark.asyncio
+async def test_extraction_executor_uses_pool_and_restarts_after_crash(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executor = _executor(max_workers=2)
+    pools: list[ThreadPoolExecutor] = []
+
+    def fake_pool() -> ThreadPoolExecutor:
+        pool = ThreadPoolExecutor(max_workers=1)
+        pools.append(pool)
+        executor._pool = pool  # type: ignore[assignment]
+        return pool
+
+    monkeypatch.setattr(executor, "_get_pool", fake_pool)
+    monkeypatch.setattr(ContentExtractor, "extract_text", staticmethod(lambda _html: "pooled"))
+    assert await executor.extract_text("<p>a</p>") == "pooled"
+
+    def crash(_html: str) -> str:
+        raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(ContentExtractor, "extract_text", staticmethod(crash))
+    assert await executor.extract_text("<p>b</p>") is None
+    assert executor._pool is None
+    assert len(pools) == 2
+
+
+@pytest.mark.asyncio
+async def test_extraction_executor_falls_back_to_thread_when_processes_unavailable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executor = _executor(max_workers=2)
+    get_pool = MagicMock(side_effect=AssertionError("daemonic processes are not allowed"))
+    monkeypatch.setattr(executor, "_get_pool", get_pool)
+    monkeypatch.setattr(ContentExtractor, "extract_text", staticmethod(lambda _html: "threaded"))
+
+    assert await executor.extract_text("<p>a</p>") == "threaded"
+    assert await executor.extract_text("<p>b</p>") == "threaded"
+    get_pool.assert_called_once()
+
+
+def test_extraction_executor_starts_process_pool_lazily_and_shuts_down() -> None:
+    executor = _executor(max_workers=1)
+    executor.shutdown()
+
+    pool = executor._get_pool()
+
+    assert isinstance(pool, ProcessPoolExecutor)
+    assert executor._get_pool() is pool
+    executor.shutdown()
+    assert executor._pool is None
+
+
+def test_get_extraction_executor_uses_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "CONTENT_EXTRACTION_MAX_WORKERS", 3)
+    monkeypatch.setattr(settings, "CONTENT_EXTRACTION_MAX_HTML_BYTES", 50_000)
+    monkeypatch.setattr(settings, "CONTENT_EXTRACTION_TIMEOUT_SECONDS", 4.0)
+    get_extraction_executor.cache_clear()
+    try:
+        executor = get_extraction_executor()
+        assert (executor.max_workers, executor.max_html_bytes, executor.timeout_seconds) == (
+            3,
+            50_000,
+            4.0,
+        )
+        assert get_extraction_executor() is executor
+    finally:
+        get_extraction_executor.cache_clear()
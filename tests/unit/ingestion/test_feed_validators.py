@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.ingestion.feed_validators import FeedValidators, body_hash
+from src.ingestion.rss_collector import FeedConfig, RSSCollector
+
+pytestmark = pytest.mark.unit
+
+_FEED_URL = "https://example.com/rss"
+_FEED_BODY = "<rss><channel><item><title>a</title></item></channel></rss>"
+
+
+def _source(**overrides: object) -> SimpleNamespace:
+    values: dict[str, object] = {
+        "id": uuid4(),
+        "fetch_etag": None,
+        "fetch_last_modified": None,
+        "fetch_body_hash": None,
+        "last_fetched_at": None,
+        "ingestion_window_end_at": None,
+        "error_count": 0,
+        "last_error": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _response(status_code: int, *, text: str = "", headers: dict[str, str] | None = None):
+    return httpx.Response(
+        status_code,
+        text=text,
+        headers=headers,
+        request=httpx.Request("GET", _FEED_URL),
+    )
+
+
+def test_feed_validators_build_conditional_headers_and_round_trip_source() -> None:
+    source = _source(fetch_etag='"v1"', fetch_last_modified="Wed, 01 Jan 2026 00:00:00 GMT")
+
+    validators = FeedValidators.from_source(source)
+
+    assert validators.request_headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert FeedValidators().request_headers() == {}
+    assert FeedValidators.from_source(SimpleNamespace()) == FeedValidators()
+
+    FeedValidators(etag='"v2"', last_modified=None, body_hash="abc").apply_to(source)
+
+    assert source.fetch_etag == '"v2"'
+    assert source.fetch_last_modified is None
+    assert source.fetch_body_hash == "abc"
+
+
+def test_feed_validators_from_response_drops_blank_and_oversized_headers() -> None:
+    response = _response(
+        200,
+        headers={"ETag": " " + "x" * 600, "Last-Modified": "  "},
+    )
+    assert FeedValidators.from_response(response, body_hash="h") == FeedValidators(body_hash="h")
+
+    response = _response(200, headers={"ETag": ' W/"abc" '})
+    assert FeedValidators.from_response(response, body_hash="h").etag == 'W/"abc"'
+    assert len(body_hash(b"payload")) == 64
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_sends_validators_and_short_circuits_on_not_modified(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    source = _source(fetch_etag='"v1"', fetch_body_hash="old")
+    mock_http_client.get = AsyncMock(return_value=_response(304))
+    monkeypatch.setattr(collector.rate_limiter, "wait", AsyncMock(return_value=None))
+    parse = AsyncMock()
+    monkeypatch.setattr("src.ingestion.rss_collector.feedparser.parse", parse)
+
+    parsed = await collector._fetch_feed(_FEED_URL, source=source)
+
+    assert parsed.entries == []
+    parse.assert_not_called()
+    headers = mock_http_client.get.await_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert "If-Modified-Since" not in headers
+    assert collector._pending_validators == {}
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_short_circuits_on_identical_body_hash(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    source = _source(fetch_body_hash=body_hash(_FEED_BODY.encode("utf-8")))
+    mock_http_client.get = AsyncMock(return_value=_response(200, text=_FEED_BODY))
+    monkeypatch.setattr(collector.rate_limiter, "wait", AsyncMock(return_value=None))
+    parse = AsyncMock()
+    monkeypatch.setattr("src.ingestion.rss_collector.feedparser.parse", parse)
+
+    parsed = await collector._fetch_feed(_FEED_URL, source=source)
+
+    assert parsed.entries == []
+    parse.assert_not_called()
+    assert collector._pending_validators[source.id].body_hash == source.fetch_body_hash
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_persists_new_validators_only_after_successful_collection(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    source = _source(fetch_etag='"v1"', fetch_body_hash="old")
+    mock_http_client.get = AsyncMock(
+        return_value=_response(
+            200,
+            text=_FEED_BODY,
+            headers={"ETag": '"v2"', "Last-Modified": "Thu, 02 Jan 2026 00:00:00 GMT"},
+        )
+    )
+    monkeypatch.setattr(collector.rate_limiter, "wait", AsyncMock(return_value=None))
+
+    parsed = await collector._fetch_feed(_FEED_URL, source=source)
+
+    assert len(parsed.entries) == 1
+    assert source.fetch_etag == '"v1"'
+
+    await collector._record_source_success(source, window_end=datetime.now(tz=UTC))
+
+    assert source.fetch_etag == '"v2"'
+    assert source.fetch_last_modified == "Thu, 02 Jan 2026 00:00:00 GMT"
+    assert source.fetch_body_hash == body_hash(_FEED_BODY.encode("utf-8"))
+    assert collector._pending_validators == {}
+
+
+@pytest.mark.asyncio
+async def test_record_source_failure_discards_pending_validators(
+    mock_db_session,
+    mock_http_client,
+) -> None:
+    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    source = _source(fetch_etag='"v1"')
+    collector._pending_validators[source.id] = FeedValidators(etag='"v2"', body_hash="new")
+
+    await collector._record_source_failure(source, "timeout")
+    await collector._record_source_success(source, window_end=datetime.now(tz=UTC))
+
+    assert source.fetch_etag == '"v1"'
+    assert source.fetch_body_hash is None
+
+
+@pytest.mark.asyncio
+async def test_entry_failure_keeps_previous_validators_so_the_feed_is_refetched(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    source = _source(fetch_etag='"v1"', fetch_body_hash="old")
+    mock_http_client.get = AsyncMock(
+        return_value=_response(200, text=_FEED_BODY, headers={"ETag": '"v2"'})
+    )
+    monkeypatch.setattr(collector.rate_limiter, "wait", AsyncMock(return_value=None))
+    monkeypatch.setattr(collector, "_get_or_create_source", AsyncMock(return_value=source))
+    monkeypatch.setattr(
+        collector.deduplication_service, "find_existing_identifiers", AsyncMock(return_value=set())
+    )
+    monkeypatch.setattr(collector, "_process_entry", AsyncMock(side_effect=RuntimeError("db")))
+    feed = FeedConfig(name="Example", url=_FEED_URL, credibility=0.8, max_items_per_fetch=10)
+
+    result = await collector.collect_feed(feed)
+
+    assert result.errors == ["db"]
+    assert (source.fetch_etag, source.fetch_body_hash) == ('"v1"', "old")
+    assert source.last_fetched_at is not None
+    assert collector._pending_validators == {}
@@ -11,7 +11,6 @@ import pytest
 
 from src.core.config import settings
 from src.ingestion.gdelt_client import GDELTClient, GDELTQueryConfig
-from src.storage.models import ProcessingStatus
 
 pytestmark = pytest.mark.unit
 
@@ -447,7 +446,7 @@ async def test_request_json_stops_after_retry_budget(
 
 
 @pytest.mark.asyncio
-async def test_store_article_sets_pending_status(mock_db_session, mock_http_client) -> None:
+async def test_store_article_queues_normalized_candidate(mock_db_session, mock_http_client) -> None:
     client = GDELTClient(session=mock_db_session, http_client=mock_http_client)
     source = SimpleNamespace(id=uuid4())
     article = {
@@ -460,42 +459,20 @@ async def test_store_article_sets_pending_status(mock_db_session, mock_http_clie
         "persons": "NATO",
     }
 
-    async def fake_is_duplicate(
-        _normalized_url: str | None,
-        _external_id: str,
-        _content_hash: str,
-    ) -> bool:
-        return False
-
-    client._is_duplicate = fake_is_duplicate
-
-    item = await client._store_article(
+    queued = await client._store_article(
         source=source,
         article=article,
         published_at=datetime(2026, 2, 6, 10, 30, tzinfo=UTC),
     )
 
-    assert item is not None
-    assert item.processing_status == ProcessingStatus.PENDING
+    assert queued is True
+    assert client.raw_item_writer.pending == 1
+    (item,) = client.raw_item_writer._pending
+    assert item.source_id == source.id
     assert item.external_id == "https://example.com/article/1"
     assert item.url == "https://example.com/article/1"
     assert item.language == "en"
-    assert mock_db_session.add.call_count == 1
-
-
-@pytest.mark.asyncio
-async def test_is_duplicate_checks_recent_window(mock_db_session, mock_http_client) -> None:
-    client = GDELTClient(session=mock_db_session, http_client=mock_http_client)
-    mock_db_session.scalar.return_value = uuid4()
-
-    duplicate = await client._is_duplicate(
-        normalized_url="https://example.com/article/1",
-        external_id="https://example.com/article/1",
-        content_hash="abc123",
-    )
-
-    assert duplicate is True
-    assert mock_db_session.scalar.await_count == 1
+    mock_db_session.add.assert_not_called()
 
 
 def test_determine_collection_window_first_run_uses_query_lookback(
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
@@ -10,7 +9,6 @@ from uuid import uuid4
 
 import httpx
 import pytest
-from sqlalchemy.exc import IntegrityError
 
 from src.ingestion.gdelt_client import GDELTClient, GDELTQueryConfig
 from src.ingestion.source_identity import (
@@ -124,11 +122,23 @@ async def test_fetch_articles_and_request_json_cover_error_paths(
     ok_response.json = MagicMock(return_value={"articles": []})
     mock_http_client.get = AsyncMock(side_effect=[status_exc, ok_response])
     sleep_mock = AsyncMock(return_value=None)
+    penalize_mock = AsyncMock(return_value=None)
     monkeypatch.setattr("src.ingestion.gdelt_client.asyncio.sleep", sleep_mock)
+    monkeypatch.setattr(client_request.rate_limiter, "penalize", penalize_mock)
 
     payload = await client_request._request_json({"query": "x"})
     assert payload == {"articles": []}
-    sleep_mock.assert_awaited_once_with(1.5)
+    penalize_mock.assert_awaited_once_with(client_request.api_url, 1.5)
+    sleep_mock.assert_not_awaited()
+
+    unavailable_response = MagicMock(status_code=503, headers={})
+    unavailable_exc = httpx.HTTPStatusError(
+        "unavailable", request=MagicMock(), response=unavailable_response
+    )
+    mock_http_client.get = AsyncMock(side_effect=[unavailable_exc, ok_response])
+    monkeypatch.setattr(client_request, "_backoff_seconds", lambda _attempt: 2.0)
+    assert await client_request._request_json({"query": "x"}) == {"articles": []}
+    sleep_mock.assert_awaited_once_with(2.0)
 
     monkeypatch.setattr(
         client,
@@ -208,39 +218,19 @@ async def test_get_or_create_source_and_store_article_cover_update_and_early_ret
     refresh_mock.assert_awaited_once_with(session=mock_db_session, source_id=existing.id)
 
     source = SimpleNamespace(id=uuid4())
-    monkeypatch.setattr(client, "_is_duplicate", AsyncMock(return_value=False))
-    assert await client._store_article(source=source, article={}, published_at=None) is None
+    assert await client._store_article(source=source, article={}, published_at=None) is False
     assert (
         await client._store_article(
             source=source,
             article={"id": "article-1"},
             published_at=None,
         )
-        is None
-    )
-    monkeypatch.setattr(client, "_is_duplicate", AsyncMock(return_value=True))
-    assert (
-        await client._store_article(
-            source=source,
-            article={"url": "https://example.com/2", "title": "Title"},
-            published_at=None,
-        )
-        is None
-    )
-
-    @asynccontextmanager
-    async def raising_nested():
-        yield
-        raise IntegrityError("insert", {}, Exception("duplicate"))
-
-    mock_db_session.begin_nested = raising_nested
-    monkeypatch.setattr(client, "_is_duplicate", AsyncMock(return_value=False))
-    stored = await client._store_article(
-        source=source,
-        article={"url": "https://example.com/3", "title": "Title"},
-        published_at=datetime.now(tz=UTC),
+        is False
     )
-    assert stored is None
+    article = {"url": "https://example.com/3", "title": "Title"}
+    assert await client._store_article(source=source, article=article, published_at=None) is True
+    assert await client._store_article(source=source, article=article, published_at=None) is False
+    assert client.raw_item_writer.pending == 1
 
 
 @pytest.mark.asyncio
@@ -449,6 +439,7 @@ def test_gdelt_helper_functions_cover_parsing_and_filters() -> None:
         [
             "bad",
             {"name": "", "query": "x"},
+            {"query": "unnamed"},
             {"name": "missing", "query": "", "themes": [], "actors": []},
             {"name": "ok", "query": "ukraine", "languages": "english;ukrainian", "custom": 1},
         ],
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.ingestion.gdelt_client import GDELTClient, GDELTCollectionResult
+from src.ingestion.gdelt_config import GDELTQueryConfig
+from src.ingestion.rate_limiter import TokenBucketRateLimiter
+from src.storage.models import Source
+
+pytestmark = pytest.mark.unit
+
+
+def _session_factory(sessions: list[AsyncMock]):
+    @asynccontextmanager
+    async def _factory():
+        session = AsyncMock()
+        sessions.append(session)
+        yield session
+
+    return _factory
+
+
+async def _noop_load_config(force: bool = False) -> None:
+    del force
+
+
+@pytest.mark.asyncio
+async def test_collect_all_runs_queries_concurrently_with_shared_token_bucket(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions: list[AsyncMock] = []
+    client = GDELTClient(
+        session=mock_db_session,
+        http_client=mock_http_client,
+        session_factory=_session_factory(sessions),
+    )
+    client.max_concurrent_queries = 2
+    client._queries = [
+        GDELTQueryConfig(name="Q1", query="a"),
+        GDELTQueryConfig(name="Off", query="b", enabled=False),
+        GDELTQueryConfig(name="Q2", query="c"),
+        GDELTQueryConfig(name="Q3", query="d"),
+    ]
+    active = 0
+    peak = 0
+    seen: dict[str, GDELTClient] = {}
+
+    async def fake_collect_query(
+        self: GDELTClient,
+        query: GDELTQueryConfig,
+    ) -> GDELTCollectionResult:
+        nonlocal active, peak
+        assert self.lock_source_rows is True
+        assert self.raw_item_writer.session is self.session
+        seen[query.name] = self
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return GDELTCollectionResult(query_name=query.name, items_stored=1)
+
+    monkeypatch.setattr(client, "load_config", _noop_load_config)
+    monkeypatch.setattr(GDELTClient, "collect_query", fake_collect_query)
+
+    results = await client.collect_all()
+
+    assert [result.query_name for result in results] == ["Q1", "Q2", "Q3"]
+    assert peak == 2
+    assert all(session.commit.await_count == 1 for session in sessions)
+    assert {id(bound.session) for bound in seen.values()} == {id(s) for s in sessions}
+    assert all(bound.rate_limiter is client.rate_limiter for bound in seen.values())
+    assert isinstance(client.rate_limiter, TokenBucketRateLimiter)
+    assert client.lock_source_rows is False
+
+
+@pytest.mark.asyncio
+async def test_collect_all_isolates_query_failures_with_rollback(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions: list[AsyncMock] = []
+    client = GDELTClient(
+        session=mock_db_session,
+        http_client=mock_http_client,
+        session_factory=_session_factory(sessions),
+    )
+    client.max_concurrent_queries = 2
+    client._queries = [
+        GDELTQueryConfig(name="Broken", query="a"),
+        GDELTQueryConfig(name="Healthy", query="b"),
+    ]
+
+    async def fake_collect_query(
+        _self: GDELTClient,
+        query: GDELTQueryConfig,
+    ) -> GDELTCollectionResult:
+        if query.name == "Broken":
+            raise RuntimeError("deadlock detected")
+        return GDELTCollectionResult(query_name=query.name, items_stored=3)
+
+    monkeypatch.setattr(client, "load_config", _noop_load_config)
+    monkeypatch.setattr(GDELTClient, "collect_query", fake_collect_query)
+
+    broken, healthy = await client.collect_all()
+
+    assert broken.terminal_errors == 1
+    assert broken.errors == ["[terminal] GDELT collection failed (runtimeerror): deadlock detected"]
+    assert healthy.items_stored == 3
+    broken_session, healthy_session = sessions
+    broken_session.rollback.assert_awaited_once()
+    broken_session.commit.assert_not_awaited()
+    healthy_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_collect_all_stays_serial_without_session_factory(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = GDELTClient(session=mock_db_session, http_client=mock_http_client)
+    client._queries = [GDELTQueryConfig(name="Q1", query="a")]
+
+    async def fake_collect_query(
+        self: GDELTClient,
+        query: GDELTQueryConfig,
+    ) -> GDELTCollectionResult:
+        assert self is client
+        return GDELTCollectionResult(query_name=query.name)
+
+    monkeypatch.setattr(client, "load_config", _noop_load_config)
+    monkeypatch.setattr(GDELTClient, "collect_query", fake_collect_query)
+
+    assert [result.query_name for result in await client.collect_all()] == ["Q1"]
+
+
+def test_select_source_locks_rows_only_for_bound_clients(mock_db_session, mock_http_client) -> None:
+    client = GDELTClient(session=mock_db_session, http_client=mock_http_client)
+    bound = client._bind_session(AsyncMock())
+    dialect = postgresql.dialect()
+
+    unlocked = str(client._select_source(Source.name == "q").compile(dialect=dialect))
+    locked = str(bound._select_source(Source.name == "q").compile(dialect=dialect))
+
+    assert "FOR UPDATE" not in unlocked
+    assert locked.endswith("FOR UPDATE")
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import importlib
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.ingestion.poll_scheduler import (
+    adaptive_poll_interval,
+    load_recent_publish_times,
+    select_due_feeds,
+)
+from src.ingestion.rss_collector import CollectionResult, FeedConfig, RSSCollector
+
+pytestmark = pytest.mark.unit
+
+celery_app_module = importlib.import_module("src.workers.celery_app")
+
+_NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _rows(rows: list[tuple[object, ...]]) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _minutes_ago(*minutes: int) -> list[datetime]:
+    return [_NOW - timedelta(minutes=value) for value in minutes]
+
+
+def test_adaptive_poll_interval_uses_median_gap_within_bounds() -> None:
+    bounds = {"default_minutes": 30, "min_minutes": 5, "max_minutes": 720}
+
+    assert adaptive_poll_interval([], **bounds) == timedelta(minutes=30)
+    assert adaptive_poll_interval(_minutes_ago(0), **bounds) == timedelta(minutes=30)
+    assert adaptive_poll_interval(_minutes_ago(0, 20, 30, 90), **bounds) == timedelta(minutes=20)
+    assert adaptive_poll_interval(_minutes_ago(0, 1, 2), **bounds) == timedelta(minutes=5)
+    assert adaptive_poll_interval(_minutes_ago(0, 5000), **bounds) == timedelta(minutes=720)
+
+    naive = [value.replace(tzinfo=None) for value in _minutes_ago(0, 60)]
+    assert adaptive_poll_interval(naive, **bounds) == timedelta(minutes=60)
+    assert adaptive_poll_interval(
+        [],
+        default_minutes=30,
+        min_minutes=60,
+        max_minutes=10,
+    ) == timedelta(minutes=60)
+
+
+@pytest.mark.asyncio
+async def test_load_recent_publish_times_groups_ranked_rows_by_source(mock_db_session) -> None:
+    source_id = uuid4()
+    mock_db_session.execute.return_value = _rows(
+        [(source_id, _NOW), (source_id, _NOW - timedelta(hours=1))]
+    )
+
+    history = await load_recent_publish_times(mock_db_session, [source_id], per_source=5)
+
+    assert history == {source_id: [_NOW, _NOW - timedelta(hours=1)]}
+    statement = str(mock_db_session.execute.await_args.args[0])
+    assert "row_number() OVER (PARTITION BY raw_items.source_id" in statement
+    assert await load_recent_publish_times(mock_db_session, [], per_source=5) == {}
+    assert mock_db_session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_select_due_feeds_polls_busy_feeds_sooner_than_quiet_ones(mock_db_session) -> None:
+    busy_id, quiet_id, unfetched_id = uuid4(), uuid4(), uuid4()
+    feeds = [
+        FeedConfig(name=name, url=f"https://{name}.example.com/rss", credibility=0.8)
+        for name in ("busy", "quiet", "unfetched", "new", "fallback")
+    ]
+    fallback_id = uuid4()
+    mock_db_session.execute = AsyncMock(
+        side_effect=[
+            _rows(
+                [
+                    (feeds[0].url, busy_id, _NOW - timedelta(minutes=15)),
+                    (feeds[1].url, quiet_id, (_NOW - timedelta(hours=2)).replace(tzinfo=None)),
+                    (feeds[2].url, unfetched_id, None),
+                    (feeds[4].url, fallback_id, _NOW - timedelta(minutes=31)),
+                ]
+            ),
+            _rows(
+                [(busy_id, value) for value in _minutes_ago(0, 10, 20)]
+                + [(quiet_id, value) for value in _minutes_ago(0, 600, 1200)]
+            ),
+        ]
+    )
+
+    due = await select_due_feeds(
+        mock_db_session,
+        feeds,
+        min_minutes=5,
+        max_minutes=720,
+        history_size=20,
+        now=_NOW,
+    )
+
+    assert [feed.name for feed in due] == ["busy", "unfetched", "new", "fallback"]
+    assert (
+        await select_due_feeds(
+            mock_db_session,
+            [],
+            min_minutes=5,
+            max_minutes=720,
+            history_size=20,
+        )
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_collect_all_collects_only_due_feeds_with_adaptive_polling(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    collector.adaptive_polling = True
+    due_feed = FeedConfig(name="due", url="https://due.example.com/rss", credibility=0.8)
+    idle_feed = FeedConfig(name="idle", url="https://idle.example.com/rss", credibility=0.8)
+    collector._feeds = [due_feed, idle_feed]
+    select_due = AsyncMock(return_value=[due_feed])
+
+    async def fake_load_config(force: bool = False) -> None:
+        del force
+
+    async def fake_collect_feed(feed: FeedConfig) -> CollectionResult:
+        return CollectionResult(feed_name=feed.name)
+
+    monkeypatch.setattr(collector, "load_config", fake_load_config)
+    monkeypatch.setattr(collector, "collect_feed", fake_collect_feed)
+    monkeypatch.setattr("src.ingestion.rss_collector.select_due_feeds", select_due)
+
+    results = await collector.collect_all()
+
+    assert [result.feed_name for result in results] == ["due"]
+    assert select_due.await_args.args[1] == [due_feed, idle_feed]
+
+
+def test_beat_schedule_ticks_rss_frequently_with_adaptive_polling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(celery_app_module.settings, "ENABLE_RSS_INGESTION", True)
+    monkeypatch.setattr(celery_app_module.settings, "RSS_COLLECTION_INTERVAL", 360)
+    monkeypatch.setattr(celery_app_module.settings, "RSS_ADAPTIVE_POLLING_ENABLED", True)
+    monkeypatch.setattr(celery_app_module.settings, "RSS_ADAPTIVE_POLL_TICK_MINUTES", 5)
+
+    schedule = celery_app_module._build_beat_schedule()
+
+    assert schedule["collect-rss"]["schedule"] == timedelta(minutes=5)
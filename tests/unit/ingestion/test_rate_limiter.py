@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from contextlib import suppress
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.ingestion.rate_limiter import DomainRateLimiter
+from src.ingestion.rate_limiter import (
+    DomainRateLimit,
+    SharedTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+)
+from src.ingestion.rss_config import parse_collector_settings
 
 pytestmark = pytest.mark.unit
 
@@ -23,42 +28,161 @@ def _monotonic_from(values: list[float]):
     return _fake
 
 
+def test_token_bucket_rate_limiter_rejects_invalid_bounds() -> None:
+    with pytest.raises(ValueError, match="requests_per_second must be > 0"):
+        TokenBucketRateLimiter(requests_per_second=0)
+    with pytest.raises(ValueError, match="burst must be >= 1"):
+        TokenBucketRateLimiter(burst=0)
+
+
 @pytest.mark.asyncio
-async def test_domain_rate_limiter_waits_between_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_token_bucket_rate_limiter_allows_burst_then_paces_refills(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     sleep_mock = AsyncMock()
     monkeypatch.setattr("src.ingestion.rate_limiter.asyncio.sleep", sleep_mock)
     monkeypatch.setattr(
         "src.ingestion.rate_limiter.time.monotonic",
-        _monotonic_from([0.0, 0.0, 0.5, 1.0]),
+        _monotonic_from([0.0, 0.0, 0.0, 0.5, 3.0]),
     )
 
-    limiter = DomainRateLimiter(requests_per_second=1.0)
+    limiter = TokenBucketRateLimiter(requests_per_second=2.0, burst=2)
 
-    await limiter.wait("https://example.com/a")
-    await limiter.wait("https://example.com/b")
+    await limiter.wait("https://api.example.com/a")
+    await limiter.wait("https://api.example.com/b")
+    sleep_mock.assert_not_awaited()
+
+    await limiter.wait("https://api.example.com/c")
+    sleep_mock.assert_awaited_once_with(0.5)
 
+    await limiter.wait("https://other.example.com/a")
+    await limiter.wait("https://api.example.com/d")
     assert sleep_mock.await_count == 1
 
 
-def test_domain_rate_limiter_rejects_invalid_rate() -> None:
+@pytest.mark.asyncio
+async def test_token_bucket_rate_limiter_applies_domain_overrides_and_retry_after(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr("src.ingestion.rate_limiter.asyncio.sleep", sleep_mock)
+    monkeypatch.setattr("src.ingestion.rate_limiter.time.monotonic", lambda: 0.0)
+
+    limiter = TokenBucketRateLimiter(
+        requests_per_second=1.0,
+        domain_overrides={"Slow.example.com": DomainRateLimit(requests_per_second=0.5)},
+    )
+
+    await limiter.wait("https://slow.example.com/a")
+    await limiter.wait("https://slow.example.com/b")
+    sleep_mock.assert_awaited_once_with(2.0)
+
+    await limiter.penalize("https://fast.example.com/a", 10.0)
+    await limiter.wait("https://fast.example.com/b")
+    sleep_mock.assert_awaited_with(11.0)
+
+
+def test_domain_rate_limit_rejects_invalid_bounds_and_parses_from_rss_settings() -> None:
     with pytest.raises(ValueError, match="requests_per_second must be > 0"):
-        DomainRateLimiter(requests_per_second=0)
+        DomainRateLimit(requests_per_second=0)
+    with pytest.raises(ValueError, match="burst must be >= 1"):
+        DomainRateLimit(requests_per_second=1.0, burst=0)
+
+    parsed = parse_collector_settings(
+        {
+            "domain_rate_limits": {
+                " Feeds.Example.com ": {"requests_per_second": 0.25, "burst": 3},
+                "defaults.example.com": {},
+                "broken.example.com": "fast",
+                "": {"requests_per_second": 2},
+            }
+        }
+    )
+
+    assert parsed.domain_rate_limits == {
+        "feeds.example.com": DomainRateLimit(requests_per_second=0.25, burst=3),
+        "defaults.example.com": DomainRateLimit(requests_per_second=1.0, burst=1),
+    }
+    assert parse_collector_settings({"domain_rate_limits": ["bad"]}).domain_rate_limits == {}
 
 
 @pytest.mark.asyncio
-async def test_domain_rate_limiter_skips_sleep_when_interval_elapsed(
+async def test_shared_rate_limiter_reserves_tokens_through_redis(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     sleep_mock = AsyncMock()
     monkeypatch.setattr("src.ingestion.rate_limiter.asyncio.sleep", sleep_mock)
-    monkeypatch.setattr(
-        "src.ingestion.rate_limiter.time.monotonic",
-        _monotonic_from([0.0, 0.0, 1.5, 1.5]),
+    script = MagicMock(side_effect=[0, 1500, 0])
+    redis_client = MagicMock()
+    redis_client.register_script = MagicMock(return_value=script)
+    limiter = SharedTokenBucketRateLimiter(
+        requests_per_second=2.0,
+        burst=3,
+        domain_overrides={"slow.example.com": DomainRateLimit(requests_per_second=0.5)},
+        enabled=True,
+        redis_prefix="  ",
+        redis_client=redis_client,
     )
 
-    limiter = DomainRateLimiter(requests_per_second=1.0)
+    await limiter.wait("https://api.example.com/a")
+    await limiter.wait("https://slow.example.com/a")
+    await limiter.penalize("https://api.example.com/b", 4.0)
+
+    sleep_mock.assert_awaited_once_with(1.5)
+    redis_client.register_script.assert_called_once_with(limiter._TOKEN_BUCKET_LUA)
+    calls = [call.kwargs for call in script.call_args_list]
+    assert calls == [
+        {"keys": ["horadus:ingestion_rate_limit:api.example.com"], "args": [2.0, 3, 0]},
+        {"keys": ["horadus:ingestion_rate_limit:slow.example.com"], "args": [0.5, 1, 0]},
+        {"keys": ["horadus:ingestion_rate_limit:api.example.com"], "args": [2.0, 3, 4000]},
+    ]
+    redis_client.eval.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_shared_rate_limiter_falls_back_to_memory_when_redis_is_unavailable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleep_mock = AsyncMock()
+    clock = {"now": 0.0}
+    monkeypatch.setattr("src.ingestion.rate_limiter.asyncio.sleep", sleep_mock)
+    monkeypatch.setattr("src.ingestion.rate_limiter.time.monotonic", lambda: clock["now"])
+    script = MagicMock(side_effect=[ConnectionError("down"), 0])
+    redis_client = MagicMock()
+    redis_client.register_script = MagicMock(return_value=script)
+    from_url = MagicMock(return_value=redis_client)
+    monkeypatch.setattr("src.ingestion.rate_limiter.redis.Redis.from_url", from_url)
+    limiter = SharedTokenBucketRateLimiter(
+        requests_per_second=1.0,
+        enabled=True,
+        redis_url=" redis://cache:6379/0 ",
+    )
 
     await limiter.wait("https://example.com/a")
     await limiter.wait("https://example.com/b")
+    sleep_mock.assert_awaited_once_with(1.0)
+    assert script.call_count == 1
 
-    sleep_mock.assert_not_awaited()
+    clock["now"] = 31.0
+    await limiter.wait("https://example.com/c")
+    assert script.call_count == 2
+    redis_client.register_script.assert_called_once()
+    from_url.assert_called_once_with("redis://cache:6379/0", decode_responses=True)
+
+
+@pytest.mark.asyncio
+async def test_shared_rate_limiter_disabled_uses_memory_buckets(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr("src.ingestion.rate_limiter.asyncio.sleep", sleep_mock)
+    monkeypatch.setattr("src.ingestion.rate_limiter.time.monotonic", lambda: 0.0)
+    redis_client = MagicMock()
+    limiter = SharedTokenBucketRateLimiter(enabled=False, redis_client=redis_client)
+
+    await limiter.wait("https://example.com/a")
+    await limiter.penalize("https://example.com/b", 2.0)
+    await limiter.wait("https://example.com/c")
+
+    sleep_mock.assert_awaited_once_with(3.0)
+    redis_client.register_script.assert_not_called()
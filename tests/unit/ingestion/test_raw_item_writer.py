@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.ingestion import raw_item_writer as writer_module
+from src.ingestion.raw_item_writer import RawItemCandidate, RawItemWriter
+from src.processing.deduplication_service import DeduplicationResult, DuplicateCandidate
+from src.processing.text_fingerprint import minhash_bands, minhash_signature
+
+pytestmark = pytest.mark.unit
+
+
+def _candidate(index: int, **overrides: object) -> RawItemCandidate:
+    values: dict[str, object] = {
+        "source_id": uuid4(),
+        "external_id": f"item-{index}",
+        "url": f"https://example.com/{index}",
+        "title": f"Title {index}",
+        "author": None,
+        "published_at": None,
+        "raw_content": f"body {index}",
+        "content_hash": f"hash-{index}",
+        "language": "en",
+    }
+    values.update(overrides)
+    return RawItemCandidate(**values)  # type: ignore[arg-type]
+
+
+def test_add_rejects_candidates_matching_a_buffered_key() -> None:
+    writer = RawItemWriter(session=SimpleNamespace())
+
+    assert writer.add(_candidate(1)) is True
+    assert writer.add(_candidate(2, external_id="item-1")) is False
+    assert writer.add(_candidate(3, url="https://example.com/1")) is False
+    assert writer.add(_candidate(4, content_hash="hash-1")) is False
+    assert writer.add(_candidate(5, url=None)) is True
+    assert writer.add(_candidate(6, url=None)) is True
+
+    assert writer.pending == 3
+
+
+@pytest.mark.asyncio
+async def test_flush_issues_one_conflict_skipping_insert_and_reports_skips(
+    mock_db_session,
+) -> None:
+    writer = RawItemWriter(session=mock_db_session)
+    inserted_id = uuid4()
+    mock_db_session.scalars.return_value = SimpleNamespace(all=lambda: [inserted_id])
+    writer.add(_candidate(1))
+    writer.add(_candidate(2))
+
+    flushed = await writer.flush()
+
+    assert flushed.inserted_ids == [inserted_id]
+    assert flushed.skipped == 1
+    assert writer.pending == 0
+    assert writer.add(_candidate(1)) is True
+    statement = mock_db_session.scalars.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.count("INSERT INTO raw_items") == 1
+    assert "ON CONFLICT ON CONSTRAINT uq_source_external DO NOTHING" in sql
+    assert "RETURNING raw_items.id" in sql
+    assert "processing_status" in sql
+
+
+@pytest.mark.asyncio
+async def test_flush_is_noop_when_empty_and_chunks_large_batches(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    writer = RawItemWriter(session=mock_db_session)
+    assert (await writer.flush()).inserted_ids == []
+    mock_db_session.scalars.assert_not_awaited()
+
+    monkeypatch.setattr(writer_module, "_MAX_ROWS_PER_STATEMENT", 2)
+    mock_db_session.scalars.side_effect = [
+        SimpleNamespace(all=lambda: [uuid4(), uuid4()]),
+        SimpleNamespace(all=lambda: [uuid4()]),
+    ]
+    for index in range(3):
+        writer.add(_candidate(index))
+
+    flushed = await writer.flush()
+
+    assert len(flushed.inserted_ids) == 3
+    assert flushed.skipped == 0
+    assert mock_db_session.scalars.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_drops_stored_duplicates_and_records_written_keys(mock_db_session) -> None:
+    dedup = SimpleNamespace(
+        find_duplicates_bulk=AsyncMock(
+            return_value=[DeduplicationResult(True, match_reason="url"), DeduplicationResult(False)]
+        ),
+        record_stored=AsyncMock(),
+    )
+    writer = RawItemWriter(mock_db_session, deduplication_service=dedup, dedup_window_days=3)
+    mock_db_session.scalars.return_value = SimpleNamespace(all=lambda: [uuid4()])
+    long_text = " ".join(f"word{index}" for index in range(20))
+    writer.add(_candidate(1))
+    writer.add(_candidate(2, raw_content=long_text))
+
+    flushed = await writer.flush()
+
+    assert flushed.skipped == 1
+    candidates = dedup.find_duplicates_bulk.await_args.args[0]
+    assert candidates[0] == DuplicateCandidate(
+        external_id="item-1", url="https://example.com/1", content_hash="hash-1"
+    )
+    signature = minhash_signature(long_text)
+    assert signature is not None
+    assert candidates[1].minhash == signature
+    assert dedup.find_duplicates_bulk.await_args.kwargs == {"dedup_window_days": 3}
+    dedup.record_stored.assert_awaited_once_with([candidates[1]])
+    params = mock_db_session.scalars.await_args.args[0].compile(dialect=postgresql.dialect()).params
+    assert params["minhash_signature_m0"] == signature
+    assert params["minhash_bands_m0"] == minhash_bands(signature)
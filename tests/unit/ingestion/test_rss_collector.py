@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
@@ -10,11 +9,11 @@ from uuid import uuid4
 
 import httpx
 import pytest
-from sqlalchemy.exc import IntegrityError
 
 from src.core.config import settings
-from src.ingestion.rss_collector import FeedConfig, RSSCollector
-from src.storage.models import ProcessingStatus
+from src.ingestion.article_cache import ArticleCache
+from src.ingestion.rss_collector import CollectionResult, FeedConfig, RSSCollector
+from src.processing.deduplication_service import DeduplicationResult
 
 pytestmark = pytest.mark.unit
 
@@ -107,7 +106,7 @@ async def test_collect_feed_counts_stored_and_skipped(
     async def fake_get_or_create_source(_feed: FeedConfig) -> SimpleNamespace:
         return source
 
-    async def fake_fetch_feed(_url: str) -> SimpleNamespace:
+    async def fake_fetch_feed(_url: str, source=None) -> SimpleNamespace:
         return SimpleNamespace(entries=[{"title": "a"}, {"title": "b"}])
 
     async def fake_process_entry(_source, _feed: FeedConfig, _entry) -> bool:
@@ -152,7 +151,7 @@ async def test_collect_feed_records_source_failure(
     async def fake_get_or_create_source(_feed: FeedConfig) -> SimpleNamespace:
         return source
 
-    async def fake_fetch_feed(_url: str) -> None:
+    async def fake_fetch_feed(_url: str, source=None) -> None:
         msg = "timeout"
         raise httpx.ReadTimeout(msg)
 
@@ -195,7 +194,7 @@ async def test_collect_feed_classifies_terminal_failure(
     async def fake_get_or_create_source(_feed: FeedConfig) -> SimpleNamespace:
         return source
 
-    async def fake_fetch_feed(_url: str) -> None:
+    async def fake_fetch_feed(_url: str, source=None) -> None:
         msg = "malformed payload"
         raise ValueError(msg)
 
@@ -221,7 +220,7 @@ async def test_collect_feed_classifies_terminal_failure(
 
 
 @pytest.mark.asyncio
-async def test_fetch_with_retries_recovers_after_timeout(
+async def test_request_with_retries_recovers_after_timeout(
     mock_db_session,
     mock_http_client,
     monkeypatch: pytest.MonkeyPatch,
@@ -235,14 +234,14 @@ async def test_fetch_with_retries_recovers_after_timeout(
     monkeypatch.setattr(collector.rate_limiter, "wait", AsyncMock(return_value=None))
     monkeypatch.setattr("src.ingestion.rss_collector.asyncio.sleep", AsyncMock(return_value=None))
 
-    result = await collector._fetch_with_retries("https://example.com/rss", timeout_seconds=5)
+    result = await collector._request_with_retries("https://example.com/rss", timeout_seconds=5)
 
-    assert result == "<rss></rss>"
+    assert result.text == "<rss></rss>"
     assert mock_http_client.get.await_count == 2
 
 
 @pytest.mark.asyncio
-async def test_fetch_with_retries_stops_after_retry_budget(
+async def test_request_with_retries_stops_after_retry_budget(
     mock_db_session,
     mock_http_client,
     monkeypatch: pytest.MonkeyPatch,
@@ -256,7 +255,7 @@ async def test_fetch_with_retries_stops_after_retry_budget(
     monkeypatch.setattr("src.ingestion.rss_collector.asyncio.sleep", AsyncMock(return_value=None))
 
     with pytest.raises(httpx.ReadTimeout):
-        await collector._fetch_with_retries("https://example.com/rss", timeout_seconds=5)
+        await collector._request_with_retries("https://example.com/rss", timeout_seconds=5)
 
     assert mock_http_client.get.await_count == 2
 
@@ -289,21 +288,9 @@ def test_extract_summary_uses_description_then_content() -> None:
 
 
 @pytest.mark.asyncio
-async def test_is_duplicate_checks_recent_window(mock_db_session, mock_http_client) -> None:
-    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
-    mock_db_session.scalar.return_value = uuid4()
-
-    is_duplicate = await collector._is_duplicate(
-        normalized_url="https://example.com/article",
-        content_hash="abc123",
-    )
-
-    assert is_duplicate is True
-    assert mock_db_session.scalar.await_count == 1
-
-
-@pytest.mark.asyncio
-async def test_store_item_sets_pending_status(mock_db_session, mock_http_client) -> None:
+async def test_store_item_queues_candidate_for_bulk_insert(
+    mock_db_session, mock_http_client
+) -> None:
     collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
     source = SimpleNamespace(id=uuid4())
     feed = FeedConfig(
@@ -323,10 +310,12 @@ async def test_store_item_sets_pending_status(mock_db_session, mock_http_client)
         content_hash="deadbeef",
     )
 
-    assert item is not None
-    assert item.processing_status == ProcessingStatus.PENDING
-    assert item.external_id == "https://example.com/article"
-    assert mock_db_session.add.call_count == 1
+    assert item is True
+    (candidate,) = collector.raw_item_writer._pending
+    assert candidate.external_id == "https://example.com/article"
+    assert candidate.author == "A"
+    assert candidate.language == "en"
+    mock_db_session.add.assert_not_called()
 
 
 def test_determine_collection_window_first_run_uses_default_lookback(
@@ -483,7 +472,7 @@ async def test_collect_feed_handles_per_entry_errors_and_empty_timestamps(
     async def fake_get_or_create_source(_feed: FeedConfig) -> SimpleNamespace:
         return source
 
-    async def fake_fetch_feed(_url: str) -> SimpleNamespace:
+    async def fake_fetch_feed(_url: str, source=None) -> SimpleNamespace:
         return SimpleNamespace(entries=[{"title": "a"}, {"title": "b"}])
 
     async def fake_process_entry(_source, _feed: FeedConfig, entry) -> bool:
@@ -512,7 +501,7 @@ async def test_collect_feed_handles_per_entry_errors_and_empty_timestamps(
 
 
 @pytest.mark.asyncio
-async def test_process_entry_covers_rejected_duplicate_and_summary_fallback_paths(
+async def test_process_entry_covers_rejected_and_summary_fallback_paths(
     mock_db_session,
     mock_http_client,
     monkeypatch: pytest.MonkeyPatch,
@@ -534,26 +523,13 @@ async def test_process_entry_covers_rejected_duplicate_and_summary_fallback_path
     monkeypatch.setattr(collector, "_extract_content", no_content)
     assert await collector._process_entry(source, feed, {"link": "https://example.com"}) is False
 
-    async def content_fallback(_url: str) -> None:
-        return None
-
-    async def duplicate(*_args) -> bool:
-        return True
-
-    monkeypatch.setattr(collector, "_extract_content", content_fallback)
-    monkeypatch.setattr(collector, "_is_duplicate", duplicate)
     entry = {"link": "https://example.com", "summary": "summary text", "title": "Headline"}
-    assert await collector._process_entry(source, feed, entry) is False
-
     stored_payload: dict[str, object] = {}
 
-    async def not_duplicate(*_args) -> bool:
-        return False
-
-    async def fake_store_item(**kwargs):
+    async def fake_store_item(**kwargs) -> bool:
         stored_payload.update(kwargs)
+        return False
 
-    monkeypatch.setattr(collector, "_is_duplicate", not_duplicate)
     monkeypatch.setattr(collector, "_store_item", fake_store_item)
     assert await collector._process_entry(source, feed, entry) is False
     assert stored_payload["content"] == "summary text"
@@ -573,15 +549,11 @@ async def test_process_entry_stores_extracted_article_content(
     async def fake_extract_content(_url: str) -> str:
         return "full article"
 
-    async def fake_is_duplicate(*_args) -> bool:
-        return False
-
-    async def fake_store_item(**kwargs):
+    async def fake_store_item(**kwargs) -> bool:
         stored_payload.update(kwargs)
-        return SimpleNamespace(id=uuid4())
+        return True
 
     monkeypatch.setattr(collector, "_extract_content", fake_extract_content)
-    monkeypatch.setattr(collector, "_is_duplicate", fake_is_duplicate)
     monkeypatch.setattr(collector, "_store_item", fake_store_item)
 
     stored = await collector._process_entry(
@@ -603,7 +575,11 @@ async def test_fetch_feed_preserves_bozo_parses(
     collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
     parsed = SimpleNamespace(bozo=True, bozo_exception=ValueError("bad"), entries=[])
 
-    monkeypatch.setattr(collector, "_fetch_with_retries", AsyncMock(return_value="<rss></rss>"))
+    monkeypatch.setattr(
+        collector,
+        "_request_with_retries",
+        AsyncMock(return_value=httpx.Response(200, text="<rss></rss>")),
+    )
     monkeypatch.setattr("src.ingestion.rss_collector.feedparser.parse", lambda _raw: parsed)
 
     result = await collector._fetch_feed("https://example.com/rss")
@@ -620,7 +596,11 @@ async def test_fetch_feed_returns_clean_parse_without_bozo_warning(
     collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
     parsed = SimpleNamespace(bozo=False, entries=[{"title": "ok"}])
 
-    monkeypatch.setattr(collector, "_fetch_with_retries", AsyncMock(return_value="<rss></rss>"))
+    monkeypatch.setattr(
+        collector,
+        "_request_with_retries",
+        AsyncMock(return_value=httpx.Response(200, text="<rss></rss>")),
+    )
     monkeypatch.setattr("src.ingestion.rss_collector.feedparser.parse", lambda _raw: parsed)
 
     result = await collector._fetch_feed("https://example.com/rss")
@@ -634,13 +614,20 @@ async def test_extract_content_uses_extractor_and_falls_back_on_fetch_error(
     mock_http_client,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    collector = RSSCollector(
+        session=mock_db_session,
+        http_client=mock_http_client,
+        article_cache=ArticleCache(enabled=False),
+    )
     monkeypatch.setattr(
-        collector, "_fetch_with_retries", AsyncMock(return_value="<html>body</html>")
+        collector,
+        "_request_with_retries",
+        AsyncMock(return_value=httpx.Response(200, text="<html>body</html>")),
     )
     monkeypatch.setattr(
-        "src.ingestion.rss_collector.ContentExtractor.extract_text",
-        lambda html: f"text::{html}",
+        collector.extraction_executor,
+        "extract_text",
+        AsyncMock(side_effect=lambda html: f"text::{html}"),
     )
 
     assert (
@@ -649,14 +636,14 @@ async def test_extract_content_uses_extractor_and_falls_back_on_fetch_error(
 
     monkeypatch.setattr(
         collector,
-        "_fetch_with_retries",
+        "_request_with_retries",
         AsyncMock(side_effect=httpx.ReadTimeout("timeout")),
     )
     assert await collector._extract_content("https://example.com/story") is None
 
 
 @pytest.mark.asyncio
-async def test_fetch_with_retries_retries_http_status_with_retry_after(
+async def test_request_with_retries_retries_http_status_with_retry_after(
     mock_db_session,
     mock_http_client,
     monkeypatch: pytest.MonkeyPatch,
@@ -676,17 +663,51 @@ async def test_fetch_with_retries_retries_http_status_with_retry_after(
             response_ok,
         ]
     )
+    penalize = AsyncMock(return_value=None)
     monkeypatch.setattr(collector.rate_limiter, "wait", rate_wait)
+    monkeypatch.setattr(collector.rate_limiter, "penalize", penalize)
+    monkeypatch.setattr("src.ingestion.rss_collector.asyncio.sleep", sleep)
+
+    result = await collector._request_with_retries("https://example.com/rss", timeout_seconds=5)
+
+    assert result.text == "<rss>ok</rss>"
+    penalize.assert_awaited_once_with("https://example.com/rss", 1.5)
+    sleep.assert_not_awaited()
+    assert rate_wait.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_with_retries_backs_off_when_retry_after_is_missing(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    collector.max_retries = 1
+    sleep = AsyncMock(return_value=None)
+    response_ok = MagicMock()
+    response_ok.raise_for_status = MagicMock()
+    response_ok.text = "<rss>ok</rss>"
+    retry_response = MagicMock(status_code=503, headers={})
+    request = httpx.Request("GET", "https://example.com/rss")
+    mock_http_client.get = AsyncMock(
+        side_effect=[
+            httpx.HTTPStatusError("unavailable", request=request, response=retry_response),
+            response_ok,
+        ]
+    )
+    monkeypatch.setattr(collector.rate_limiter, "wait", AsyncMock(return_value=None))
+    monkeypatch.setattr(collector, "_backoff_seconds", lambda _attempt: 2.0)
     monkeypatch.setattr("src.ingestion.rss_collector.asyncio.sleep", sleep)
 
-    result = await collector._fetch_with_retries("https://example.com/rss", timeout_seconds=5)
+    result = await collector._request_with_retries("https://example.com/rss", timeout_seconds=5)
 
-    assert result == "<rss>ok</rss>"
-    sleep.assert_awaited_once_with(1.5)
+    assert result.text == "<rss>ok</rss>"
+    sleep.assert_awaited_once_with(2.0)
 
 
 @pytest.mark.asyncio
-async def test_fetch_with_retries_raises_for_non_retryable_http_status(
+async def test_request_with_retries_raises_for_non_retryable_http_status(
     mock_db_session,
     mock_http_client,
     monkeypatch: pytest.MonkeyPatch,
@@ -700,11 +721,11 @@ async def test_fetch_with_retries_raises_for_non_retryable_http_status(
     monkeypatch.setattr(collector.rate_limiter, "wait", AsyncMock(return_value=None))
 
     with pytest.raises(httpx.HTTPStatusError):
-        await collector._fetch_with_retries("https://example.com/rss", timeout_seconds=5)
+        await collector._request_with_retries("https://example.com/rss", timeout_seconds=5)
 
 
 @pytest.mark.asyncio
-async def test_fetch_with_retries_recovers_after_network_error(
+async def test_request_with_retries_recovers_after_network_error(
     mock_db_session,
     mock_http_client,
     monkeypatch: pytest.MonkeyPatch,
@@ -721,13 +742,13 @@ async def test_fetch_with_retries_recovers_after_network_error(
     monkeypatch.setattr(collector.rate_limiter, "wait", AsyncMock(return_value=None))
     monkeypatch.setattr("src.ingestion.rss_collector.asyncio.sleep", AsyncMock(return_value=None))
 
-    result = await collector._fetch_with_retries("https://example.com/rss", timeout_seconds=5)
+    result = await collector._request_with_retries("https://example.com/rss", timeout_seconds=5)
 
-    assert result == "<rss>ok</rss>"
+    assert result.text == "<rss>ok</rss>"
 
 
 @pytest.mark.asyncio
-async def test_fetch_with_retries_raises_runtimeerror_when_retry_budget_is_negative(
+async def test_request_with_retries_raises_runtimeerror_when_retry_budget_is_negative(
     mock_db_session,
     mock_http_client,
 ) -> None:
@@ -735,7 +756,7 @@ async def test_fetch_with_retries_raises_runtimeerror_when_retry_budget_is_negat
     collector.max_retries = -1
 
     with pytest.raises(RuntimeError, match="unreachable retry loop state"):
-        await collector._fetch_with_retries("https://example.com/rss", timeout_seconds=5)
+        await collector._request_with_retries("https://example.com/rss", timeout_seconds=5)
 
 
 @pytest.mark.asyncio
@@ -866,29 +887,42 @@ async def test_get_or_create_source_refreshes_provenance_when_credibility_change
 
 
 @pytest.mark.asyncio
-async def test_store_item_returns_none_on_insert_race(mock_db_session, mock_http_client) -> None:
+async def test_process_entries_moves_stored_duplicates_and_insert_race_losers_to_skipped(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    collector.store_batch_size = 2
     source = SimpleNamespace(id=uuid4())
     feed = FeedConfig(name="Feed", url="https://example.com/rss", credibility=0.8)
-
-    @asynccontextmanager
-    async def fake_begin_nested():
-        yield
-
-    mock_db_session.begin_nested = fake_begin_nested
-    mock_db_session.flush.side_effect = IntegrityError("insert", {}, Exception("boom"))
-
-    item = await collector._store_item(
-        source=source,
-        feed=feed,
-        entry={},
-        normalized_url="https://example.com/article",
-        title=None,
-        content="Body",
-        content_hash="deadbeef",
+    result = CollectionResult(feed_name=feed.name)
+    entries = [{"link": f"https://example.com/{index}"} for index in range(3)]
+    monkeypatch.setattr(
+        collector.deduplication_service,
+        "find_existing_identifiers",
+        AsyncMock(return_value=set()),
+    )
+    find_duplicates_bulk = AsyncMock(
+        side_effect=[
+            [DeduplicationResult(False), DeduplicationResult(False)],
+            [DeduplicationResult(True, matched_item_id=uuid4(), match_reason="url")],
+        ]
     )
+    monkeypatch.setattr(
+        collector.deduplication_service, "find_duplicates_bulk", find_duplicates_bulk
+    )
+    monkeypatch.setattr(collector, "_extract_content", AsyncMock(side_effect=lambda url: url))
+    mock_db_session.scalars.side_effect = [SimpleNamespace(all=lambda: [uuid4()])]
+
+    await collector._process_entries(source, feed, entries, result)
 
-    assert item is None
+    assert find_duplicates_bulk.await_count == 2
+    assert find_duplicates_bulk.await_args.kwargs == {"dedup_window_days": 7}
+    assert mock_db_session.scalars.await_count == 1
+    assert result.items_stored == 1
+    assert result.items_skipped == 2
+    assert collector.raw_item_writer.pending == 0
 
 
 def test_determine_collection_window_and_as_utc_normalize_naive_values(
@@ -917,6 +951,7 @@ async def test_record_source_success_and_failure_update_state(
 ) -> None:
     collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
     source = SimpleNamespace(
+        id=uuid4(),
         last_fetched_at=None,
         ingestion_window_end_at=None,
         error_count=2,
@@ -956,7 +991,7 @@ async def test_collect_feed_uses_published_timestamps_for_window_coverage(
         source.ingestion_window_end_at = watermark
         return source
 
-    async def fake_fetch_feed(_url: str) -> SimpleNamespace:
+    async def fake_fetch_feed(_url: str, source=None) -> SimpleNamespace:
         return SimpleNamespace(
             entries=[
                 {"published_parsed": published_one.utctimetuple()},
@@ -1070,3 +1105,44 @@ def test_misc_helper_functions_cover_url_hash_retry_and_failure_taxonomy(
     assert RSSCollector._safe_str(None) is None
     assert RSSCollector._safe_str("  ") is None
     assert RSSCollector._safe_str(" value ") == "value"
+
+
+@pytest.mark.asyncio
+async def test_process_entries_skips_known_links_before_fetching_articles(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    collector = RSSCollector(session=mock_db_session, http_client=mock_http_client)
+    source = SimpleNamespace(id=uuid4())
+    feed = FeedConfig(name="Feed", url="https://example.com/rss", credibility=0.8)
+    result = CollectionResult(feed_name=feed.name)
+    entries = [
+        {
+            "link": "https://example.com/known?utm_source=x",
+            "published_parsed": datetime(2026, 1, 1, tzinfo=UTC).timetuple(),
+        },
+        {"link": "https://example.com/new"},
+        {"title": "no link"},
+    ]
+    lookup = AsyncMock(return_value={"https://example.com/known"})
+    monkeypatch.setattr(collector.deduplication_service, "find_existing_identifiers", lookup)
+    processed: list[dict[str, str]] = []
+
+    async def fake_process_entry(_source, _feed: FeedConfig, entry) -> bool:
+        processed.append(entry)
+        return "link" in entry
+
+    monkeypatch.setattr(collector, "_process_entry", fake_process_entry)
+
+    timestamps = await collector._process_entries(source, feed, entries, result)
+
+    assert len(timestamps) == 1
+    assert processed == entries[1:]
+    assert result.items_stored == 1
+    assert result.items_skipped == 2
+    lookup.assert_awaited_once_with(
+        ["https://example.com/known", "https://example.com/new"],
+        dedup_window_days=collector.dedup_window_days,
+        source_id=source.id,
+    )
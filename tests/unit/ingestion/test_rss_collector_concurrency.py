@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.ingestion.rss_collector import CollectionResult, FeedConfig, RSSCollector
+
+pytestmark = pytest.mark.unit
+
+
+def _session_factory(sessions: list[AsyncMock]):
+    @asynccontextmanager
+    async def _factory():
+        session = AsyncMock()
+        sessions.append(session)
+        yield session
+
+    return _factory
+
+
+async def _noop_load_config(force: bool = False) -> None:
+    del force
+
+
+@pytest.mark.asyncio
+async def test_collect_all_runs_feeds_concurrently_in_isolated_sessions(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions: list[AsyncMock] = []
+    collector = RSSCollector(
+        session=mock_db_session,
+        http_client=mock_http_client,
+        session_factory=_session_factory(sessions),
+    )
+    collector.max_concurrent_feeds = 4
+    collector.max_concurrent_per_domain = 1
+    collector._feeds = [
+        FeedConfig(name="A1", url="https://a.example/rss", credibility=0.8),
+        FeedConfig(name="B1", url="https://b.example/rss", credibility=0.8),
+        FeedConfig(name="Off", url="https://c.example/rss", credibility=0.8, enabled=False),
+        FeedConfig(name="A2", url="https://a.example/other", credibility=0.8),
+    ]
+    active = 0
+    peak = 0
+    seen_sessions: dict[str, object] = {}
+
+    async def fake_collect_feed(self: RSSCollector, feed: FeedConfig) -> CollectionResult:
+        nonlocal active, peak
+        assert self.deduplication_service.session is self.session
+        seen_sessions[feed.name] = self.session
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return CollectionResult(feed_name=feed.name, items_stored=1)
+
+    monkeypatch.setattr(collector, "load_config", _noop_load_config)
+    monkeypatch.setattr(RSSCollector, "collect_feed", fake_collect_feed)
+
+    results = await collector.collect_all()
+
+    assert [result.feed_name for result in results] == ["A1", "B1", "A2"]
+    assert peak == 2
+    assert len(sessions) == 3
+    assert all(session.commit.await_count == 1 for session in sessions)
+    assert len({id(session) for session in seen_sessions.values()}) == 3
+    assert mock_db_session not in seen_sessions.values()
+    assert collector.session is mock_db_session
+
+
+@pytest.mark.asyncio
+async def test_collect_all_isolates_feed_failures_with_rollback(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions: list[AsyncMock] = []
+    collector = RSSCollector(
+        session=mock_db_session,
+        http_client=mock_http_client,
+        session_factory=_session_factory(sessions),
+    )
+    collector.max_concurrent_feeds = 2
+    collector._feeds = [
+        FeedConfig(name="Broken", url="https://a.example/rss", credibility=0.8),
+        FeedConfig(name="Healthy", url="https://b.example/rss", credibility=0.8),
+    ]
+
+    async def fake_collect_feed(_self: RSSCollector, feed: FeedConfig) -> CollectionResult:
+        if feed.name == "Broken":
+            raise RuntimeError("source upsert failed")
+        return CollectionResult(feed_name=feed.name, items_stored=2)
+
+    monkeypatch.setattr(collector, "load_config", _noop_load_config)
+    monkeypatch.setattr(RSSCollector, "collect_feed", fake_collect_feed)
+
+    broken, healthy = await collector.collect_all()
+
+    assert broken.feed_name == "Broken"
+    assert broken.terminal_errors == 1
+    assert broken.errors == [
+        "[terminal] Feed collection failed (runtimeerror): source upsert failed"
+    ]
+    assert healthy.items_stored == 2
+    assert healthy.errors == []
+    broken_session, healthy_session = sessions
+    broken_session.rollback.assert_awaited_once()
+    broken_session.commit.assert_not_awaited()
+    healthy_session.commit.assert_awaited_once()
+    healthy_session.rollback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_collect_all_stays_serial_without_session_factory_or_with_single_slot(
+    mock_db_session,
+    mock_http_client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions: list[AsyncMock] = []
+    collector = RSSCollector(
+        session=mock_db_session,
+        http_client=mock_http_client,
+        session_factory=_session_factory(sessions),
+    )
+    collector.max_concurrent_feeds = 1
+    collector._feeds = [FeedConfig(name="One", url="https://a.example/rss", credibility=0.8)]
+
+    async def fake_collect_feed(self: RSSCollector, feed: FeedConfig) -> CollectionResult:
+        assert self is collector
+        return CollectionResult(feed_name=feed.name)
+
+    monkeypatch.setattr(collector, "load_config", _noop_load_config)
+    monkeypatch.setattr(RSSCollector, "collect_feed", fake_collect_feed)
+
+    results = await collector.collect_all()
+
+    assert [result.feed_name for result in results] == ["One"]
+    assert sessions == []
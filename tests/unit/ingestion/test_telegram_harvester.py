@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
@@ -9,14 +8,13 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
-from sqlalchemy.exc import IntegrityError
 
+from src.ingestion.raw_item_writer import RawItemCandidate
 from src.ingestion.source_identity import (
     normalize_telegram_channel_handle,
     telegram_provider_source_key,
 )
-from src.ingestion.telegram_harvester import ChannelConfig, TelegramHarvester
-from src.storage.models import ProcessingStatus
+from src.ingestion.telegram_harvester import ChannelConfig, HarvestResult, TelegramHarvester
 
 pytestmark = pytest.mark.unit
 
@@ -38,8 +36,16 @@ class FakeTelegramClient:
     async def get_entity(self, channel: str) -> str:
         return channel
 
-    async def get_messages(self, _entity: str, limit: int) -> list[object]:
-        return self._messages[:limit]
+    async def get_messages(
+        self,
+        _entity: str,
+        limit: int,
+        min_id: int = 0,
+        reverse: bool = False,
+    ) -> list[object]:
+        del min_id
+        messages = list(reversed(self._messages)) if reverse else self._messages
+        return messages[:limit]
 
     async def iter_messages(
         self,
@@ -349,6 +355,7 @@ async def test_backfill_channel_counts_messages_and_applies_maximums(
         return source
 
     async def fake_process_message(_source, _channel: ChannelConfig, message: object) -> bool:
+        harvester.raw_item_writer.pending = int(message.id != 2)
         return message.id != 2
 
     async def fake_record_success(_source) -> None:
@@ -357,6 +364,10 @@ async def test_backfill_channel_counts_messages_and_applies_maximums(
     monkeypatch.setattr(harvester, "_get_or_create_source", fake_get_or_create_source)
     monkeypatch.setattr(harvester, "_process_message", fake_process_message)
     monkeypatch.setattr(harvester, "_record_source_success", fake_record_success)
+    flush_items = AsyncMock()
+    monkeypatch.setattr(harvester, "_flush_items", flush_items)
+    harvester.raw_item_writer = SimpleNamespace(pending=0)
+    harvester.store_batch_size = 1
 
     result = await harvester.backfill_channel(channel, days=0, max_messages=2)
 
@@ -364,6 +375,7 @@ async def test_backfill_channel_counts_messages_and_applies_maximums(
     assert result.messages_stored == 1
     assert result.messages_skipped == 1
     assert result.errors == []
+    assert flush_items.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -411,7 +423,7 @@ async def test_stream_channel_processes_only_newer_message_ids(
         credibility=0.8,
         max_messages_per_fetch=3,
     )
-    source = SimpleNamespace(error_count=0)
+    source = SimpleNamespace(error_count=0, high_water_message_id=None)
     sleep_calls: list[float] = []
 
     async def fake_get_or_create_source(_channel: ChannelConfig) -> SimpleNamespace:
@@ -434,6 +446,8 @@ async def test_stream_channel_processes_only_newer_message_ids(
     assert result.messages_skipped == 1
     assert client.entities == ["@channel_one"]
     assert sleep_calls == [1.0]
+    assert source.high_water_message_id == 3
+    mock_db_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -449,7 +463,7 @@ async def test_stream_channel_skips_messages_without_new_ids(
         credibility=0.8,
         max_messages_per_fetch=2,
     )
-    source = SimpleNamespace(error_count=0)
+    source = SimpleNamespace(error_count=0, high_water_message_id=None)
 
     async def fake_get_or_create_source(_channel: ChannelConfig) -> SimpleNamespace:
         return source
@@ -471,11 +485,99 @@ async def test_stream_channel_skips_messages_without_new_ids(
     assert result.messages_skipped == 0
 
 
+class FakeMinIdClient(FakeEntityLookupClient):
+    def __init__(self, messages_by_channel: dict[str, list[object]]) -> None:
+        super().__init__()
+        self.messages_by_channel = messages_by_channel
+        self.requests: list[tuple[str, int]] = []
+
+    async def get_messages(
+        self,
+        entity: str,
+        limit: int,
+        min_id: int = 0,
+        reverse: bool = False,
+    ) -> list[object]:
+        self.requests.append((entity, min_id))
+        if entity == "@broken":
+            msg = "flood wait"
+            raise RuntimeError(msg)
+        newer = [message for message in self.messages_by_channel[entity] if message.id > min_id]
+        return sorted(newer, key=lambda message: message.id, reverse=not reverse)[:limit]
+
+
 @pytest.mark.asyncio
-async def test_process_message_skips_invalid_duplicate_and_empty_content_paths(
+async def test_stream_channels_multiplexes_channels_and_resumes_from_high_water_mark(
     mock_db_session,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    client = FakeMinIdClient(
+        {
+            "@one": [SimpleNamespace(id=5), SimpleNamespace(id=6)],
+            "@two": [SimpleNamespace(id=1)],
+            "@empty": [],
+        }
+    )
+    harvester = TelegramHarvester(
+        session=mock_db_session,
+        client=client,
+        min_request_interval_seconds=0.5,
+    )
+    channels = [
+        ChannelConfig(name="One", channel="@one", credibility=0.8),
+        ChannelConfig(name="Two", channel="@two", credibility=0.8),
+        ChannelConfig(name="Broken", channel="@broken", credibility=0.8),
+        ChannelConfig(name="Empty", channel="@empty", credibility=0.8),
+    ]
+    sources = {
+        "@one": SimpleNamespace(high_water_message_id=5),
+        "@two": SimpleNamespace(high_water_message_id=None),
+        "@broken": SimpleNamespace(high_water_message_id=None),
+        "@empty": SimpleNamespace(high_water_message_id=None),
+    }
+    processed: list[tuple[str, int]] = []
+    sleep_calls: list[float] = []
+
+    async def fake_get_or_create_source(channel: ChannelConfig) -> SimpleNamespace:
+        return sources[channel.channel]
+
+    async def fake_process_message(_source, channel: ChannelConfig, message: object) -> bool:
+        processed.append((channel.channel, message.id))
+        return True
+
+    async def fake_sleep(seconds: float) -> None:
+        sleep_calls.append(seconds)
+
+    monkeypatch.setattr(harvester, "_get_or_create_source", fake_get_or_create_source)
+    monkeypatch.setattr(harvester, "_process_message", fake_process_message)
+    monkeypatch.setattr("src.ingestion.telegram_harvester.asyncio.sleep", fake_sleep)
+
+    results = await harvester.stream_channels(channels, poll_interval_seconds=2.0, max_polls=2)
+
+    assert processed == [("@one", 6), ("@two", 1)]
+    assert [result.messages_stored for result in results] == [1, 1, 0, 0]
+    assert results[2].errors == ["Telegram poll failed: flood wait"] * 2
+    assert sources["@one"].high_water_message_id == 6
+    assert sources["@two"].high_water_message_id == 1
+    assert sources["@broken"].high_water_message_id is None
+    assert sources["@empty"].high_water_message_id is None
+    assert client.requests == [
+        ("@one", 5),
+        ("@two", 0),
+        ("@broken", 0),
+        ("@empty", 0),
+        ("@one", 6),
+        ("@two", 1),
+        ("@broken", 0),
+        ("@empty", 0),
+    ]
+    assert client.entities == ["@one", "@two", "@broken", "@empty"]
+    assert sleep_calls == [0.5, 0.5, 0.5, 2.0] * 2
+    assert mock_db_session.commit.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_process_message_skips_invalid_and_empty_content_paths(mock_db_session) -> None:
     harvester = TelegramHarvester(session=mock_db_session, client=FakeTelegramClient())
     source = SimpleNamespace(id=uuid4())
     channel = ChannelConfig(name="Channel One", channel="@channel_one", credibility=0.8)
@@ -485,15 +587,6 @@ async def test_process_message_skips_invalid_duplicate_and_empty_content_paths(
     message_without_content = SimpleNamespace(id=1, message=None, raw_text=None, media=None)
     assert await harvester._process_message(source, channel, message_without_content) is False
 
-    async def fake_is_duplicate(**_kwargs) -> bool:
-        return True
-
-    monkeypatch.setattr(harvester, "_is_duplicate", fake_is_duplicate)
-    assert (
-        await harvester._process_message(source, channel, SimpleNamespace(id=2, message="dup"))
-        is False
-    )
-
 
 @pytest.mark.asyncio
 async def test_process_message_stores_valid_items(
@@ -510,14 +603,10 @@ async def test_process_message_stores_valid_items(
     )
     stored_payload: dict[str, object] = {}
 
-    async def fake_is_duplicate(**_kwargs) -> bool:
-        return False
-
-    async def fake_store_item(**kwargs):
+    async def fake_store_item(**kwargs) -> bool:
         stored_payload.update(kwargs)
-        return SimpleNamespace(id=uuid4())
+        return True
 
-    monkeypatch.setattr(harvester, "_is_duplicate", fake_is_duplicate)
     monkeypatch.setattr(harvester, "_store_item", fake_store_item)
 
     was_stored = await harvester._process_message(
@@ -584,77 +673,76 @@ def test_message_and_channel_url_variants() -> None:
 
 
 @pytest.mark.asyncio
-async def test_is_duplicate_checks_recent_window(mock_db_session) -> None:
-    harvester = TelegramHarvester(
-        session=mock_db_session,
-        client=FakeTelegramClient(),
-    )
-    mock_db_session.scalar.return_value = uuid4()
-
-    duplicate = await harvester._is_duplicate(
-        external_id="@intel_feed:1",
-        url="https://t.me/intel_feed/1",
-        content_hash="deadbeef",
-    )
-
-    assert duplicate is True
-    assert mock_db_session.scalar.await_count == 1
-
-
-@pytest.mark.asyncio
-async def test_store_item_sets_pending_status(mock_db_session) -> None:
+async def test_flush_drops_messages_stored_within_dedup_window(mock_db_session) -> None:
     harvester = TelegramHarvester(
         session=mock_db_session,
         client=FakeTelegramClient(),
     )
     source = SimpleNamespace(id=uuid4())
-
-    item = await harvester._store_item(
-        source=source,
-        external_id="@intel_feed:5",
-        url="https://t.me/intel_feed/5",
-        title="Headline",
-        author="1000",
-        published_at=datetime(2026, 2, 6, 12, 0, tzinfo=UTC),
-        raw_content="Message body",
-        content_hash="abc123",
-        language="en",
+    for message_id in (1, 2):
+        harvester.raw_item_writer.add(
+            RawItemCandidate(
+                source_id=source.id,
+                external_id=f"@intel_feed:{message_id}",
+                url=f"https://t.me/intel_feed/{message_id}",
+                title=None,
+                author=None,
+                published_at=None,
+                raw_content=f"Message {message_id}",
+                content_hash=f"hash-{message_id}",
+                language=None,
+            )
+        )
+    mock_db_session.execute.return_value = SimpleNamespace(
+        all=lambda: [(uuid4(), "@intel_feed:1", "https://t.me/intel_feed/1", "hash-1")]
     )
+    inserted_id = uuid4()
+    mock_db_session.scalars.return_value = SimpleNamespace(all=lambda: [inserted_id])
+    result = HarvestResult(channel_name="Channel", messages_stored=2)
+
+    await harvester._flush_items(result)
 
-    assert item is not None
-    assert item.processing_status == ProcessingStatus.PENDING
-    assert item.external_id == "@intel_feed:5"
-    assert mock_db_session.add.call_count == 1
+    assert (result.messages_stored, result.messages_skipped) == (1, 1)
+    assert mock_db_session.execute.await_count == 1
+    statement = mock_db_session.scalars.await_args.args[0]
+    params = statement.compile().params
+    assert params["external_id_m0"] == "@intel_feed:2"
+    assert "external_id_m1" not in params
 
 
 @pytest.mark.asyncio
-async def test_store_item_returns_none_on_insert_race(mock_db_session) -> None:
+async def test_store_item_queues_candidate_and_flush_reconciles_insert_races(
+    mock_db_session,
+) -> None:
     harvester = TelegramHarvester(
         session=mock_db_session,
         client=FakeTelegramClient(),
     )
     source = SimpleNamespace(id=uuid4())
+    item_fields = {
+        "source": source,
+        "url": "https://t.me/intel_feed/5",
+        "title": "Headline",
+        "author": "1000",
+        "published_at": datetime(2026, 2, 6, 12, 0, tzinfo=UTC),
+        "raw_content": "Message body",
+        "content_hash": "abc123",
+        "language": "en",
+    }
 
-    @asynccontextmanager
-    async def fake_begin_nested():
-        yield
-
-    mock_db_session.begin_nested = fake_begin_nested
-    mock_db_session.flush.side_effect = IntegrityError("insert", {}, Exception("boom"))
+    assert await harvester._store_item(external_id="@intel_feed:5", **item_fields) is True
+    assert await harvester._store_item(external_id="@intel_feed:6", **item_fields) is False
+    (candidate,) = harvester.raw_item_writer._pending
+    assert candidate.external_id == "@intel_feed:5"
+    mock_db_session.add.assert_not_called()
 
-    item = await harvester._store_item(
-        source=source,
-        external_id="@intel_feed:6",
-        url=None,
-        title=None,
-        author=None,
-        published_at=None,
-        raw_content="Message body",
-        content_hash="abc123",
-        language=None,
-    )
+    mock_db_session.execute.return_value = SimpleNamespace(all=list)
+    mock_db_session.scalars.return_value = SimpleNamespace(all=list)
+    result = HarvestResult(channel_name="Channel", messages_stored=1)
+    await harvester._flush_items(result)
 
-    assert item is None
+    assert (result.messages_stored, result.messages_skipped) == (0, 1)
+    assert harvester.raw_item_writer.pending == 0
 
 
 @pytest.mark.asyncio
@@ -1038,3 +1126,56 @@ def test_datetime_title_hash_and_safe_str_helpers() -> None:
     assert TelegramHarvester._safe_str(None) is None
     assert TelegramHarvester._safe_str("  ") is None
     assert TelegramHarvester._safe_str(" value ") == "value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("high_water_mark", "max_polls", "expected_processed", "expected_requests"),
+    [
+        # A persisted mark pages a backlog forward, oldest first, across polls.
+        (1, 3, [2, 3, 4, 5, 6], [("@one", 1), ("@one", 3), ("@one", 5)]),
+        # A missing mark is seeded from the newest messages, not the channel history.
+        (None, 2, [5, 6], [("@one", 0), ("@one", 6)]),
+    ],
+)
+async def test_stream_channel_pages_from_high_water_mark(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+    high_water_mark: int | None,
+    max_polls: int,
+    expected_processed: list[int],
+    expected_requests: list[tuple[str, int]],
+) -> None:
+    client = FakeMinIdClient(
+        {"@one": [SimpleNamespace(id=message_id) for message_id in range(1, 7)]}
+    )
+    harvester = TelegramHarvester(session=mock_db_session, client=client)
+    channel = ChannelConfig(
+        name="One",
+        channel="@one",
+        credibility=0.8,
+        max_messages_per_fetch=2,
+    )
+    source = SimpleNamespace(error_count=0, high_water_message_id=high_water_mark)
+    processed: list[int] = []
+
+    async def fake_get_or_create_source(_channel: ChannelConfig) -> SimpleNamespace:
+        return source
+
+    async def fake_process_message(_source, _channel: ChannelConfig, message: object) -> bool:
+        processed.append(message.id)
+        return True
+
+    async def fake_sleep(_seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(harvester, "_get_or_create_source", fake_get_or_create_source)
+    monkeypatch.setattr(harvester, "_process_message", fake_process_message)
+    monkeypatch.setattr("src.ingestion.telegram_harvester.asyncio.sleep", fake_sleep)
+
+    result = await harvester.stream_channel(channel, poll_interval_seconds=0.1, max_polls=max_polls)
+
+    assert processed == expected_processed
+    assert result.messages_stored == len(expected_processed)
+    assert source.high_water_message_id == 6
+    assert client.requests == expected_requests
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+import src.processing.event_clusterer as event_clusterer_module
+from src.processing.active_event_index import ActiveEventIndex
+from src.processing.event_clusterer import EventClusterer
+from src.storage.models import Event, RawItem
+
+pytestmark = pytest.mark.unit
+
+MODEL = "text-embedding-3-small"
+NOW = datetime(2026, 3, 2, 12, tzinfo=UTC)
+
+
+def _index(**kwargs: object) -> ActiveEventIndex:
+    return ActiveEventIndex(enabled=True, window_hours=48, max_events=10, **kwargs)
+
+
+def test_nearest_returns_best_event_within_window_and_threshold() -> None:
+    index = _index()
+    close_id, far_id, stale_id = uuid4(), uuid4(), uuid4()
+    index.upsert(
+        event_id=close_id, embedding=[1.0, 0.1, 0.0], embedding_model=MODEL, last_mention_at=NOW
+    )
+    index.upsert(
+        event_id=far_id, embedding=[0.0, 1.0, 0.0], embedding_model=MODEL, last_mention_at=NOW
+    )
+    index.upsert(
+        event_id=stale_id,
+        embedding=[1.0, 0.0, 0.0],
+        embedding_model=MODEL,
+        last_mention_at=NOW - timedelta(hours=72),
+    )
+    window_start = NOW - timedelta(hours=48)
+
+    hit = index.nearest([2.0, 0.0, 0.0], MODEL, window_start=window_start, min_similarity=0.9)
+
+    assert hit is not None
+    assert hit[0] == close_id
+    assert hit[1] == pytest.approx(1.0 / np.sqrt(1.01), abs=1e-6)
+    for query, model in (([0.0, 0.0, 1.0], MODEL), ([1.0, 0.0, 0.0], "other")):
+        assert index.nearest(query, model, window_start=window_start, min_similarity=0.5) is None
+
+    index.discard(close_id)
+    assert (
+        index.nearest([1.0, 0.0, 0.0], MODEL, window_start=window_start, min_similarity=0.5) is None
+    )
+    assert index.expire(window_start) == 1
+    assert len(index) == 1
+
+
+def test_upsert_reuses_slots_grows_and_skips_unusable_rows() -> None:
+    index = _index()
+    event_ids = [uuid4() for _ in range(1100)]
+    for offset, event_id in enumerate(event_ids):
+        index.upsert(
+            event_id=event_id,
+            embedding=[1.0, offset * 1e-3],
+            embedding_model=MODEL,
+            last_mention_at=NOW,
+        )
+    index.upsert(event_id=uuid4(), embedding=[0.0, 0.0], embedding_model=MODEL, last_mention_at=NOW)
+    index.upsert(event_id=uuid4(), embedding=[1.0, 0.0], embedding_model=None, last_mention_at=NOW)
+
+    assert len(index) == 1100
+    index.upsert(
+        event_id=event_ids[0], embedding=[0.0, 1.0], embedding_model=MODEL, last_mention_at=NOW
+    )
+    assert len(index) == 1100
+    hit = index.nearest([1.0, 0.0], MODEL, window_start=NOW, min_similarity=0.99)
+    assert hit is not None
+    assert hit[0] == event_ids[1]
+
+
+def test_index_ignores_vectors_of_another_dimension_and_zero_queries() -> None:
+    index = _index()
+    event_id = uuid4()
+    index.upsert(
+        event_id=event_id, embedding=[1.0, 0.0], embedding_model=MODEL, last_mention_at=NOW
+    )
+    index.upsert(
+        event_id=uuid4(), embedding=[1.0, 0.0, 0.0], embedding_model=MODEL, last_mention_at=NOW
+    )
+
+    assert len(index) == 1
+    for query in ([1.0, 0.0, 0.0], [[1.0, 0.0]], [0.0, 0.0], [np.inf, 0.0]):
+        assert index.nearest(query, MODEL, window_start=NOW, min_similarity=0.0) is None
+    assert index.nearest([1.0, 0.0], MODEL, window_start=NOW, min_similarity=0.9) == (
+        event_id,
+        pytest.approx(1.0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_loads_window_then_reads_only_recent_updates(mock_db_session) -> None:
+    index = _index()
+    event_id = uuid4()
+    updated_at = NOW - timedelta(minutes=5)
+    mock_db_session.scalar.return_value = 1
+    mock_db_session.execute.return_value = SimpleNamespace(
+        all=lambda: [(event_id, np.array([1.0, 0.0], dtype=np.float32), MODEL, NOW, updated_at)]
+    )
+
+    assert await index.sync(mock_db_session, now=NOW) == 1
+    assert index.ready is True
+    assert len(index) == 1
+    first_sql = str(mock_db_session.execute.await_args.args[0])
+    assert "events.last_updated_at >=" not in first_sql
+
+    mock_db_session.execute.return_value = SimpleNamespace(all=list)
+    await index.sync(mock_db_session, now=NOW + timedelta(hours=60))
+
+    assert "events.last_updated_at >=" in str(mock_db_session.execute.await_args.args[0])
+    assert mock_db_session.scalar.await_count == 1
+    assert len(index) == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_leaves_index_cold_when_window_exceeds_capacity(mock_db_session) -> None:
+    index = _index()
+    mock_db_session.scalar.return_value = 11
+
+    assert await index.sync(mock_db_session, now=NOW) == 0
+    assert index.ready is False
+    mock_db_session.execute.assert_not_called()
+    assert await ActiveEventIndex(enabled=False).sync(mock_db_session) == 0
+    assert mock_db_session.scalar.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_clears_index_when_updates_outgrow_capacity(mock_db_session) -> None:
+    index = ActiveEventIndex(enabled=True, window_hours=48, max_events=1)
+    mock_db_session.scalar.return_value = 1
+    mock_db_session.execute.return_value = SimpleNamespace(
+        all=lambda: [(uuid4(), [1.0, 0.0], MODEL, NOW, None)]
+    )
+    assert await index.sync(mock_db_session, now=NOW) == 1
+    assert index.ready is True
+
+    mock_db_session.execute.return_value = SimpleNamespace(
+        all=lambda: [(uuid4(), [0.0, 1.0], MODEL, NOW, NOW)]
+    )
+    assert await index.sync(mock_db_session, now=NOW + timedelta(minutes=1)) == 1
+
+    assert len(index) == 0
+    assert index.ready is False
+    assert index.nearest([1.0, 0.0], MODEL, window_start=NOW, min_similarity=0.0) is None
+
+
+@pytest.mark.asyncio
+async def test_clusterer_verifies_index_hits_and_queries_pgvector_on_misses(
+    mock_db_session,
+) -> None:
+    index = _index()
+    mock_db_session.scalar.return_value = 0
+    mock_db_session.execute.return_value = SimpleNamespace(all=list)
+    await index.sync(mock_db_session, now=NOW)
+    event = Event(
+        id=uuid4(),
+        canonical_summary="indexed",
+        embedding=[1.0, 0.0],
+        embedding_model=MODEL,
+        last_mention_at=NOW,
+    )
+    index.upsert(
+        event_id=event.id, embedding=[1.0, 0.0], embedding_model=MODEL, last_mention_at=NOW
+    )
+    clusterer = EventClusterer(session=mock_db_session, event_index=index)
+    mock_db_session.execute.reset_mock()
+    mock_db_session.get = AsyncMock(return_value=event)
+
+    matched = await clusterer._find_matching_event([1.0, 0.01], MODEL, NOW)
+
+    assert matched is not None
+    assert matched[0] is event
+    assert matched[1] == pytest.approx(1.0, abs=1e-3)
+    mock_db_session.execute.assert_not_called()
+    assert mock_db_session.get.await_args.kwargs == {"populate_existing": True}
+
+    mock_db_session.execute.return_value = SimpleNamespace(first=lambda: None)
+    assert await clusterer._find_matching_event([0.0, 1.0], MODEL, NOW) is None
+    mock_db_session.execute.assert_awaited_once()
+
+    # Another worker moved the event away from the indexed vector.
+    mock_db_session.sync_session = Session()
+    mock_db_session.sync_session.begin()
+    mock_db_session.get = AsyncMock(
+        return_value=Event(
+            id=event.id, embedding=[0.0, 1.0], embedding_model=MODEL, last_mention_at=NOW
+        )
+    )
+    assert await clusterer._find_matching_event([1.0, 0.01], MODEL, NOW) is None
+    assert len(index) == 0
+    mock_db_session.get.assert_awaited_once()
+    assert mock_db_session.execute.await_count == 2
+    mock_db_session.sync_session.commit()
+    assert index.nearest([0.0, 1.0], MODEL, window_start=NOW, min_similarity=0.9) is not None
+
+    index.upsert(
+        event_id=event.id, embedding=[1.0, 0.0], embedding_model=MODEL, last_mention_at=NOW
+    )
+    mock_db_session.get = AsyncMock(return_value=None)
+    assert await clusterer._find_matching_event([1.0, 0.01], MODEL, NOW) is None
+    assert len(index) == 0
+    assert mock_db_session.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_verify_index_hint_gives_up_after_repeated_stale_hints(mock_db_session) -> None:
+    index = _index()
+    mock_db_session.scalar.return_value = 0
+    mock_db_session.execute.return_value = SimpleNamespace(all=list)
+    await index.sync(mock_db_session, now=NOW)
+    for offset in range(4):
+        index.upsert(
+            event_id=uuid4(),
+            embedding=[1.0, offset * 1e-3],
+            embedding_model=MODEL,
+            last_mention_at=NOW,
+        )
+    mock_db_session.get = AsyncMock(
+        side_effect=lambda _model, event_id, **_kwargs: Event(
+            id=event_id, embedding=[0.0, 1.0], embedding_model=MODEL, last_mention_at=NOW
+        )
+    )
+    mock_db_session.sync_session = Session()
+    clusterer = EventClusterer(session=mock_db_session, event_index=index)
+    hint = clusterer._index_hint([1.0, 0.0], MODEL, NOW)
+
+    assert await clusterer._verify_index_hint(hint, [1.0, 0.0], MODEL, NOW) is None
+    assert mock_db_session.get.await_count == 3
+    assert len(index) == 1
+
+
+@pytest.mark.asyncio
+async def test_upsert_on_commit_applies_on_commit_and_drops_on_any_rollback() -> None:
+    index = _index()
+    session = AsyncSession()
+    sync_session = session.sync_session
+    row = {"embedding": [1.0, 0.0], "embedding_model": MODEL, "last_mention_at": NOW}
+    event_id = uuid4()
+
+    sync_session.begin()
+    index.upsert_on_commit(session, event_id=event_id, **row)
+    savepoint = sync_session.begin_nested()
+    savepoint.rollback()
+    await session.commit()
+    assert len(index) == 0
+
+    sync_session.begin()
+    index.upsert_on_commit(session, event_id=event_id, **row)
+    assert len(index) == 0
+    await session.commit()
+    assert index.nearest([1.0, 0.0], MODEL, window_start=NOW, min_similarity=0.9) == (
+        event_id,
+        pytest.approx(1.0),
+    )
+
+    sync_session.begin()
+    index.upsert_on_commit(session, event_id=uuid4(), **row)
+    await session.rollback()
+    await session.commit()
+    assert len(index) == 1
+
+
+@pytest.mark.asyncio
+async def test_find_indexed_matches_leaves_misses_and_unembedded_items_unresolved(
+    mock_db_session,
+) -> None:
+    index = _index()
+    mock_db_session.scalar.return_value = 0
+    mock_db_session.execute.return_value = SimpleNamespace(all=list)
+    await index.sync(mock_db_session, now=NOW)
+    event = Event(
+        id=uuid4(),
+        canonical_summary="indexed",
+        embedding=[1.0, 0.0],
+        embedding_model=MODEL,
+        last_mention_at=NOW,
+    )
+    index.upsert(
+        event_id=event.id, embedding=[1.0, 0.0], embedding_model=MODEL, last_mention_at=NOW
+    )
+    hit, miss, unembedded = (
+        RawItem(id=uuid4(), embedding=embedding, embedding_model=MODEL, published_at=NOW)
+        for embedding in ([1.0, 0.01], [0.0, 1.0], None)
+    )
+    mock_db_session.scalars = AsyncMock(return_value=SimpleNamespace(all=lambda: [event]))
+    mock_db_session.get = AsyncMock(return_value=event)
+    clusterer = EventClusterer(session=mock_db_session, event_index=index)
+
+    matches, unresolved = await clusterer._find_indexed_matches([hit, miss, unembedded])
+
+    assert list(matches) == [hit.id]
+    assert matches[hit.id][0] is event
+    assert unresolved == [unembedded, miss]
+
+
+@pytest.mark.asyncio
+async def test_cluster_items_syncs_index_and_skips_pgvector_for_verified_hits(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    index = _index()
+    # cluster_items syncs against the wall clock, so the event must be recent.
+    mentioned_at = datetime.now(tz=UTC)
+    event = Event(
+        id=uuid4(),
+        canonical_summary="indexed",
+        embedding=[1.0, 0.0],
+        embedding_model=MODEL,
+        last_mention_at=mentioned_at,
+    )
+    item = RawItem(
+        id=uuid4(), embedding=[1.0, 0.01], embedding_model=MODEL, published_at=mentioned_at
+    )
+    mock_db_session.scalar.return_value = 1
+    mock_db_session.execute.side_effect = [
+        SimpleNamespace(all=lambda: [(event.id, [1.0, 0.0], MODEL, mentioned_at, mentioned_at)]),
+        SimpleNamespace(all=list),
+        SimpleNamespace(all=list),
+    ]
+    mock_db_session.get = AsyncMock(return_value=event)
+    mock_db_session.sync_session = Session()
+    monkeypatch.setattr(event_clusterer_module, "ensure_cluster_health", AsyncMock())
+    clusterer = EventClusterer(session=mock_db_session, event_index=index)
+    clusterer._add_event_link = AsyncMock(return_value=True)
+    clusterer._merge_into_event = AsyncMock()
+
+    results = await clusterer.cluster_items([item])
+
+    assert index.ready is True
+    assert (results[0].event_id, results[0].created) == (event.id, False)
+    assert results[0].similarity == pytest.approx(1.0, abs=1e-3)
+    # Sync, existing links and suppression state; the match lookup never runs.
+    assert mock_db_session.execute.await_count == 3
+    clusterer._merge_into_event.assert_awaited_once_with(event, item)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from itertools import permutations
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.processing.corroboration_grouping import EventSourceProvenance, ProvenanceCounters
+from src.processing.corroboration_provenance import summarize_provenance_counters
+
+pytestmark = pytest.mark.unit
+
+
+def _observation(
+    source_url: str | None,
+    *,
+    reporting_type: str | None = "secondary",
+    content_hash: str | None = None,
+    author: str | None = None,
+    source_id: UUID | None = None,
+    source_name: str | None = "Outlet",
+) -> EventSourceProvenance:
+    return EventSourceProvenance(
+        source_id=source_id or uuid4(),
+        source_name=source_name,
+        source_url=source_url,
+        source_tier="regional",
+        reporting_type=reporting_type,
+        item_url=None,
+        title="Short",
+        author=author,
+        content_hash=content_hash,
+    )
+
+
+def _summary(counters: ProvenanceCounters) -> dict[str, object]:
+    return summarize_provenance_counters(
+        counters,
+        raw_source_count=counters.observation_count,
+        unique_source_count=counters.observation_count,
+    ).as_dict()
+
+
+def test_folding_observations_in_any_order_matches_grouping_them_together() -> None:
+    observations = [
+        _observation("https://a.example.test", content_hash="a" * 64),
+        _observation("https://b.example.test", content_hash="a" * 64),
+        _observation("https://a.example.test", reporting_type="firsthand", content_hash="a" * 64),
+        _observation("https://c.example.test", content_hash="b" * 64, author="Reuters"),
+        _observation("https://c.example.test", reporting_type=None),
+    ]
+
+    summaries = [
+        _summary(ProvenanceCounters.from_observations(list(ordered)))
+        for ordered in permutations(observations)
+    ]
+
+    assert all(summary == summaries[0] for summary in summaries)
+    groups = {group["key"]: group for group in summaries[0]["groups"]}
+    near_duplicate = groups[f"near-duplicate:content:{'a' * 16}"]
+    assert near_duplicate["member_count"] == 2
+    assert near_duplicate["source_families"] == ["a.example.test", "b.example.test"]
+    assert groups["family:c.example.test"]["weight"] == pytest.approx(0.5)
+    assert summaries[0]["independent_evidence_count"] == 4
+    assert summaries[0]["near_duplicate_group_count"] == 1
+    assert summaries[0]["syndication_group_count"] == 1
+
+
+def test_counters_resume_from_their_payload() -> None:
+    first = _observation("https://a.example.test", content_hash="c" * 64)
+    second = _observation("https://b.example.test", content_hash="c" * 64)
+    counters = ProvenanceCounters.from_observations([first])
+
+    resumed = ProvenanceCounters.from_payload(counters.as_payload())
+    assert resumed is not None
+    resumed.add(second)
+
+    assert resumed.pending == {}
+    assert _summary(resumed) == _summary(ProvenanceCounters.from_observations([first, second]))
+
+    # Payloads written before a group was dropped still fold the repeat.
+    orphaned = ProvenanceCounters.from_payload({**counters.as_payload(), "groups": {}})
+    assert orphaned is not None
+    orphaned.add(second)
+    near_duplicate = orphaned.groups[f"near-duplicate:content:{'c' * 16}"]
+    assert near_duplicate.member_count == 2
+    assert set(orphaned.groups) == {near_duplicate.key}
+
+    assert ProvenanceCounters.from_payload(None) is None
+    assert ProvenanceCounters.from_payload({"observation_count": 1}) is None
+    assert ProvenanceCounters.from_payload({**counters.as_payload(), "groups": []}) is None
+
+
+def test_repeated_story_leaves_other_members_in_an_unnamed_source_group() -> None:
+    source_id = uuid4()
+    observations = [
+        _observation(None, source_name=None, source_id=source_id, content_hash="d" * 64),
+        _observation(None, source_name=None, source_id=source_id, content_hash="e" * 64),
+        _observation("https://d.example.test", content_hash="d" * 64),
+    ]
+
+    summaries = [
+        _summary(ProvenanceCounters.from_observations(list(ordered)))
+        for ordered in permutations(observations)
+    ]
+
+    assert all(summary == summaries[0] for summary in summaries)
+    counters = ProvenanceCounters.from_observations(observations)
+    source_group = counters.groups[f"source:{source_id}"]
+    assert source_group.member_count == 1
+    assert dict(source_group.source_ids) == {str(source_id): 1}
+    assert source_group.source_families == {}
+    near_duplicate = counters.groups[f"near-duplicate:content:{'d' * 16}"]
+    assert near_duplicate.member_count == 2
+    assert dict(near_duplicate.source_families) == {"d.example.test": 1}
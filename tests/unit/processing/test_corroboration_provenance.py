@@ -7,6 +7,7 @@ from uuid import uuid4
 
 import pytest
 
+import src.processing.corroboration_grouping as grouping_module
 import src.processing.corroboration_provenance as provenance_module
 import src.processing.corroboration_refresh_support as refresh_support_module
 from src.processing.corroboration_provenance import (
@@ -17,7 +18,7 @@ from src.processing.corroboration_provenance import (
     refresh_events_for_source,
     summarize_event_provenance,
 )
-from src.storage.models import Event, RawItem
+from src.storage.models import Event, RawItem, Source
 
 pytestmark = pytest.mark.unit
 
@@ -295,7 +296,7 @@ def test_provenance_helpers_cover_fallback_and_internal_normalization_paths() ->
     )
     assert source_only_summary.groups[0]["key"].startswith("source:")
 
-    source_slug = provenance_module.infer_source_family(
+    source_slug = grouping_module.infer_source_family(
         EventSourceProvenance(
             source_id=uuid4(),
             source_name="Telegram Mirror",
@@ -326,37 +327,36 @@ def test_provenance_helpers_cover_fallback_and_internal_normalization_paths() ->
 
 
 def test_provenance_helper_normalization_paths() -> None:
-    assert provenance_module.reporting_type_weight("aggregator") == pytest.approx(0.35)
-    assert provenance_module.reporting_type_weight("other") == pytest.approx(0.5)
-    assert provenance_module._maybe_str(7) == "7"
+    assert grouping_module.reporting_type_weight("aggregator") == pytest.approx(0.35)
+    assert grouping_module.reporting_type_weight("other") == pytest.approx(0.5)
+    assert grouping_module.maybe_str(7) == "7"
+    assert grouping_module.maybe_str("  ") is None
+    assert grouping_module._normalized_hostname("https://www.example.test/story") == "example.test"
+    assert grouping_module._normalized_hostname("example.test") == "example.test"
+    assert grouping_module._normalized_hostname(None) is None
     assert (
-        provenance_module._normalized_hostname("https://www.example.test/story") == "example.test"
-    )
-    assert provenance_module._normalized_hostname("example.test") == "example.test"
-    assert provenance_module._normalized_hostname(None) is None
-    assert (
-        provenance_module._source_family_key_from_url("https://t.me/channel_name/123")
+        grouping_module._source_family_key_from_url("https://t.me/channel_name/123")
         == "t.me/channel_name"
     )
     assert (
-        provenance_module._source_family_key_from_url("https://t.me/s/channel_name/123")
+        grouping_module._source_family_key_from_url("https://t.me/s/channel_name/123")
         == "t.me/channel_name"
     )
     assert (
-        provenance_module._source_family_key_from_url("https://telegram.me/channel_name/123")
+        grouping_module._source_family_key_from_url("https://telegram.me/channel_name/123")
         == "t.me/channel_name"
     )
-    assert provenance_module._source_family_key_from_url("https://t.me") == "t.me"
-    assert provenance_module._slug_text(None) is None
-    assert provenance_module._slug_text("   !!!   ") is None
-    assert provenance_module._normalized_text(None) == ""
-    assert provenance_module._normalized_text(" Mixed   CASE ") == "mixed case"
-    assert provenance_module._normalized_value(None) is None
+    assert grouping_module._source_family_key_from_url("https://t.me") == "t.me"
+    assert grouping_module._slug_text(None) is None
+    assert grouping_module._slug_text("   !!!   ") is None
+    assert grouping_module._normalized_text(None) == ""
+    assert grouping_module._normalized_text(" Mixed   CASE ") == "mixed case"
+    assert grouping_module._normalized_value(None) is None
 
 
 def test_provenance_helper_provider_and_reporting_paths() -> None:
     assert (
-        provenance_module._syndication_provider(
+        grouping_module._syndication_provider(
             EventSourceProvenance(
                 source_id=uuid4(),
                 source_name=None,
@@ -523,6 +523,73 @@ async def test_refresh_event_provenance_persists_summary(mock_db_session) -> Non
     }
 
 
+@pytest.mark.asyncio
+async def test_refresh_event_provenance_folds_merged_item_into_stored_counters(
+    mock_db_session,
+) -> None:
+    row = (
+        uuid4(),
+        "Regional Outlet A",
+        "https://a.example.test",
+        "major",
+        "secondary",
+        "https://a.example.test/story",
+        "Forces moved near the eastern border overnight",
+        None,
+        "a" * 64,
+    )
+    mock_db_session.execute.return_value = SimpleNamespace(all=lambda: [row])
+    event = Event(id=uuid4(), canonical_summary="Event", source_count=1, unique_source_count=1)
+    await refresh_event_provenance(session=mock_db_session, event=event)
+    assert event.provenance_summary["counters"]["observation_count"] == 1
+    mock_db_session.execute.reset_mock()
+
+    source = SimpleNamespace(
+        id=uuid4(),
+        name="Regional Outlet B",
+        url="https://b.example.test",
+        source_tier="major",
+        reporting_type="secondary",
+    )
+    mock_db_session.get = AsyncMock(return_value=source)
+    item = RawItem(
+        id=uuid4(),
+        source_id=source.id,
+        url="https://b.example.test/story",
+        title="Forces moved near the eastern border overnight",
+        raw_content="Body",
+        content_hash="a" * 64,
+    )
+    event.source_count = 2
+    event.unique_source_count = 2
+    event.provenance_summary["cluster_health"] = {"cluster_cohesion_score": 0.7}
+
+    summary = await refresh_event_provenance(session=mock_db_session, event=event, item=item)
+
+    mock_db_session.execute.assert_not_called()
+    assert summary.independent_evidence_count == 1
+    assert summary.near_duplicate_group_count == 1
+    assert event.provenance_summary["counters"]["observation_count"] == 2
+    assert event.provenance_summary["cluster_health"] == {"cluster_cohesion_score": 0.7}
+
+    # Counters out of step with the event's mention count trigger a full recompute.
+    mock_db_session.execute.return_value = SimpleNamespace(all=lambda: [row])
+    event.source_count = 5
+    await refresh_event_provenance(session=mock_db_session, event=event, item=item)
+
+    mock_db_session.execute.assert_awaited_once()
+    assert event.provenance_summary["counters"]["observation_count"] == 1
+
+    # A source deleted since the merge cannot be folded in, so the event is recomputed.
+    mock_db_session.get = AsyncMock(return_value=None)
+    event.source_count = 2
+    await refresh_event_provenance(session=mock_db_session, event=event, item=item)
+
+    mock_db_session.get.assert_awaited_once_with(Source, source.id)
+    assert mock_db_session.execute.await_count == 2
+    assert event.provenance_summary["counters"]["observation_count"] == 1
+
+
 @pytest.mark.asyncio
 async def test_refresh_events_for_source_recomputes_linked_events(mock_db_session) -> None:
     first_event = Event(
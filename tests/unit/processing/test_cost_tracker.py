@@ -239,7 +239,11 @@ async def test_ensure_within_budget_returns_when_budget_allows_call(mock_db_sess
 
     await tracker.ensure_within_budget(TIER1)
 
-    tracker.check_budget.assert_awaited_once_with(TIER1)
+    tracker.check_budget.assert_awaited_once_with(
+        TIER1,
+        reserved_calls=0,
+        reserved_cost_usd=Decimal(0),
+    )
 
 
 @pytest.mark.asyncio
@@ -298,6 +302,63 @@ async def test_check_budget_allows_call_when_under_limits(mock_db_session, monke
     assert await tracker.check_budget(" Tier1 ") == (True, None)
 
 
+@pytest.mark.asyncio
+async def test_check_budget_counts_reserved_calls_and_cost(mock_db_session, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "TIER1_MAX_DAILY_CALLS", 3)
+    monkeypatch.setattr(settings, "DAILY_COST_LIMIT_USD", 1.0)
+    today = datetime.now(tz=UTC).date()
+    usage = ApiUsage(
+        usage_date=today,
+        tier=TIER1,
+        call_count=1,
+        input_tokens=50,
+        output_tokens=20,
+        estimated_cost_usd=0.1,
+    )
+    mock_db_session.scalar.side_effect = [usage, usage, Decimal("0.5"), usage, Decimal("0.5")]
+    tracker = CostTracker(session=mock_db_session)
+
+    allowed, reason = await tracker.check_budget(TIER1, reserved_calls=2)
+    assert allowed is False
+    assert reason is not None
+    assert "daily call limit" in reason
+
+    allowed, reason = await tracker.check_budget(
+        TIER1,
+        reserved_calls=1,
+        reserved_cost_usd=Decimal("0.5"),
+    )
+    assert allowed is False
+    assert reason is not None
+    assert "daily cost limit" in reason
+
+    assert await tracker.check_budget(
+        TIER1,
+        reserved_calls=1,
+        reserved_cost_usd=Decimal("0.4"),
+    ) == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_ensure_within_budget_prices_reserved_input_tokens(
+    mock_db_session, monkeypatch
+) -> None:
+    def resolve_token_rates(_self: CostTracker, **_: object) -> tuple[Decimal, Decimal]:
+        return (Decimal("0.2"), Decimal("0.0"))
+
+    monkeypatch.setattr(CostTracker, "_resolve_token_rates", resolve_token_rates)
+    tracker = CostTracker(session=mock_db_session)
+    tracker.check_budget = AsyncMock(return_value=(True, None))
+
+    await tracker.ensure_within_budget(EMBEDDING, reserved_calls=2, reserved_input_tokens=500_000)
+
+    tracker.check_budget.assert_awaited_once_with(
+        EMBEDDING,
+        reserved_calls=2,
+        reserved_cost_usd=Decimal("0.1"),
+    )
+
+
 @pytest.mark.asyncio
 async def test_record_usage_denies_when_daily_cost_limit_would_be_exceeded(
     mock_db_session,
@@ -5,13 +5,23 @@ from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.core.config import settings
-from src.processing.deduplication_service import DeduplicationService
+from src.processing.deduplication_service import DeduplicationService, DuplicateCandidate
+from src.processing.text_fingerprint import minhash_signature
 
 pytestmark = pytest.mark.unit
 
 
+def _signature(prefix: str, *, edits: int = 0) -> list[int]:
+    words = [f"{prefix}{index}" for index in range(200)]
+    words[100 : 100 + edits] = ["rewritten"] * edits
+    signature = minhash_signature(" ".join(words))
+    assert signature is not None
+    return signature
+
+
 @pytest.mark.asyncio
 async def test_find_duplicate_matches_external_id_first(mock_db_session) -> None:
     service = DeduplicationService(session=mock_db_session)
@@ -85,6 +95,32 @@ async def test_find_duplicate_matches_embedding_similarity(mock_db_session) -> N
     assert "raw_items.embedding_model =" in str(query)
 
 
+@pytest.mark.asyncio
+async def test_find_duplicate_reranks_quantized_embedding_candidates(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "EMBEDDING_ANN_STORAGE", "halfvec")
+    monkeypatch.setattr(settings, "EMBEDDING_ANN_RERANK_CANDIDATES", 25)
+    service = DeduplicationService(session=mock_db_session, similarity_threshold=0.92)
+    matched_id = uuid4()
+    mock_db_session.execute.return_value = SimpleNamespace(first=lambda: (matched_id, 0.05))
+
+    result = await service.find_duplicate(
+        embedding=[0.1, 0.2, 0.3],
+        embedding_model="text-embedding-3-small",
+    )
+
+    assert result.matched_item_id == matched_id
+    assert result.similarity == pytest.approx(0.95)
+    query = mock_db_session.execute.await_args.args[0]
+    compiled = query.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "CAST(raw_items.embedding AS HALFVEC(1536))" in sql
+    assert "anon_1.embedding <=>" in sql
+    assert 25 in compiled.params.values()
+
+
 @pytest.mark.asyncio
 async def test_find_duplicate_strips_embedding_model_before_similarity_lookup(
     mock_db_session,
@@ -251,3 +287,152 @@ async def test_find_embedding_match_excludes_current_item_id(mock_db_session) ->
     )
     query = mock_db_session.execute.await_args.args[0]
     assert "raw_items.id !=" in str(query)
+
+
+@pytest.mark.asyncio
+async def test_find_existing_identifiers_returns_matched_values_in_one_query(
+    mock_db_session,
+) -> None:
+    service = DeduplicationService(session=mock_db_session)
+    mock_db_session.execute.return_value = SimpleNamespace(
+        all=lambda: [
+            ("https://example.com/a", "https://example.com/a"),
+            ("legacy-guid", "https://example.com/b"),
+            (None, "https://other.example/unrelated"),
+        ]
+    )
+
+    known = await service.find_existing_identifiers(
+        ["https://example.com/a", "https://example.com/b", "https://example.com/a", "new"],
+        source_id=uuid4(),
+    )
+
+    assert known == {"https://example.com/a", "https://example.com/b"}
+    assert mock_db_session.execute.await_count == 1
+    query = str(mock_db_session.execute.await_args.args[0])
+    assert "raw_items.source_id" in query
+
+
+@pytest.mark.asyncio
+async def test_find_existing_identifiers_skips_query_for_empty_batch(mock_db_session) -> None:
+    service = DeduplicationService(session=mock_db_session)
+    mock_db_session.execute.return_value = SimpleNamespace(all=list)
+
+    assert await service.find_existing_identifiers([]) == set()
+    mock_db_session.execute.assert_not_awaited()
+
+    assert await service.find_existing_identifiers(["https://example.com/a"]) == set()
+    query = str(mock_db_session.execute.await_args.args[0])
+    assert "raw_items.source_id" not in query
+
+
+@pytest.mark.asyncio
+async def test_find_duplicates_bulk_resolves_batch_in_one_query(mock_db_session) -> None:
+    service = DeduplicationService(session=mock_db_session)
+    stored_id = uuid4()
+    first_id = uuid4()
+    mock_db_session.execute.return_value = SimpleNamespace(
+        all=lambda: [(stored_id, "stored-ext", "https://example.com/shared", None)]
+    )
+
+    results = await service.find_duplicates_bulk(
+        [
+            DuplicateCandidate(external_id="new-1", content_hash="hash-a", item_id=first_id),
+            DuplicateCandidate(external_id="new-2", url="https://www.example.com/shared/?utm=1"),
+            DuplicateCandidate(external_id="stored-ext", url="https://example.com/shared"),
+            DuplicateCandidate(external_id="new-3", content_hash="hash-a", item_id=uuid4()),
+            DuplicateCandidate(external_id="new-4", content_hash="hash-b"),
+        ]
+    )
+
+    assert [(r.is_duplicate, r.matched_item_id, r.match_reason) for r in results] == [
+        (False, None, None),
+        (True, stored_id, "url"),
+        (True, stored_id, "external_id"),
+        (True, first_id, "content_hash"),
+        (False, None, None),
+    ]
+    assert mock_db_session.execute.await_count == 1
+    query = str(mock_db_session.execute.await_args.args[0])
+    assert "raw_items.external_id IN" in query
+    assert "raw_items.id NOT IN" in query
+
+
+@pytest.mark.asyncio
+async def test_find_duplicates_bulk_skips_query_without_keys(mock_db_session) -> None:
+    service = DeduplicationService(session=mock_db_session)
+
+    assert await service.find_duplicates_bulk([]) == []
+    results = await service.find_duplicates_bulk([DuplicateCandidate(url="not-a-url")])
+
+    assert [result.is_duplicate for result in results] == [False]
+    mock_db_session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_find_duplicate_matches_minhash_before_embedding(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = DeduplicationService(session=mock_db_session)
+    stored_id = uuid4()
+    rows = [(uuid4(), None), (uuid4(), _signature("other")), (stored_id, _signature("wire"))]
+    mock_db_session.execute.return_value = SimpleNamespace(all=lambda: rows)
+
+    result = await service.find_duplicate(
+        minhash=_signature("wire", edits=2),
+        embedding=[0.1, 0.2, 0.3],
+        embedding_model="text-embedding-3-small",
+        exclude_item_id=uuid4(),
+    )
+
+    assert (result.is_duplicate, result.matched_item_id, result.match_reason) == (
+        True,
+        stored_id,
+        "minhash",
+    )
+    assert result.similarity is not None
+    assert result.similarity >= 0.8
+    assert mock_db_session.execute.await_count == 1
+    query = str(mock_db_session.execute.await_args.args[0])
+    assert "raw_items.minhash_bands &&" in query
+    assert "raw_items.id NOT IN" in query
+    assert (await service.find_duplicate(minhash=_signature("unrelated"))).is_duplicate is False
+    assert "raw_items.id NOT IN" not in str(mock_db_session.execute.await_args.args[0])
+
+    monkeypatch.setattr(settings, "DEDUP_MINHASH_ENABLED", False)
+    disabled = DeduplicationService(session=mock_db_session)
+    assert (await disabled.find_duplicate(minhash=_signature("wire"))).is_duplicate is False
+    assert mock_db_session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_find_duplicates_bulk_matches_minhash_against_stored_and_earlier_items(
+    mock_db_session,
+) -> None:
+    service = DeduplicationService(session=mock_db_session, minhash_threshold=0.8)
+    stored_id = uuid4()
+    first_id = uuid4()
+    mock_db_session.execute.side_effect = [
+        SimpleNamespace(all=list),
+        SimpleNamespace(all=lambda: [(stored_id, _signature("stored"))]),
+    ]
+
+    results = await service.find_duplicates_bulk(
+        [
+            DuplicateCandidate(external_id="a", minhash=_signature("stored", edits=1)),
+            DuplicateCandidate(external_id="b", minhash=_signature("fresh"), item_id=first_id),
+            DuplicateCandidate(external_id="c", minhash=_signature("fresh", edits=2)),
+            DuplicateCandidate(external_id="d", minhash=_signature("unrelated")),
+            DuplicateCandidate(external_id="e"),
+        ]
+    )
+
+    assert [(r.is_duplicate, r.matched_item_id, r.match_reason) for r in results] == [
+        (True, stored_id, "minhash"),
+        (False, None, None),
+        (True, first_id, "minhash"),
+        (False, None, None),
+        (False, None, None),
+    ]
+    assert mock_db_session.execute.await_count == 2
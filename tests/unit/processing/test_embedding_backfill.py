@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from src.processing.cost_tracker import BudgetExceededError
+from src.processing.embedding_backfill import EmbeddingBackfillRunner
+from src.processing.embedding_service import EmbeddingInputAudit
+
+pytestmark = pytest.mark.unit
+
+
+class FakeStore:
+    def __init__(self, pages: list[list[tuple[UUID, str]]]) -> None:
+        self.pages = pages
+        self.selects: list[Any] = []
+        self.updates: list[list[dict[str, Any]]] = []
+        self.commits = 0
+
+
+class FakeSession:
+    def __init__(self, store: FakeStore) -> None:
+        self.store = store
+
+    async def __aenter__(self) -> FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    async def execute(self, statement: Any, params: Any = None) -> SimpleNamespace:
+        if params is not None:
+            self.store.updates.append(params)
+            return SimpleNamespace()
+        self.store.selects.append(statement)
+        rows = self.store.pages.pop(0) if self.store.pages else []
+        return SimpleNamespace(all=lambda: rows)
+
+    async def commit(self) -> None:
+        self.store.commits += 1
+
+
+class FakeEmbeddingService:
+    model = "embed-v2"
+
+    def __init__(self, *, fail_on_call: int | None = None, error: Exception | None = None) -> None:
+        self.calls: list[list[str]] = []
+        self.fail_on_call = fail_on_call
+        self.error = error
+
+    async def embed_texts_with_contexts(
+        self,
+        texts: list[str],
+        *,
+        entity_type: str,
+        entity_ids: list[Any],
+    ) -> tuple[list[np.ndarray], list[EmbeddingInputAudit], int, int]:
+        assert entity_type == "raw_item"
+        assert len(entity_ids) == len(texts)
+        self.calls.append(texts)
+        if self.fail_on_call == len(self.calls):
+            msg = "embedding daily call limit (1) exceeded"
+            raise self.error or BudgetExceededError(msg)
+        audit = EmbeddingInputAudit(
+            original_tokens=5,
+            retained_tokens=5,
+            strategy="none",
+            was_truncated=False,
+            dropped_tail_tokens=0,
+            chunk_count=1,
+        )
+        vectors = [np.full(3, float(len(text)), dtype=np.float32) for text in texts]
+        return (vectors, [audit] * len(texts), 0, 1)
+
+
+def _rows(count: int) -> list[tuple[UUID, str]]:
+    ids = sorted(uuid4() for _ in range(count))
+    return [(row_id, f"text {index}") for index, row_id in enumerate(ids)]
+
+
+def _runner(
+    store: FakeStore,
+    service: FakeEmbeddingService,
+    checkpoint_path: Path,
+    **kwargs: Any,
+) -> EmbeddingBackfillRunner:
+    return EmbeddingBackfillRunner(
+        session_factory=lambda: FakeSession(store),
+        entity="raw_items",
+        checkpoint_path=checkpoint_path,
+        page_size=2,
+        embedding_service_factory=lambda _session: service,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_pages_by_keyset_and_writes_each_page(tmp_path: Path) -> None:
+    rows = _rows(3)
+    store = FakeStore([rows[:2], rows[2:]])
+    service = FakeEmbeddingService()
+    checkpoint_path = tmp_path / "raw.json"
+
+    progress = await _runner(store, service, checkpoint_path).run()
+
+    assert progress.completed is True
+    assert progress.embedded == 3
+    assert progress.pages == 2
+    assert progress.api_calls == 2
+    assert progress.last_id == str(rows[2][0])
+    assert service.calls == [["text 0", "text 1"], ["text 2"]]
+    assert "raw_items.id >" not in str(store.selects[0])
+    assert "raw_items.id >" in str(store.selects[1])
+    assert "IS DISTINCT FROM" in str(store.selects[0])
+    written = [row for page in store.updates for row in page]
+    assert [row["id"] for row in written] == [row_id for row_id, _text in rows]
+    assert {row["embedding_model"] for row in written} == {"embed-v2"}
+    assert json.loads(checkpoint_path.read_text(encoding="utf-8"))["completed"] is True
+
+
+@pytest.mark.asyncio
+async def test_backfill_stops_at_budget_and_resumes_after_last_written_page(
+    tmp_path: Path,
+) -> None:
+    rows = _rows(4)
+    checkpoint_path = tmp_path / "raw.json"
+    store = FakeStore([rows[:2], rows[2:]])
+
+    stopped = await _runner(store, FakeEmbeddingService(fail_on_call=2), checkpoint_path).run()
+
+    assert stopped.completed is False
+    assert stopped.stopped_reason is not None
+    assert stopped.stopped_reason.startswith("budget:")
+    assert stopped.last_id == str(rows[1][0])
+    assert len(store.updates) == 1
+
+    resumed_store = FakeStore([rows[2:]])
+    resumed = await _runner(resumed_store, FakeEmbeddingService(), checkpoint_path).run()
+
+    assert resumed.completed is True
+    assert resumed.embedded == 4
+    assert resumed.pages == 2
+    cursor_params = resumed_store.selects[0].compile().params
+    assert rows[1][0] in cursor_params.values()
+
+
+@pytest.mark.asyncio
+async def test_backfill_honours_api_call_cap_and_restart(tmp_path: Path) -> None:
+    rows = _rows(4)
+    checkpoint_path = tmp_path / "raw.json"
+    store = FakeStore([rows[:2], rows[2:]])
+    service = FakeEmbeddingService()
+
+    progress = await _runner(store, service, checkpoint_path, max_api_calls=1).run()
+
+    assert progress.stopped_reason == "max_api_calls"
+    assert progress.embedded == 2
+    assert len(service.calls) == 1
+
+    restart_store = FakeStore([rows[:2]])
+    restarted = await _runner(restart_store, FakeEmbeddingService(), checkpoint_path).run(
+        restart=True
+    )
+    assert restarted.embedded == 2
+    assert "raw_items.id >" not in str(restart_store.selects[0])
+
+
+def test_backfill_rejects_invalid_configuration(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="entity must be one of"):
+        EmbeddingBackfillRunner(
+            session_factory=lambda: None, entity="trends", checkpoint_path=tmp_path / "x.json"
+        )
+    with pytest.raises(ValueError, match="page_size"):
+        EmbeddingBackfillRunner(
+            session_factory=lambda: None,
+            entity="events",
+            checkpoint_path=tmp_path / "x.json",
+            page_size=0,
+        )
+    with pytest.raises(ValueError, match="max_items_per_minute"):
+        EmbeddingBackfillRunner(
+            session_factory=lambda: None,
+            entity="events",
+            checkpoint_path=tmp_path / "x.json",
+            max_items_per_minute=0,
+        )
+
+
+@pytest.mark.asyncio
+async def test_backfill_paces_pages_and_drains_queued_pages_after_stopping(
+    tmp_path: Path,
+) -> None:
+    rows = _rows(16)
+    store = FakeStore([rows[index : index + 2] for index in range(0, 16, 2)])
+    service = FakeEmbeddingService()
+    runner = _runner(
+        store,
+        service,
+        tmp_path / "raw.json",
+        max_api_calls=2,
+        max_items_per_minute=12_000,
+        monotonic_fn=lambda: 0.0,
+    )
+
+    progress = await runner.run()
+
+    assert progress.stopped_reason == "max_api_calls"
+    assert progress.embedded == 4
+    assert progress.last_id == str(rows[3][0])
+    assert len(service.calls) == 2
+    # The reader saw the stop signal and left the rest of the scope unread.
+    assert store.pages
+
+
+@pytest.mark.asyncio
+async def test_backfill_cancels_every_stage_when_one_fails(tmp_path: Path) -> None:
+    rows = _rows(4)
+    store = FakeStore([rows[:2], rows[2:]])
+    service = FakeEmbeddingService(fail_on_call=1, error=RuntimeError("provider down"))
+    checkpoint_path = tmp_path / "raw.json"
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        await _runner(store, service, checkpoint_path).run()
+
+    assert store.updates == []
+    assert not checkpoint_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_backfill_starts_fresh_from_unreadable_or_foreign_checkpoints(
+    tmp_path: Path,
+) -> None:
+    rows = _rows(1)
+    checkpoint_path = tmp_path / "raw.json"
+    foreign = {"entity": "raw_items", "target_model": "embed-v1", "last_id": str(rows[0][0])}
+
+    for content in ("not json", json.dumps({"unexpected": 1}), json.dumps(foreign)):
+        checkpoint_path.write_text(content, encoding="utf-8")
+        store = FakeStore([rows])
+
+        progress = await _runner(store, FakeEmbeddingService(), checkpoint_path).run()
+
+        assert progress.target_model == "embed-v2"
+        assert progress.embedded == 1
+        assert "raw_items.id >" not in str(store.selects[0])
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+import src.processing.embedding_cache as embedding_cache_module
+from src.processing.embedding_cache import SharedEmbeddingCache, get_shared_embedding_cache
+from src.processing.embedding_service import EmbeddingService
+
+pytestmark = pytest.mark.unit
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.index: dict[str, dict[str, float]] = {}
+        self.fail = False
+
+    def pipeline(self, *, transaction: bool) -> FakePipeline:
+        assert transaction is False
+        return FakePipeline(self)
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        if self.fail:
+            raise ConnectionError("down")
+        return [self.values.get(key) for key in keys]
+
+    def setex(self, key: str, ttl: int, value: bytes) -> bool:
+        self.values[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.index.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zremrangebyscore(self, key: str, low: str, high: float) -> int:
+        assert low == "-inf"
+        stale = [member for member, score in self.index.get(key, {}).items() if score <= high]
+        for member in stale:
+            del self.index[key][member]
+        return len(stale)
+
+    def expire(self, key: str, ttl: int) -> bool:
+        self.ttls[key] = ttl
+        return True
+
+    def zcard(self, key: str) -> int:
+        return len(self.index.get(key, {}))
+
+    def zrange(self, key: str, start: int, stop: int) -> list[str]:
+        ordered = sorted(self.index.get(key, {}).items(), key=lambda pair: pair[1])
+        return [member for member, _score in ordered[start : stop + 1]]
+
+    def zrem(self, key: str, *members: str) -> int:
+        for member in members:
+            self.index[key].pop(member, None)
+        return len(members)
+
+    def delete(self, *keys: str) -> int:
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args: self.calls.append((name, args))
+
+    def execute(self) -> list[Any]:
+        if self.redis.fail:
+            raise ConnectionError("down")
+        return [getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+def _cache(
+    redis_client: FakeRedis, clock: dict[str, float], **overrides: Any
+) -> SharedEmbeddingCache:
+    options: dict[str, Any] = {
+        "enabled": True,
+        "ttl_seconds": 100,
+        "max_entries": 2,
+        "redis_prefix": "test:embeddings",
+        "redis_client": redis_client,
+        "wall_time_fn": lambda: clock["now"],
+    }
+    options.update(overrides)
+    return SharedEmbeddingCache(**options)
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_round_trips_float32_vectors_and_evicts_oldest() -> None:
+    redis_client = FakeRedis()
+    clock = {"now": 0.0}
+    cache = _cache(redis_client, clock)
+
+    await cache.set_many("model:3", {"a": [0.5, 1.25, -2.0], "b": [0.1, 0.2, 0.3]})
+    assert len(redis_client.values["test:embeddings:model:3:a"]) == 12
+    assert redis_client.ttls["test:embeddings:model:3:a"] == 100
+    vectors = await cache.get_many("model:3", ["a", "b", "missing"], dimensions=3)
+    assert vectors[0].dtype == np.float32
+    assert vectors[0].tolist() == [0.5, 1.25, -2.0]
+    # Callers own the returned arrays and may normalise them in place.
+    vectors[0] /= np.float32(2.0)
+    assert vectors[0].tolist() == [0.25, 0.625, -1.0]
+    assert vectors[1].tolist() == pytest.approx([0.1, 0.2, 0.3])
+    assert vectors[2] is None
+    assert await cache.get_many("model:3", ["a"], dimensions=4) == [None]
+    assert await cache.get_many("other:3", ["a"], dimensions=3) == [None]
+
+    clock["now"] = 10.0
+    await cache.set_many("model:3", {"c": [1.0, 2.0, 3.0]})
+    evicted, kept = await cache.get_many("model:3", ["a", "c"], dimensions=3)
+    assert evicted is None
+    assert kept.tolist() == [1.0, 2.0, 3.0]
+    assert set(redis_client.index["test:embeddings:model:3:index"]) == {
+        "test:embeddings:model:3:b",
+        "test:embeddings:model:3:c",
+    }
+    await cache.set_many("model:3", {})
+    assert await cache.get_many("model:3", [], dimensions=3) == []
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_skips_eviction_when_another_writer_already_trimmed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis_client = FakeRedis()
+    cache = _cache(redis_client, {"now": 0.0}, max_entries=1)
+    # A concurrent writer evicted the overflow between ZCARD and ZRANGE.
+    monkeypatch.setattr(redis_client, "zrange", lambda *_args: [])
+    delete = MagicMock()
+    monkeypatch.setattr(redis_client, "delete", delete)
+
+    await cache.set_many("model:1", {"a": [1.0], "b": [2.0]})
+
+    delete.assert_not_called()
+    assert set(redis_client.values) == {"test:embeddings:model:1:a", "test:embeddings:model:1:b"}
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_degrades_to_misses_and_skips_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis_client = FakeRedis()
+    redis_client.fail = True
+    from_url = MagicMock(return_value=redis_client)
+    monkeypatch.setattr("src.processing.embedding_cache.redis.Redis.from_url", from_url)
+    cache = SharedEmbeddingCache(enabled=True, redis_url=" redis://cache:6379/0 ", redis_prefix=" ")
+
+    await cache.set_many("model:1", {"a": [1.0]})
+    redis_client.fail = False
+    assert await cache.get_many("model:1", ["a"], dimensions=1) == [None]
+    assert cache.redis_prefix == "horadus:embedding_cache"
+    from_url.assert_called_once_with("redis://cache:6379/0")
+    assert redis_client.values == {}
+
+    disabled = SharedEmbeddingCache(enabled=False, redis_client=redis_client)
+    await disabled.set_many("model:1", {"a": [1.0]})
+    assert await disabled.get_many("model:1", ["a"], dimensions=1) == [None]
+    assert redis_client.values == {}
+
+
+def test_get_shared_embedding_cache_builds_process_wide_instance_from_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(embedding_cache_module.settings, "EMBEDDING_SHARED_CACHE_MAX_ENTRIES", 7)
+    get_shared_embedding_cache.cache_clear()
+    try:
+        cache = get_shared_embedding_cache()
+        assert cache.max_entries == 7
+        assert get_shared_embedding_cache() is cache
+    finally:
+        get_shared_embedding_cache.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_embedding_services_share_vectors_across_instances(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    recorded: list[tuple[str, int, int]] = []
+    monkeypatch.setattr(
+        "src.processing.embedding_service.record_embedding_cache_lookups",
+        lambda *, tier, hits, misses: recorded.append((tier, hits, misses)),
+    )
+    shared = _cache(FakeRedis(), {"now": 0.0}, max_entries=100)
+    calls: list[list[str]] = []
+
+    async def create(*, model: str, input: list[str]) -> SimpleNamespace:
+        calls.append(input)
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(index=index, embedding=[float(len(text)), 0.5, 0.25])
+                for index, text in enumerate(input)
+            ]
+        )
+
+    def build(model: str = "model-a") -> EmbeddingService:
+        return EmbeddingService(
+            session=mock_db_session,
+            client=SimpleNamespace(embeddings=SimpleNamespace(create=create)),
+            model=model,
+            dimensions=3,
+            cost_tracker=SimpleNamespace(
+                ensure_within_budget=AsyncMock(), record_usage=AsyncMock()
+            ),
+            shared_cache=shared,
+        )
+
+    first = await build().embed_texts(["alpha", "beta"])
+    second_service = build()
+    second = await second_service.embed_texts(["alpha", "beta", "alpha", "gamma"])
+    again = await second_service.embed_texts(["beta"])
+    other_model = await build("model-b").embed_texts(["alpha"])
+
+    assert first[1:] == (0, 1)
+    assert [vector.tolist() for vector in second[0][:2]] == [vector.tolist() for vector in first[0]]
+    assert second[1:] == (3, 1)
+    assert again[1:] == (1, 0)
+    assert other_model[1:] == (0, 1)
+    assert calls == [["alpha", "beta"], ["gamma"], ["alpha"]]
+    assert recorded[:4] == [
+        ("memory", 0, 2),
+        ("shared", 0, 2),
+        ("memory", 0, 4),
+        ("shared", 2, 1),
+    ]
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import sys
 from dataclasses import dataclass
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+import numpy as np
 import pytest
 
+from src.processing.cost_tracker import BudgetExceededError
 from src.processing.embedding_service import EmbeddingInputAudit, EmbeddingService
 from src.storage.models import Event, RawItem
 
@@ -78,7 +81,7 @@ async def test_embed_texts_batches_requests_and_counts_cache_hits(mock_db_sessio
     )
 
     assert len(vectors) == 4
-    assert vectors[0] == vectors[2]
+    assert vectors[0].tolist() == vectors[2].tolist()
     assert cache_hits == 0
     assert api_calls == 2
     assert embeddings_api.calls == [
@@ -99,7 +102,7 @@ async def test_embed_texts_reuses_cache_across_calls(mock_db_session) -> None:
     first = await service.embed_text("cached")
     vectors, cache_hits, api_calls = await service.embed_texts(["cached", "new"])
 
-    assert vectors[0] == first
+    assert vectors[0].tolist() == first.tolist()
     assert cache_hits == 1
     assert api_calls == 1
     assert len(embeddings_api.calls) == 2
@@ -461,7 +464,7 @@ async def test_request_embeddings_uses_total_tokens_when_prompt_tokens_missing(
     service.client = SimpleNamespace(embeddings=TotalTokensAPI())
     vectors = await service._request_embeddings(["one"])
 
-    assert vectors == [[1.0, 2.0, 3.0]]
+    assert [vector.tolist() for vector in vectors] == [[1.0, 2.0, 3.0]]
     cost_tracker.record_usage.assert_awaited_once()
     assert cost_tracker.record_usage.await_args.kwargs["input_tokens"] == 12
 
@@ -487,7 +490,7 @@ async def test_request_embeddings_prefers_prompt_tokens_and_handles_empty_inputs
     service.client = SimpleNamespace(embeddings=PromptTokensAPI())
     vectors = await service._request_embeddings(["one"])
 
-    assert vectors == [[1.0, 2.0, 3.0]]
+    assert [vector.tolist() for vector in vectors] == [[1.0, 2.0, 3.0]]
     cost_tracker.record_usage.assert_awaited_once()
     assert cost_tracker.record_usage.await_args.kwargs["input_tokens"] == 7
 
@@ -690,7 +693,9 @@ def test_cache_helpers_chunking_and_average_vector_behaviors(mock_db_session) ->
         service._average_vectors([])
     with pytest.raises(ValueError, match="dimension mismatch"):
         service._average_vectors([[1.0, 2.0]])
-    assert service._average_vectors([[1.0, 2.0, 3.0], [3.0, 4.0, 5.0]]) == [2.0, 3.0, 4.0]
+    averaged = service._average_vectors([[1.0, 2.0, 3.0], [3.0, 4.0, 5.0]])
+    assert averaged.dtype == np.float32
+    assert averaged.tolist() == [2.0, 3.0, 4.0]
 
 
 def test_prepare_input_record_audit_and_normalize_helpers(
@@ -739,3 +744,108 @@ def test_prepare_input_record_audit_and_normalize_helpers(
     assert EmbeddingService._normalize_text("  alpha   beta  ") == "alpha beta"
     with pytest.raises(ValueError, match="must not be empty"):
         EmbeddingService._normalize_text("   ")
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_runs_requests_concurrently_up_to_limit_in_order(
+    mock_db_session,
+) -> None:
+    service, _embeddings_api, cost_tracker = _build_service(
+        mock_db_session=mock_db_session,
+        batch_size=1,
+        max_input_tokens=2,
+        input_policy="chunk",
+    )
+    service._request_slots = asyncio.Semaphore(2)
+    in_flight = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def create(*, model: str, input: list[str]) -> SimpleNamespace:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        if peak == 2:
+            release.set()
+        await release.wait()
+        in_flight -= 1
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=0, embedding=[float(len(input[0])), 1.0, 2.0])]
+        )
+
+    service.client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+
+    vectors, _hits, api_calls = await service.embed_texts(["a", "bbb", "cccc dddddd", "ee"])
+
+    assert peak == 2
+    assert api_calls == 5
+    np.testing.assert_array_equal(
+        np.stack(vectors),
+        [[1.0, 1.0, 2.0], [3.0, 1.0, 2.0], [5.0, 1.0, 2.0], [2.0, 1.0, 2.0]],
+    )
+    assert cost_tracker.ensure_within_budget.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_reserve_budget_before_launching(mock_db_session) -> None:
+    service, _embeddings_api, cost_tracker = _build_service(
+        mock_db_session=mock_db_session,
+        batch_size=1,
+    )
+    service._request_slots = asyncio.Semaphore(3)
+    budget_checks: list[tuple[int, int]] = []
+    launched: list[str] = []
+
+    async def ensure_within_budget(
+        _tier: str,
+        *,
+        provider: str,
+        model: str,
+        reserved_calls: int,
+        reserved_input_tokens: int,
+    ) -> None:
+        del provider, model
+        budget_checks.append((reserved_calls, reserved_input_tokens))
+        if reserved_calls >= 1:
+            raise BudgetExceededError("embedding daily call limit (1) exceeded")
+
+    async def create(*, model: str, input: list[str]) -> SimpleNamespace:
+        launched.extend(input)
+        await asyncio.sleep(0)
+        return SimpleNamespace(data=[SimpleNamespace(index=0, embedding=[1.0, 0.0, 0.0])])
+
+    cost_tracker.ensure_within_budget = AsyncMock(side_effect=ensure_within_budget)
+    service.client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+
+    with pytest.raises(BudgetExceededError, match="call limit"):
+        await service.embed_texts(["aaaa", "bbbb", "cccc"])
+
+    assert launched == ["aaaa"]
+    assert budget_checks[:2] == [(0, 0), (1, 1)]
+    assert service._reserved_calls == 0
+    assert service._reserved_input_tokens == 0
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_cancels_pending_requests_when_one_fails(mock_db_session) -> None:
+    service, _embeddings_api, _cost_tracker = _build_service(
+        mock_db_session=mock_db_session,
+        batch_size=1,
+    )
+    cancelled = asyncio.Event()
+
+    async def create(*, model: str, input: list[str]) -> SimpleNamespace:
+        if input == ["fails"]:
+            raise ValueError("provider rejected input")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        raise AssertionError("unreachable")
+
+    service.client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+
+    with pytest.raises(ValueError, match="provider rejected input"):
+        await service.embed_texts(["slow", "fails"])
+    assert cancelled.is_set()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+import src.processing.event_centroid as event_centroid_module
+import src.processing.event_clusterer as event_clusterer_module
+import src.processing.event_lineage as event_lineage_module
+from src.processing.event_centroid import (
+    add_to_event_centroid,
+    event_match_embedding,
+    event_match_embedding_column,
+    merge_event_centroids,
+    rebuild_event_centroid,
+    remove_from_event_centroid,
+)
+from src.processing.event_clusterer import EventClusterer
+from src.processing.event_lineage import _EventItemRow, _refresh_event_after_item_change
+from src.storage.models import Event, EventItem, RawItem
+
+pytestmark = pytest.mark.unit
+
+MODEL = "text-embedding-3-small"
+
+
+def _event(embedding: list[float] | None = None, **kwargs: object) -> Event:
+    return Event(
+        id=uuid4(),
+        canonical_summary="event",
+        source_count=1,
+        unique_source_count=1,
+        primary_item_id=uuid4(),
+        embedding=embedding,
+        embedding_model=MODEL if embedding is not None else None,
+        **kwargs,
+    )
+
+
+def _item(embedding: list[float] | None, *, model: str | None = MODEL) -> RawItem:
+    return RawItem(
+        id=uuid4(),
+        source_id=uuid4(),
+        external_id=f"item-{uuid4()}",
+        title="title",
+        raw_content="body",
+        content_hash="a" * 64,
+        embedding=embedding,
+        embedding_model=model,
+        published_at=datetime(2026, 3, 2, tzinfo=UTC),
+    )
+
+
+def test_running_sum_adds_removes_and_merges_unit_vectors() -> None:
+    event = _event([3.0, 0.0])
+    rebuild_event_centroid(event, [([3.0, 0.0], MODEL), ([0.0, 5.0], MODEL), ([1.0, 1.0], "x")])
+
+    assert event.embedding_centroid_count == 2
+    np.testing.assert_allclose(event.embedding_centroid_sum, [1.0, 1.0])
+    assert add_to_event_centroid(event, [0.0, 2.0], MODEL) is True
+    assert add_to_event_centroid(event, [0.0, 2.0], "other-model") is False
+    assert add_to_event_centroid(event, [0.0, 0.0], MODEL) is False
+    np.testing.assert_allclose(event.embedding_centroid_sum, [1.0, 2.0], rtol=1e-6)
+
+    remove_from_event_centroid(event, [([0.0, 4.0], MODEL), ([9.0, 9.0], "other-model")])
+    assert event.embedding_centroid_count == 2
+    np.testing.assert_allclose(event.embedding_centroid_sum, [1.0, 1.0], atol=1e-6)
+
+    source = _event([0.0, 1.0])
+    assert merge_event_centroids(event, source) is True
+    assert event.embedding_centroid_count == 3
+    np.testing.assert_allclose(event.embedding_centroid_sum, [1.0, 2.0], atol=1e-6)
+    assert merge_event_centroids(event, _event(None)) is False
+
+
+def test_centroid_updates_start_empty_and_skip_other_dimensions() -> None:
+    event = _event(None)
+    event.embedding_model = MODEL
+
+    assert add_to_event_centroid(event, [3.0, 4.0], MODEL) is True
+    assert event.embedding_centroid_count == 1
+    np.testing.assert_allclose(event.embedding_centroid_sum, [0.6, 0.8], rtol=1e-6)
+    assert add_to_event_centroid(event, [1.0, 0.0, 0.0], MODEL) is False
+
+    remove_from_event_centroid(event, [([1.0, 0.0, 0.0], MODEL), ([0.0, 0.0], MODEL)])
+    assert event.embedding_centroid_count == 1
+    np.testing.assert_allclose(event.embedding_centroid_sum, [0.6, 0.8], rtol=1e-6)
+
+    target = _event(None)
+    target.embedding_model = MODEL
+    assert merge_event_centroids(target, event) is True
+    assert target.embedding_centroid_count == 1
+    np.testing.assert_allclose(target.embedding_centroid_sum, [0.6, 0.8], rtol=1e-6)
+    assert merge_event_centroids(target, _event([1.0, 0.0, 0.0])) is False
+    assert target.embedding_centroid_count == 1
+
+
+def test_legacy_event_seeds_centroid_from_stored_embedding() -> None:
+    event = _event([2.0, 0.0])
+
+    assert add_to_event_centroid(event, [0.0, 1.0], MODEL) is True
+
+    assert event.embedding_centroid_count == 2
+    np.testing.assert_allclose(event.embedding_centroid_sum, [1.0, 1.0])
+
+
+def test_match_embedding_follows_mode_without_touching_stored_embedding() -> None:
+    event = _event([1.0, 0.0])
+    assert event_match_embedding(event, mode="centroid") == [1.0, 0.0]
+
+    rebuild_event_centroid(event, [([1.0, 0.0], MODEL)])
+    add_to_event_centroid(event, [0.0, 1.0], MODEL)
+
+    assert event_match_embedding(event, mode="seed") == [1.0, 0.0]
+    np.testing.assert_allclose(event_match_embedding(event, mode="centroid"), [1.0, 1.0])
+    assert event.embedding == [1.0, 0.0]
+
+
+def test_match_embedding_column_reads_centroid_sum_only_in_centroid_mode() -> None:
+    assert event_match_embedding_column(mode="seed") is Event.embedding
+    assert str(event_match_embedding_column(mode="centroid")) == (
+        "coalesce(events.embedding_centroid_sum, events.embedding)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_merge_into_event_keeps_seed_embedding_and_audit_fields(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(event_centroid_module.settings, "CLUSTER_EVENT_EMBEDDING_MODE", "centroid")
+    monkeypatch.setattr(event_clusterer_module, "update_cluster_health_after_merge", AsyncMock())
+    clusterer = EventClusterer(session=mock_db_session)
+    clusterer._update_primary_item = AsyncMock(return_value=False)
+    clusterer._count_unique_sources = AsyncMock(return_value=2)
+    clusterer._refresh_event_provenance = AsyncMock()
+    clusterer.lifecycle_manager.on_event_mention = MagicMock()
+    seed = _item([1.0, 0.0])
+    seed.embedding_generated_at = datetime(2026, 3, 1, tzinfo=UTC)
+    seed.embedding_input_tokens = 12
+    event = await clusterer._create_event(seed)
+    audit = (
+        event.embedding_model,
+        event.embedding_generated_at,
+        event.embedding_input_tokens,
+    )
+
+    assert event.embedding_centroid_count == 1
+    await clusterer._merge_into_event(event, _item([0.0, 3.0]))
+
+    assert event.embedding_centroid_count == 2
+    # The stored embedding stays the vector its audit fields describe.
+    assert event.embedding == seed.embedding
+    assert (
+        event.embedding_model,
+        event.embedding_generated_at,
+        event.embedding_input_tokens,
+    ) == audit
+    np.testing.assert_allclose(event_match_embedding(event), [1.0, 1.0])
+    await clusterer._merge_into_event(event, _item([0.0, 1.0], model="other-model"))
+    assert event.embedding_centroid_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lineage_refresh_keeps_running_sums_and_rebuilds_when_out_of_step(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(event_centroid_module.settings, "CLUSTER_EVENT_EMBEDDING_MODE", "centroid")
+    items = [_item([1.0, 0.0]), _item([0.0, 1.0]), _item([0.0, 1.0])]
+    event = _event([1.0, 0.0])
+    rebuild_event_centroid(event, [(item.embedding, MODEL) for item in items])
+    rows = [
+        _EventItemRow(link=EventItem(event_id=event.id, item_id=item.id), item=item)
+        for item in items[:2]
+    ]
+    monkeypatch.setattr(event_lineage_module, "_load_event_item_rows", AsyncMock(return_value=rows))
+    monkeypatch.setattr(
+        event_lineage_module, "_pick_primary_item", AsyncMock(return_value=items[0])
+    )
+    monkeypatch.setattr(event_lineage_module, "refresh_event_provenance", AsyncMock())
+    monkeypatch.setattr(event_lineage_module, "_mark_event_replay_pending", AsyncMock())
+    monkeypatch.setattr(event_lineage_module, "_mark_event_claims_stale", AsyncMock())
+
+    remove_from_event_centroid(event, [(items[2].embedding, MODEL)])
+    event.embedding_centroid_sum = np.array([7.0, 7.0], dtype=np.float32)
+    await _refresh_event_after_item_change(session=mock_db_session, event=event)
+
+    # Counts match the linked rows, so the stored sum is used without re-reading vectors.
+    np.testing.assert_allclose(event.embedding_centroid_sum, [7.0, 7.0])
+
+    event.embedding_centroid_count = 5
+    await _refresh_event_after_item_change(session=mock_db_session, event=event)
+
+    assert event.embedding_centroid_count == 2
+    np.testing.assert_allclose(event.embedding_centroid_sum, [1.0, 1.0])
+    assert event.embedding == [1.0, 0.0]
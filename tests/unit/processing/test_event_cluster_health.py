@@ -6,6 +6,7 @@ from uuid import uuid4
 
 import pytest
 
+from src.processing.event_centroid import add_to_event_centroid
 from src.processing.event_cluster_health import (
     apply_default_cluster_health,
     apply_merge_cluster_health,
@@ -15,6 +16,7 @@ from src.processing.event_cluster_health import (
     ensure_cluster_health,
     resolve_cluster_health,
     split_risk_score,
+    update_cluster_health_after_merge,
 )
 
 pytestmark = pytest.mark.unit
@@ -264,3 +266,239 @@ async def test_resolve_cluster_health_filters_to_event_embedding_model() -> None
     query_text = str(session.scalars.await_args.args[0]).lower()
     assert "raw_items.embedding_model = :embedding_model_1" in query_text
     assert "raw_items.embedding_model is null" in query_text
+
+
+def _centroid_event(**kwargs: object) -> SimpleNamespace:
+    defaults: dict[str, object] = {
+        "id": uuid4(),
+        "embedding": None,
+        "embedding_model": "text-embedding-3-small",
+        "embedding_centroid_sum": None,
+        "embedding_centroid_count": 0,
+        "provenance_summary": {},
+    }
+    return SimpleNamespace(**{**defaults, **kwargs})
+
+
+@pytest.mark.asyncio
+async def test_update_cluster_health_after_merge_rebuilds_then_folds_incrementally() -> None:
+    event = _centroid_event()
+    first_id, second_id, merged_id = uuid4(), uuid4(), uuid4()
+    rows = [(first_id, [1.0, 0.0]), (second_id, [1.0, 1.0])]
+    session = AsyncMock()
+    session.execute.return_value = SimpleNamespace(all=lambda: rows)
+
+    # No running stats yet, so the first merge rebuilds centroid and health exactly.
+    await update_cluster_health_after_merge(
+        session=session,
+        event=event,
+        item_id=second_id,
+        item_embedding=[1.0, 1.0],
+        prior_health=None,
+    )
+
+    prior = event.provenance_summary["cluster_health"]
+    assert event.embedding_centroid_count == 2
+    assert prior["member_count"] == 2
+    assert set(prior["outlier_item_ids"]) == {str(first_id), str(second_id)}
+    assert prior["split_risk_score"] == pytest.approx(1.0 - 2**-0.5, abs=1e-6)
+
+    assert add_to_event_centroid(event, [0.0, 1.0], event.embedding_model) is True
+    event.provenance_summary = {}
+    await update_cluster_health_after_merge(
+        session=session,
+        event=event,
+        item_id=merged_id,
+        item_embedding=[0.0, 1.0],
+        prior_health=prior,
+    )
+
+    expected = SimpleNamespace(provenance_summary={})
+    apply_repaired_cluster_health(expected, item_embeddings=[[1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+    payload = event.provenance_summary["cluster_health"]
+    assert payload["cluster_cohesion_score"] == pytest.approx(
+        cluster_cohesion_score(expected), abs=1e-5
+    )
+    assert payload["split_risk_score"] == pytest.approx(split_risk_score(expected), abs=1e-5)
+    assert payload["member_count"] == 3
+    assert str(merged_id) in payload["outlier_item_ids"]
+    assert "raw_items.id in" in str(session.execute.await_args.args[0]).lower()
+
+
+@pytest.mark.asyncio
+async def test_update_cluster_health_after_merge_keeps_prior_when_item_not_folded() -> None:
+    prior = {
+        "cluster_cohesion_score": 0.6,
+        "split_risk_score": 0.4,
+        "member_count": 2,
+        "outlier_item_ids": [str(uuid4())],
+    }
+    event = _centroid_event(embedding_centroid_sum=[1.0, 1.0], embedding_centroid_count=2)
+    session = AsyncMock()
+
+    await update_cluster_health_after_merge(
+        session=session,
+        event=event,
+        item_id=uuid4(),
+        item_embedding=None,
+        prior_health=prior,
+    )
+
+    assert event.provenance_summary["cluster_health"] == prior
+    session.execute.assert_not_called()
+
+    unsaved = _centroid_event(
+        id=None,
+        embedding_centroid_sum=[1.0, 0.0],
+        embedding_centroid_count=1,
+    )
+    await update_cluster_health_after_merge(
+        session=session,
+        event=unsaved,
+        item_id=uuid4(),
+        item_embedding=[1.0, 0.0],
+        prior_health=None,
+    )
+
+    assert cluster_health_payload(unsaved) == {
+        "cluster_cohesion_score": 1.0,
+        "split_risk_score": 0.0,
+    }
+    assert unsaved.embedding_centroid_count == 1
+    session.execute.assert_not_called()
+
+
+def test_apply_repaired_cluster_health_skips_unparseable_and_non_finite_embeddings() -> None:
+    event = SimpleNamespace(provenance_summary={})
+
+    apply_repaired_cluster_health(
+        event,
+        item_embeddings=[
+            ["not", "numeric"],
+            [[1.0, 0.0]],
+            [],
+            [1.0, float("nan")],
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ],
+    )
+
+    assert cluster_cohesion_score(event) == pytest.approx(0.0)
+    assert split_risk_score(event) == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_update_cluster_health_after_merge_folds_first_tracked_member() -> None:
+    item_id = uuid4()
+    prior = {
+        "cluster_cohesion_score": 1.0,
+        "split_risk_score": 0.25,
+        "member_count": 0,
+        "outlier_item_ids": [],
+    }
+    event = _centroid_event(embedding_centroid_sum=[1.0, 0.0], embedding_centroid_count=1)
+    session = AsyncMock()
+
+    await update_cluster_health_after_merge(
+        session=session,
+        event=event,
+        item_id=item_id,
+        item_embedding=[2.0, 0.0],
+        prior_health=prior,
+    )
+
+    assert event.provenance_summary["cluster_health"] == {
+        "cluster_cohesion_score": 1.0,
+        "split_risk_score": 0.25,
+        "member_count": 1,
+        "outlier_item_ids": [str(item_id)],
+    }
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("prior_health", "item_embedding"),
+    [
+        # Legacy payloads carry scores but no running counters.
+        ({"cluster_cohesion_score": 0.5, "split_risk_score": 0.5}, [0.0, 1.0]),
+        # Stored outlier ids that no longer parse cannot seed the running stats.
+        (
+            {
+                "cluster_cohesion_score": 0.5,
+                "split_risk_score": 0.5,
+                "member_count": 1,
+                "outlier_item_ids": ["not-a-uuid"],
+            },
+            [0.0, 1.0],
+        ),
+        # The counter drifted from the centroid, e.g. after a lineage repair.
+        (
+            {
+                "cluster_cohesion_score": 0.5,
+                "split_risk_score": 0.5,
+                "member_count": 5,
+                "outlier_item_ids": [],
+            },
+            [0.0, 1.0],
+        ),
+        # A zero vector has no direction to compare against the members.
+        (
+            {
+                "cluster_cohesion_score": 0.5,
+                "split_risk_score": 0.5,
+                "member_count": 1,
+                "outlier_item_ids": [],
+            },
+            [0.0, 0.0],
+        ),
+    ],
+)
+async def test_update_cluster_health_after_merge_rebuilds_when_running_stats_are_unusable(
+    prior_health: dict[str, object],
+    item_embedding: list[float],
+) -> None:
+    first_id, second_id = uuid4(), uuid4()
+    event = _centroid_event(embedding_centroid_sum=[1.0, 1.0], embedding_centroid_count=2)
+    session = AsyncMock()
+    session.execute.return_value = SimpleNamespace(
+        all=lambda: [(first_id, [1.0, 0.0]), (second_id, [0.0, 1.0])]
+    )
+
+    await update_cluster_health_after_merge(
+        session=session,
+        event=event,
+        item_id=second_id,
+        item_embedding=item_embedding,
+        prior_health=prior_health,
+    )
+
+    payload = event.provenance_summary["cluster_health"]
+    assert payload["cluster_cohesion_score"] == pytest.approx(0.0)
+    assert payload["split_risk_score"] == pytest.approx(1.0)
+    assert payload["member_count"] == 2
+    assert set(payload["outlier_item_ids"]) == {str(first_id), str(second_id)}
+    assert event.embedding_centroid_count == 2
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_cluster_health_after_merge_drops_running_stats_without_members() -> None:
+    event = _centroid_event(embedding_centroid_sum=[1.0, 0.0], embedding_centroid_count=1)
+    session = AsyncMock()
+    session.execute.return_value = SimpleNamespace(all=list)
+
+    await update_cluster_health_after_merge(
+        session=session,
+        event=event,
+        item_id=uuid4(),
+        item_embedding=[1.0, 0.0],
+        prior_health=None,
+    )
+
+    assert event.embedding_centroid_sum is None
+    assert event.embedding_centroid_count == 0
+    assert event.provenance_summary["cluster_health"] == {
+        "cluster_cohesion_score": 1.0,
+        "split_risk_score": 0.0,
+    }
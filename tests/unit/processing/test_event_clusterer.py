@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
 import src.processing.event_clusterer as event_clusterer_module
@@ -135,15 +136,12 @@ async def test_cluster_item_merges_into_existing_event(mock_db_session, monkeypa
     clusterer._update_primary_item = update_primary
     clusterer._count_unique_sources = count_unique
     monkeypatch.setattr(event_clusterer_module, "ensure_cluster_health", AsyncMock())
-    resolve_cluster_health = AsyncMock(
-        return_value={
-            "cluster_cohesion_score": 0.4,
-            "split_risk_score": 0.6,
-        }
+    update_cluster_health = AsyncMock()
+    monkeypatch.setattr(
+        event_clusterer_module, "update_cluster_health_after_merge", update_cluster_health
     )
-    monkeypatch.setattr(event_clusterer_module, "resolve_cluster_health", resolve_cluster_health)
 
-    async def refresh_provenance(target_event: Event) -> None:
+    async def refresh_provenance(target_event: Event, *_args: object) -> None:
         target_event.independent_evidence_count = target_event.unique_source_count
         target_event.corroboration_score = Decimal(target_event.unique_source_count)
         target_event.corroboration_mode = "provenance_aware"
@@ -162,16 +160,14 @@ async def test_cluster_item_merges_into_existing_event(mock_db_session, monkeypa
     assert result.created is False
     assert result.merged is True
     assert result.similarity == pytest.approx(0.95)
-    assert event.provenance_summary["cluster_health"]["cluster_cohesion_score"] == pytest.approx(
-        0.4
-    )
-    assert event.provenance_summary["cluster_health"]["split_risk_score"] == pytest.approx(0.6)
     assert add_link.await_count == 1
     assert update_primary.await_count == 1
-    resolve_cluster_health.assert_awaited_once_with(
+    update_cluster_health.assert_awaited_once_with(
         session=mock_db_session,
         event=event,
-        prefer_stored=False,
+        item_id=item.id,
+        item_embedding=item.embedding,
+        prior_health=None,
     )
 
 
@@ -217,15 +213,12 @@ async def test_cluster_item_backfills_cluster_health_before_adding_link(
     clusterer._count_unique_sources = count_unique
     clusterer._update_primary_item = AsyncMock(return_value=True)
     monkeypatch.setattr(event_clusterer_module, "ensure_cluster_health", ensure_cluster_health)
-    resolve_cluster_health = AsyncMock(
-        return_value={
-            "cluster_cohesion_score": 0.7,
-            "split_risk_score": 0.3,
-        }
+    update_cluster_health = AsyncMock()
+    monkeypatch.setattr(
+        event_clusterer_module, "update_cluster_health_after_merge", update_cluster_health
     )
-    monkeypatch.setattr(event_clusterer_module, "resolve_cluster_health", resolve_cluster_health)
 
-    async def refresh_provenance(target_event: Event) -> None:
+    async def refresh_provenance(target_event: Event, *_args: object) -> None:
         target_event.independent_evidence_count = target_event.unique_source_count
 
     clusterer._refresh_event_provenance = AsyncMock(side_effect=refresh_provenance)
@@ -236,11 +229,8 @@ async def test_cluster_item_backfills_cluster_health_before_adding_link(
     assert cluster_event.unique_source_count == 3
     assert cluster_event.lifecycle_status == EventLifecycle.CONFIRMED.value
     assert cluster_event.confirmed_at is not None
-    resolve_cluster_health.assert_awaited_once_with(
-        session=mock_db_session,
-        event=cluster_event,
-        prefer_stored=False,
-    )
+    update_cluster_health.assert_awaited_once()
+    assert update_cluster_health.await_args.kwargs["event"] is cluster_event
 
 
 @pytest.mark.asyncio
@@ -424,6 +414,144 @@ async def test_find_matching_event_filters_by_embedding_model(mock_db_session) -
     assert "events.embedding_model =" in str(query)
 
 
+@pytest.mark.asyncio
+async def test_find_matching_event_reranks_binary_quantized_candidates(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(event_clusterer_module.settings, "EMBEDDING_ANN_STORAGE", "binary")
+    clusterer = EventClusterer(session=mock_db_session)
+    mock_db_session.execute.return_value = SimpleNamespace(first=lambda: None)
+
+    result = await clusterer._find_matching_event(
+        item_embedding=[0.1, 0.2, 0.3],
+        embedding_model="text-embedding-3-small",
+        reference_time=datetime.now(tz=UTC),
+    )
+
+    assert result is None
+    query = mock_db_session.execute.await_args.args[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "CAST(binary_quantize(events.embedding) AS BIT(1536)) <~>" in sql
+    assert "JOIN (SELECT events.id" in sql
+    assert "anon_1.embedding <=>" in sql
+
+
+@pytest.mark.asyncio
+async def test_cluster_items_resolves_batch_once_and_groups_new_events(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clusterer = EventClusterer(session=mock_db_session)
+    fetched_at = datetime(2026, 3, 2, tzinfo=UTC)
+    linked = _build_item(embedding=[1.0, 0.0, 0.0])
+    matched = _build_item(embedding=[1.0, 0.0, 0.0])
+    first_new = _build_item(embedding=[0.0, 1.0, 0.0])
+    second_new = _build_item(embedding=[0.0, 0.99, 0.01])
+    unrelated = _build_item(embedding=[0.0, 0.0, 1.0])
+    items = [linked, matched, first_new, second_new, unrelated]
+    for item in items:
+        item.embedding_model = "text-embedding-3-small"
+        item.fetched_at = fetched_at
+    stored_event = Event(id=uuid4(), canonical_summary="stored")
+    linked_event_id = uuid4()
+    mock_db_session.execute.side_effect = [
+        SimpleNamespace(all=lambda: [(linked.id, linked_event_id)]),
+        SimpleNamespace(all=lambda: [(matched.id, stored_event, 0.05)]),
+        SimpleNamespace(all=list),
+    ]
+    clusterer._add_event_link = AsyncMock(return_value=True)
+    clusterer._refresh_event_provenance = AsyncMock()
+    clusterer._merge_into_event = AsyncMock()
+    monkeypatch.setattr(event_clusterer_module, "ensure_cluster_health", AsyncMock())
+
+    results = await clusterer.cluster_items(items)
+
+    assert [result.item_id for result in results] == [item.id for item in items]
+    assert (results[0].event_id, results[0].merged) == (linked_event_id, True)
+    assert (results[1].event_id, results[1].created) == (stored_event.id, False)
+    assert results[1].similarity == pytest.approx(0.95)
+    assert results[2].created is True
+    assert (results[3].event_id, results[3].created) == (results[2].event_id, False)
+    assert results[3].similarity == pytest.approx(0.99995, abs=1e-4)
+    assert results[4].created is True
+    assert results[4].event_id != results[2].event_id
+    assert mock_db_session.execute.await_count == 3
+    assert clusterer._merge_into_event.await_count == 2
+    lookup_sql = str(
+        mock_db_session.execute.await_args_list[1].args[0].compile(dialect=postgresql.dialect())
+    )
+    assert "JOIN LATERAL (SELECT" in lookup_sql
+    assert "DISTINCT ON (batch.item_id)" in lookup_sql
+    assert "events.embedding <=> batch.embedding" in lookup_sql
+
+
+@pytest.mark.asyncio
+async def test_cluster_items_skips_suppressed_matches_without_rescoring_them(
+    mock_db_session,
+) -> None:
+    clusterer = EventClusterer(session=mock_db_session)
+    assert await clusterer.cluster_items([]) == []
+    mock_db_session.execute.assert_not_called()
+
+    suppressed_event = Event(id=uuid4(), canonical_summary="suppressed")
+    first = _build_item(embedding=[1.0, 0.0, 0.0])
+    second = _build_item(embedding=[1.0, 0.0, 0.0])
+    for item in (first, second):
+        item.embedding_model = "text-embedding-3-small"
+        item.fetched_at = datetime(2026, 3, 2, tzinfo=UTC)
+    mock_db_session.execute.side_effect = [
+        SimpleNamespace(all=list),
+        SimpleNamespace(
+            all=lambda: [(first.id, suppressed_event, 0.05), (second.id, suppressed_event, 0.1)]
+        ),
+        SimpleNamespace(all=lambda: [(suppressed_event.id, "mark_noise")]),
+    ]
+    clusterer._merge_into_event = AsyncMock()
+
+    results = await clusterer.cluster_items([first, second])
+
+    assert [(result.event_id, result.created, result.merged) for result in results] == [
+        (suppressed_event.id, False, False),
+        (suppressed_event.id, False, False),
+    ]
+    assert results[1].similarity == pytest.approx(0.9)
+    clusterer._merge_into_event.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_matching_events_shortlists_quantized_candidates_per_item(
+    mock_db_session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(event_clusterer_module.settings, "EMBEDDING_ANN_STORAGE", "binary")
+    clusterer = EventClusterer(session=mock_db_session)
+    mock_db_session.execute.return_value = SimpleNamespace(all=list)
+
+    assert await clusterer._find_matching_events([]) == {}
+    assert await clusterer._find_matching_events([_build_item(embedding=[0.1])]) == {}
+
+    sql = str(mock_db_session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "CAST(binary_quantize(batch.embedding) AS BIT(1536))" in sql
+    assert "btrim(raw_items.embedding_model)" in sql
+    assert "candidate.distance <=" in sql
+
+
+@pytest.mark.asyncio
+async def test_event_suppression_actions_normalizes_batch_rows(mock_db_session) -> None:
+    clusterer = EventClusterer(session=mock_db_session)
+    noisy_id, archived_id = uuid4(), uuid4()
+    mock_db_session.execute.return_value = SimpleNamespace(
+        all=lambda: [(noisy_id, " mark_noise "), (archived_id, "archive")]
+    )
+
+    assert await clusterer._event_suppression_actions(event_ids=set()) == {}
+    actions = await clusterer._event_suppression_actions(event_ids={noisy_id, archived_id})
+
+    assert actions == {noisy_id: "mark_noise"}
+    mock_db_session.execute.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_cluster_item_skips_merge_for_suppressed_event(mock_db_session, monkeypatch) -> None:
     clusterer = EventClusterer(session=mock_db_session)
@@ -511,8 +639,8 @@ async def test_cluster_unlinked_items_clusters_each_result_and_flushes(mock_db_s
     clusterer = EventClusterer(session=mock_db_session)
     items = [_build_item(), _build_item()]
     mock_db_session.scalars.return_value = SimpleNamespace(all=lambda: items)
-    clusterer.cluster_item = AsyncMock(
-        side_effect=[
+    clusterer.cluster_items = AsyncMock(
+        return_value=[
             SimpleNamespace(item_id=items[0].id),
             SimpleNamespace(item_id=items[1].id),
         ]
@@ -521,6 +649,7 @@ async def test_cluster_unlinked_items_clusters_each_result_and_flushes(mock_db_s
     results = await clusterer.cluster_unlinked_items(limit=2)
 
     assert [result.item_id for result in results] == [items[0].id, items[1].id]
+    clusterer.cluster_items.assert_awaited_once_with(items)
     assert mock_db_session.flush.await_count >= 1
 
 
@@ -579,25 +708,25 @@ async def test_merge_into_event_populates_embedding_and_preserves_summary_when_p
     clusterer._update_primary_item = AsyncMock(return_value=False)
     clusterer._count_unique_sources = AsyncMock(return_value=2)
     clusterer.lifecycle_manager.on_event_mention = MagicMock()
-    resolve_cluster_health = AsyncMock(
-        return_value={
-            "cluster_cohesion_score": 0.8,
-            "split_risk_score": 0.2,
-        }
+    update_cluster_health = AsyncMock()
+    monkeypatch.setattr(
+        event_clusterer_module, "update_cluster_health_after_merge", update_cluster_health
     )
-    monkeypatch.setattr(event_clusterer_module, "resolve_cluster_health", resolve_cluster_health)
 
     await clusterer._merge_into_event(event, item)
 
     assert event.embedding == [0.5, 0.6]
     assert event.embedding_model == "text-embedding-3-small"
     assert event.embedding_generated_at == item.embedding_generated_at
+    assert event.embedding_centroid_count == 1
     assert event.canonical_summary == "old summary"
     clusterer.lifecycle_manager.on_event_mention.assert_called_once()
-    resolve_cluster_health.assert_awaited_once_with(
+    update_cluster_health.assert_awaited_once_with(
         session=mock_db_session,
         event=event,
-        prefer_stored=False,
+        item_id=item.id,
+        item_embedding=item.embedding,
+        prior_health=None,
     )
 
 
@@ -617,16 +746,7 @@ async def test_merge_into_event_preserves_existing_embedding(mock_db_session, mo
     clusterer._update_primary_item = AsyncMock(return_value=False)
     clusterer._count_unique_sources = AsyncMock(return_value=1)
     clusterer.lifecycle_manager.on_event_mention = MagicMock()
-    monkeypatch.setattr(
-        event_clusterer_module,
-        "resolve_cluster_health",
-        AsyncMock(
-            return_value={
-                "cluster_cohesion_score": 0.9,
-                "split_risk_score": 0.1,
-            }
-        ),
-    )
+    monkeypatch.setattr(event_clusterer_module, "update_cluster_health_after_merge", AsyncMock())
 
     await clusterer._merge_into_event(event, item)
 
@@ -655,16 +775,7 @@ async def test_merge_into_event_keeps_last_mention_monotonic_for_older_backfill(
     clusterer._update_primary_item = AsyncMock(return_value=False)
     clusterer._count_unique_sources = AsyncMock(return_value=2)
     clusterer._refresh_event_provenance = AsyncMock()
-    monkeypatch.setattr(
-        event_clusterer_module,
-        "resolve_cluster_health",
-        AsyncMock(
-            return_value={
-                "cluster_cohesion_score": 0.9,
-                "split_risk_score": 0.1,
-            }
-        ),
-    )
+    monkeypatch.setattr(event_clusterer_module, "update_cluster_health_after_merge", AsyncMock())
 
     await clusterer._merge_into_event(event, item)
 
@@ -698,29 +809,24 @@ async def test_merge_into_event_preserves_prior_cluster_health_after_provenance_
     clusterer._update_primary_item = AsyncMock(return_value=False)
     clusterer._count_unique_sources = AsyncMock(return_value=3)
     clusterer.lifecycle_manager.on_event_mention = MagicMock()
-    resolve_cluster_health = AsyncMock(
-        return_value={
-            "cluster_cohesion_score": 0.25,
-            "split_risk_score": 0.75,
-        }
+    update_cluster_health = AsyncMock()
+    monkeypatch.setattr(
+        event_clusterer_module, "update_cluster_health_after_merge", update_cluster_health
     )
-    monkeypatch.setattr(event_clusterer_module, "resolve_cluster_health", resolve_cluster_health)
 
-    async def refresh_provenance(target_event: Event) -> None:
+    async def refresh_provenance(target_event: Event, *_args: object) -> None:
         target_event.provenance_summary = {"method": "provenance_aware"}
 
     clusterer._refresh_event_provenance = AsyncMock(side_effect=refresh_provenance)
 
     await clusterer._merge_into_event(event, item)
 
-    assert event.provenance_summary["cluster_health"]["cluster_cohesion_score"] == pytest.approx(
-        0.25
-    )
-    assert event.provenance_summary["cluster_health"]["split_risk_score"] == pytest.approx(0.75)
-    resolve_cluster_health.assert_awaited_once_with(
+    update_cluster_health.assert_awaited_once_with(
         session=mock_db_session,
         event=event,
-        prefer_stored=False,
+        item_id=item.id,
+        item_embedding=None,
+        prior_health={"cluster_cohesion_score": 0.6, "split_risk_score": 0.4},
     )
 
 
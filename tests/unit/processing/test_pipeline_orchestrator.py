@@ -25,6 +25,13 @@ from src.storage.models import Event, ProcessingStatus, RawItem, TaxonomyGap, Ta
 pytestmark = pytest.mark.unit
 
 
+def _dedup(result: DeduplicationResult | None = None) -> SimpleNamespace:
+    verdict = result or DeduplicationResult(False)
+    return SimpleNamespace(
+        find_duplicates_bulk=AsyncMock(side_effect=lambda candidates: [verdict] * len(candidates))
+    )
+
+
 def _build_item() -> RawItem:
     return RawItem(
         id=uuid4(),
@@ -66,7 +73,7 @@ async def test_process_items_classifies_relevant_item(mock_db_session) -> None:
     item = _build_item()
     event = Event(id=uuid4(), canonical_summary="Seed summary")
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -133,7 +140,7 @@ async def test_process_items_sets_item_embedding_lineage_when_embedding_created(
     item = _build_item()
     event = Event(id=uuid4(), canonical_summary="Seed summary")
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(
         model="test-embedding-model",
         embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)),
@@ -210,13 +217,11 @@ async def test_process_items_sets_item_embedding_lineage_when_embedding_created(
 @pytest.mark.asyncio
 async def test_process_items_marks_duplicates_as_noise(mock_db_session) -> None:
     item = _build_item()
-    dedup = SimpleNamespace(
-        find_duplicate=AsyncMock(
-            return_value=DeduplicationResult(
-                is_duplicate=True,
-                matched_item_id=uuid4(),
-                match_reason="content_hash",
-            )
+    dedup = _dedup(
+        DeduplicationResult(
+            is_duplicate=True,
+            matched_item_id=uuid4(),
+            match_reason="content_hash",
         )
     )
     embedding = SimpleNamespace(embed_texts=AsyncMock())
@@ -257,12 +262,50 @@ async def test_process_items_marks_duplicates_as_noise(mock_db_session) -> None:
     tier2.classify_event.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_process_items_falls_back_to_per_item_dedup_when_bulk_lookup_fails(
+    mock_db_session,
+) -> None:
+    duplicate, failing, over_budget = _build_item(), _build_item(), _build_item()
+    dedup = SimpleNamespace(
+        find_duplicates_bulk=AsyncMock(side_effect=RuntimeError("IN-list too large")),
+        find_duplicate=AsyncMock(
+            side_effect=[
+                DeduplicationResult(True, matched_item_id=uuid4(), match_reason="url"),
+                RuntimeError("lookup failed"),
+                BudgetExceededError("cap"),
+            ]
+        ),
+    )
+    tier1 = SimpleNamespace(classify_items=AsyncMock())
+    pipeline = ProcessingPipeline(
+        session=mock_db_session,
+        deduplication_service=dedup,
+        embedding_service=SimpleNamespace(embed_texts=AsyncMock()),
+        event_clusterer=SimpleNamespace(cluster_item=AsyncMock()),
+        tier1_classifier=tier1,
+        tier2_classifier=SimpleNamespace(classify_event=AsyncMock()),
+    )
+
+    result = await pipeline.process_items(
+        [duplicate, failing, over_budget], trends=[_build_trend()]
+    )
+
+    assert (result.duplicates, result.errors) == (1, 1)
+    assert duplicate.processing_status == ProcessingStatus.NOISE
+    assert failing.processing_status == ProcessingStatus.ERROR
+    assert failing.error_message == "lookup failed"
+    assert over_budget.processing_status == ProcessingStatus.PENDING
+    assert dedup.find_duplicate.await_args_list[0].kwargs["exclude_item_id"] == duplicate.id
+    tier1.classify_items.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_process_items_sets_error_status_on_failure(mock_db_session) -> None:
     item = _build_item()
     event_id = uuid4()
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -313,7 +356,7 @@ async def test_process_items_batches_tier1_and_preserves_result_order(mock_db_se
     event_one = Event(id=uuid4(), canonical_summary="Seed summary one")
     event_two = Event(id=uuid4(), canonical_summary="Seed summary two")
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -397,7 +440,7 @@ async def test_process_items_tier1_batch_fallback_handles_partial_failures(mock_
     event_fail = Event(id=uuid4(), canonical_summary="Seed summary fail")
     event_ok = Event(id=uuid4(), canonical_summary="Seed summary ok")
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -488,7 +531,7 @@ async def test_process_items_applies_trend_impacts(mock_db_session) -> None:
         unique_source_count=3,
     )
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -702,7 +745,7 @@ async def test_process_items_skips_unknown_signal_weight(mock_db_session) -> Non
         },
     )
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -782,7 +825,7 @@ async def test_process_items_records_taxonomy_gap_for_unknown_trend_id(mock_db_s
         },
     )
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -869,7 +912,7 @@ async def test_process_items_applies_indicator_decay_factor(mock_db_session) ->
         unique_source_count=3,
     )
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -937,7 +980,7 @@ async def test_process_items_keeps_item_pending_when_tier1_budget_exceeded(mock_
     item = _build_item()
     event = Event(id=uuid4(), canonical_summary="Seed summary")
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -983,7 +1026,7 @@ async def test_process_items_keeps_item_pending_when_tier2_budget_exceeded(mock_
     item = _build_item()
     event = Event(id=uuid4(), canonical_summary="Seed summary")
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -1039,7 +1082,7 @@ async def test_process_items_skips_suppressed_event_feedback(
     item = _build_item()
     event = Event(id=uuid4(), canonical_summary="Suppressed event")
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -1133,7 +1176,7 @@ async def test_process_items_skips_unsupported_language_when_mode_skip(
     item = _build_item()
     item.language = "es"
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock())
     clusterer = SimpleNamespace(cluster_item=AsyncMock())
     tier1 = SimpleNamespace(classify_items=AsyncMock())
@@ -1174,7 +1217,7 @@ async def test_process_items_defers_unsupported_language_when_mode_defer(
     item = _build_item()
     item.language = "fr"
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock())
     clusterer = SimpleNamespace(cluster_item=AsyncMock())
     tier1 = SimpleNamespace(classify_items=AsyncMock())
@@ -1211,7 +1254,7 @@ async def test_process_items_records_language_segmented_metrics(
     item = _build_item()
     item.language = "uk"
     event = Event(id=uuid4(), canonical_summary="Seed summary")
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
+    dedup = _dedup()
     embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
@@ -64,7 +64,11 @@ def _pipeline(mock_db_session, **kwargs) -> ProcessingPipeline:
         deduplication_service=kwargs.pop(
             "deduplication_service",
             SimpleNamespace(
-                find_duplicate=AsyncMock(return_value=SimpleNamespace(is_duplicate=False))
+                find_duplicates_bulk=AsyncMock(
+                    side_effect=lambda candidates: [
+                        SimpleNamespace(is_duplicate=False) for _ in candidates
+                    ]
+                )
             ),
         ),
         embedding_service=kwargs.pop(
@@ -370,34 +374,29 @@ def test_pipeline_usage_and_result_counter_helpers_cover_pending_and_flags() ->
 
 
 @pytest.mark.asyncio
-async def test_prepare_item_for_tier1_covers_empty_budget_and_exception_paths(
+async def test_prepare_item_for_tier1_covers_empty_and_exception_paths(
     mock_db_session,
 ) -> None:
     item = _item()
     item.raw_content = "   "
     pipeline = _pipeline(mock_db_session)
+    unseen = SimpleNamespace(is_duplicate=False)
 
-    prepared, execution = await pipeline._prepare_item_for_tier1(item=item)
+    prepared, execution = await pipeline._prepare_item_for_tier1(item=item, duplicate_result=unseen)
     assert prepared is None
     assert execution is not None
     assert item.processing_status == ProcessingStatus.ERROR
 
-    item_budget = _item()
-    pipeline.deduplication_service.find_duplicate = AsyncMock(
-        side_effect=BudgetExceededError("cap")
-    )
-    prepared, execution = await pipeline._prepare_item_for_tier1(item=item_budget)
-    assert prepared is None
-    assert execution is not None
-    assert execution.result.final_status == ProcessingStatus.PENDING
-
-    item_exc = _item()
-    pipeline.deduplication_service.find_duplicate = AsyncMock(side_effect=RuntimeError("boom"))
-    prepared, execution = await pipeline._prepare_item_for_tier1(item=item_exc)
+    item = _item()
+    item.raw_content = None
+    prepared, execution = await pipeline._prepare_item_for_tier1(item=item, duplicate_result=unseen)
     assert prepared is None
     assert execution is not None
     assert execution.result.final_status == ProcessingStatus.ERROR
 
+    pipeline.deduplication_service.find_duplicates_bulk = AsyncMock(side_effect=RuntimeError("x"))
+    assert await pipeline._find_exact_duplicates([_item(), _item()]) == [None, None]
+
 
 @pytest.mark.asyncio
 async def test_classify_tier1_prepared_items_covers_per_item_budget_and_error_paths(
@@ -47,7 +47,11 @@ def _pipeline(mock_db_session, **overrides) -> ProcessingPipeline:
         deduplication_service=overrides.pop(
             "deduplication_service",
             SimpleNamespace(
-                find_duplicate=AsyncMock(return_value=SimpleNamespace(is_duplicate=False))
+                find_duplicates_bulk=AsyncMock(
+                    side_effect=lambda candidates: [
+                        SimpleNamespace(is_duplicate=False) for _ in candidates
+                    ]
+                )
             ),
         ),
         embedding_service=overrides.pop(
@@ -147,20 +151,36 @@ def test_build_retryable_pipeline_error_covers_passthrough_and_non_retryable_pat
 
 @pytest.mark.asyncio
 async def test_prepare_item_for_tier1_raises_retryable_pipeline_error(mock_db_session) -> None:
+    item = _item()
+    pipeline = _pipeline(mock_db_session)
+    mock_db_session.flush.side_effect = [None, TimeoutError("retry")]
+
+    with pytest.raises(RetryablePipelineError, match="prepare"):
+        await pipeline._prepare_item_for_tier1(
+            item=item,
+            duplicate_result=SimpleNamespace(is_duplicate=True),
+        )
+
+    assert item.processing_status == ProcessingStatus.PENDING
+    assert item.processing_started_at is None
+    assert item.error_message is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_duplicate_lookup_raises_retryable_pipeline_error(mock_db_session) -> None:
     item = _item()
     pipeline = _pipeline(
         mock_db_session,
         deduplication_service=SimpleNamespace(
-            find_duplicate=AsyncMock(side_effect=TimeoutError("retry"))
+            find_duplicates_bulk=AsyncMock(side_effect=TimeoutError("retry"))
         ),
     )
 
     with pytest.raises(RetryablePipelineError, match="prepare"):
-        await pipeline._prepare_item_for_tier1(item=item)
+        await pipeline.process_items([item], trends=[_trend()])
 
     assert item.processing_status == ProcessingStatus.PENDING
-    assert item.processing_started_at is None
-    assert item.error_message is None
+    mock_db_session.flush.assert_not_called()
 
 
 def test_raise_retryable_failure_if_needed_covers_batch_item_none(mock_db_session) -> None:
@@ -249,7 +269,9 @@ async def test_process_items_can_retry_after_transient_failure_without_error_sta
     item = _item()
     event = Event(id=uuid4(), canonical_summary="Seed summary")
     dedup = SimpleNamespace(
-        find_duplicate=AsyncMock(return_value=SimpleNamespace(is_duplicate=False))
+        find_duplicates_bulk=AsyncMock(
+            side_effect=lambda candidates: [SimpleNamespace(is_duplicate=False) for _ in candidates]
+        )
     )
     embedding = SimpleNamespace(
         embed_texts=AsyncMock(side_effect=[TimeoutError("temporary"), ([[0.1, 0.2]], 0, 1)])
@@ -19,6 +19,13 @@ from src.storage.models import Event, ProcessingStatus, RawItem
 pytestmark = pytest.mark.unit
 
 
+def _dedup(result: DeduplicationResult | None = None) -> SimpleNamespace:
+    verdict = result or DeduplicationResult(False)
+    return SimpleNamespace(
+        find_duplicates_bulk=AsyncMock(side_effect=lambda candidates: [verdict] * len(candidates))
+    )
+
+
 def _build_item_with_title(title: str) -> RawItem:
     return RawItem(
         id=uuid4(),
@@ -66,9 +73,7 @@ def _tier2_budget_snapshot(*, remaining_calls: int | None, headroom_ratio: float
 def _build_basic_pipeline(mock_db_session) -> ProcessingPipeline:
     return ProcessingPipeline(
         session=mock_db_session,
-        deduplication_service=SimpleNamespace(
-            find_duplicate=AsyncMock(return_value=DeduplicationResult(False))
-        ),
+        deduplication_service=_dedup(),
         embedding_service=SimpleNamespace(
             embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1))
         ),
@@ -95,8 +100,10 @@ async def test_process_items_reorders_tier2_calls_by_voi_under_budget_pressure(
         has_contradictions=True,
     )
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
-    embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
+    dedup = _dedup()
+    embedding = SimpleNamespace(
+        embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]], 0, 1))
+    )
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
             side_effect=[
@@ -171,6 +178,8 @@ async def test_process_items_reorders_tier2_calls_by_voi_under_budget_pressure(
         event_high.id,
         event_low.id,
     ]
+    embedding.embed_texts.assert_awaited_once_with([item_low.raw_content, item_high.raw_content])
+    assert item_high.embedding == [0.3, 0.2, 0.1]
 
 
 @pytest.mark.asyncio
@@ -186,8 +195,10 @@ async def test_process_items_keeps_tier2_order_when_budget_is_not_under_pressure
         id=uuid4(), canonical_summary="Event two", source_count=1, unique_source_count=1
     )
 
-    dedup = SimpleNamespace(find_duplicate=AsyncMock(return_value=DeduplicationResult(False)))
-    embedding = SimpleNamespace(embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3]], 0, 1)))
+    dedup = _dedup()
+    embedding = SimpleNamespace(
+        embed_texts=AsyncMock(return_value=([[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]], 0, 1))
+    )
     clusterer = SimpleNamespace(
         cluster_item=AsyncMock(
             side_effect=[
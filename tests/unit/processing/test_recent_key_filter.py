@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+import src.processing.recent_key_filter as recent_key_filter_module
+from src.processing.deduplication_service import DeduplicationService, DuplicateCandidate
+from src.processing.recent_key_filter import RecentKeyFilter, get_recent_key_filter
+
+pytestmark = pytest.mark.unit
+
+_DAY = 86400
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.bitmaps: dict[str, set[int]] = {}
+        self.values: dict[str, str] = {}
+        self.expiry: dict[str, int] = {}
+        self.fail = False
+        self.fail_deletes = False
+
+    def pipeline(self, *, transaction: bool) -> FakePipeline:
+        assert transaction is False
+        return FakePipeline(self)
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: str) -> bool:
+        self.values[key] = value
+        return True
+
+    def delete(self, key: str) -> int:
+        if self.fail_deletes:
+            raise ConnectionError("down")
+        return int(self.values.pop(key, None) is not None)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args: self.calls.append((name, args))
+
+    def execute(self) -> list[Any]:
+        if self.redis.fail:
+            raise ConnectionError("down")
+        replies: list[Any] = []
+        for name, args in self.calls:
+            if name == "getbit":
+                replies.append(int(args[1] in self.redis.bitmaps.get(args[0], set())))
+            elif name == "setbit":
+                self.redis.bitmaps.setdefault(args[0], set()).add(args[1])
+                replies.append(0)
+            elif name == "expireat":
+                self.redis.expiry[args[0]] = args[1]
+                replies.append(True)
+            else:
+                replies.append(getattr(self.redis, name)(*args))
+        return replies
+
+
+def _filter(redis_client: FakeRedis, clock: dict[str, float], **overrides: Any) -> RecentKeyFilter:
+    options: dict[str, Any] = {
+        "enabled": True,
+        "bits": 4096,
+        "hash_count": 4,
+        "window_days": 7,
+        "redis_prefix": "test:filter",
+        "redis_client": redis_client,
+        "wall_time_fn": lambda: clock["now"],
+    }
+    options.update(overrides)
+    return RecentKeyFilter(**options)
+
+
+def _stream_session(rows: list[tuple[str | None, ...]]) -> MagicMock:
+    async def partitions(_size: int):
+        yield rows
+
+    session = MagicMock()
+    session.stream = AsyncMock(return_value=SimpleNamespace(partitions=partitions))
+    return session
+
+
+@pytest.mark.asyncio
+async def test_filter_reports_absent_keys_only_once_coverage_spans_window() -> None:
+    redis_client = FakeRedis()
+    clock = {"now": 100 * _DAY}
+    key_filter = _filter(redis_client, clock)
+    stored = ("url", "https://example.com/a")
+    unseen = ("content_hash", "never-stored")
+
+    await key_filter.add([stored])
+    assert await key_filter.might_contain([stored, unseen], window_days=7) == [True, True]
+
+    session = _stream_session([("ext-1", None, "hash-1"), (None, None, None)])
+    assert await key_filter.rebuild(session, batch_size=10) == 2
+    assert await key_filter.might_contain([stored, unseen], window_days=7) == [True, False]
+    assert await key_filter.might_contain([("external_id", "ext-1")], window_days=7) == [True]
+    assert await key_filter.might_contain([unseen], window_days=8) == [True]
+    assert await key_filter.might_contain([], window_days=7) == []
+
+    clock["now"] += 7 * _DAY
+    assert await key_filter.might_contain([stored, unseen], window_days=7) == [True, False]
+    clock["now"] += 7 * _DAY
+    assert await key_filter.might_contain([stored], window_days=7) == [False]
+    assert all(expire_at > clock["now"] - 7 * _DAY for expire_at in redis_client.expiry.values())
+
+
+@pytest.mark.asyncio
+async def test_filter_lost_write_disables_negatives_until_coverage_is_withdrawn(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis_client = FakeRedis()
+    clock = {"now": 100 * _DAY}
+    key_filter = _filter(redis_client, clock)
+    await key_filter.rebuild(_stream_session([]), batch_size=10)
+    unseen = ("external_id", "unseen")
+    assert await key_filter.might_contain([unseen], window_days=7) == [False]
+
+    redis_client.fail = True
+    await key_filter.add([("external_id", "lost")])
+    assert await key_filter.might_contain([unseen], window_days=7) == [True]
+
+    redis_client.fail = False
+    monkeypatch.setattr(key_filter, "_backend_unavailable_until", 0.0)
+    await key_filter.add([("external_id", "next")])
+    assert await key_filter.might_contain([unseen], window_days=7) == [True]
+    assert not any(key.endswith(":coverage") for key in redis_client.values)
+
+    redis_client.fail = True
+    with pytest.raises(RuntimeError, match="rerun the rebuild"):
+        await _filter(redis_client, clock).rebuild(
+            _stream_session([("ext", None, None)]), batch_size=10
+        )
+
+
+@pytest.mark.asyncio
+async def test_lost_write_withdraws_coverage_for_every_worker_sharing_redis(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis_client = FakeRedis()
+    clock = {"now": 100 * _DAY}
+    writer = _filter(redis_client, clock)
+    reader = _filter(redis_client, clock)
+    await writer.rebuild(_stream_session([]), batch_size=10)
+    lost = ("external_id", "lost")
+    assert await reader.might_contain([lost], window_days=7) == [False]
+
+    async def lose_write_during_outage() -> None:
+        redis_client.fail = True
+        redis_client.fail_deletes = True
+        await writer.add([lost])
+        redis_client.fail = False
+        redis_client.fail_deletes = False
+
+    await lose_write_during_outage()
+    # The marker survived the outage, so peers still trust the bitmap until the
+    # writer next reaches Redis and withdraws it.
+    assert await reader.might_contain([lost], window_days=7) == [False]
+    await writer.add([("external_id", "skipped")])
+    assert await writer.might_contain([lost], window_days=7) == [True]
+    monkeypatch.setattr(writer, "_backend_unavailable_until", 0.0)
+    assert await writer.might_contain([lost], window_days=7) == [True]
+    assert await reader.might_contain([lost], window_days=7) == [True]
+    assert writer._coverage_lost is False
+
+    await writer.rebuild(_stream_session([]), batch_size=10)
+    await lose_write_during_outage()
+    monkeypatch.setattr(writer, "_backend_unavailable_until", 0.0)
+    await writer.add([("external_id", "next")])
+    assert writer._coverage_lost is False
+    assert await reader.might_contain([lost], window_days=7) == [True]
+
+    await writer.rebuild(_stream_session([]), batch_size=10)
+    assert await reader.might_contain([lost], window_days=7) == [False]
+    redis_client.fail = True
+    await writer.add([lost])
+    redis_client.fail = False
+    assert await reader.might_contain([lost], window_days=7) == [True]
+
+
+@pytest.mark.asyncio
+async def test_disabled_filter_never_touches_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    from_url = MagicMock()
+    monkeypatch.setattr("src.processing.recent_key_filter.redis.Redis.from_url", from_url)
+    key_filter = RecentKeyFilter(enabled=False)
+
+    await key_filter.add([("url", "https://example.com")])
+    assert await key_filter.might_contain([("url", "x")], window_days=7) == [True]
+    assert await key_filter.rebuild(MagicMock()) == 0
+    from_url.assert_not_called()
+
+    enabled = RecentKeyFilter(enabled=True, redis_url=" redis://cache:6379/0 ", redis_prefix=" ")
+    from_url.return_value = FakeRedis()
+    assert enabled.redis_prefix == "horadus:dedup_filter"
+    assert await enabled.might_contain([("url", "x")], window_days=7) == [True]
+    from_url.assert_called_once_with("redis://cache:6379/0", decode_responses=True)
+
+
+def test_get_recent_key_filter_builds_process_wide_instance_from_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(recent_key_filter_module.settings, "DEDUP_RECENT_KEY_FILTER_HASHES", 3)
+    get_recent_key_filter.cache_clear()
+    try:
+        key_filter = get_recent_key_filter()
+        assert key_filter.hash_count == 3
+        assert get_recent_key_filter() is key_filter
+    finally:
+        get_recent_key_filter.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_deduplication_service_skips_sql_for_definite_negatives(mock_db_session) -> None:
+    redis_client = FakeRedis()
+    clock = {"now": 100 * _DAY}
+    key_filter = _filter(redis_client, clock)
+    await key_filter.rebuild(_stream_session([]), batch_size=10)
+    service = DeduplicationService(session=mock_db_session, recent_key_filter=key_filter)
+    await service.record_stored(
+        [DuplicateCandidate(external_id="stored", url=None, content_hash="stored-hash")]
+    )
+    matched_id = uuid4()
+    mock_db_session.scalar.side_effect = [matched_id]
+    mock_db_session.execute.return_value = SimpleNamespace(
+        all=lambda: [(matched_id, None, None, "stored-hash")]
+    )
+
+    single = await service.find_duplicate(external_id="new", content_hash="stored-hash")
+    bulk = await service.find_duplicates_bulk(
+        [
+            DuplicateCandidate(external_id="new", url="https://example.com/new"),
+            DuplicateCandidate(external_id="other", content_hash="stored-hash"),
+        ]
+    )
+    unseen = await service.find_duplicates_bulk([DuplicateCandidate(external_id="unseen")])
+
+    assert (single.match_reason, single.matched_item_id) == ("content_hash", matched_id)
+    assert mock_db_session.scalar.await_count == 1
+    assert [result.is_duplicate for result in bulk] == [False, True]
+    query = str(mock_db_session.execute.await_args.args[0])
+    assert "raw_items.content_hash IN" in query
+    assert "raw_items.external_id IN" not in query
+    assert unseen[0].is_duplicate is False
+    assert mock_db_session.execute.await_count == 1
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.processing.similarity_kernels import (
+    cosine_matrix,
+    cosine_scores,
+    normalize_rows,
+    pairwise_similarity_stats,
+    top_k_indices,
+)
+from src.processing.vector_similarity import cosine_similarity, nearest_neighbors
+
+pytestmark = pytest.mark.unit
+
+
+def test_normalize_rows_zeroes_unusable_rows_and_rejects_non_matrices() -> None:
+    units = normalize_rows([[3.0, 4.0], [0.0, 0.0], [np.inf, 1.0]])
+
+    assert units.dtype == np.float32
+    np.testing.assert_allclose(units, [[0.6, 0.8], [0.0, 0.0], [0.0, 0.0]])
+    with pytest.raises(ValueError, match="2-D matrix"):
+        normalize_rows([1.0, 2.0])
+
+
+def test_kernels_match_scalar_cosine_similarity() -> None:
+    rng = np.random.default_rng(3)
+    left = rng.normal(size=(5, 16))
+    right = rng.normal(size=(4, 16))
+    expected = [[cosine_similarity(row, other) for other in right] for row in left]
+
+    matrix = cosine_matrix(
+        normalize_rows(left, dtype=np.float64), normalize_rows(right, dtype=np.float64)
+    )
+    scores = cosine_scores(normalize_rows(right), left[0])
+
+    np.testing.assert_allclose(matrix, expected, atol=1e-12)
+    np.testing.assert_allclose(scores, expected[0], atol=1e-6)
+    assert not np.any(cosine_scores(normalize_rows(right), np.zeros(16)))
+
+
+def test_top_k_indices_orders_best_first_and_breaks_ties_by_index() -> None:
+    scores = np.array([0.2, 0.9, 0.5, 0.9, 0.1])
+
+    assert top_k_indices(scores, 3).tolist() == [1, 3, 2]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 0, 4]
+    with pytest.raises(ValueError, match="k must be >= 1"):
+        top_k_indices(scores, 0)
+
+
+def test_pairwise_similarity_stats_spans_row_blocks() -> None:
+    rng = np.random.default_rng(5)
+    units = normalize_rows(rng.normal(size=(7, 8)), dtype=np.float64)
+    pairs = [float(units[i] @ units[j]) for i in range(7) for j in range(i + 1, 7)]
+
+    pair_count, pair_total, lowest = pairwise_similarity_stats(units, block_rows=3)
+
+    assert pair_count == 21
+    assert pair_total == pytest.approx(sum(pairs))
+    assert lowest == pytest.approx(min(pairs))
+    assert pairwise_similarity_stats(units[:1]) == (0, 0.0, 1.0)
+
+
+def test_nearest_neighbors_keeps_limit_ties_ordered_by_entity_id() -> None:
+    rows = nearest_neighbors(
+        query_embedding=[1.0, 0.0],
+        candidates=[("d", [1.0, 0.0]), ("c", [2.0, 0.0]), ("b", [1.0, 1.0]), ("a", [3.0, 0.0])],
+        similarity_threshold=0.5,
+        limit=2,
+    )
+
+    assert [row.entity_id for row in rows] == ["a", "c"]
+    assert (
+        nearest_neighbors(query_embedding=[1.0], candidates=[], similarity_threshold=0.1, limit=1)
+        == []
+    )
+    with pytest.raises(ValueError, match="matching dimensions"):
+        nearest_neighbors(
+            query_embedding=[1.0, 0.0],
+            candidates=[("a", [1.0])],
+            similarity_threshold=0.1,
+            limit=1,
+        )
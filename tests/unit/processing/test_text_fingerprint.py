@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from src.processing.text_fingerprint import (
+    BAND_COUNT,
+    SIGNATURE_SIZE,
+    estimated_jaccard,
+    minhash_bands,
+    minhash_signature,
+)
+
+pytestmark = pytest.mark.unit
+
+_WIRE_COPY = " ".join(f"token{index}" for index in range(300))
+
+
+def test_minhash_signature_is_stable_signed_and_skips_short_texts() -> None:
+    signature = minhash_signature(_WIRE_COPY)
+
+    assert signature is not None
+    assert len(signature) == SIGNATURE_SIZE
+    assert all(-(2**31) <= value < 2**31 for value in signature)
+    assert minhash_signature(_WIRE_COPY.upper()) == signature
+    assert minhash_signature("too short to fingerprint") is None
+
+
+def test_reworded_copies_share_bands_and_unrelated_texts_do_not() -> None:
+    words = _WIRE_COPY.split()
+    reworded = " ".join(["Reuters", "-", *words[:100], "reportedly", *words[101:280]])
+    unrelated = " ".join(f"other{index}" for index in range(300))
+    original = minhash_signature(_WIRE_COPY)
+    copy = minhash_signature(reworded)
+    other = minhash_signature(unrelated)
+    assert original is not None
+    assert copy is not None
+    assert other is not None
+
+    assert estimated_jaccard(original, copy) >= 0.8
+    assert set(minhash_bands(original)) & set(minhash_bands(copy))
+    assert estimated_jaccard(original, other) < 0.1
+    assert not set(minhash_bands(original)) & set(minhash_bands(other))
+    assert len(minhash_bands(original)) == BAND_COUNT
+    assert estimated_jaccard(original, original[:10]) == 0.0
+    assert estimated_jaccard([], []) == 0.0
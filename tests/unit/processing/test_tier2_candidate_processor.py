@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import OperationalError
 
 from src.processing.cost_tracker import BudgetExceededError
+from src.processing.event_clusterer import ClusterResult
+from src.processing.pipeline_retry import RetryablePipelineError
 from src.processing.tier1_classifier import Tier1ItemResult, TrendRelevanceScore
 from src.processing.tier2_candidate_processor import (
     _build_tier2_trend_signals,
+    cluster_tier2_candidates,
+    embed_tier2_candidates,
     load_item_source_credibility,
     stage_tier2_candidate,
 )
@@ -19,6 +26,11 @@ from src.storage.models import ProcessingStatus, RawItem
 pytestmark = pytest.mark.unit
 
 
+@asynccontextmanager
+async def _savepoint() -> AsyncIterator[None]:
+    yield
+
+
 def _raw_item(*, with_id: bool = True) -> RawItem:
     return RawItem(
         id=uuid4() if with_id else None,
@@ -63,6 +75,240 @@ async def test_stage_tier2_candidate_returns_pending_execution_on_budget_exceede
     assert execution.result.status == ProcessingStatus.PENDING
 
 
+@pytest.mark.asyncio
+async def test_embed_tier2_candidates_embeds_missing_items_in_one_call() -> None:
+    items = [_raw_item(), _raw_item(), _raw_item()]
+    items[1].embedding = [0.9]
+    prepared = [
+        SimpleNamespace(item=item, item_id=item.id, raw_content=item.raw_content) for item in items
+    ]
+    audit = SimpleNamespace(
+        original_tokens=12,
+        retained_tokens=8,
+        was_truncated=True,
+        was_cut=True,
+        strategy="head_tail",
+    )
+    embed = AsyncMock(return_value=([[0.1], [0.3]], [audit, audit], 0, 1))
+    owner = SimpleNamespace(
+        embedding_service=SimpleNamespace(model="embed-model", embed_texts_with_contexts=embed)
+    )
+
+    embedded_ids, api_calls, error = await embed_tier2_candidates(
+        owner=owner, prepared_items=prepared
+    )
+
+    assert embedded_ids == {items[0].id, items[2].id}
+    assert (api_calls, error) == (1, None)
+    embed.assert_awaited_once_with(
+        [items[0].raw_content, items[2].raw_content],
+        entity_type="raw_item",
+        entity_ids=[items[0].id, items[2].id],
+    )
+    assert [item.embedding for item in items] == [[0.1], [0.9], [0.3]]
+    assert items[2].embedding_model == "embed-model"
+    assert items[2].embedding_retained_tokens == 8
+    assert items[2].embedding_truncation_strategy == "head_tail"
+    assert await embed_tier2_candidates(owner=owner, prepared_items=prepared[1:2]) == (
+        set(),
+        0,
+        None,
+    )
+    assert embed.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_embed_tier2_candidates_reports_batch_budget_denial_per_item(
+    mock_db_session,
+) -> None:
+    item = _raw_item()
+    prepared = SimpleNamespace(item=item, item_id=item.id, raw_content=item.raw_content)
+    owner = SimpleNamespace(
+        session=mock_db_session,
+        embedding_service=SimpleNamespace(
+            embed_texts=AsyncMock(side_effect=BudgetExceededError("budget denied"))
+        ),
+        event_clusterer=SimpleNamespace(cluster_item=AsyncMock()),
+        _build_item_result=lambda **kwargs: SimpleNamespace(**kwargs),
+        _raise_retryable_failure_if_needed=lambda **_: None,
+    )
+
+    embedded_ids, api_calls, error = await embed_tier2_candidates(
+        owner=owner, prepared_items=[prepared]
+    )
+    assert (embedded_ids, api_calls) == (set(), 0)
+    assert isinstance(error, BudgetExceededError)
+    assert item.embedding is None
+
+    staged, execution = await stage_tier2_candidate(
+        owner=owner,
+        prepared=prepared,
+        tier1_result=Tier1ItemResult(item_id=item.id, max_relevance=8, should_queue_tier2=True),
+        embedding_error=error,
+    )
+
+    assert staged is None
+    assert execution is not None
+    assert execution.result.status == ProcessingStatus.PENDING
+    owner.embedding_service.embed_texts.assert_awaited_once()
+    owner.event_clusterer.cluster_item.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_embed_tier2_candidates_falls_back_to_per_item_embedding_on_batch_failure(
+    mock_db_session,
+) -> None:
+    items = [_raw_item(), _raw_item()]
+    prepared = [
+        SimpleNamespace(item=item, item_id=item.id, raw_content=item.raw_content) for item in items
+    ]
+    event = SimpleNamespace(id=uuid4())
+    owner = SimpleNamespace(
+        session=mock_db_session,
+        embedding_service=SimpleNamespace(
+            model="embed-model",
+            # The batch response is one vector short of the request.
+            embed_texts=AsyncMock(
+                side_effect=[
+                    ([[0.1]], 0, 1),
+                    ([[0.2]], 0, 1),
+                    RuntimeError("provider rejected input"),
+                ]
+            ),
+        ),
+        event_clusterer=SimpleNamespace(
+            cluster_item=AsyncMock(
+                return_value=ClusterResult(
+                    item_id=items[0].id, event_id=event.id, created=True, merged=False
+                )
+            )
+        ),
+        _load_event=AsyncMock(return_value=event),
+        _event_suppression_action=AsyncMock(return_value=None),
+        _build_item_result=lambda **kwargs: SimpleNamespace(**kwargs),
+        _raise_retryable_failure_if_needed=lambda **_: None,
+    )
+
+    embedded_ids, api_calls, error = await embed_tier2_candidates(
+        owner=owner, prepared_items=prepared
+    )
+    assert (embedded_ids, api_calls, error) == (set(), 1, None)
+    assert [item.embedding for item in items] == [None, None]
+
+    executions = [
+        await stage_tier2_candidate(
+            owner=owner,
+            prepared=candidate,
+            tier1_result=Tier1ItemResult(
+                item_id=candidate.item_id, max_relevance=8, should_queue_tier2=True
+            ),
+            embedding_error=error,
+        )
+        for candidate in prepared
+    ]
+
+    staged, failed = executions[0][0], executions[1][1]
+    assert staged is not None
+    assert staged.embedded is True
+    assert items[0].embedding == [0.2]
+    assert failed is not None
+    assert failed.result.final_status == ProcessingStatus.ERROR
+    assert items[1].embedding is None
+    assert owner.embedding_service.embed_texts.await_count == 3
+
+    owner.embedding_service.embed_texts = AsyncMock(side_effect=TimeoutError("slow"))
+    _ids, _calls, retry_error = await embed_tier2_candidates(
+        owner=owner, prepared_items=prepared[1:]
+    )
+    assert isinstance(retry_error, TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_cluster_tier2_candidates_batches_embedded_items_and_falls_back_on_error(
+    mock_db_session,
+) -> None:
+    items = [_raw_item(), _raw_item(), _raw_item()]
+    items[0].embedding = [0.1]
+    items[2].embedding = [0.3]
+    prepared = [
+        SimpleNamespace(item=item, item_id=item.id, raw_content=item.raw_content) for item in items
+    ]
+    event = SimpleNamespace(id=uuid4())
+    batch_results = [
+        ClusterResult(item_id=items[0].id, event_id=event.id, created=True, merged=False),
+        ClusterResult(item_id=items[2].id, event_id=event.id, created=False, merged=True),
+    ]
+    owner = SimpleNamespace(
+        session=mock_db_session,
+        event_clusterer=SimpleNamespace(
+            cluster_items=AsyncMock(return_value=batch_results),
+            cluster_item=AsyncMock(),
+        ),
+        _load_event=AsyncMock(return_value=event),
+        _event_suppression_action=AsyncMock(return_value=None),
+        _raise_retryable_failure_if_needed=lambda **_: None,
+    )
+
+    cluster_results = await cluster_tier2_candidates(owner=owner, prepared_items=prepared)
+
+    assert cluster_results == {result.item_id: result for result in batch_results}
+    owner.event_clusterer.cluster_items.assert_awaited_once_with([items[0], items[2]])
+    staged, execution = await stage_tier2_candidate(
+        owner=owner,
+        prepared=prepared[2],
+        tier1_result=Tier1ItemResult(item_id=items[2].id, max_relevance=8, should_queue_tier2=True),
+        embedded=True,
+        cluster_result=cluster_results[items[2].id],
+    )
+    assert execution is None
+    assert staged is not None
+    assert staged.cluster_result is batch_results[1]
+    owner.event_clusterer.cluster_item.assert_not_awaited()
+
+    mock_db_session.begin_nested.side_effect = lambda: _savepoint()
+    owner.event_clusterer.cluster_items = AsyncMock(side_effect=RuntimeError("lateral failed"))
+    assert await cluster_tier2_candidates(owner=owner, prepared_items=prepared) == {}
+    assert await cluster_tier2_candidates(owner=owner, prepared_items=prepared[1:2]) == {}
+    owner.event_clusterer = SimpleNamespace(cluster_item=AsyncMock())
+    assert await cluster_tier2_candidates(owner=owner, prepared_items=prepared) == {}
+
+
+@pytest.mark.asyncio
+async def test_cluster_tier2_candidates_runs_batch_in_savepoint_and_reraises_failures(
+    mock_db_session,
+) -> None:
+    item = _raw_item()
+    item.embedding = [0.1]
+    prepared = [SimpleNamespace(item=item, item_id=item.id, raw_content=item.raw_content)]
+    retryable = RetryablePipelineError(
+        item_id=None,
+        stage="cluster_batch",
+        reason="TimeoutError",
+        exc=TimeoutError("slow"),
+    )
+
+    def _raise_retryable(**kwargs) -> None:
+        if isinstance(kwargs["exc"], TimeoutError):
+            raise retryable
+
+    owner = SimpleNamespace(
+        session=mock_db_session,
+        event_clusterer=SimpleNamespace(
+            cluster_items=AsyncMock(side_effect=OperationalError("SELECT 1", {}, Exception("x")))
+        ),
+        _raise_retryable_failure_if_needed=_raise_retryable,
+    )
+
+    with pytest.raises(OperationalError):
+        await cluster_tier2_candidates(owner=owner, prepared_items=prepared)
+    mock_db_session.begin_nested.assert_called_once()
+
+    owner.event_clusterer.cluster_items = AsyncMock(side_effect=TimeoutError("slow"))
+    mock_db_session.begin_nested.return_value = _savepoint()
+    with pytest.raises(RetryablePipelineError):
+        await cluster_tier2_candidates(owner=owner, prepared_items=prepared)
+
+
 @pytest.mark.asyncio
 async def test_load_item_source_credibility_returns_empty_when_no_item_ids(mock_db_session) -> None:
     owner = SimpleNamespace(session=mock_db_session)
@@ -422,13 +422,8 @@ async def test_classify_event_preserves_primary_item_summary_after_cluster_merge
     clusterer.lifecycle_manager = SimpleNamespace(on_event_mention=lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
         event_clusterer_module,
-        "resolve_cluster_health",
-        AsyncMock(
-            return_value={
-                "cluster_cohesion_score": 0.8,
-                "split_risk_score": 0.2,
-            }
-        ),
+        "update_cluster_health_after_merge",
+        AsyncMock(),
     )
 
     await clusterer._merge_into_event(event, merged_item)
@@ -22,6 +22,10 @@ def test_vector_similarity_rejects_invalid_inputs() -> None:
         cosine_similarity([1.0], [1.0, 2.0])
     with pytest.raises(ValueError, match="must not be empty"):
         cosine_similarity([], [])
+    with pytest.raises(ValueError, match="must not be empty"):
+        nearest_neighbors(
+            query_embedding=[], candidates=[("a", [])], similarity_threshold=0.5, limit=1
+        )
 
 
 def test_cosine_similarity_returns_zero_for_zero_norm_vectors() -> None:
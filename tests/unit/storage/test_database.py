@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
 
 import src.api.routes._privileged_write_contract as write_contract_module
 import src.storage.database as database_module
@@ -39,6 +40,23 @@ def test_create_engine_sets_pool_timeout_in_production(monkeypatch) -> None:
     assert kwargs["pool_timeout"] == 42
 
 
+def test_install_vector_codec_registers_codec_on_asyncpg_connections_only() -> None:
+    engine = create_async_engine("postgresql+asyncpg://user@localhost/horadus")
+    dbapi_connection = MagicMock()
+
+    dispatch = engine.sync_engine.pool.dispatch
+    dialect_listeners = list(dispatch.connect)
+
+    database_module.install_vector_codec(engine)
+    (register,) = [fn for fn in dispatch.connect if fn not in dialect_listeners]
+    register(dbapi_connection, None)
+
+    dbapi_connection.run_async.assert_called_once_with(database_module.register_vector_codec)
+
+    other_engine = SimpleNamespace(dialect=SimpleNamespace(driver="psycopg"), sync_engine=None)
+    database_module.install_vector_codec(other_engine)
+
+
 def test_create_engine_uses_nullpool_in_development(monkeypatch) -> None:
     captured: dict[str, object] = {}
 
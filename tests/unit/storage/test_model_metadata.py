@@ -5,6 +5,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from sqlalchemy import Integer
 from sqlalchemy.dialects import postgresql
 
 from src.storage.models import (
@@ -52,6 +53,10 @@ def test_pgvector_indexes_present_in_model_metadata() -> None:
 
     assert "idx_raw_items_embedding" in raw_item_indexes
     assert "idx_events_embedding" in event_indexes
+    assert not {"idx_raw_items_embedding_halfvec", "idx_raw_items_embedding_binary"} & (
+        raw_item_indexes
+    )
+    assert not {"idx_events_embedding_halfvec", "idx_events_embedding_binary"} & event_indexes
 
 
 def test_pgvector_indexes_match_migration_profile_lists_setting() -> None:
@@ -99,6 +104,18 @@ def test_source_ingestion_watermark_column_present_in_model_metadata() -> None:
     )
 
 
+def test_source_fetch_validator_columns_present_in_model_metadata() -> None:
+    assert Source.__table__.c["fetch_etag"].type.length == 512
+    assert Source.__table__.c["fetch_last_modified"].type.length == 64
+    assert Source.__table__.c["fetch_body_hash"].type.length == 64
+
+
+def test_source_high_water_message_id_column_present_in_model_metadata() -> None:
+    column = Source.__table__.c["high_water_message_id"]
+    assert isinstance(column.type, Integer)
+    assert column.nullable is True
+
+
 def test_event_items_item_uniqueness_constraint_present_in_model_metadata() -> None:
     unique_constraint_names = {
         constraint.name
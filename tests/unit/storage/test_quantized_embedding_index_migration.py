@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+MIGRATION_PATH = REPO_ROOT / "alembic" / "versions" / "0042_add_quantized_embedding_indexes.py"
+
+
+def _load_migration_module() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("migration_0042_quantized", MIGRATION_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(migration: ModuleType, step: str, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    statements: list[str] = []
+    monkeypatch.setattr(migration, "op", SimpleNamespace(execute=statements.append))
+    getattr(migration, step)()
+    return [" ".join(statement.split()) for statement in statements]
+
+
+def test_quantized_index_migration_keeps_full_index_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    migration = _load_migration_module()
+    monkeypatch.setattr(migration.settings, "EMBEDDING_ANN_STORAGE", "full")
+
+    assert _run(migration, "upgrade", monkeypatch) == []
+
+
+def test_quantized_index_migration_replaces_full_index_with_configured_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    migration = _load_migration_module()
+    monkeypatch.setattr(migration.settings, "EMBEDDING_ANN_STORAGE", "binary")
+
+    statements = _run(migration, "upgrade", monkeypatch)
+
+    assert statements == [
+        "CREATE INDEX IF NOT EXISTS idx_raw_items_embedding_binary ON raw_items USING ivfflat "
+        "((binary_quantize(embedding)::bit(1536)) bit_hamming_ops) WITH (lists = 64)",
+        "DROP INDEX IF EXISTS idx_raw_items_embedding",
+        "CREATE INDEX IF NOT EXISTS idx_events_embedding_binary ON events USING ivfflat "
+        "((binary_quantize(embedding)::bit(1536)) bit_hamming_ops) WITH (lists = 64)",
+        "DROP INDEX IF EXISTS idx_events_embedding",
+    ]
+    assert not any("halfvec" in statement for statement in statements)
+
+    downgrade = _run(migration, "downgrade", monkeypatch)
+    assert downgrade[0] == (
+        "CREATE INDEX IF NOT EXISTS idx_raw_items_embedding ON raw_items USING ivfflat "
+        "(embedding vector_cosine_ops) WITH (lists = 64)"
+    )
+    assert "DROP INDEX IF EXISTS idx_events_embedding_halfvec" in downgrade
+    assert "DROP INDEX IF EXISTS idx_events_embedding_binary" in downgrade
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import src.storage.vector_types as vector_types_module
+from src.storage.models import RawItem
+from src.storage.vector_types import (
+    Float32Vector,
+    ann_candidate_distance,
+    as_embedding_vector,
+    register_vector_codec,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_as_embedding_vector_converts_lists_and_keeps_float32_arrays() -> None:
+    vector = as_embedding_vector([1, 2.5, -3.0], dimensions=3)
+
+    assert vector.dtype == np.float32
+    assert vector.tolist() == [1.0, 2.5, -3.0]
+    assert as_embedding_vector(vector) is vector
+
+
+def test_as_embedding_vector_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError, match="dimension mismatch"):
+        as_embedding_vector([1.0, 2.0], dimensions=3)
+    with pytest.raises(ValueError, match="non-numeric"):
+        as_embedding_vector([1.0, "bad", 3.0])
+    with pytest.raises(ValueError, match="non-numeric"):
+        as_embedding_vector([[1.0], [2.0]])
+    with pytest.raises(ValueError, match="non-numeric"):
+        as_embedding_vector([[1.0], [2.0, 3.0]])
+    with pytest.raises(ValueError, match="non-finite"):
+        as_embedding_vector([1.0, float("nan")])
+    with pytest.raises(ValueError, match="non-finite"):
+        as_embedding_vector([1.0, 1e39])
+
+
+def test_float32_vector_binds_arrays_only_for_asyncpg() -> None:
+    column_type = Float32Vector(3)
+
+    process = column_type.bind_processor(SimpleNamespace(driver="asyncpg"))
+    bound = process([0.5, 1.0, 2.0])
+    assert isinstance(bound, np.ndarray)
+    assert bound.dtype == np.float32
+    assert process(None) is None
+    with pytest.raises(ValueError, match="dimension mismatch"):
+        process([0.5])
+
+    text_process = column_type.bind_processor(SimpleNamespace(driver="psycopg"))
+    assert text_process([0.5, 1.0, 2.0]) == "[0.5,1.0,2.0]"
+
+
+@pytest.mark.asyncio
+async def test_register_vector_codec_tolerates_only_a_missing_extension(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register = AsyncMock()
+    monkeypatch.setattr(vector_types_module, "register_vector", register)
+    connection = object()
+
+    await register_vector_codec(connection)
+    register.assert_awaited_once_with(connection)
+
+    register.side_effect = ValueError("unknown type: public.vector")
+    await register_vector_codec(connection)
+
+    register.side_effect = ValueError("codec failure")
+    with pytest.raises(ValueError, match="codec failure"):
+        await register_vector_codec(connection)
+
+
+def test_ann_candidate_distance_matches_each_storage_index_expression() -> None:
+    query = [0.5] * 1536
+
+    def sql(storage: str) -> str:
+        expression = ann_candidate_distance(RawItem.embedding, query, storage=storage)
+        return str(expression.compile(dialect=postgresql.dialect()))
+
+    assert sql("full") == "raw_items.embedding <=> %(embedding_1)s"
+    assert "CAST(raw_items.embedding AS HALFVEC(1536)) <=>" in sql("halfvec")
+    assert "CAST(binary_quantize(raw_items.embedding) AS BIT(1536)) <~>" in sql("binary")
+    with pytest.raises(ValueError, match="Unsupported ANN storage mode 'pq'"):
+        ann_candidate_distance(RawItem.embedding, query, storage="pq")
@@ -436,9 +436,10 @@ async def test_collect_rss_async_aggregates_results(monkeypatch: pytest.MonkeyPa
             return None
 
     class FakeCollector:
-        def __init__(self, *, session, http_client) -> None:
+        def __init__(self, *, session, http_client, session_factory) -> None:
             seen["session"] = session
             seen["http_client"] = http_client
+            seen["session_factory"] = session_factory
 
         async def collect_all(self) -> list[FakeCollectorResult]:
             return [
@@ -461,7 +462,11 @@ async def test_collect_rss_async_aggregates_results(monkeypatch: pytest.MonkeyPa
     assert result["terminal_errors"] == 1
     assert result["sources_succeeded"] == 1
     assert result["sources_failed"] == 1
-    assert seen == {"session": mock_session, "http_client": http_client}
+    assert seen == {
+        "session": mock_session,
+        "http_client": http_client,
+        "session_factory": tasks_module.async_session_maker,
+    }
     assert mock_session.commit.await_count == 1
 
 
@@ -477,9 +482,10 @@ async def test_collect_gdelt_async_aggregates_results(monkeypatch: pytest.Monkey
             return None
 
     class FakeCollector:
-        def __init__(self, *, session, http_client) -> None:
+        def __init__(self, *, session, http_client, session_factory) -> None:
             assert session is mock_session
             assert http_client == "client"
+            assert session_factory is tasks_module.async_session_maker
 
         async def collect_all(self) -> list[FakeCollectorResult]:
             return [FakeCollectorResult(4, 4, 0, [])]
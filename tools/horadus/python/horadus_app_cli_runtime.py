@@ -5,24 +5,23 @@ import asyncio
 import json
 from dataclasses import asdict
 from datetime import date, datetime
-from enum import IntEnum
 from pathlib import Path
-from types import SimpleNamespace
 from typing import Any, cast
 from uuid import UUID
 
 from src.core.config import settings as runtime_settings
+from tools.horadus.python.horadus_app_cli_runtime_backfill import (
+    _action_pipeline_backfill_embeddings,
+)
+from tools.horadus.python.horadus_app_cli_runtime_common import (
+    ExitCode,
+    _namespace,
+    _result_payload,
+)
 
 settings = runtime_settings
 
 
-class ExitCode(IntEnum):
-    OK = 0
-    VALIDATION_ERROR = 2
-    NOT_FOUND = 3
-    ENVIRONMENT_ERROR = 4
-
-
 def _json_default(value: object) -> object:
     if isinstance(value, date | datetime):
         return value.isoformat()
@@ -33,23 +32,6 @@ def _json_default(value: object) -> object:
     raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
-def _result_payload(
-    *,
-    exit_code: int,
-    data: dict[str, Any] | None = None,
-    lines: list[str] | None = None,
-    error_lines: list[str] | None = None,
-) -> dict[str, Any]:
-    payload: dict[str, Any] = {"exit_code": int(exit_code)}
-    if data is not None:
-        payload["data"] = data
-    if lines:
-        payload["lines"] = lines
-    if error_lines:
-        payload["error_lines"] = error_lines
-    return payload
-
-
 def _parse_iso_datetime(value: str | None) -> datetime | None:
     if value is None:
         return None
@@ -239,6 +221,8 @@ async def _collect_eval_vector_benchmark(args: Any) -> tuple[dict[str, Any], lis
         top_k=max(1, args.top_k),
         similarity_threshold=args.similarity_threshold,
         seed=args.seed,
+        compare_cluster_targets=args.compare_cluster_targets,
+        compare_similarity_kernels=args.compare_similarity_kernels,
     )
     return (
         {"output_path": str(output_path)},
@@ -506,8 +490,27 @@ def _collect_pipeline_dry_run(args: Any) -> tuple[dict[str, Any], list[str], int
     )
 
 
-def _namespace(payload: dict[str, Any]) -> SimpleNamespace:
-    return SimpleNamespace(**payload)
+async def _collect_pipeline_rebuild_dedup_filter(
+    args: Any,
+) -> tuple[dict[str, Any], list[str], int]:
+    from src.processing.recent_key_filter import get_recent_key_filter
+    from src.storage.database import async_session_maker
+
+    key_filter = get_recent_key_filter()
+    if not key_filter.enabled:
+        return (
+            {"enabled": False, "rows": 0},
+            ["Dedup filter disabled (DEDUP_RECENT_KEY_FILTER_ENABLED=false); nothing rebuilt."],
+            ExitCode.VALIDATION_ERROR,
+        )
+
+    async with async_session_maker() as session:
+        rows = await key_filter.rebuild(session, batch_size=max(1, int(args.batch_size)))
+    return (
+        {"enabled": True, "rows": rows, "window_days": key_filter.window_days},
+        [f"Dedup filter rebuilt from {rows} raw items (window_days={key_filter.window_days})"],
+        ExitCode.OK,
+    )
 
 
 def _action_trends_status(payload: dict[str, Any]) -> dict[str, Any]:
@@ -565,6 +568,13 @@ def _action_pipeline_dry_run(payload: dict[str, Any]) -> dict[str, Any]:
     return _result_payload(exit_code=exit_code, data=data, lines=lines)
 
 
+def _action_pipeline_rebuild_dedup_filter(payload: dict[str, Any]) -> dict[str, Any]:
+    data, lines, exit_code = asyncio.run(
+        _collect_pipeline_rebuild_dedup_filter(_namespace(payload))
+    )
+    return _result_payload(exit_code=exit_code, data=data, lines=lines)
+
+
 def _action_doctor(payload: dict[str, Any]) -> dict[str, Any]:
     data, lines, exit_code = _collect_doctor(max(0.1, float(payload.get("timeout_seconds", 2.0))))
     return _result_payload(exit_code=exit_code, data=data, lines=lines)
@@ -580,7 +590,9 @@ _ACTIONS: dict[str, Any] = {
     "eval-source-freshness": _action_eval_source_freshness,
     "eval-validate-taxonomy": _action_eval_validate_taxonomy,
     "eval-vector-benchmark": _action_eval_vector_benchmark,
+    "pipeline-backfill-embeddings": _action_pipeline_backfill_embeddings,
     "pipeline-dry-run": _action_pipeline_dry_run,
+    "pipeline-rebuild-dedup-filter": _action_pipeline_rebuild_dedup_filter,
     "trends-status": _action_trends_status,
 }
 
@@ -625,6 +637,7 @@ __all__ = [
     "_collect_eval_validate_taxonomy",
     "_collect_eval_vector_benchmark",
     "_collect_pipeline_dry_run",
+    "_collect_pipeline_rebuild_dedup_filter",
     "_collect_trends_status",
     "_doctor_check_database",
     "_doctor_check_redis",
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from tools.horadus.python.horadus_app_cli_runtime_common import (
+    ExitCode,
+    _namespace,
+    _result_payload,
+)
+
+
+async def _collect_pipeline_backfill_embeddings(
+    args: Any,
+) -> tuple[dict[str, Any], list[str], int]:
+    from src.processing.embedding_backfill import BACKFILL_ENTITIES, EmbeddingBackfillRunner
+    from src.storage.database import async_session_maker
+
+    entities = BACKFILL_ENTITIES if args.entity == "all" else (args.entity,)
+    runs: list[dict[str, Any]] = []
+    lines: list[str] = []
+    for entity in entities:
+        runner = EmbeddingBackfillRunner(
+            session_factory=async_session_maker,
+            entity=entity,
+            checkpoint_path=Path(args.checkpoint_dir) / f"embedding-backfill-{entity}.json",
+            page_size=max(1, int(args.page_size)),
+            max_api_calls=args.max_api_calls,
+            max_items_per_minute=args.max_items_per_minute,
+        )
+        progress = await runner.run(restart=bool(args.restart))
+        runs.append(asdict(progress))
+        lines.append(
+            f"{entity}: embedded={progress.embedded}, api_calls={progress.api_calls}, "
+            f"cache_hits={progress.cache_hits}, pages={progress.pages}, "
+            f"completed={str(progress.completed).lower()}"
+            + (f", stopped={progress.stopped_reason}" if progress.stopped_reason else "")
+        )
+        if progress.stopped_reason is not None:
+            break
+    # Non-zero while scope remains, so operators can rerun until it completes.
+    completed = len(runs) == len(entities) and all(run["completed"] for run in runs)
+    exit_code = ExitCode.OK if completed else ExitCode.VALIDATION_ERROR
+    return ({"runs": runs, "completed": completed}, lines, exit_code)
+
+
+def _action_pipeline_backfill_embeddings(payload: dict[str, Any]) -> dict[str, Any]:
+    data, lines, exit_code = asyncio.run(_collect_pipeline_backfill_embeddings(_namespace(payload)))
+    return _result_payload(exit_code=exit_code, data=data, lines=lines)
+
+
+__all__ = [
+    "_action_pipeline_backfill_embeddings",
+    "_collect_pipeline_backfill_embeddings",
+]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from types import SimpleNamespace
+from typing import Any
+
+
+class ExitCode(IntEnum):
+    OK = 0
+    VALIDATION_ERROR = 2
+    NOT_FOUND = 3
+    ENVIRONMENT_ERROR = 4
+
+
+def _result_payload(
+    *,
+    exit_code: int,
+    data: dict[str, Any] | None = None,
+    lines: list[str] | None = None,
+    error_lines: list[str] | None = None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {"exit_code": int(exit_code)}
+    if data is not None:
+        payload["data"] = data
+    if lines:
+        payload["lines"] = lines
+    if error_lines:
+        payload["error_lines"] = error_lines
+    return payload
+
+
+def _namespace(payload: dict[str, Any]) -> SimpleNamespace:
+    return SimpleNamespace(**payload)
+
+
+__all__ = [
+    "ExitCode",
+    "_namespace",
+    "_result_payload",
+]
@@ -257,6 +257,16 @@ def register_ops_commands(
     eval_vector_parser.add_argument(
         "--seed", type=int, default=42, help="Random seed for deterministic synthetic data."
     )
+    eval_vector_parser.add_argument(
+        "--compare-cluster-targets",
+        action="store_true",
+        help="Also compare seed vs centroid event embeddings as clustering targets.",
+    )
+    eval_vector_parser.add_argument(
+        "--compare-similarity-kernels",
+        action="store_true",
+        help="Also time per-pair cosine loops vs batched similarity kernels for top-k.",
+    )
     eval_vector_parser.set_defaults(
         handler=lambda args: runtime_result("eval-vector-benchmark", args)
     )
@@ -298,30 +308,8 @@ def register_ops_commands(
         handler=lambda args: runtime_result("eval-source-freshness", args)
     )
 
-    pipeline_parser = subparsers.add_parser("pipeline")
-    pipeline_subparsers = pipeline_parser.add_subparsers(dest="pipeline_command")
-    pipeline_dry_run_parser = pipeline_subparsers.add_parser(
-        "dry-run",
-        help="Run deterministic offline pipeline scoring on local fixtures.",
-    )
-    add_leaf_options(pipeline_dry_run_parser)
-    pipeline_dry_run_parser.add_argument(
-        "--fixture-path",
-        default="ai/eval/fixtures/pipeline_dry_run_items.jsonl",
-        help="Path to fixture JSONL file.",
-    )
-    pipeline_dry_run_parser.add_argument(
-        "--trend-config-dir",
-        default="config/trends",
-        help="Directory containing trend config YAML files.",
-    )
-    pipeline_dry_run_parser.add_argument(
-        "--output-path",
-        default="artifacts/agent/pipeline-dry-run-output.json",
-        help="Output JSON artifact path.",
-    )
-    pipeline_dry_run_parser.set_defaults(
-        handler=lambda args: runtime_result("pipeline-dry-run", args)
+    _register_pipeline_commands(
+        subparsers, add_leaf_options=add_leaf_options, runtime_result=runtime_result
     )
 
     agent_parser = subparsers.add_parser("agent")
@@ -355,3 +343,89 @@ def register_ops_commands(
         "--timeout-seconds", type=float, default=2.0, help="Timeout per dependency check."
     )
     doctor_parser.set_defaults(handler=lambda args: runtime_result("doctor", args))
+
+
+def _register_pipeline_commands(
+    subparsers: Any,
+    *,
+    add_leaf_options: Callable[[argparse.ArgumentParser], None],
+    runtime_result: Callable[[str, Any], Any],
+) -> None:
+    pipeline_parser = subparsers.add_parser("pipeline")
+    pipeline_subparsers = pipeline_parser.add_subparsers(dest="pipeline_command")
+    pipeline_dry_run_parser = pipeline_subparsers.add_parser(
+        "dry-run",
+        help="Run deterministic offline pipeline scoring on local fixtures.",
+    )
+    add_leaf_options(pipeline_dry_run_parser)
+    pipeline_dry_run_parser.add_argument(
+        "--fixture-path",
+        default="ai/eval/fixtures/pipeline_dry_run_items.jsonl",
+        help="Path to fixture JSONL file.",
+    )
+    pipeline_dry_run_parser.add_argument(
+        "--trend-config-dir",
+        default="config/trends",
+        help="Directory containing trend config YAML files.",
+    )
+    pipeline_dry_run_parser.add_argument(
+        "--output-path",
+        default="artifacts/agent/pipeline-dry-run-output.json",
+        help="Output JSON artifact path.",
+    )
+    pipeline_dry_run_parser.set_defaults(
+        handler=lambda args: runtime_result("pipeline-dry-run", args)
+    )
+    pipeline_dedup_filter_parser = pipeline_subparsers.add_parser(
+        "rebuild-dedup-filter",
+        help="Rebuild the Redis dedup Bloom filter from raw items in the dedup window.",
+    )
+    add_leaf_options(pipeline_dedup_filter_parser)
+    pipeline_dedup_filter_parser.add_argument(
+        "--batch-size", type=int, default=5000, help="Raw items streamed per Redis write."
+    )
+    pipeline_dedup_filter_parser.set_defaults(
+        handler=lambda args: runtime_result("pipeline-rebuild-dedup-filter", args)
+    )
+    pipeline_backfill_parser = pipeline_subparsers.add_parser(
+        "backfill-embeddings",
+        help=(
+            "Embed rows missing a vector for the configured embedding model "
+            "(the re-embed scope reported by `eval embedding-lineage`)."
+        ),
+    )
+    add_leaf_options(pipeline_backfill_parser)
+    pipeline_backfill_parser.add_argument(
+        "--entity",
+        choices=("raw_items", "events", "all"),
+        default="all",
+        help="Tables to backfill; `all` runs raw_items then events.",
+    )
+    pipeline_backfill_parser.add_argument(
+        "--page-size", type=int, default=200, help="Rows read, embedded and written per page."
+    )
+    pipeline_backfill_parser.add_argument(
+        "--max-api-calls",
+        type=int,
+        default=None,
+        help="Stop each entity run after this many embedding API calls.",
+    )
+    pipeline_backfill_parser.add_argument(
+        "--max-items-per-minute",
+        type=float,
+        default=None,
+        help="Pace embedding requests to at most this many rows per minute.",
+    )
+    pipeline_backfill_parser.add_argument(
+        "--checkpoint-dir",
+        default="artifacts/agent",
+        help="Directory holding per-entity resume checkpoints.",
+    )
+    pipeline_backfill_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore existing checkpoints and scan from the beginning.",
+    )
+    pipeline_backfill_parser.set_defaults(
+        handler=lambda args: runtime_result("pipeline-backfill-embeddings", args)
+    )
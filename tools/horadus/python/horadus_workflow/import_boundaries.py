@@ -18,7 +18,11 @@ _SRC_ALLOWED_LAYER_TARGETS: dict[str, frozenset[str]] = {
 _TOOLS_ALLOWED_GROUP_TARGETS: dict[str, frozenset[str]] = {
     "horadus_cli": frozenset({"horadus_workflow"}),
     "horadus_workflow": frozenset(),
-    "horadus_app_cli_runtime": frozenset(),
+    "horadus_app_cli_runtime": frozenset(
+        {"horadus_app_cli_runtime_backfill", "horadus_app_cli_runtime_common"}
+    ),
+    "horadus_app_cli_runtime_backfill": frozenset({"horadus_app_cli_runtime_common"}),
+    "horadus_app_cli_runtime_common": frozenset(),
 }
 
 
@@ -96,6 +100,21 @@ _TOOLS_TO_SRC_ALLOWED_IMPORT_EXCEPTIONS: tuple[AllowedImportException, ...] = (
         imported_prefix="src.processing.dry_run_pipeline",
         rationale="runtime bridge may run the deterministic pipeline dry-run surface",
     ),
+    AllowedImportException(
+        importer_prefix="tools.horadus.python.horadus_app_cli_runtime_backfill",
+        imported_prefix="src.processing.embedding_backfill",
+        rationale="runtime bridge may run the resumable embedding backfill",
+    ),
+    AllowedImportException(
+        importer_prefix="tools.horadus.python.horadus_app_cli_runtime_backfill",
+        imported_prefix="src.storage.database",
+        rationale="the embedding backfill opens app database sessions via the documented seam",
+    ),
+    AllowedImportException(
+        importer_prefix="tools.horadus.python.horadus_app_cli_runtime",
+        imported_prefix="src.processing.recent_key_filter",
+        rationale="runtime bridge may rebuild the dedup key filter from raw items",
+    ),
     AllowedImportException(
         importer_prefix="tools.horadus.python.horadus_app_cli_runtime",
         imported_prefix="src.storage.database",